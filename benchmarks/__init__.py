@@ -0,0 +1 @@
+# Benchmarks for eCatalog CLI importers
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+
+"""
+Importer throughput benchmark
+
+For each layout (dropship, RTG delivered, resku) and sheet size, a synthetic sheet is
+written to disk and imported in a fresh process, timing each stage:
+
+    read         the importer's open_sheet (mapped columns only, streamed in batches)
+    normalize    column cleaning, title casing, category/attribute corrections
+    model_build  ItemNew / ItemAttributes construction (pydantic validation)
+    serialize    model_dump + json.dumps, as create_item sends it
+    submit       create_item against a local stub server (first --submit-rows items)
+    dry_run      the importer's full import_from_spreadsheet(dry_run=True)
+
+plus micro benchmarks for smart_title_case and correct_common_data_errors, and the peak
+RSS of a dry run. The stages above hold the whole sheet in memory to time each step on
+its own, so the dry run's memory is measured in a separate process that only streams
+the sheet. Results are compared against a baseline file and the run fails (exit code 1)
+when a metric is more than --tolerance worse.
+
+Usage:
+    uv run python -m benchmarks.importer_benchmark
+    uv run python -m benchmarks.importer_benchmark --layout dropship --rows 10000
+    uv run python -m benchmarks.importer_benchmark --save-baseline
+"""
+
+import contextlib
+import importlib
+import json
+import logging
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from unittest import mock
+
+import click
+from rich.console import Console
+from rich.table import Table
+
+from benchmarks.synthetic_sheets import LAYOUTS, SHEET_BUILDERS, add_unmapped_columns, write_sheet
+
+console = Console()
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+
+DEFAULT_ROWS = (1000, 10000, 100000)
+
+# Importer class and the module holding its text helpers, per layout
+IMPORTERS = {
+    "dropship": ("workflows.import_dropship_items", "DropshipItemImporter", "Category"),
+    "rtg_delivered": ("workflows.import_rtg_delivered_items", "RtgDeliveredItemImporter", "Ecat Category"),
+    "resku": ("workflows.import_items", "ReskuItemImporter", "Ecat Category"),
+}
+
+STAGES = ("read", "normalize", "model_build", "serialize", "submit", "dry_run")
+
+# Sample size for the micro benchmarks
+TEXT_SAMPLE = 5000
+
+
+def _peak_rss_mb() -> float:
+    import resource
+    # Linux carries ru_maxrss over fork + exec, so a spawned process would report the
+    # benchmark parent's peak; VmHWM belongs to this process's own address space
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class _ConstructionTimer:
+    """Wraps a model class so the time spent constructing it can be separated out"""
+
+    def __init__(self):
+        self.seconds = 0.0
+
+    def wrap(self, model_class):
+        def build(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return model_class(*args, **kwargs)
+            finally:
+                self.seconds += time.perf_counter() - start
+        return build
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+def _setup_process(sheet_path: str) -> None:
+    # Per-request INFO logging would dominate the submit stage
+    logging.disable(logging.INFO)
+    # Synthetic categories and attributes aren't real ones; measure without local lookups
+    os.environ["CATEGORY_INDEX_FILE"] = os.path.join(os.path.dirname(sheet_path), "no-category-index.json")
+    os.environ["ATTRIBUTE_VOCABULARY_FILE"] = os.path.join(os.path.dirname(sheet_path), "no-attribute-vocabulary.json")
+
+
+def run_dry_run_memory(layout: str, sheet_path: str) -> float:
+    """Peak RSS (MB) of a dry run alone; runs in its own process"""
+    from ecatalog_client import ECatalogAPIClient
+
+    _setup_process(sheet_path)
+    module_name, class_name, _ = IMPORTERS[layout]
+    importer = getattr(importlib.import_module(module_name), class_name)(ECatalogAPIClient("http://127.0.0.1:9"))
+    with open(os.devnull, "w") as devnull, _quiet(devnull):
+        importer.import_from_spreadsheet(Path(sheet_path), dry_run=True)
+    return round(_peak_rss_mb(), 1)
+
+
+def run_case(layout: str, sheet_path: str, stub_url: Optional[str], submit_rows: int, concurrency: int) -> Dict:
+    """Benchmark one sheet's stages; runs in its own process with clean caches"""
+    import pandas as pd
+    from ecatalog_client import ECatalogAPIClient, TransportConfig
+    from workflows.concurrent_submit import submit_ordered
+    from workflows.title_case import smart_title_case
+
+    _setup_process(sheet_path)
+
+    module_name, class_name, category_column = IMPORTERS[layout]
+    module = importlib.import_module(module_name)
+    # Items are built by the shared import engine, whatever the layout
+    engine = importlib.import_module("workflows.import_engine")
+    path = Path(sheet_path)
+    devnull = open(os.devnull, "w")
+
+    client = ECatalogAPIClient(
+        stub_url or "http://127.0.0.1:9",
+        transport=TransportConfig(pool_maxsize=max(concurrency, 1)),
+    )
+    importer = getattr(module, class_name)(client)
+    seconds: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    reader = importer.open_sheet(path)
+    batches = list(reader)
+    seconds["read"] = time.perf_counter() - start
+    df = pd.concat(batches)
+    del batches
+    rows = len(df)
+
+    timer = _ConstructionTimer()
+    with _quiet(devnull), mock.patch.object(engine, "ItemNew", timer.wrap(engine.ItemNew)), \
+            mock.patch.object(engine, "ItemAttributes", timer.wrap(engine.ItemAttributes)):
+        start = time.perf_counter()
+        frame = next(importer.filter_batches([df]))
+        items = [item for item in importer.items_from_frame(frame) if item]
+        convert = time.perf_counter() - start
+    seconds["model_build"] = timer.seconds
+    seconds["normalize"] = convert - timer.seconds
+
+    start = time.perf_counter()
+    for item in items:
+        json.dumps(item.model_dump(by_alias=True, exclude_none=True))
+    seconds["serialize"] = time.perf_counter() - start
+
+    submitted = 0
+    if stub_url and submit_rows:
+        sample = items[:submit_rows]
+        start = time.perf_counter()
+        for _, result, error in submit_ordered(client.create_item, sample, concurrency):
+            submitted += 1
+        seconds["submit"] = time.perf_counter() - start
+
+    with _quiet(devnull):
+        start = time.perf_counter()
+        importer.import_from_spreadsheet(path, dry_run=True)
+        seconds["dry_run"] = time.perf_counter() - start
+
+    micro = {}
+    text_helpers = {
+        "smart_title_case": (
+            smart_title_case if "Collection" in importer.TITLE_CASE_FIELDS else None,
+            "Collection",
+            lambda fn, value: fn(value),
+        ),
+        "correct_common_data_errors": (
+            getattr(module, "correct_common_data_errors", None),
+            category_column,
+            lambda fn, value: fn(value, "category"),
+        ),
+    }
+    for name, (fn, column, call) in text_helpers.items():
+        if fn is None:
+            continue
+        values = [str(v) for v in df[column].dropna().head(TEXT_SAMPLE)]
+        start = time.perf_counter()
+        for value in values:
+            call(fn, value)
+        micro[name] = _rate(len(values), time.perf_counter() - start)
+
+    devnull.close()
+
+    rows_per_sec = {
+        stage: _rate(submitted if stage == "submit" else rows, stage_seconds)
+        for stage, stage_seconds in seconds.items()
+    }
+    pipeline = sum(seconds[stage] for stage in ("read", "normalize", "model_build", "serialize"))
+    rows_per_sec["pipeline"] = _rate(rows, pipeline)
+
+    return {
+        "layout": layout,
+        "rows": rows,
+        "items": len(items),
+        "read_engine": reader.engine,
+        "stage_seconds": {stage: round(value, 4) for stage, value in seconds.items()},
+        "rows_per_sec": rows_per_sec,
+        "micro_ops_per_sec": micro,
+    }
+
+
+@contextlib.contextmanager
+def _quiet(devnull):
+    """Silence importer console output (rich writes to the current sys.stdout)"""
+    with contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        yield
+
+
+def case_key(layout: str, rows: int, file_format: str, unmapped_columns: int = 0) -> str:
+    key = f"{layout}-{rows}-{file_format}"
+    return f"{key}-unmapped{unmapped_columns}" if unmapped_columns else key
+
+
+def find_regressions(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float) -> List[str]:
+    """Metrics that got more than `tolerance` (fraction) worse than the baseline"""
+    regressions = []
+    for key, result in results.items():
+        base = baseline.get(key)
+        if not base:
+            continue
+        for group in ("rows_per_sec", "micro_ops_per_sec"):
+            for metric, value in result.get(group, {}).items():
+                base_value = base.get(group, {}).get(metric)
+                if base_value and value < base_value * (1 - tolerance):
+                    regressions.append(
+                        f"{key} {metric}: {value:,.0f}/s vs baseline {base_value:,.0f}/s "
+                        f"({(value / base_value - 1) * 100:+.0f}%)"
+                    )
+        base_rss = base.get("peak_rss_mb")
+        if base_rss and result["peak_rss_mb"] > base_rss * (1 + tolerance):
+            regressions.append(
+                f"{key} peak RSS: {result['peak_rss_mb']:.0f} MB vs baseline {base_rss:.0f} MB"
+            )
+    return regressions
+
+
+def _display_results(results: Dict[str, Dict]) -> None:
+    table = Table(title="Importer Benchmark (rows/sec)")
+    table.add_column("Case", style="cyan")
+    for stage in STAGES + ("pipeline",):
+        table.add_column(stage, justify="right")
+    table.add_column("Dry-run RSS", justify="right")
+
+    for key, result in results.items():
+        rates = result["rows_per_sec"]
+        table.add_row(
+            key,
+            *[f"{rates[stage]:,.0f}" if stage in rates else "-" for stage in STAGES + ("pipeline",)],
+            f"{result['peak_rss_mb']:,.0f} MB",
+        )
+    console.print(table)
+
+    micro = Table(title="Micro Benchmarks (calls/sec)")
+    micro.add_column("Case", style="cyan")
+    names = sorted({name for result in results.values() for name in result["micro_ops_per_sec"]})
+    for name in names:
+        micro.add_column(name, justify="right")
+    for key, result in results.items():
+        ops = result["micro_ops_per_sec"]
+        micro.add_row(key, *[f"{ops[name]:,.0f}" if name in ops else "-" for name in names])
+    console.print(micro)
+
+
+def _load_baseline(path: Path) -> Dict[str, Dict]:
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f).get("cases", {})
+
+
+def _save_baseline(path: Path, results: Dict[str, Dict]) -> None:
+    cases = _load_baseline(path)
+    cases.update(results)
+    data = {
+        "generated": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cases": dict(sorted(cases.items())),
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+@click.command()
+@click.option("--layout", "layouts", multiple=True, type=click.Choice(LAYOUTS), help="Sheet layout (repeatable, default: all)")
+@click.option("--rows", "row_counts", multiple=True, type=click.IntRange(min=1), help="Sheet size (repeatable, default: 1000, 10000, 100000)")
+@click.option("--format", "file_format", type=click.Choice(["csv", "xlsx"]), default="csv", show_default=True,
+              help="Sheet file format (xlsx also measures the Excel parser, but is slow to generate at 100k rows)")
+@click.option("--unmapped-columns", type=click.IntRange(min=0), default=0, show_default=True,
+              help="Extra vendor columns the importers don't map (shows the column-projection gain in read)")
+@click.option("--submit-rows", type=click.IntRange(min=0), default=1000, show_default=True,
+              help="Items per case to create on the stub server (0 skips the submit stage)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=8, show_default=True, help="Parallel create_item calls")
+@click.option("--stub-latency", type=float, default=0.0, show_default=True, help="Stub server latency per request, in seconds")
+@click.option("--seed", type=int, default=0, show_default=True, help="Seed for the synthetic sheets")
+@click.option("--baseline", "baseline_path", type=click.Path(dir_okay=False, path_type=Path), default=BASELINE_PATH,
+              show_default=True, help="Baseline file to compare against")
+@click.option("--tolerance", type=click.FloatRange(0, 1), default=0.25, show_default=True,
+              help="Allowed slowdown before a metric counts as a regression (0.25 = 25%)")
+@click.option("--save-baseline", is_flag=True, help="Store these results as the new baseline")
+@click.option("--output", type=click.Path(dir_okay=False, path_type=Path), help="Also write results to this JSON file")
+def main(layouts: Tuple[str], row_counts: Tuple[int], file_format: str, unmapped_columns: int, submit_rows: int,
+         concurrency: int,
+         stub_latency: float, seed: int, baseline_path: Path, tolerance: float, save_baseline: bool,
+         output: Optional[Path]):
+    """Measure importer throughput on synthetic vendor sheets"""
+    from stub_server import StubBehavior, start_stub_server
+
+    layouts = layouts or LAYOUTS
+    row_counts = row_counts or DEFAULT_ROWS
+    results: Dict[str, Dict] = {}
+
+    with tempfile.TemporaryDirectory(prefix="ecatalog-bench-") as workdir, \
+            start_stub_server(StubBehavior(latency=stub_latency, seed=seed)) as stub:
+        for layout in layouts:
+            for rows in row_counts:
+                key = case_key(layout, rows, file_format, unmapped_columns)
+                console.print(f"[blue]Generating {key}...[/blue]")
+                sheet = SHEET_BUILDERS[layout](rows, seed=seed, sku_prefix=f"B{layout[:2].upper()}{rows}X")
+                if unmapped_columns:
+                    sheet = add_unmapped_columns(sheet, unmapped_columns, seed=seed)
+                sheet_path = write_sheet(sheet, Path(workdir) / f"{key}.{file_format}")
+                del sheet
+
+                console.print(f"[blue]Running {key}...[/blue]")
+                # Fresh process per case: clean caches
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    results[key] = pool.submit(
+                        run_case, layout, str(sheet_path), stub.url if submit_rows else None,
+                        submit_rows, concurrency
+                    ).result()
+                # And another for the dry run's memory, so nothing else has grown the heap
+                with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as pool:
+                    results[key]["peak_rss_mb"] = pool.submit(run_dry_run_memory, layout, str(sheet_path)).result()
+
+    _display_results(results)
+
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+    if save_baseline:
+        _save_baseline(baseline_path, results)
+        console.print(f"[green]Baseline saved to {baseline_path}[/green]")
+        return
+
+    baseline = _load_baseline(baseline_path)
+    if not baseline:
+        console.print(f"[yellow]No baseline at {baseline_path} - run with --save-baseline to create one[/yellow]")
+        return
+
+    regressions = find_regressions(results, baseline, tolerance)
+    if regressions:
+        console.print(f"[red]❌ {len(regressions)} regression(s) beyond {tolerance:.0%}:[/red]")
+        for regression in regressions:
+            console.print(f"  • {regression}")
+        sys.exit(1)
+    console.print(f"[green]✅ No regressions beyond {tolerance:.0%} against {baseline_path.name}[/green]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""
+Synthetic vendor sheets for importer benchmarks
+
+Builds DataFrames shaped like the dropship, RTG delivered and resku spreadsheets:
+same column names, realistic value mixes (a few hundred collections and categories,
+comma-separated attributes, the typos correct_common_data_errors fixes) and
+deterministic content for a given seed, so runs are comparable.
+"""
+
+import random
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import pandas as pd
+
+LAYOUTS = ("dropship", "rtg_delivered", "resku")
+
+SITES = ["RTG", "RTG", "RTG", "KTG", "OTG"]
+
+COLLECTION_WORDS = [
+    "bellingham", "oak", "cindy crawford", "home", "mccoy", "sofia vergara", "santa monica",
+    "harbor", "lane", "iii", "ii", "of the", "NFL", "dallas", "cottage", "creek", "ridge",
+    "hillside", "vintage", "modern", "coastal", "and", "valencia", "bay", "TV", "gray",
+]
+
+CATEGORIES = [
+    "Living Room : Sofas",
+    "Livingroom : Sofas",
+    "Living Room : Cocktail Tables",
+    "Livingroom : Cocktail Tables",
+    "Living Room : Chairs",
+    "Living Room : Ottomans",
+    "Bedroom : Beds",
+    "Bedroom : Dressers",
+    "Bedroom : Nightstands",
+    "Dining Room : Tables",
+    "Dining Room : Chairs",
+    "Accessories : Pillows/Throws",
+    "Accessoreis : Wall Dcor",
+    "Adult : Bedroom : Mirrors",
+    "Outdoor : Seating : Chairs",
+    "Kids : Beds : Bunk Beds",
+]
+
+GENERIC_NAMES = ["Sofa", "Loveseat", "Chair", "Ottoman", "Bed", "Dresser", "Nightstand", "Table", "Mirror"]
+COLORS = ["Brown", "Gray", "Blue", "White", "Black", "Beige", "Green", "Natural"]
+DECOR = ["Modern", "Mid Century Modern", "Mid Century", "Traditional", "Coastal", "Farmhouse"]
+MATERIALS = ["Wood", "Fabric", "Leather", "Metal", "Aluminum", "Glass"]
+SIZES = ["Small", "Medium", "Large", "Extra Large", '24"-36" Medium', '48" + Extra Large']
+FEATURES = ["Storage", "USB Charging", "Reclining", "Sleeper", "Power", "Adjustable"]
+DELIVERY_TYPES = ["D", "O", "P"]
+BUILD_STATUSES = ["Build in {division}", "Build in {division}", "Do Not Build", ""]
+REGION_LISTS = ["FL", "FL,SE", "FL,SE,TX", "SE,TX", "TX", ""]
+REGIONS = ["FL", "SE", "TX", "ALL", "FL/SE", ""]
+
+
+def _collections(rng: random.Random, count: int = 300) -> List[str]:
+    return [" ".join(rng.sample(COLLECTION_WORDS, rng.randint(1, 3))) for _ in range(count)]
+
+
+def _attribute(rng: random.Random, values: List[str], max_values: int = 3) -> str:
+    if rng.random() < 0.3:
+        return ""
+    return ", ".join(rng.sample(values, rng.randint(1, max_values)))
+
+
+def _common_rows(rng: random.Random, rows: int, sku_prefix: str) -> Dict[str, List]:
+    """Values shared by every layout, before renaming to layout-specific columns"""
+    collections = _collections(rng)
+    data = {
+        "sku": [f"{sku_prefix}{i:07d}" for i in range(rows)],
+        "site": [rng.choice(SITES) for _ in range(rows)],
+        "collection": [rng.choice(collections) for _ in range(rows)],
+        "category": [rng.choice(CATEGORIES) for _ in range(rows)],
+        "generic": [rng.choice(GENERIC_NAMES) for _ in range(rows)],
+        "delivery": [rng.choice(DELIVERY_TYPES) for _ in range(rows)],
+        "color": [_attribute(rng, COLORS) for _ in range(rows)],
+        "decor": [_attribute(rng, DECOR, 2) for _ in range(rows)],
+        "material": [_attribute(rng, MATERIALS, 2) for _ in range(rows)],
+        "size": [_attribute(rng, SIZES, 1) for _ in range(rows)],
+        "features": [_attribute(rng, FEATURES) for _ in range(rows)],
+    }
+    data["title"] = [f"{c.title()} {g}" for c, g in zip(data["collection"], data["generic"])]
+    data["description"] = [t.upper() for t in data["title"]]
+    data["copy"] = [f"The {t} brings comfort and style to any room." for t in data["title"]]
+    data["image"] = [t.lower().replace(" ", "_") for t in data["title"]]
+    data["dimensions"] = [f"{rng.randint(20, 96)}w x {rng.randint(16, 42)}d x {rng.randint(16, 40)}h" for _ in range(rows)]
+    return data
+
+
+def dropship_sheet(rows: int, seed: int = 0, sku_prefix: str = "DS") -> pd.DataFrame:
+    rng = random.Random(seed)
+    data = _common_rows(rng, rows, sku_prefix)
+    return pd.DataFrame({
+        "Sku": data["sku"],
+        "site": data["site"],
+        "Collection": data["collection"],
+        "Category": data["category"],
+        "VendorDescription": data["description"],
+        "Name": data["title"],
+        "Advertising Copy": data["copy"],
+        "Image": data["image"],
+        "Notes": "",
+        "Dimensions": data["dimensions"],
+        "GenericName": data["generic"],
+        "DeliveryType": data["delivery"],
+        "ShippingCode": "",
+        "Brand": "",
+        "Single Item Room": [rng.random() < 0.1 for _ in range(rows)],
+        "Vendor Delivery Code": "",
+        "RegionList": [rng.choice(REGION_LISTS) for _ in range(rows)],
+        "Color": data["color"],
+        "Decor": data["decor"],
+        "Material": data["material"],
+        "Size": data["size"],
+        "Features": data["features"],
+        "team": "",
+    })
+
+
+def _rtg_style_columns(data: Dict[str, List]) -> Dict[str, List]:
+    """Columns shared by the RTG delivered and resku sheets"""
+    return {
+        "New SKU": data["sku"],
+        "Site": data["site"],
+        "Collection": data["collection"],
+        "Ecat Category": data["category"],
+        "Category": "",
+        "Top Category": "",
+        "Description": data["description"],
+        "Title": data["title"],
+        "Advertising Copy": data["copy"],
+        "Ecat Image Name": data["image"],
+        "Additional Notes": "",
+        "Out Of Box Dim": data["dimensions"],
+        "Generic Name": data["generic"],
+        "Delivery Type": data["delivery"],
+        "Shipping Code": "",
+        "Specialty Brand": "",
+        "Vendor Delivery Code": "",
+        "Color": data["color"],
+        "Décor": data["decor"],
+        "Material": data["material"],
+        "Size": data["size"],
+        "Features": data["features"],
+    }
+
+
+def rtg_delivered_sheet(rows: int, seed: int = 0, sku_prefix: str = "RD") -> pd.DataFrame:
+    rng = random.Random(seed)
+    data = _common_rows(rng, rows, sku_prefix)
+    columns = _rtg_style_columns(data)
+    for division in ("FL", "SE", "TX"):
+        columns[f"{division} Ecat Status"] = [
+            rng.choice(BUILD_STATUSES).format(division=division) for _ in range(rows)
+        ]
+    return pd.DataFrame(columns)
+
+
+def resku_sheet(rows: int, seed: int = 0, sku_prefix: str = "RS") -> pd.DataFrame:
+    rng = random.Random(seed)
+    data = _common_rows(rng, rows, sku_prefix)
+    columns = _rtg_style_columns(data)
+    columns["Region"] = [rng.choice(REGIONS) for _ in range(rows)]
+    return pd.DataFrame(columns)
+
+
+def add_unmapped_columns(df: pd.DataFrame, count: int, seed: int = 0) -> pd.DataFrame:
+    """Pad a sheet with vendor columns no importer maps, as real vendor workbooks have"""
+    rng = random.Random(seed)
+    extra = {
+        f"Vendor Field {i + 1}": [str(rng.randint(0, 99999)) for _ in range(len(df))]
+        for i in range(count)
+    }
+    return pd.concat([df, pd.DataFrame(extra, index=df.index)], axis=1)
+
+
+SHEET_BUILDERS: Dict[str, Callable[..., pd.DataFrame]] = {
+    "dropship": dropship_sheet,
+    "rtg_delivered": rtg_delivered_sheet,
+    "resku": resku_sheet,
+}
+
+
+def write_sheet(df: pd.DataFrame, path: Path) -> Path:
+    """Write a sheet as .csv or .xlsx (by suffix), the formats the importers read"""
+    if path.suffix.lower() == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        df.to_excel(path, index=False, engine="openpyxl")
+    return path
@@ -3,6 +3,7 @@
 import click
 import json
 import os
+import time
 from pathlib import Path
 from rich.console import Console
 from rich.table import Table
@@ -17,7 +18,9 @@ from ecatalog_client import (
     SwapRoomItemsRequest,
     RoomItem,
     OAuthConfig,
+    TransportConfig,
 )
+from workflows.payload_export import EXPORT_FORMATS, EXPORT_NDJSON
 
 console = Console()
 
@@ -25,7 +28,8 @@ console = Console()
 load_dotenv()
 
 
-def create_authenticated_client(api_url: str, manual_auth: bool = False, force_auth: bool = False) -> ECatalogAPIClient:
+def create_authenticated_client(api_url: str, manual_auth: bool = False, force_auth: bool = False,
+                                transport: TransportConfig = None) -> ECatalogAPIClient:
     """Create an authenticated eCatalog API client using M2M OAuth"""
     # Get OAuth credentials from environment
     oauth_token_url = os.getenv("OAUTH_TOKEN_URL", "http://127.0.0.1:8010/token")
@@ -45,7 +49,7 @@ def create_authenticated_client(api_url: str, manual_auth: bool = False, force_a
         use_pkce=False,
     )
 
-    client = ECatalogAPIClient(api_url, oauth_config=oauth_config)
+    client = ECatalogAPIClient(api_url, oauth_config=oauth_config, transport=transport)
 
     try:
         console.print("[yellow]Authenticating with M2M OAuth...[/yellow]")
@@ -76,28 +80,131 @@ def create_authenticated_client(api_url: str, manual_auth: bool = False, force_a
 @click.option(
     "--force-auth", is_flag=True, help="Force re-authentication (ignore cached tokens)"
 )
+@click.option(
+    "--timeout", type=float, default=60.0, show_default=True, help="Read timeout in seconds for API requests"
+)
+@click.option(
+    "--max-retries", type=int, default=3, show_default=True, help="Retries for transient failures (429/5xx, dropped connections)"
+)
+@click.option(
+    "--pool-size", type=int, default=20, show_default=True, help="Max keep-alive connections per host"
+)
 @click.pass_context
-def main(ctx, api_url, no_auth, manual_auth, force_auth):
+def main(ctx, api_url, no_auth, manual_auth, force_auth, timeout, max_retries, pool_size):
     """eCatalog CLI - Workflow tool for eCatalog API operations"""
     ctx.ensure_object(dict)
 
+    transport = TransportConfig(
+        read_timeout=timeout,
+        max_retries=max_retries,
+        pool_maxsize=pool_size,
+    )
+
     if no_auth:
         # For testing/development - skip OAuth
-        ctx.obj["client"] = ECatalogAPIClient(api_url)
+        ctx.obj["client"] = ECatalogAPIClient(api_url, transport=transport)
     else:
         # Production - use OAuth authentication
-        ctx.obj["client"] = create_authenticated_client(api_url, manual_auth=manual_auth, force_auth=force_auth)
+        ctx.obj["client"] = create_authenticated_client(
+            api_url, manual_auth=manual_auth, force_auth=force_auth, transport=transport
+        )
 
     ctx.obj["api_url"] = api_url
 
 
+LOOKUP_FIELDS = ["sku", "exists", "type", "site", "divisions", "error"]
+
+
+def _lookup_record(sku, result, error) -> dict:
+    """Flatten a lookup_skus() result into a CSV/JSON record"""
+    return {
+        "sku": sku,
+        "exists": bool(result and result.exists),
+        "type": result.type if result else "",
+        "site": result.site if result else "",
+        "divisions": json.dumps(result.divisions) if result else "",
+        "error": str(error) if error else "",
+    }
+
+
+def _bulk_lookup(client, sku_file: str, output: str, output_format: str, concurrency: int):
+    """Look up every SKU in a file, streaming results to CSV/JSON as they arrive"""
+    import csv
+    import sys
+
+    with open(sku_file, "r", encoding="utf-8") as f:
+        skus = [line.split(",")[0].strip() for line in f if line.strip() and not line.startswith("#")]
+
+    output_format = output_format or ("json" if output and output.lower().endswith(".json") else "csv")
+    out = open(output, "w", newline="", encoding="utf-8") if output else sys.stdout
+    counts = {"found": 0, "not found": 0, "error": 0}
+    not_found = []
+
+    try:
+        if output_format == "csv":
+            writer = csv.DictWriter(out, fieldnames=LOOKUP_FIELDS)
+            writer.writeheader()
+        else:
+            out.write("[\n")
+
+        for i, (sku, result, error) in enumerate(client.lookup_skus(skus, concurrency=concurrency)):
+            record = _lookup_record(sku, result, error)
+            if error:
+                counts["error"] += 1
+            elif record["exists"]:
+                counts["found"] += 1
+            else:
+                counts["not found"] += 1
+                not_found.append(sku)
+
+            if output_format == "csv":
+                writer.writerow(record)
+            else:
+                out.write((",\n" if i else "") + "  " + json.dumps(record))
+            out.flush()
+
+        if output_format == "json":
+            out.write("\n]\n")
+    finally:
+        if output:
+            out.close()
+
+    # Keep stdout clean for piping when results go there
+    summary_console = console if output else Console(stderr=True)
+    total = sum(counts.values())
+    summary_console.print(
+        f"\n[bold]Looked up {total} unique SKUs[/bold] ({len(skus) - total} duplicates skipped): "
+        f"[green]{counts['found']} found[/green], [yellow]{counts['not found']} not found[/yellow], "
+        f"[red]{counts['error']} errors[/red]"
+    )
+    if output:
+        summary_console.print(f"[green]Results written to:[/green] {output}")
+    if not_found:
+        preview = ", ".join(not_found[:20]) + (" ..." if len(not_found) > 20 else "")
+        summary_console.print(f"[yellow]Not found:[/yellow] {preview}")
+
+
 @main.command()
-@click.argument("sku")
+@click.argument("sku", required=False)
+@click.option("--file", "sku_file", type=click.Path(exists=True, dir_okay=False), help="File with one SKU per line (bulk lookup)")
+@click.option("--output", "-o", type=click.Path(dir_okay=False), help="Write bulk results to this file (default: stdout)")
+@click.option("--format", "output_format", type=click.Choice(["csv", "json"]), help="Bulk output format (default: from --output extension, else csv)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=8, show_default=True, help="Parallel lookups for --file")
 @click.pass_context
-def lookup(ctx, sku):
-    """Look up a SKU to check its type and availability"""
+def lookup(ctx, sku, sku_file, output, output_format, concurrency):
+    """Look up a SKU (or a file of SKUs) to check type and availability"""
     client = ctx.obj["client"]
 
+    if sku_file:
+        try:
+            _bulk_lookup(client, sku_file, output, output_format, concurrency)
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+        return
+
+    if not sku:
+        raise click.UsageError("Provide a SKU or --file")
+
     try:
         result = client.lookup_sku(sku)
         if result:
@@ -585,7 +692,7 @@ def workflow():
 @click.pass_context
 def import_items(ctx, file_path, sheet_name, execute):
     """Import items from spreadsheet file (generic format)"""
-    from workflows.import_items import ItemImporter
+    from workflows.import_items_with_auth import ItemImporter
     import pandas as pd
     from pathlib import Path
 
@@ -615,10 +722,49 @@ def import_items(ctx, file_path, sheet_name, execute):
 @click.option(
     "--execute", is_flag=True, help="Actually create items (default is dry-run)"
 )
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
 @click.pass_context
-def import_resku_items(ctx, file_path, sheet_name, limit, preview_mapping, execute):
+def import_resku_items(
+    ctx, file_path, sheet_name, limit, preview_mapping, execute, concurrency, resume, skip_existing,
+    incremental, workers, quiet, report_file,
+):
     """Import items from resku spreadsheet format"""
-    from workflows.import_resku_items import ReskuItemImporter
+    from workflows.import_items import ReskuItemImporter
     from pathlib import Path
 
     client = ctx.obj["client"]
@@ -639,12 +785,27 @@ def import_resku_items(ctx, file_path, sheet_name, limit, preview_mapping, execu
     if limit:
         console.print(f"[blue]Testing mode: Processing only first {limit} rows[/blue]")
 
-    stats = importer.import_from_spreadsheet(file_path, sheet_name, dry_run, limit)
+    precheck = importer.precheck_skus(file_path, sheet_name, limit) if skip_existing else None
+
+    stats = importer.import_from_spreadsheet(
+        file_path, sheet_name, dry_run, limit, concurrency=concurrency, resume=resume, precheck=precheck,
+        incremental=incremental, workers=workers, quiet=quiet or report_file is not None,
+        report_file=report_file,
+    )
 
     console.print(f"\n[bold]Results:[/bold]")
     console.print(f"Processed: {stats['processed']}")
     console.print(f"{'Would create' if dry_run else 'Created'}: {stats['created']}")
     console.print(f"Failed: {stats['failed']}")
+    if stats.get("resumed"):
+        console.print(f"Already created (resumed): {stats['resumed']}")
+    if precheck is not None:
+        console.print(f"Already in eCatalog: {stats['exists']}")
+        console.print(f"Exists on another site: {stats['site_conflicts']}")
+    if incremental:
+        console.print(f"{'Would update' if dry_run else 'Updated'}: {stats['updated']}")
+        console.print(f"Unchanged since last import: {stats['unchanged']}")
+        console.print(f"Changes that need a manual edit: {stats['not_updatable']}")
 
 
 @workflow.command()
@@ -667,8 +828,61 @@ def sku_substitution(ctx):
 @workflow.command()
 @click.argument("file_path", type=click.Path(path_type=Path), required=False)
 @click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=200,
+    show_default=True,
+    help="Work requests per processing request",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
+@click.option(
+    "--export-format",
+    type=click.Choice(EXPORT_FORMATS),
+    default=EXPORT_NDJSON,
+    show_default=True,
+    help="How the dry run exports payloads: one compressed NDJSON file per run, or a JSON file per item",
+)
 @click.pass_context
-def dropship(ctx, file_path, sheet_name):
+def dropship(
+    ctx, file_path, sheet_name, concurrency, chunk_size, resume, skip_existing, incremental, workers, quiet,
+    report_file, export_format,
+):
     """End-to-end workflow for dropship items"""
     from workflows.dropship_workflow import DropshipWorkflow
     from pathlib import Path
@@ -721,8 +935,13 @@ def dropship(ctx, file_path, sheet_name):
         return
 
     # Run the workflow
-    workflow = DropshipWorkflow(client)
-    success = workflow.run_end_to_end_workflow(file_path, sheet_name)
+    workflow = DropshipWorkflow(
+        client, concurrency=concurrency, chunk_size=chunk_size, workers=workers,
+        quiet=quiet or report_file is not None, report_file=report_file, export_format=export_format,
+    )
+    success = workflow.run_end_to_end_workflow(
+        file_path, sheet_name, resume=resume, skip_existing=skip_existing, incremental=incremental
+    )
 
     if success:
         console.print("\n[green]✅ Workflow completed successfully![/green]")
@@ -733,8 +952,15 @@ def dropship(ctx, file_path, sheet_name):
 @workflow.command()
 @click.argument("file_path", type=click.Path(path_type=Path), required=False)
 @click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.option(
+    "--export-format",
+    type=click.Choice(EXPORT_FORMATS),
+    default=EXPORT_NDJSON,
+    show_default=True,
+    help="How swaps are exported: one compressed NDJSON file per run, or a JSON file per swap",
+)
 @click.pass_context
-def room_item_swap(ctx, file_path, sheet_name):
+def room_item_swap(ctx, file_path, sheet_name, export_format):
     """End-to-end workflow for room item swaps"""
     from workflows.room_item_swap_workflow import RoomItemSwapWorkflow
     from pathlib import Path
@@ -787,7 +1013,7 @@ def room_item_swap(ctx, file_path, sheet_name):
         return
 
     # Run the workflow
-    workflow = RoomItemSwapWorkflow(client)
+    workflow = RoomItemSwapWorkflow(client, export_format=export_format)
     success = workflow.run_end_to_end_workflow(file_path, sheet_name)
 
     if success:
@@ -799,8 +1025,61 @@ def room_item_swap(ctx, file_path, sheet_name):
 @workflow.command()
 @click.argument("file_path", type=click.Path(path_type=Path), required=False)
 @click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--chunk-size",
+    type=click.IntRange(min=1),
+    default=200,
+    show_default=True,
+    help="Work requests per processing request",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
+@click.option(
+    "--export-format",
+    type=click.Choice(EXPORT_FORMATS),
+    default=EXPORT_NDJSON,
+    show_default=True,
+    help="How the dry run exports payloads: one compressed NDJSON file per run, or a JSON file per item",
+)
 @click.pass_context
-def rtg_delivered(ctx, file_path, sheet_name):
+def rtg_delivered(
+    ctx, file_path, sheet_name, concurrency, chunk_size, resume, skip_existing, incremental, workers, quiet,
+    report_file, export_format,
+):
     """End-to-end workflow for RTG delivered products"""
     from workflows.rtg_delivered_workflow import RtgDeliveredWorkflow
     from pathlib import Path
@@ -853,8 +1132,13 @@ def rtg_delivered(ctx, file_path, sheet_name):
         return
 
     # Run the workflow
-    workflow = RtgDeliveredWorkflow(client)
-    success = workflow.run_end_to_end_workflow(file_path, sheet_name)
+    workflow = RtgDeliveredWorkflow(
+        client, concurrency=concurrency, chunk_size=chunk_size, workers=workers,
+        quiet=quiet or report_file is not None, report_file=report_file, export_format=export_format,
+    )
+    success = workflow.run_end_to_end_workflow(
+        file_path, sheet_name, resume=resume, skip_existing=skip_existing, incremental=incremental
+    )
 
     if success:
         console.print("\n[green]✅ Workflow completed successfully![/green]")
@@ -862,6 +1146,63 @@ def rtg_delivered(ctx, file_path, sheet_name):
         console.print("\n[red]❌ Workflow completed with issues or was cancelled.[/red]")
 
 
+SYNC_LAYOUTS = {
+    "dropship": ("workflows.import_dropship_items", "DropshipItemImporter"),
+    "rtg-delivered": ("workflows.import_rtg_delivered_items", "RtgDeliveredItemImporter"),
+    "resku": ("workflows.import_items", "ReskuItemImporter"),
+}
+
+
+@workflow.command()
+@click.argument("file_path", type=click.Path(exists=True, path_type=Path))
+@click.option("--layout", type=click.Choice(sorted(SYNC_LAYOUTS)), required=True, help="Spreadsheet layout (which importer's mapping to use)")
+@click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.option("--limit", type=int, help="Limit to first N rows for testing")
+@click.option("--execute", is_flag=True, help="Send the PATCH requests (default: report only)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=16, show_default=True, help="Items fetched / updated in parallel")
+@click.option("--report", "report_path", type=click.Path(dir_okay=False, path_type=Path), help="Write every differing field to this CSV file")
+@click.option("--chunk-size", type=click.IntRange(min=1), default=200, show_default=True, help="Work requests per processing request")
+@click.pass_context
+def sync(ctx, file_path, layout, sheet_name, limit, execute, concurrency, report_path, chunk_size):
+    """Update live items to match a spreadsheet, sending only changed fields"""
+    import importlib
+    from workflows.item_sync import ItemSync
+    from workflows.workrequest_batches import process_in_chunks
+
+    client = ctx.obj["client"]
+    module_name, class_name = SYNC_LAYOUTS[layout]
+    importer = getattr(importlib.import_module(module_name), class_name)(client)
+
+    dry_run = not execute
+    if dry_run:
+        console.print("[yellow]DRY RUN MODE - Use --execute to send the updates[/yellow]")
+
+    stats = ItemSync(client, importer, concurrency=concurrency).run(
+        file_path, sheet_name, dry_run=dry_run, report_path=report_path, limit=limit
+    )
+
+    console.print("\n[bold]Results:[/bold]")
+    console.print(f"Processed: {stats['processed']}")
+    if stats["skipped"]:
+        console.print(f"Skipped (no {importer.FILTER_LABEL}): {stats['skipped']}")
+    console.print(f"Already in sync: {stats['in_sync']}")
+    console.print(f"{'Would update' if dry_run else 'Updated'}: {stats['patched']}")
+    console.print(f"Differences that need a manual edit only: {stats['manual']}")
+    console.print(f"Not in eCatalog: {stats['missing']}")
+    console.print(f"Failed: {stats['failed'] + stats['errors'] + stats['patch_failed']}")
+    if report_path:
+        console.print(f"[green]Diff report written to:[/green] {report_path}")
+
+    workrequest_ids = stats["workrequest_ids"]
+    if workrequest_ids:
+        console.print(f"\n[blue]Processing {len(workrequest_ids)} work request(s)...[/blue]")
+        summary = process_in_chunks(client, workrequest_ids, chunk_size=chunk_size)
+        console.print(
+            f"[green]{len(summary['accepted'])} accepted[/green], "
+            f"[red]{len(summary['failed'])} failed[/red] in {summary['chunks']} chunk(s)"
+        )
+
+
 @workflow.command()
 @click.argument("file_path", type=click.Path(path_type=Path), required=False)
 @click.option("--sheet-name", help="Excel sheet name (if applicable)")
@@ -926,49 +1267,52 @@ def sku_substitution(ctx, file_path, sheet_name):
         console.print("\n[red]❌ Workflow completed with issues or was cancelled.[/red]")
 
 
+def _json_dirs(workflow: str) -> dict:
+    """Payload export directory of each workflow (or just the one selected)"""
+    from workflows.payload_export import export_dir
+
+    json_dirs = {
+        "dropship": export_dir("dropship"),
+        "rtg-delivered": export_dir("rtg_delivered"),
+        "room-item-swap": export_dir("room_item_swap"),
+        "sku-substitution": export_dir("sku_substitution")
+    }
+    if workflow != "all":
+        json_dirs = {workflow: json_dirs[workflow]}
+    return json_dirs
+
+
 @main.command()
 @click.option("--workflow", type=click.Choice(["dropship", "rtg-delivered", "room-item-swap", "sku-substitution", "all"]), default="all", help="Specific workflow to clean (default: all)")
 @click.option("--confirm", is_flag=True, help="Skip confirmation prompt")
 @click.pass_context
 def clean(ctx, workflow, confirm):
-    """Clean JSON files from workflow directories"""
-    from pathlib import Path
+    """Clean exported JSON payloads from workflow directories"""
     from rich.prompt import Confirm
+    from workflows.payload_export import find_exports, index_path
 
-    project_root = Path.cwd()
-
-    # Define workflow directories
-    workflows_to_clean = {
-        "dropship": project_root / "data" / "dropship" / "json",
-        "rtg-delivered": project_root / "data" / "rtg_delivered" / "json",
-        "room-item-swap": project_root / "data" / "room_item_swap" / "json",
-        "sku-substitution": project_root / "data" / "sku_substitution" / "json"
-    }
-
-    # Filter based on selection
-    if workflow != "all":
-        workflows_to_clean = {workflow: workflows_to_clean[workflow]}
+    workflows_to_clean = _json_dirs(workflow)
 
-    # Count files to delete
-    total_files = 0
-    file_counts = {}
+    # Per-item JSON files and batched NDJSON exports (each removed with its index)
+    to_delete = {}
     for name, json_dir in workflows_to_clean.items():
         if json_dir.exists():
-            json_files = list(json_dir.glob("*.json"))
-            file_counts[name] = len(json_files)
-            total_files += len(json_files)
+            to_delete[name] = (list(json_dir.glob("*.json")), find_exports(json_dir))
         else:
-            file_counts[name] = 0
+            to_delete[name] = ([], [])
 
+    total_files = sum(len(json_files) + len(exports) for json_files, exports in to_delete.values())
     if total_files == 0:
         console.print("[yellow]No JSON files found to clean[/yellow]")
         return
 
     # Display what will be deleted
     console.print(f"[bold]Files to be deleted:[/bold]")
-    for name, count in file_counts.items():
-        if count > 0:
-            console.print(f"  {name}: [cyan]{count}[/cyan] JSON files")
+    for name, (json_files, exports) in to_delete.items():
+        if json_files:
+            console.print(f"  {name}: [cyan]{len(json_files)}[/cyan] JSON files")
+        if exports:
+            console.print(f"  {name}: [cyan]{len(exports)}[/cyan] NDJSON exports")
     console.print(f"\n[bold]Total: [cyan]{total_files}[/cyan] files[/bold]")
 
     # Confirm deletion
@@ -979,17 +1323,240 @@ def clean(ctx, workflow, confirm):
 
     # Delete files
     deleted_count = 0
-    for name, json_dir in workflows_to_clean.items():
-        if json_dir.exists():
-            json_files = list(json_dir.glob("*.json"))
-            for json_file in json_files:
-                try:
-                    json_file.unlink()
-                    deleted_count += 1
-                except Exception as e:
-                    console.print(f"[red]Error deleting {json_file.name}: {e}[/red]")
+    for name, (json_files, exports) in to_delete.items():
+        for export in exports:
+            try:
+                index_path(export).unlink(missing_ok=True)
+                export.unlink()
+                deleted_count += 1
+            except Exception as e:
+                console.print(f"[red]Error deleting {export.name}: {e}[/red]")
+        for json_file in json_files:
+            try:
+                json_file.unlink()
+                deleted_count += 1
+            except Exception as e:
+                console.print(f"[red]Error deleting {json_file.name}: {e}[/red]")
 
-    console.print(f"[green]✅ Successfully deleted {deleted_count} JSON files[/green]")
+    console.print(f"[green]✅ Successfully deleted {deleted_count} files[/green]")
+
+
+@main.group()
+def exports():
+    """Exported payload commands"""
+    pass
+
+
+@exports.command("list")
+@click.option("--workflow", type=click.Choice(["dropship", "rtg-delivered", "room-item-swap", "sku-substitution", "all"]), default="all", help="Specific workflow to list (default: all)")
+@click.pass_context
+def list_exports(ctx, workflow):
+    """List the NDJSON payload exports of each workflow, newest first"""
+    from workflows.payload_export import PayloadExportReader, find_exports
+
+    table = Table(title="Payload Exports")
+    table.add_column("Workflow", style="cyan")
+    table.add_column("File", style="white")
+    table.add_column("Payloads", justify="right")
+    table.add_column("Size", justify="right")
+
+    for name, json_dir in _json_dirs(workflow).items():
+        for export in find_exports(json_dir):
+            try:
+                count = f"{len(PayloadExportReader(export)):,}"
+            except (OSError, ValueError, KeyError):
+                count = "[yellow]no index[/yellow]"
+            table.add_row(name, export.name, count, f"{export.stat().st_size / 1024:,.1f} KB")
+
+    if table.row_count == 0:
+        console.print("[yellow]No NDJSON exports found[/yellow]")
+        return
+    console.print(table)
+
+
+@exports.command("lookup")
+@click.argument("key")
+@click.option("--workflow", type=click.Choice(["dropship", "rtg-delivered", "room-item-swap", "sku-substitution", "all"]), default="all", help="Specific workflow to search (default: all)")
+@click.option("--file", "export_file", type=click.Path(exists=True, dir_okay=False, path_type=Path), help="Search this export only")
+@click.pass_context
+def lookup_export(ctx, key, workflow, export_file):
+    """Show the exported payload of a SKU (or room SKU) from the newest export that has it"""
+    from workflows.payload_export import PayloadExportReader, find_exports
+
+    if export_file:
+        candidates = [export_file]
+    else:
+        candidates = [export for json_dir in _json_dirs(workflow).values() for export in find_exports(json_dir)]
+
+    for export in candidates:
+        reader = PayloadExportReader(export)
+        try:
+            if key not in reader:
+                continue
+            payloads = reader.get(key)
+        except (OSError, ValueError, KeyError) as e:
+            console.print(f"[yellow]Skipping {reader.path.name}: {e}[/yellow]")
+            continue
+
+        console.print(f"[dim]{reader.path}[/dim]")
+        for payload in payloads:
+            console.print(JSON(json.dumps(payload, default=str)))
+        return
+
+    console.print(f"[yellow]{key} not found in any export[/yellow]")
+    ctx.exit(1)
+
+
+@main.group()
+def logs():
+    """Workflow log commands"""
+    pass
+
+
+@logs.command("export")
+@click.option("--workflow", type=click.Choice(["dropship", "rtg-delivered", "room-item-swap", "sku-substitution", "all"]), default="all", help="Specific workflow to export (default: all)")
+@click.option("--date", help="Log date as YYYY-MM-DD (default: today)")
+@click.pass_context
+def export_logs(ctx, workflow, date):
+    """Write the Excel workflow log from the append-only log"""
+    from pathlib import Path
+    from workflows.workflow_logger import WorkflowLogger
+    from workflows.sku_substitution_file_workflow import SUBSTITUTION_LOG_COLUMNS
+
+    project_root = Path.cwd()
+
+    # Define workflow loggers (name, data directory, columns)
+    workflow_logs = {
+        "dropship": ("dropship", "dropship", None),
+        "rtg-delivered": ("rtg_delivered", "rtg_delivered", None),
+        "room-item-swap": ("room_item_swap", "room_item_swap", None),
+        "sku-substitution": ("sku_substitution", "sku_substitution", SUBSTITUTION_LOG_COLUMNS),
+    }
+
+    # Filter based on selection
+    if workflow != "all":
+        workflow_logs = {workflow: workflow_logs[workflow]}
+
+    exported = 0
+    for name, (logger_name, data_dir, columns) in workflow_logs.items():
+        logs_dir = project_root / "data" / data_dir / "logs"
+        if not logs_dir.exists():
+            continue
+
+        log_path = WorkflowLogger(logger_name, logs_dir, columns=columns).export_excel(date)
+        if log_path:
+            console.print(f"[green]✅ {name}:[/green] {log_path}")
+            exported += 1
+
+    if exported == 0:
+        console.print(f"[yellow]No log entries found for {date or 'today'}[/yellow]")
+
+
+@main.group()
+def categories():
+    """Category index commands"""
+    pass
+
+
+@categories.command("refresh")
+@click.argument("export_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.pass_context
+def refresh_categories(ctx, export_file, sheet_name):
+    """Rebuild the category index from a category export (CSV/Excel with site and category columns)"""
+    from workflows.category_index import CategoryIndex, index_path
+
+    try:
+        index = CategoryIndex.from_export(export_file, sheet_name)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        ctx.exit(1)
+
+    path = index.save(index_path())
+    counts = ", ".join(f"{site}: {len(site_index.paths)}" for site, site_index in sorted(index.sites.items()))
+    console.print(f"[green]✅ {len(index)} categories ({counts})[/green] → {path}")
+
+
+@categories.command("check")
+@click.argument("category")
+@click.option("--site", required=True, help="Site (e.g., RTG, KTG, OTG)")
+@click.pass_context
+def check_category(ctx, category, site):
+    """Look up a category in the index and show the closest matches"""
+    from workflows.category_index import load_category_index, index_path
+
+    index = load_category_index()
+    if index is None:
+        console.print(f"[red]No category index at {index_path()} - run 'categories refresh' first[/red]")
+        ctx.exit(1)
+    if not index.has_site(site):
+        console.print(f"[yellow]No categories for site {site.upper()} in the index[/yellow]")
+        ctx.exit(1)
+
+    resolved, _ = index.resolve(category, site)
+    if resolved:
+        console.print(f"[green]✓ {resolved}[/green]")
+    else:
+        console.print(f"[red]✗ '{category}' is not a {site.upper()} category[/red]")
+
+    table = Table(title="Closest categories")
+    table.add_column("Category", style="cyan")
+    table.add_column("Score", justify="right")
+    for path, score in index.suggest(category, site, limit=5):
+        table.add_row(path, f"{score:.2f}")
+    console.print(table)
+    ctx.exit(0 if resolved else 1)
+
+
+@main.group()
+def attributes():
+    """Attribute vocabulary commands"""
+    pass
+
+
+@attributes.command("refresh")
+@click.argument("export_file", type=click.Path(exists=True, dir_okay=False, path_type=Path))
+@click.option("--sheet-name", help="Excel sheet name (if applicable)")
+@click.pass_context
+def refresh_attributes(ctx, export_file, sheet_name):
+    """Rebuild the attribute vocabulary from an export (CSV/Excel with site, attribute and value columns)"""
+    from workflows.attribute_vocabulary import AttributeVocabulary, vocabulary_path
+
+    try:
+        vocabulary = AttributeVocabulary.from_export(export_file, sheet_name)
+    except ValueError as e:
+        console.print(f"[red]{e}[/red]")
+        ctx.exit(1)
+
+    path = vocabulary.save(vocabulary_path())
+    counts = ", ".join(f"{site}: {sum(len(v) for v in attrs.values())}" for site, attrs in sorted(vocabulary.values.items()))
+    console.print(f"[green]✅ {len(vocabulary)} attribute values ({counts})[/green] → {path}")
+
+
+@attributes.command("check")
+@click.argument("attribute")
+@click.argument("values", nargs=-1, required=True)
+@click.option("--site", required=True, help="Site (e.g., RTG, KTG, OTG)")
+@click.pass_context
+def check_attributes(ctx, attribute, values, site):
+    """Check attribute values against the vocabulary (e.g. attributes check Size "King Sham" --site RTG)"""
+    from workflows.attribute_vocabulary import load_attribute_vocabulary, vocabulary_path
+
+    vocabulary = load_attribute_vocabulary()
+    if vocabulary is None:
+        console.print(f"[red]No attribute vocabulary at {vocabulary_path()} - run 'attributes refresh' first[/red]")
+        ctx.exit(1)
+    if vocabulary.allowed(site, attribute) is None:
+        console.print(f"[yellow]No {attribute} values for site {site.upper()} in the vocabulary[/yellow]")
+        ctx.exit(1)
+
+    unknown = vocabulary.unknown_values(site, attribute, values)
+    for value in values:
+        if value in unknown:
+            console.print(f"[red]✗ {value}[/red]")
+        else:
+            console.print(f"[green]✓ {value}[/green]")
+    ctx.exit(1 if unknown else 0)
 
 
 @main.command()
@@ -1000,7 +1567,7 @@ def status(ctx):
     api_url = ctx.obj["api_url"]
 
     try:
-        response = client.session.get(f"{api_url}/")
+        response = client.session.get(f"{api_url}/", timeout=client.transport.timeout)
         if response.status_code == 200:
             console.print(f"[green]✓ API server is running at {api_url}[/green]")
         else:
@@ -1081,41 +1648,84 @@ def list_workrequests(ctx, status, route_name):
         console.print(f"[red]Error:[/red] {e}")
 
 
+@workrequest.command()
+@click.argument("workrequest_ids", nargs=-1, type=int, required=True)
+@click.option("--interval", type=float, default=2.0, show_default=True, help="Initial seconds between polls")
+@click.option("--max-interval", type=float, default=60.0, show_default=True, help="Longest wait between polls while nothing changes")
+@click.option("--timeout", type=float, help="Give up after this many seconds (default: wait until all finish)")
+@click.option("--concurrency", type=click.IntRange(min=1), default=8, show_default=True, help="Parallel status requests")
+@click.pass_context
+def watch(ctx, workrequest_ids, interval, max_interval, timeout, concurrency):
+    """Wait for work requests to finish, reporting failures as they appear
+
+    Exits 0 when all completed, 1 if any failed, 2 if the timeout was reached.
+    """
+    from workflows.workrequest_status import WorkRequestWatcher
+
+    client = ctx.obj["client"]
+    watcher = WorkRequestWatcher(
+        client, workrequest_ids, concurrency=concurrency, min_interval=interval, max_interval=max_interval
+    )
+    total = len(watcher.states)
+    console.print(f"[yellow]Watching {total} work request(s)...[/yellow]")
+
+    def report(watcher, finished):
+        for wr in finished:
+            if str(wr.get('status', '')).upper() == "FAILED":
+                console.print(f"[red]❌ Work request {wr.get('id')} failed:[/red] {wr.get('error_message') or 'no error message'}")
+
+        counts = watcher.counts()
+        eta = watcher.eta_seconds()
+        eta_text = f"ETA {int(eta // 60)}m{int(eta % 60):02d}s" if eta is not None else "ETA --"
+        console.print(
+            f"[dim]{time.strftime('%H:%M:%S')}[/dim] {watcher.done_count}/{total} done - "
+            f"[green]{counts['COMPLETED']} completed[/green], [red]{counts['FAILED']} failed[/red], "
+            f"{counts['RUNNING']} running, {counts['PENDING']} pending - "
+            f"{watcher.throughput():.1f}/min, {eta_text}"
+        )
+
+    try:
+        counts = watcher.watch(timeout=timeout, on_poll=report)
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped watching[/yellow]")
+        ctx.exit(130)
+
+    if watcher.open_ids:
+        console.print(f"[yellow]⏱️  Timed out with {len(watcher.open_ids)} work request(s) still open[/yellow]")
+        ctx.exit(2)
+    if counts["FAILED"]:
+        console.print(f"[red]⚠️  {counts['FAILED']} of {total} work request(s) failed[/red]")
+        ctx.exit(1)
+    console.print(f"[green]✅ All {total} work request(s) completed[/green]")
+
+
 @workrequest.command()
 @click.argument("workrequest_id", type=int)
 @click.argument("additional_ids", nargs=-1, type=int)
+@click.option("--chunk-size", type=click.IntRange(min=1), default=200, show_default=True, help="Work requests per processing request")
 @click.pass_context
-def process(ctx, workrequest_id, additional_ids):
+def process(ctx, workrequest_id, additional_ids, chunk_size):
     """Process one or more work requests by ID"""
+    from workflows.workrequest_batches import process_in_chunks
+
     client = ctx.obj["client"]
 
-    try:
-        # Combine all work request IDs into a single list
-        workrequest_ids = [workrequest_id] + list(additional_ids)
-        console.print(f"[yellow]Processing work request(s): {', '.join(map(str, workrequest_ids))}[/yellow]")
-        result = client.process_workrequests(workrequest_ids)
+    workrequest_ids = [workrequest_id] + list(additional_ids)
+    console.print(f"[yellow]Processing {len(workrequest_ids)} work request(s)...[/yellow]")
 
-        if result:
-            console.print("[green]✅ Work request processing initiated[/green]")
-            if result.get('message'):
-                console.print(f"Message: {result['message']}")
+    def report(number, chunk, error, attempts):
+        if error:
+            console.print(f"[red]❌ Chunk {number} ({len(chunk)} work requests) failed: {error}[/red]")
 
-            # Debug: print result type and content
-            console.print(f"[blue]Result type: {type(result)}[/blue]")
-            console.print(f"[blue]Result content: {result}[/blue]")
-
-            try:
-                console.print(JSON(json.dumps(result, indent=2)))
-            except Exception as json_error:
-                console.print(f"[yellow]Could not format as JSON: {json_error}[/yellow]")
-                console.print(f"Raw result: {result}")
-        else:
-            console.print("[red]Failed to process work requests[/red]")
-    except Exception as e:
-        console.print(f"[red]Error:[/red] {e}")
-        import traceback
-        console.print(f"[red]Traceback:[/red]")
-        console.print(traceback.format_exc())
+    summary = process_in_chunks(client, workrequest_ids, chunk_size=chunk_size, on_chunk=report)
+    console.print(
+        f"[green]{len(summary['accepted'])} accepted[/green], "
+        f"[red]{len(summary['failed'])} failed[/red] in {summary['chunks']} chunk(s)"
+    )
+    if summary["failed"]:
+        console.print(f"[dim]Failed: {' '.join(map(str, summary['failed']))}[/dim]")
+        ctx.exit(1)
+    console.print("[green]✅ Work request processing initiated[/green]")
 
 
 @workrequest.command()
@@ -0,0 +1,456 @@
+"""
+Asyncio client for the eCatalog API.
+
+AsyncECatalogAPIClient mirrors every endpoint of ECatalogAPIClient, using the same
+Pydantic models, OAuth token cache and TransportConfig, but runs on httpx so an import
+job can keep many requests in flight. A semaphore bounds the number of concurrent
+requests (``max_concurrency``) regardless of how many coroutines are scheduled.
+
+Requires the optional ``httpx`` dependency:
+
+    uv sync --extra async
+
+Interactive browser (PKCE) authentication is only available on the sync client; obtain
+a token there and pass it as ``access_token``, or use ``authenticate_m2m``.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import httpx
+except ImportError:  # Optional dependency
+    httpx = None
+
+from ecatalog_client import (
+    Item,
+    ItemNew,
+    ItemPartialUpdate,
+    ItemDeleteRequest,
+    Room,
+    SwapRoomItemsRequest,
+    SkuLookupResponse,
+    SkuSubstitutionRequest,
+    OAuthConfig,
+    TokenResponse,
+    TokenCacheMixin,
+    TransportConfig,
+)
+
+
+class AsyncECatalogAPIClient(TokenCacheMixin):
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:8000",
+        access_token: Optional[str] = None,
+        oauth_config: Optional[OAuthConfig] = None,
+        transport: Optional[TransportConfig] = None,
+        max_concurrency: int = 20,
+    ):
+        if httpx is None:
+            raise ImportError(
+                "AsyncECatalogAPIClient requires httpx - install it with `uv sync --extra async`"
+            )
+
+        self.base_url = base_url.rstrip('/')
+        self.transport = transport or TransportConfig()
+        self.max_concurrency = max_concurrency
+
+        self.session = httpx.AsyncClient(
+            headers={
+                'Content-Type': 'application/json',
+                'Accept': 'application/json'
+            },
+            timeout=httpx.Timeout(self.transport.read_timeout, connect=self.transport.connect_timeout),
+            limits=httpx.Limits(
+                max_connections=max(self.transport.pool_maxsize, max_concurrency),
+                max_keepalive_connections=self.transport.pool_maxsize,
+            ),
+        )
+        # Created on first use: on Python < 3.10 asyncio primitives bind to the event loop
+        # current when they are built, which isn't the one the client will run on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._token_lock: Optional[asyncio.Lock] = None
+
+        # OAuth configuration
+        self.oauth_config = oauth_config
+        self.current_token: Optional[TokenResponse] = None
+        self.token_expires_at: Optional[datetime] = None
+
+        # Set initial token if provided
+        if access_token:
+            self.set_access_token(access_token)
+
+        logging.basicConfig(level=logging.INFO)
+        self.logger = logging.getLogger(__name__)
+
+        # Token storage (shared with the sync client)
+        self.token_cache_dir = Path.home() / ".ecatalog" / "tokens"
+        self.token_cache_dir.mkdir(parents=True, exist_ok=True)
+
+    async def __aenter__(self) -> "AsyncECatalogAPIClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close pooled connections"""
+        await self.session.aclose()
+
+    async def _make_request(self, method: str, endpoint: str, **kwargs) -> "httpx.Response":
+        # Ensure we have a valid token if OAuth is configured
+        if self.oauth_config and self.current_token:
+            await self.ensure_valid_token()
+
+        url = f"{self.base_url}{endpoint}"
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        async with self._semaphore:
+            attempt = 0
+            while True:
+                try:
+                    response = await self.session.request(method, url, **kwargs)
+                except httpx.TransportError as e:
+                    # Nothing reached the server on a failed connect, so any verb can be resent
+                    retryable = (
+                        isinstance(e, (httpx.ConnectError, httpx.ConnectTimeout))
+                        or self.transport.is_retryable_method(method)
+                    )
+                    if retryable and attempt < self.transport.max_retries:
+                        delay = self.transport.backoff_delay(attempt)
+                        attempt += 1
+                        self.logger.warning(
+                            f"{method} {url} - {e.__class__.__name__}, retrying in {delay:.1f}s "
+                            f"(attempt {attempt}/{self.transport.max_retries})"
+                        )
+                        await asyncio.sleep(delay)
+                        continue
+                    self.logger.error(f"Request failed: {e}")
+                    raise
+
+                self.logger.info(f"{method} {url} - Status: {response.status_code}")
+
+                if attempt < self.transport.max_retries and self.transport.should_retry_status(method, response.status_code):
+                    delay = self.transport.backoff_delay(attempt, response.headers.get('Retry-After'))
+                    attempt += 1
+                    self.logger.warning(
+                        f"{method} {url} - Status: {response.status_code}, retrying in {delay:.1f}s "
+                        f"(attempt {attempt}/{self.transport.max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                return response
+
+    def _handle_response(self, response: "httpx.Response") -> Dict[str, Any]:
+        try:
+            response.raise_for_status()
+            return response.json() if response.content else {}
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"HTTP Error: {e} - {response.text}")
+            raise
+        except json.JSONDecodeError as e:
+            self.logger.error(f"JSON Decode Error: {e}")
+            raise
+
+    def set_access_token(self, token: str):
+        """Set the access token for authentication"""
+        self.session.headers['Authorization'] = f'Bearer {token}'
+
+    async def _request_token(self, token_data: Dict[str, str]) -> TokenResponse:
+        """POST to the OAuth token endpoint and store the resulting token"""
+        headers = {'Content-Type': 'application/x-www-form-urlencoded'}
+        # Separate client so the current bearer token is not sent to the token endpoint
+        async with httpx.AsyncClient(timeout=self.session.timeout) as token_client:
+            response = await token_client.post(
+                self.oauth_config.token_url,
+                data=token_data,
+                headers=headers,
+            )
+        response.raise_for_status()
+        token_response = TokenResponse(**response.json())
+
+        # Store token and set expiration
+        self.current_token = token_response
+        if token_response.expires_in:
+            token_response.expires_at = datetime.now() + timedelta(seconds=token_response.expires_in)
+            self.token_expires_at = token_response.expires_at
+
+        # Save token to cache and use it for future requests
+        self.save_token(token_response)
+        self.set_access_token(token_response.access_token)
+        return token_response
+
+    async def refresh_token(self) -> Optional[TokenResponse]:
+        """Refresh the access token using refresh token"""
+        if not self.current_token or not self.current_token.refresh_token:
+            self.logger.error("No refresh token available")
+            return None
+
+        if not self.oauth_config:
+            raise ValueError("OAuth configuration not provided")
+
+        token_data = {
+            'grant_type': 'refresh_token',
+            'client_id': self.oauth_config.client_id,
+            'refresh_token': self.current_token.refresh_token,
+        }
+
+        if not self.oauth_config.use_pkce and self.oauth_config.client_secret:
+            token_data['client_secret'] = self.oauth_config.client_secret
+
+        try:
+            token_response = await self._request_token(token_data)
+            self.logger.info("Token refreshed successfully")
+            return token_response
+        except httpx.HTTPStatusError as e:
+            self.logger.error(f"Token refresh failed: {e}")
+            return None
+
+    def is_token_expired(self) -> bool:
+        """Check if the current token is expired"""
+        if not self.token_expires_at:
+            return False
+        return datetime.now() >= self.token_expires_at - timedelta(minutes=1)  # Refresh 1 minute early
+
+    async def ensure_valid_token(self):
+        """Ensure we have a valid token, refresh if needed"""
+        if not self.is_token_expired():
+            return
+
+        # Only one coroutine refreshes; the rest wait and reuse the new token
+        if self._token_lock is None:
+            self._token_lock = asyncio.Lock()
+        async with self._token_lock:
+            if not self.is_token_expired():
+                return
+
+            self.logger.info("Token expired, attempting to refresh")
+            if self.oauth_config and self.oauth_config.use_m2m and self.oauth_config.client_secret:
+                # Client credentials tokens usually carry no refresh token
+                if await self.refresh_token() or await self.authenticate_m2m(force_reauth=True):
+                    return
+            elif await self.refresh_token():
+                return
+            raise Exception("Unable to refresh token, re-authentication required")
+
+    async def load_token(self) -> Optional[TokenResponse]:
+        """Load token from cache file"""
+        try:
+            token = self._read_cached_token()
+            if token is None:
+                return None
+
+            if token.is_expired():
+                self.logger.info("Cached token is expired")
+                # Try to refresh if we have a refresh token
+                if token.refresh_token:
+                    self.current_token = token
+                    refreshed = await self.refresh_token()
+                    if refreshed:
+                        return refreshed
+
+                # Remove expired token
+                self._get_token_cache_path().unlink()
+                return None
+
+            self.logger.info("Loaded valid token from cache")
+            return token
+
+        except Exception as e:
+            self.logger.warning(f"Failed to load token: {e}")
+            return None
+
+    async def authenticate_m2m(self, force_reauth: bool = False) -> TokenResponse:
+        """Authenticate using Machine-to-Machine (client credentials) flow"""
+        if not self.oauth_config:
+            raise ValueError("OAuth configuration not provided")
+
+        if not self.oauth_config.client_secret:
+            raise ValueError("Client secret required for M2M authentication")
+
+        # Try to load cached token first (unless forced to reauth)
+        if not force_reauth:
+            cached_token = await self.load_token()
+            if cached_token:
+                self.current_token = cached_token
+                self.token_expires_at = cached_token.expires_at
+                self.set_access_token(cached_token.access_token)
+                return cached_token
+
+        # Request token using client credentials
+        token_data = {
+            'grant_type': 'client_credentials',
+            'client_id': self.oauth_config.client_id,
+            'client_secret': self.oauth_config.client_secret,
+        }
+
+        if self.oauth_config.scope:
+            token_data['scope'] = self.oauth_config.scope
+
+        try:
+            token_response = await self._request_token(token_data)
+            self.logger.info("M2M OAuth token obtained successfully")
+            return token_response
+        except httpx.HTTPStatusError as e:
+            error_details = f" - {e.response.text}" if e.response.content else ""
+            self.logger.error(f"M2M token request failed: {e}{error_details}")
+            raise Exception(f"M2M OAuth token request failed: {e}{error_details}")
+
+    # SKU Lookup Operations
+    async def lookup_sku(self, sku: str) -> Optional[SkuLookupResponse]:
+        """Look up SKU type, site, and division availability"""
+        response = await self._make_request('GET', f'/sku/{sku}/lookup')
+        data = self._handle_response(response)
+
+        try:
+            return SkuLookupResponse(**data)
+        except Exception as e:
+            self.logger.error(f"Invalid SKU lookup data: {e}")
+            return None
+
+    # Item Operations
+    async def get_item(self, sku: str) -> Optional[Item]:
+        """Get item by SKU"""
+        response = await self._make_request('GET', f'/item/{sku}')
+        data = self._handle_response(response)
+
+        try:
+            return Item(**data)
+        except Exception as e:
+            self.logger.error(f"Invalid item data: {e}")
+            return None
+
+    async def create_item(self, item: ItemNew) -> Optional[Dict]:
+        """Create a new item - returns response data with work request ID if successful"""
+        item_data = item.model_dump(by_alias=True, exclude_none=True)
+        response = await self._make_request('POST', '/item', json=item_data)
+
+        try:
+            response.raise_for_status()
+            return response.json()
+        except httpx.HTTPStatusError:
+            return None
+
+    async def create_items(
+        self, items: Iterable[ItemNew]
+    ) -> List[Tuple[ItemNew, Optional[Dict], Optional[Exception]]]:
+        """
+        Create many items concurrently
+
+        Returns:
+            (item, result, error) per item in input order, like
+            workflows.concurrent_submit.submit_ordered does for the sync client; error is
+            the exception create_item raised, in which case result is None.
+            One failed request doesn't lose the results of the others.
+        """
+        items = list(items)
+        outcomes = await asyncio.gather(*(self.create_item(item) for item in items), return_exceptions=True)
+        return [
+            (item, None, outcome) if isinstance(outcome, Exception) else (item, outcome, None)
+            for item, outcome in zip(items, outcomes)
+        ]
+
+    async def update_item(self, sku: str, item_update: ItemPartialUpdate) -> Optional[Dict]:
+        """Partially update an item by SKU"""
+        update_data = item_update.model_dump(exclude_none=True)
+        response = await self._make_request('PATCH', f'/item/{sku}', json=update_data)
+        return self._handle_response(response)
+
+    async def delete_item(self, sku: str, delete_request: ItemDeleteRequest) -> Optional[Dict]:
+        """Delete an item by SKU"""
+        delete_data = delete_request.model_dump(exclude_none=True)
+        response = await self._make_request('DELETE', f'/item/{sku}', json=delete_data)
+        return self._handle_response(response)
+
+    # Room Operations
+    async def get_room(self, sku: str) -> Optional[Room]:
+        """Get room by SKU"""
+        response = await self._make_request('GET', f'/room/{sku}')
+        data = self._handle_response(response)
+
+        try:
+            return Room(**data)
+        except Exception as e:
+            self.logger.error(f"Invalid room data: {e}")
+            return None
+
+    async def create_room(self, room: Room) -> bool:
+        """Create a new room"""
+        room_data = room.model_dump(by_alias=True, exclude_none=True)
+        response = await self._make_request('POST', '/room', json=room_data)
+
+        try:
+            response.raise_for_status()
+            return True
+        except httpx.HTTPStatusError:
+            return False
+
+    async def update_room(self, sku: str, room_update: Dict) -> Optional[Dict]:
+        """Partially update a room by SKU"""
+        response = await self._make_request('PATCH', f'/room/{sku}', json=room_update)
+        return self._handle_response(response)
+
+    async def delete_room(self, sku: str, delete_request: ItemDeleteRequest) -> Optional[Dict]:
+        """Delete a room by SKU"""
+        delete_data = delete_request.model_dump(exclude_none=True)
+        response = await self._make_request('DELETE', f'/room/{sku}', json=delete_data)
+        return self._handle_response(response)
+
+    async def swap_room_items(self, swap_request: SwapRoomItemsRequest) -> Optional[Dict]:
+        """Swap items in a room"""
+        request_data = swap_request.model_dump(by_alias=True, exclude_none=True)
+        response = await self._make_request('POST', '/room/swap-items', json=request_data)
+        return self._handle_response(response)
+
+    # SKU Substitution Operations
+    async def prevalidate_sku_substitution(self, substitution_request: SkuSubstitutionRequest) -> Optional[Dict]:
+        """Prevalidate a SKU substitution request"""
+        request_data = substitution_request.model_dump(by_alias=True, exclude_none=True)
+        response = await self._make_request('POST', '/sku/substitution/prevalidate', json=request_data)
+        return self._handle_response(response)
+
+    async def submit_sku_substitution(self, substitution_request: SkuSubstitutionRequest) -> Optional[Dict]:
+        """Submit a SKU substitution request"""
+        request_data = substitution_request.model_dump(by_alias=True, exclude_none=True)
+        response = await self._make_request('POST', '/sku/substitution', json=request_data)
+        return self._handle_response(response)
+
+    # Work Request Operations
+    async def get_workrequest(self, workrequest_id: int) -> Optional[Dict]:
+        """Get work request by ID"""
+        response = await self._make_request('GET', f'/workrequests/{workrequest_id}')
+        return self._handle_response(response)
+
+    async def list_workrequests(self, status: Optional[str] = None, route_name: Optional[str] = None) -> Optional[List[Dict]]:
+        """List work requests with optional filtering"""
+        params = {}
+        if status:
+            params['status'] = status
+        if route_name:
+            params['route_name'] = route_name
+
+        response = await self._make_request('GET', '/workrequests/', params=params)
+        return self._handle_response(response)
+
+    async def process_workrequests(self, workrequest_ids: List[int]) -> Optional[Dict]:
+        """Process a list of work request IDs"""
+        request_data = {"workrequest_ids": workrequest_ids}
+        response = await self._make_request('POST', '/workrequests/process', json=request_data)
+        return self._handle_response(response)
+
+    async def process_workflows(self, flow_type: str, workrequest_ids: Optional[List[int]] = None) -> Optional[Dict]:
+        """Process workflows by flow type, optionally filtering by work request IDs"""
+        params = {"flow_type": flow_type}
+        request_data = {}
+        if workrequest_ids:
+            request_data["workrequest_ids"] = workrequest_ids
+
+        response = await self._make_request('POST', '/workflows/process', params=params, json=request_data)
+        return self._handle_response(response)
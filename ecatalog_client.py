@@ -1,6 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter
 import logging
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Tuple
 from pydantic import BaseModel, Field
 import json
 from datetime import datetime, timedelta
@@ -12,9 +13,12 @@ import urllib.parse
 import webbrowser
 from http.server import HTTPServer, BaseHTTPRequestHandler
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 from pathlib import Path
 import os
+import random
+from email.utils import parsedate_to_datetime
 
 
 class ItemDivision(BaseModel):
@@ -183,6 +187,46 @@ class SkuLookupResponse(BaseModel):
     exists: bool
 
 
+class SkuLookupCache:
+    """Thread-safe TTL cache of SKU lookups, including SKUs that don't exist"""
+
+    def __init__(self, ttl: float = 300.0, negative_ttl: float = 60.0):
+        """
+        Args:
+            ttl: Seconds to keep a lookup for a SKU that exists
+            negative_ttl: Seconds to keep a "not found" result, kept shorter since
+                pending work requests can create the SKU at any time
+        """
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: Dict[str, Tuple[float, Optional[SkuLookupResponse]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, sku: str) -> Tuple[bool, Optional[SkuLookupResponse]]:
+        """Return (hit, result); result is None for a cached "not found" entry"""
+        with self._lock:
+            entry = self._entries.get(sku)
+            if entry is None:
+                return False, None
+            expires_at, result = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[sku]
+                return False, None
+            return True, result
+
+    def put(self, sku: str, result: Optional[SkuLookupResponse]):
+        found = result is not None and result.exists
+        ttl = self.ttl if found else self.negative_ttl
+        if ttl <= 0:
+            return
+        with self._lock:
+            self._entries[sku] = (time.monotonic() + ttl, result)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
 class SkuSubstitutionRequest(BaseModel):
     Site: str
     ReplacedSkus: List[str] = Field(alias="Replaced Skus")
@@ -204,6 +248,65 @@ class OAuthConfig(BaseModel):
     callback_port: int = 8080  # Port for local callback server
 
 
+class TransportConfig(BaseModel):
+    """HTTP transport settings: connection pooling, timeouts and retry policy"""
+    pool_connections: int = 10  # Number of per-host connection pools to cache
+    pool_maxsize: int = 20  # Max connections kept alive per host
+    connect_timeout: float = 5.0  # Seconds to wait for a connection
+    read_timeout: float = 60.0  # Seconds to wait for the server to respond
+    max_retries: int = 3  # Retries after the first attempt (0 disables retrying)
+    backoff_factor: float = 0.5  # Base delay; attempt N sleeps up to factor * 2**N
+    backoff_max: float = 30.0  # Upper bound for any single sleep, including Retry-After
+    retry_statuses: List[int] = [429, 500, 502, 503, 504]
+    retry_methods: List[str] = ["GET", "HEAD", "OPTIONS", "PUT", "DELETE"]  # Idempotent verbs
+    respect_retry_after: bool = True
+
+    @property
+    def timeout(self) -> tuple:
+        """(connect, read) timeout tuple for requests"""
+        return (self.connect_timeout, self.read_timeout)
+
+    def is_retryable_method(self, method: str) -> bool:
+        """Check if a request with this HTTP method is safe to send again"""
+        return method.upper() in self.retry_methods
+
+    def should_retry_status(self, method: str, status_code: int) -> bool:
+        """Check if a response status warrants another attempt"""
+        if status_code not in self.retry_statuses:
+            return False
+        # 429 means the server rejected the request without processing it,
+        # so even non-idempotent requests (e.g. POST /item) can be resent
+        return status_code == 429 or self.is_retryable_method(method)
+
+    def backoff_delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to sleep before retry number `attempt` (0-based)"""
+        if retry_after and self.respect_retry_after:
+            delay = self._parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.backoff_max)
+
+        # Exponential backoff with full jitter
+        ceiling = min(self.backoff_max, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def _parse_retry_after(value: str) -> Optional[float]:
+        """Parse a Retry-After header given either as seconds or an HTTP date"""
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at is None:
+            return None
+        now = datetime.now(retry_at.tzinfo) if retry_at.tzinfo else datetime.now()
+        return max(0.0, (retry_at - now).total_seconds())
+
+
 class PKCEChallenge(BaseModel):
     code_verifier: str
     code_challenge: str
@@ -298,19 +401,94 @@ class CallbackHandler(BaseHTTPRequestHandler):
         pass
 
 
-class ECatalogAPIClient:
-    def __init__(self, base_url: str = "http://127.0.0.1:8000", access_token: Optional[str] = None, oauth_config: Optional[OAuthConfig] = None):
+class TokenCacheMixin:
+    """On-disk OAuth token cache shared by the sync and async clients.
+
+    Expects ``oauth_config``, ``base_url``, ``token_cache_dir`` and ``logger`` attributes.
+    """
+
+    def _get_token_cache_path(self) -> Path:
+        """Get the path for token cache file"""
+        if not self.oauth_config:
+            raise ValueError("OAuth configuration required for token caching")
+
+        # Use client_id and base_url to create unique token file
+        safe_url = self.base_url.replace("://", "_").replace("/", "_").replace(":", "_")
+        filename = f"{self.oauth_config.client_id}_{safe_url}.json"
+        return self.token_cache_dir / filename
+
+    def save_token(self, token: TokenResponse):
+        """Save token to cache file"""
+        try:
+            cache_path = self._get_token_cache_path()
+
+            # Calculate expiration time if not set
+            if not token.expires_at and token.expires_in:
+                token.expires_at = datetime.now() + timedelta(seconds=token.expires_in)
+
+            with open(cache_path, 'w') as f:
+                json.dump(token.to_dict(), f, indent=2)
+
+            # Set restrictive permissions (only user can read/write)
+            os.chmod(cache_path, 0o600)
+
+            self.logger.info(f"Token saved to {cache_path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to save token: {e}")
+
+    def _read_cached_token(self) -> Optional[TokenResponse]:
+        """Read the cached token as-is (no expiry handling)"""
+        cache_path = self._get_token_cache_path()
+
+        if not cache_path.exists():
+            self.logger.debug("No cached token found")
+            return None
+
+        with open(cache_path, 'r') as f:
+            token_data = json.load(f)
+
+        return TokenResponse.from_dict(token_data)
+
+    def clear_token_cache(self):
+        """Clear cached token"""
+        try:
+            cache_path = self._get_token_cache_path()
+            if cache_path.exists():
+                cache_path.unlink()
+                self.logger.info("Token cache cleared")
+        except Exception as e:
+            self.logger.warning(f"Failed to clear token cache: {e}")
+
+
+class ECatalogAPIClient(TokenCacheMixin):
+    def __init__(self, base_url: str = "http://127.0.0.1:8000", access_token: Optional[str] = None, oauth_config: Optional[OAuthConfig] = None,
+                 transport: Optional[TransportConfig] = None):
         self.base_url = base_url.rstrip('/')
+        self.transport = transport or TransportConfig()
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         })
 
+        # Pooled adapter so bulk imports reuse warm keep-alive connections.
+        # Retries are handled in _make_request so we can log and honour Retry-After.
+        adapter = HTTPAdapter(
+            pool_connections=self.transport.pool_connections,
+            pool_maxsize=self.transport.pool_maxsize,
+            max_retries=0,
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
         # OAuth configuration
         self.oauth_config = oauth_config
         self.current_token: Optional[TokenResponse] = None
         self.token_expires_at: Optional[datetime] = None
+        # Importers share one client across worker threads; only one of them refreshes
+        self._token_lock = threading.Lock()
+        # Shared by lookup_skus() calls so repeated pre-flight checks don't hit the API again
+        self.sku_lookup_cache = SkuLookupCache()
 
         # Set initial token if provided
         if access_token:
@@ -329,13 +507,47 @@ class ECatalogAPIClient:
             self.ensure_valid_token()
 
         url = f"{self.base_url}{endpoint}"
-        try:
-            response = self.session.request(method, url, **kwargs)
+        kwargs.setdefault('timeout', self.transport.timeout)
+
+        attempt = 0
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                # A connect timeout means nothing reached the server, so any verb can be resent
+                retryable = (
+                    isinstance(e, requests.exceptions.ConnectTimeout)
+                    or self.transport.is_retryable_method(method)
+                )
+                if retryable and attempt < self.transport.max_retries:
+                    delay = self.transport.backoff_delay(attempt)
+                    attempt += 1
+                    self.logger.warning(
+                        f"{method} {url} - {e.__class__.__name__}, retrying in {delay:.1f}s "
+                        f"(attempt {attempt}/{self.transport.max_retries})"
+                    )
+                    time.sleep(delay)
+                    continue
+                self.logger.error(f"Request failed: {e}")
+                raise
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Request failed: {e}")
+                raise
+
             self.logger.info(f"{method} {url} - Status: {response.status_code}")
+
+            if attempt < self.transport.max_retries and self.transport.should_retry_status(method, response.status_code):
+                delay = self.transport.backoff_delay(attempt, response.headers.get('Retry-After'))
+                attempt += 1
+                self.logger.warning(
+                    f"{method} {url} - Status: {response.status_code}, retrying in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.transport.max_retries})"
+                )
+                response.close()
+                time.sleep(delay)
+                continue
+
             return response
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request failed: {e}")
-            raise
 
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         try:
@@ -414,7 +626,8 @@ class ECatalogAPIClient:
             response = requests.post(
                 self.oauth_config.token_url,
                 data=token_data,
-                headers=headers
+                headers=headers,
+                timeout=self.transport.timeout,
             )
             response.raise_for_status()
             token_response = TokenResponse(**response.json())
@@ -473,7 +686,8 @@ class ECatalogAPIClient:
             response = requests.post(
                 self.oauth_config.token_url,
                 data=token_data,
-                headers=headers
+                headers=headers,
+                timeout=self.transport.timeout,
             )
             response.raise_for_status()
             token_response = TokenResponse(**response.json())
@@ -505,54 +719,30 @@ class ECatalogAPIClient:
 
     def ensure_valid_token(self):
         """Ensure we have a valid token, refresh if needed"""
-        if self.is_token_expired():
-            self.logger.info("Token expired, attempting to refresh")
-            if not self.refresh_token():
-                raise Exception("Unable to refresh token, re-authentication required")
-
-    def _get_token_cache_path(self) -> Path:
-        """Get the path for token cache file"""
-        if not self.oauth_config:
-            raise ValueError("OAuth configuration required for token caching")
-
-        # Use client_id and base_url to create unique token file
-        safe_url = self.base_url.replace("://", "_").replace("/", "_").replace(":", "_")
-        filename = f"{self.oauth_config.client_id}_{safe_url}.json"
-        return self.token_cache_dir / filename
-
-    def save_token(self, token: TokenResponse):
-        """Save token to cache file"""
-        try:
-            cache_path = self._get_token_cache_path()
-
-            # Calculate expiration time if not set
-            if not token.expires_at and token.expires_in:
-                token.expires_at = datetime.now() + timedelta(seconds=token.expires_in)
-
-            with open(cache_path, 'w') as f:
-                json.dump(token.to_dict(), f, indent=2)
+        if not self.is_token_expired():
+            return
 
-            # Set restrictive permissions (only user can read/write)
-            os.chmod(cache_path, 0o600)
+        with self._token_lock:
+            # Another thread may have refreshed while we waited
+            if not self.is_token_expired():
+                return
 
-            self.logger.info(f"Token saved to {cache_path}")
-        except Exception as e:
-            self.logger.warning(f"Failed to save token: {e}")
+            self.logger.info("Token expired, attempting to refresh")
+            if self.refresh_token():
+                return
+            # Client credentials tokens usually carry no refresh token - just request a new one
+            if self.oauth_config and self.oauth_config.use_m2m and self.oauth_config.client_secret:
+                self.authenticate_m2m(force_reauth=True)
+                return
+            raise Exception("Unable to refresh token, re-authentication required")
 
     def load_token(self) -> Optional[TokenResponse]:
         """Load token from cache file"""
         try:
-            cache_path = self._get_token_cache_path()
-
-            if not cache_path.exists():
-                self.logger.debug("No cached token found")
+            token = self._read_cached_token()
+            if token is None:
                 return None
 
-            with open(cache_path, 'r') as f:
-                token_data = json.load(f)
-
-            token = TokenResponse.from_dict(token_data)
-
             if token.is_expired():
                 self.logger.info("Cached token is expired")
                 # Try to refresh if we have a refresh token
@@ -564,7 +754,7 @@ class ECatalogAPIClient:
                         return refreshed
 
                 # Remove expired token
-                cache_path.unlink()
+                self._get_token_cache_path().unlink()
                 return None
 
             self.logger.info("Loaded valid token from cache")
@@ -574,16 +764,6 @@ class ECatalogAPIClient:
             self.logger.warning(f"Failed to load token: {e}")
             return None
 
-    def clear_token_cache(self):
-        """Clear cached token"""
-        try:
-            cache_path = self._get_token_cache_path()
-            if cache_path.exists():
-                cache_path.unlink()
-                self.logger.info("Token cache cleared")
-        except Exception as e:
-            self.logger.warning(f"Failed to clear token cache: {e}")
-
     def authenticate_m2m(self, force_reauth: bool = False) -> TokenResponse:
         """Authenticate using Machine-to-Machine (client credentials) flow"""
         if not self.oauth_config:
@@ -616,7 +796,8 @@ class ECatalogAPIClient:
             response = requests.post(
                 self.oauth_config.token_url,
                 data=token_data,
-                headers=headers
+                headers=headers,
+                timeout=self.transport.timeout,
             )
             response.raise_for_status()
             token_response = TokenResponse(**response.json())
@@ -722,6 +903,9 @@ class ECatalogAPIClient:
     def lookup_sku(self, sku: str) -> Optional[SkuLookupResponse]:
         """Look up SKU type, site, and division availability"""
         response = self._make_request('GET', f'/sku/{sku}/lookup')
+        if response.status_code == 404:
+            # "Not found" is an answer for a lookup, not an error worth logging
+            response.raise_for_status()
         data = self._handle_response(response)
 
         try:
@@ -730,10 +914,66 @@ class ECatalogAPIClient:
             self.logger.error(f"Invalid SKU lookup data: {e}")
             return None
 
+    def _lookup_sku_cached(self, sku: str) -> Optional[SkuLookupResponse]:
+        hit, result = self.sku_lookup_cache.get(sku)
+        if hit:
+            return result
+
+        try:
+            result = self.lookup_sku(sku)
+        except requests.exceptions.HTTPError as e:
+            if e.response is None or e.response.status_code != 404:
+                raise
+            result = None
+
+        self.sku_lookup_cache.put(sku, result)
+        return result
+
+    def lookup_skus(self, skus: Iterable[str], concurrency: int = 8
+                    ) -> Iterator[Tuple[str, Optional[SkuLookupResponse], Optional[Exception]]]:
+        """
+        Look up many SKUs, skipping duplicates and running up to `concurrency` lookups at once.
+
+        Results (found and not found) are cached on the client for
+        sku_lookup_cache.ttl / negative_ttl seconds; failed requests are not cached.
+
+        Yields:
+            (sku, result, error) in first-seen order. For a SKU eCatalog doesn't have,
+            result has exists=False (None from servers that answer 404). result is
+            None when the lookup failed, in which case error is set.
+        """
+        unique_skus = list(dict.fromkeys(str(sku).strip() for sku in skus if str(sku).strip()))
+
+        def lookup(sku: str) -> Tuple[str, Optional[SkuLookupResponse], Optional[Exception]]:
+            try:
+                return sku, self._lookup_sku_cached(sku), None
+            except Exception as e:
+                return sku, None, e
+
+        if concurrency <= 1:
+            for sku in unique_skus:
+                yield lookup(sku)
+            return
+
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        futures = [executor.submit(lookup, sku) for sku in unique_skus]
+        try:
+            for future in futures:
+                yield future.result()
+        finally:
+            # Caller stopped reading early: drop the lookups that haven't started
+            # (by hand - shutdown(cancel_futures=True) needs Python 3.9)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+
     # Item Operations
     def get_item(self, sku: str) -> Optional[Item]:
         """Get item by SKU"""
         response = self._make_request('GET', f'/item/{sku}')
+        if response.status_code == 404:
+            # Raised without logging; callers checking many SKUs expect some to be missing
+            response.raise_for_status()
         data = self._handle_response(response)
 
         try:
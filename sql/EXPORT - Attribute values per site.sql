@@ -0,0 +1,14 @@
+/*
+    Active attribute values per site, for the CLI's attribute vocabulary.
+
+    Save the results as CSV (with headers) and rebuild the vocabulary with:
+        uv run python cli.py attributes refresh attribute_values.csv
+*/
+SELECT avs.attributevaluesite_site AS site
+      ,ad.attributedefinition_name AS attribute
+      ,av.attributevalue_value AS value
+  FROM dbo.AttributeValues av
+  JOIN dbo.AttributeDefinitions ad ON ad.attributedefinition_id = av.attributevalue_attributedefinition_id
+  JOIN dbo.AttributeValueSites avs ON avs.attributevaluesite_attributevalue_id = av.attributevalue_id
+ WHERE av.attributevalue_isactive = 1
+ ORDER BY avs.attributevaluesite_site, ad.attributedefinition_name, av.attributevalue_value
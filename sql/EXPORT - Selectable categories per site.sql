@@ -0,0 +1,11 @@
+/*
+    Selectable eCatalog categories per site, for the CLI's category index.
+
+    Save the results as CSV (with headers) and rebuild the index with:
+        uv run python cli.py categories refresh categories.csv
+*/
+SELECT cat_belongsToSite AS site
+      ,cat_long_title AS category
+  FROM dbo.category
+ WHERE cat_isselectable = 1
+ ORDER BY cat_belongsToSite, cat_long_title
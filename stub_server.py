@@ -0,0 +1,686 @@
+#!/usr/bin/env python3
+
+"""
+Local stub eCatalog server
+
+Serves the API described in docs/openapi.json from memory so the CLI, importers and
+workflows can run without the real server - for benchmarking throughput and
+concurrency changes reproducibly on a laptop.
+
+Routes, path/query parameters and JSON request bodies are taken from the OpenAPI spec:
+unknown routes get 404/405 and invalid bodies get FastAPI-style 422 responses.
+Responses are checked against the spec's response schemas and mismatches are logged.
+
+Behaviour is configurable: per-request latency, injected errors (503/429/...) and how
+work requests move PENDING -> RUNNING -> COMPLETED/FAILED once processed.
+
+Usage:
+    uv run python stub_server.py --port 8000 --latency 0.05 --error-rate 0.01
+    uv run python cli.py --no-auth --api-url http://127.0.0.1:8000 workflow dropship ...
+
+Or in-process (e.g. from a benchmark):
+    with start_stub_server(StubBehavior(latency=0.02)) as server:
+        client = ECatalogAPIClient(server.url)
+"""
+
+import json
+import logging
+import random
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import click
+from pydantic import BaseModel
+
+OPENAPI_PATH = Path(__file__).parent / "docs" / "openapi.json"
+
+# Endpoints the real deployment serves outside the spec: the standalone OAuth
+# server's token URL (OAUTH_TOKEN_URL) and the stub's own counters
+EXTRA_ROUTES = [
+    ("POST", "/token", "token_auth_token_post"),
+    ("GET", "/_stub/stats", "stub_stats"),
+]
+
+# Operations that queue a work request, and the route_name it gets
+WORKREQUEST_ROUTES = {
+    "create_item": "product_creation",
+    "update_item_partial": "product_update",
+    "delete_item": "product_deletion",
+    "create_room": "room_creation",
+    "update_room_partial": "room_update",
+    "delete_room": "room_deletion",
+    "swap_room_items": "room_item_swap",
+    "sku_substitution": "sku_substitution",
+}
+
+logger = logging.getLogger("stub_server")
+
+
+class StubBehavior(BaseModel):
+    """How the stub responds: latency, injected failures and work request timing"""
+    latency: float = 0.0  # Seconds added to every response
+    latency_jitter: float = 0.0  # Extra random delay, uniform in [0, jitter]
+    error_rate: float = 0.0  # Fraction of API requests answered with error_status
+    error_status: int = 503  # Status for injected errors (429 also sends Retry-After)
+    run_seconds: float = 2.0  # Mean time a processed work request spends RUNNING
+    failure_rate: float = 0.0  # Fraction of processed work requests that end FAILED
+    require_auth: bool = False  # Reject API calls without a token issued by /auth/token
+    token_expires_in: int = 3600
+    seed: Optional[int] = None  # Seed for latency, error and failure randomness
+
+
+class HTTPError(Exception):
+    def __init__(self, status: int, detail: Any, headers: Optional[Dict[str, str]] = None):
+        super().__init__(str(detail))
+        self.status = status
+        self.detail = detail
+        self.headers = headers or {}
+
+
+# ---------------------------------------------------------------------------
+# OpenAPI spec: routing and schema validation
+# ---------------------------------------------------------------------------
+
+class OpenAPISpec:
+    """Routes and JSON schemas from an OpenAPI document"""
+
+    def __init__(self, spec_path: Path = OPENAPI_PATH):
+        with open(spec_path, "r", encoding="utf-8") as f:
+            self.spec = json.load(f)
+        self.schemas = self.spec.get("components", {}).get("schemas", {})
+        self.operations: Dict[str, Dict] = {}
+        self.routes: List[Tuple[str, re.Pattern, str]] = []
+
+        for path, methods in self.spec.get("paths", {}).items():
+            for method, operation in methods.items():
+                self.operations[operation["operationId"]] = operation
+                self.routes.append((method.upper(), self._compile(path), operation["operationId"]))
+        for method, path, operation_id in EXTRA_ROUTES:
+            self.operations.setdefault(operation_id, {})
+            self.routes.append((method, self._compile(path), operation_id))
+
+        # Literal paths win over templated ones (/room/swap-items before /room/{sku})
+        self.routes.sort(key=lambda route: route[1].pattern.count("(?P<"))
+
+    @staticmethod
+    def _compile(path: str) -> re.Pattern:
+        pattern = re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", re.escape(path).replace(r"\{", "{").replace(r"\}", "}"))
+        return re.compile(f"^{pattern}$")
+
+    def match(self, method: str, path: str) -> Tuple[str, Dict[str, str]]:
+        """Find the operation for a request; raises 404/405 like FastAPI"""
+        path_matched = False
+        for route_method, pattern, operation_id in self.routes:
+            match = pattern.match(path)
+            if not match:
+                continue
+            path_matched = True
+            if route_method == method:
+                return operation_id, match.groupdict()
+        if path_matched:
+            raise HTTPError(405, "Method Not Allowed")
+        raise HTTPError(404, "Not Found")
+
+    def resolve(self, schema: Dict) -> Dict:
+        while "$ref" in schema:
+            schema = self.schemas[schema["$ref"].rsplit("/", 1)[-1]]
+        return schema
+
+    def validate(self, schema: Dict, value: Any, loc: List) -> List[Dict]:
+        """Validate a value against a JSON schema, returning FastAPI-style error entries"""
+        schema = self.resolve(schema)
+
+        if "anyOf" in schema:
+            if any(not self.validate(option, value, loc) for option in schema["anyOf"]):
+                return []
+            return [{"loc": loc, "msg": "Input does not match any allowed type", "type": "union_type"}]
+
+        if "enum" in schema and value not in schema["enum"]:
+            return [{"loc": loc, "msg": f"Input should be one of {schema['enum']}", "type": "enum"}]
+
+        expected = schema.get("type")
+        checks = {
+            "object": lambda v: isinstance(v, dict),
+            "array": lambda v: isinstance(v, list),
+            "string": lambda v: isinstance(v, str),
+            "integer": lambda v: isinstance(v, int) and not isinstance(v, bool),
+            "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+            "boolean": lambda v: isinstance(v, bool),
+            "null": lambda v: v is None,
+        }
+        if expected in checks and not checks[expected](value):
+            return [{"loc": loc, "msg": f"Input should be a valid {expected}", "type": f"{expected}_type"}]
+
+        errors = []
+        if expected == "object":
+            for field in schema.get("required", []):
+                if field not in value:
+                    errors.append({"loc": loc + [field], "msg": "Field required", "type": "missing"})
+            for field, field_schema in schema.get("properties", {}).items():
+                if field in value:
+                    errors.extend(self.validate(field_schema, value[field], loc + [field]))
+        elif expected == "array" and "items" in schema:
+            for i, item in enumerate(value):
+                errors.extend(self.validate(schema["items"], item, loc + [i]))
+        return errors
+
+    def request_schema(self, operation_id: str) -> Tuple[Optional[Dict], bool]:
+        """(JSON body schema, required) for an operation; None if it takes no JSON body"""
+        body = self.operations[operation_id].get("requestBody")
+        if not body or "application/json" not in body.get("content", {}):
+            return None, False
+        return body["content"]["application/json"].get("schema", {}), body.get("required", False)
+
+    def response_schema(self, operation_id: str) -> Optional[Dict]:
+        response = self.operations[operation_id].get("responses", {}).get("200", {})
+        schema = response.get("content", {}).get("application/json", {}).get("schema")
+        return schema or None
+
+    def parameters(self, operation_id: str) -> List[Dict]:
+        return self.operations[operation_id].get("parameters", [])
+
+
+# ---------------------------------------------------------------------------
+# In-memory catalog and work requests
+# ---------------------------------------------------------------------------
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+class StubState:
+    """Items, rooms and work requests held by the stub"""
+
+    def __init__(self, behavior: StubBehavior):
+        self.behavior = behavior
+        self.rng = random.Random(behavior.seed)
+        self.lock = threading.Lock()
+        self.items: Dict[str, Dict] = {}
+        self.rooms: Dict[str, Dict] = {}
+        self.workrequests: Dict[int, Dict] = {}
+        self.tokens: Dict[str, float] = {}
+        self.request_counts: Dict[str, int] = {}
+        self._next_workrequest_id = 1
+
+    def count(self, operation_id: str):
+        with self.lock:
+            self.request_counts[operation_id] = self.request_counts.get(operation_id, 0) + 1
+
+    def add_workrequest(self, route_name: str, payload: Dict, status: str = "PENDING") -> Dict:
+        with self.lock:
+            wr_id = self._next_workrequest_id
+            self._next_workrequest_id += 1
+            wr = {
+                "id": wr_id,
+                "status": status,
+                "route_name": route_name,
+                "workrequest_json": payload,
+                "route_params": None,
+                "callback_url": None,
+                "status_date": _now(),
+                "status_json": None,
+                "error_message": None,
+                # Stub bookkeeping, stripped from responses
+                "_finishes_at": None,
+                "_fails": False,
+            }
+            self.workrequests[wr_id] = wr
+            return wr
+
+    def dispatch(self, wr: Dict):
+        """Start processing a PENDING work request: RUNNING now, terminal after run time"""
+        run_time = self.behavior.run_seconds * self.rng.uniform(0.5, 1.5)
+        wr["status"] = "RUNNING"
+        wr["status_date"] = _now()
+        wr["_finishes_at"] = time.monotonic() + run_time
+        wr["_fails"] = self.rng.random() < self.behavior.failure_rate
+
+    def view(self, wr: Dict) -> Dict:
+        """Public representation of a work request, advancing it if its run time is up"""
+        if wr["status"] == "RUNNING" and time.monotonic() >= wr["_finishes_at"]:
+            wr["status"] = "FAILED" if wr["_fails"] else "COMPLETED"
+            wr["status_date"] = _now()
+            if wr["_fails"]:
+                wr["error_message"] = f"Simulated failure in {wr['route_name']} flow"
+        return {key: value for key, value in wr.items() if not key.startswith("_")}
+
+    def preload_items(self, items: List[Dict]):
+        for item in items:
+            self.items[item["Sku"]] = _stored_item(item)
+
+
+def _stored_item(payload: Dict) -> Dict:
+    """Shape an ItemTypeNew payload like the ItemType the API returns"""
+    item = dict(payload)
+    item["RTGAlias"] = item.pop("PDMDescription", "") or ""
+    item.setdefault("PackageProducts", None)
+    return item
+
+
+def _stored_room(payload: Dict) -> Dict:
+    room = dict(payload)
+    room["RTGAlias"] = room.pop("PDMDescription", "") or ""
+    room.setdefault("PackageProducts", None)
+    room.setdefault("RoomItems", {"Items": []})
+    return room
+
+
+# ---------------------------------------------------------------------------
+# Operation handlers
+# ---------------------------------------------------------------------------
+
+class StubAPI:
+    """One method per operationId: (state, path params, query, body) -> JSON response"""
+
+    def __init__(self, state: StubState):
+        self.state = state
+
+    def _queue(self, operation_id: str, payload: Any) -> int:
+        return self.state.add_workrequest(WORKREQUEST_ROUTES[operation_id], payload or {})["id"]
+
+    # Items
+    def get_item_by_sku(self, params, query, body):
+        item = self.state.items.get(params["sku"])
+        if item is None:
+            raise HTTPError(404, f"Item {params['sku']} not found")
+        return item
+
+    def create_item(self, params, query, body):
+        if body["Sku"] in self.state.items:
+            raise HTTPError(400, f"Item {body['Sku']} already exists")
+        self.state.items[body["Sku"]] = _stored_item(body)
+        wr_id = self._queue("create_item", body)
+        return {"message": f"Item {body['Sku']} creation request submitted", "workrequest_id": wr_id}
+
+    def update_item_partial(self, params, query, body):
+        item = self.get_item_by_sku(params, query, body)
+        updated = {key: value for key, value in (body or {}).items() if value is not None}
+        item.update(updated)
+        wr_id = self._queue("update_item_partial", {"Sku": params["sku"], **updated})
+        return {"workrequest_id": wr_id, "message": f"Item {params['sku']} update request submitted",
+                "updated_fields": list(updated)}
+
+    def delete_item(self, params, query, body):
+        self.get_item_by_sku(params, query, body)
+        if not (body or {}).get("Division"):
+            del self.state.items[params["sku"]]
+        wr_id = self._queue("delete_item", {"Sku": params["sku"], **(body or {})})
+        return {"workrequest_id": wr_id, "message": f"Item {params['sku']} deletion request submitted"}
+
+    # Rooms
+    def get_room_by_sku(self, params, query, body):
+        room = self.state.rooms.get(params["sku"])
+        if room is None:
+            raise HTTPError(404, f"Room {params['sku']} not found")
+        return room
+
+    def create_room(self, params, query, body):
+        self.state.rooms[body["Sku"]] = _stored_room(body)
+        wr_id = self._queue("create_room", body)
+        return {"message": f"Room {body['Sku']} creation request submitted", "workrequest_id": wr_id}
+
+    def update_room_partial(self, params, query, body):
+        room = self.get_room_by_sku(params, query, body)
+        updated = {key: value for key, value in (body or {}).items() if value is not None}
+        room.update(updated)
+        wr_id = self._queue("update_room_partial", {"Sku": params["sku"], **updated})
+        return {"workrequest_id": wr_id, "message": f"Room {params['sku']} update request submitted",
+                "updated_fields": list(updated)}
+
+    def delete_room(self, params, query, body):
+        self.get_room_by_sku(params, query, body)
+        del self.state.rooms[params["sku"]]
+        wr_id = self._queue("delete_room", {"Sku": params["sku"], **(body or {})})
+        return {"workrequest_id": wr_id, "message": f"Room {params['sku']} deletion request submitted"}
+
+    def swap_room_items(self, params, query, body):
+        wr_id = self._queue("swap_room_items", body)
+        return {"message": f"Room {body['RoomSku']} item swap request submitted", "workrequest_id": wr_id}
+
+    # SKUs
+    def lookup_sku_status(self, params, query, body):
+        sku = params["sku"]
+        for record, sku_type in ((self.state.items.get(sku), "Item"), (self.state.rooms.get(sku), "Room")):
+            if record is not None:
+                return {"sku": sku, "site": record.get("Site", ""), "type": sku_type,
+                        "divisions": record.get("Divisions") or {}, "exists": True}
+        # The spec has no 404 here: an unknown SKU is a normal answer
+        return {"sku": sku, "site": "", "type": "Missing", "divisions": {}, "exists": False}
+
+    def prevalidate_sku_substitution(self, params, query, body):
+        missing = [sku for sku in body["Replaced Skus"] + body["Substituted Skus"] if sku not in self.state.items]
+        return {
+            "valid": not missing,
+            "validation_results": {
+                "divisions_valid": all(d in ("FL", "SE", "TX") for d in body["Divisions"]),
+                "replaced_skus_exist": all(s in self.state.items for s in body["Replaced Skus"]),
+                "substituted_skus_exist": all(s in self.state.items for s in body["Substituted Skus"]),
+            },
+            "errors": [f"SKU {sku} not found" for sku in missing],
+            "warnings": [],
+        }
+
+    def sku_substitution(self, params, query, body):
+        wr_id = self._queue("sku_substitution", body)
+        return {
+            "workrequest_id": wr_id,
+            "message": f"Sku substitution request submitted for site {body['Site']}",
+            "site": body["Site"],
+            "replaced_skus": body["Replaced Skus"],
+            "substituted_skus": body["Substituted Skus"],
+            "divisions": body["Divisions"],
+            "package_skus": body.get("Package Skus"),
+        }
+
+    # Work requests
+    def list_workrequests(self, params, query, body):
+        status = (query.get("status") or "").upper()
+        route_name = query.get("route_name")
+        results = []
+        for wr in list(self.state.workrequests.values()):
+            wr = self.state.view(wr)
+            if status and wr["status"] != status:
+                continue
+            if route_name and wr["route_name"] != route_name:
+                continue
+            results.append(wr)
+        return results
+
+    def create_workrequest(self, params, query, body):
+        wr = self.state.add_workrequest(body["route_name"], body["workrequest_json"], body.get("status", "PENDING"))
+        return self.state.view(wr)
+
+    def get_workrequest_by_id(self, params, query, body):
+        wr = self.state.workrequests.get(int(params["workrequest_id"]))
+        if wr is None:
+            raise HTTPError(404, f"Workrequest {params['workrequest_id']} not found")
+        return self.state.view(wr)
+
+    def update_workrequest(self, params, query, body):
+        wr = self.state.workrequests.get(int(params["workrequest_id"]))
+        if wr is None:
+            raise HTTPError(404, f"Workrequest {params['workrequest_id']} not found")
+        for key in ("status", "route_params", "callback_url"):
+            if body.get(key) is not None:
+                wr[key] = body[key]
+        return self.state.view(wr)
+
+    def _dispatch(self, wr_ids: List[int]) -> Dict:
+        dispatched, skipped = [], []
+        with self.state.lock:
+            for wr_id in wr_ids:
+                wr = self.state.workrequests.get(wr_id)
+                if wr is None:
+                    skipped.append({"id": wr_id, "reason": "not found"})
+                elif wr["status"] != "PENDING":
+                    skipped.append({"id": wr_id, "reason": f"status is {wr['status']}"})
+                else:
+                    self.state.dispatch(wr)
+                    dispatched.append(wr_id)
+        return {"message": f"Dispatched {len(dispatched)} workrequest(s)", "dispatched": dispatched, "skipped": skipped}
+
+    def process_workrequests(self, params, query, body):
+        return self._dispatch(body["workrequest_ids"])
+
+    def process_workflows(self, params, query, body):
+        wr_ids = (body or {}).get("workrequest_ids")
+        if wr_ids is None:
+            wr_ids = [wr["id"] for wr in self.state.workrequests.values()
+                      if wr["route_name"] == query["flow_type"] and wr["status"] == "PENDING"]
+        return self._dispatch(wr_ids)
+
+    # Auth
+    def token_auth_token_post(self, params, query, body):
+        token = secrets.token_urlsafe(24)
+        self.state.tokens[token] = time.time() + self.state.behavior.token_expires_in
+        return {"access_token": token, "token_type": "bearer", "expires_in": self.state.behavior.token_expires_in,
+                "refresh_token": secrets.token_urlsafe(24), "scope": (body or {}).get("scope")}
+
+    def userinfo_auth_userinfo_get(self, params, query, body):
+        return {"sub": "stub-client", "name": "Stub Client"}
+
+    # Service
+    def get_ecatapi_status(self, params, query, body):
+        return {"status": "ok", "service": "eCatalog stub server"}
+
+    def check_prefect_health(self, params, query, body):
+        return {"status": "healthy"}
+
+    check_prefect_health_workflows = check_prefect_health
+
+    def simulate_error(self, params, query, body):
+        raise HTTPError(500, "Simulated error")
+
+    def stub_stats(self, params, query, body):
+        statuses = {}
+        for wr in list(self.state.workrequests.values()):
+            status = self.state.view(wr)["status"]
+            statuses[status] = statuses.get(status, 0) + 1
+        return {"requests": dict(self.state.request_counts), "items": len(self.state.items),
+                "rooms": len(self.state.rooms), "workrequests": statuses}
+
+
+# ---------------------------------------------------------------------------
+# HTTP server
+# ---------------------------------------------------------------------------
+
+class StubRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, so client connection pooling behaves as in production
+    # Headers and body go out as separate writes; without TCP_NODELAY each response stalls on delayed ACK
+    disable_nagle_algorithm = True
+    server: "StubServer"
+
+    def _send_json(self, status: int, data: Any, headers: Optional[Dict[str, str]] = None):
+        body = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Tuple[bytes, str]:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b"", self.headers.get("Content-Type", "")
+
+    def _handle(self, method: str):
+        raw_body, content_type = self._read_body()
+        url = urlparse(self.path)
+        server = self.server
+
+        try:
+            operation_id, params = server.spec.match(method, url.path)
+            server.state.count(operation_id)
+            is_auth = operation_id.endswith("_auth_token_post")
+
+            behavior = server.behavior
+            delay = behavior.latency + (server.state.rng.uniform(0, behavior.latency_jitter) if behavior.latency_jitter else 0)
+            if delay:
+                time.sleep(delay)
+
+            if not is_auth and behavior.error_rate and server.state.rng.random() < behavior.error_rate:
+                headers = {"Retry-After": "1"} if behavior.error_status == 429 else None
+                raise HTTPError(behavior.error_status, "Simulated server error", headers)
+
+            if behavior.require_auth and not is_auth and operation_id != "stub_stats":
+                self._check_token()
+
+            query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            body = self._parse_body(operation_id, raw_body, content_type)
+            self._validate_parameters(operation_id, params, query)
+
+            handler = getattr(server.api, operation_id, None)
+            result = handler(params, query, body) if handler else {}
+
+            response_schema = server.spec.response_schema(operation_id)
+            if response_schema:
+                errors = server.spec.validate(response_schema, result, ["response"])
+                if errors:
+                    logger.warning(f"{operation_id} response doesn't match the spec: {errors[:3]}")
+
+            self._send_json(200, result)
+        except HTTPError as e:
+            self._send_json(e.status, {"detail": e.detail}, e.headers)
+        except Exception as e:
+            logger.exception(f"{method} {self.path} failed")
+            self._send_json(500, {"detail": f"Stub server error: {e}"})
+
+    def _check_token(self):
+        auth = self.headers.get("Authorization", "")
+        token = auth[7:] if auth.lower().startswith("bearer ") else ""
+        expires_at = self.server.state.tokens.get(token)
+        if expires_at is None or expires_at < time.time():
+            raise HTTPError(401, "Not authenticated", {"WWW-Authenticate": "Bearer"})
+
+    def _parse_body(self, operation_id: str, raw_body: bytes, content_type: str) -> Any:
+        if "application/x-www-form-urlencoded" in content_type:
+            return {key: values[-1] for key, values in parse_qs(raw_body.decode("utf-8")).items()}
+
+        schema, required = self.server.spec.request_schema(operation_id)
+        if schema is None:
+            return None
+        if not raw_body:
+            if required:
+                raise HTTPError(422, [{"loc": ["body"], "msg": "Field required", "type": "missing"}])
+            return None
+
+        try:
+            body = json.loads(raw_body)
+        except json.JSONDecodeError as e:
+            raise HTTPError(422, [{"loc": ["body", e.pos], "msg": "JSON decode error", "type": "json_invalid"}])
+
+        errors = self.server.spec.validate(schema, body, ["body"])
+        if errors:
+            raise HTTPError(422, errors)
+        return body
+
+    def _validate_parameters(self, operation_id: str, params: Dict, query: Dict):
+        errors = []
+        for parameter in self.server.spec.parameters(operation_id):
+            source = params if parameter["in"] == "path" else query if parameter["in"] == "query" else None
+            if source is None:
+                continue
+            name = parameter["name"]
+            if name not in source:
+                if parameter.get("required"):
+                    errors.append({"loc": [parameter["in"], name], "msg": "Field required", "type": "missing"})
+                continue
+            if self.server.spec.resolve(parameter.get("schema", {})).get("type") == "integer":
+                try:
+                    int(source[name])
+                except ValueError:
+                    errors.append({"loc": [parameter["in"], name],
+                                   "msg": "Input should be a valid integer", "type": "int_parsing"})
+        if errors:
+            raise HTTPError(422, errors)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PATCH(self):
+        self._handle("PATCH")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+
+
+class StubServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], behavior: Optional[StubBehavior] = None,
+                 spec_path: Path = OPENAPI_PATH):
+        self.behavior = behavior or StubBehavior()
+        self.spec = OpenAPISpec(spec_path)
+        self.state = StubState(self.behavior)
+        self.api = StubAPI(self.state)
+        super().__init__(address, StubRequestHandler)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+
+@contextmanager
+def start_stub_server(behavior: Optional[StubBehavior] = None, host: str = "127.0.0.1",
+                      port: int = 0) -> Iterator[StubServer]:
+    """Run a stub server on a background thread (port 0 = any free port)"""
+    server = StubServer((host, port), behavior)
+    thread = threading.Thread(target=server.serve_forever, name="stub-server", daemon=True)
+    thread.start()
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+
+@click.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='Interface to listen on')
+@click.option('--port', type=int, default=8000, show_default=True, help='Port to listen on')
+@click.option('--latency', type=float, default=0.0, show_default=True, help='Seconds added to every response')
+@click.option('--jitter', type=float, default=0.0, show_default=True, help='Extra random latency, up to this many seconds')
+@click.option('--error-rate', type=click.FloatRange(0, 1), default=0.0, show_default=True,
+              help='Fraction of API requests that fail with --error-status')
+@click.option('--error-status', type=int, default=503, show_default=True, help='Status code for injected errors')
+@click.option('--run-seconds', type=float, default=2.0, show_default=True,
+              help='Mean time a processed work request stays RUNNING')
+@click.option('--failure-rate', type=click.FloatRange(0, 1), default=0.0, show_default=True,
+              help='Fraction of processed work requests that end FAILED')
+@click.option('--require-auth', is_flag=True, help='Reject API calls without a token from /auth/token')
+@click.option('--seed', type=int, help='Random seed for reproducible latency/errors/failures')
+@click.option('--items-file', type=click.Path(exists=True, dir_okay=False),
+              help='JSON list of item payloads (POST /item format) to preload')
+@click.option('--verbose', is_flag=True, help='Log every request')
+def main(host, port, latency, jitter, error_rate, error_status, run_seconds, failure_rate,
+         require_auth, seed, items_file, verbose):
+    """Run a local stub of the eCatalog API built from docs/openapi.json"""
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO, format="%(asctime)s %(message)s")
+
+    behavior = StubBehavior(
+        latency=latency,
+        latency_jitter=jitter,
+        error_rate=error_rate,
+        error_status=error_status,
+        run_seconds=run_seconds,
+        failure_rate=failure_rate,
+        require_auth=require_auth,
+        seed=seed,
+    )
+    server = StubServer((host, port), behavior)
+
+    if items_file:
+        with open(items_file, "r", encoding="utf-8") as f:
+            server.state.preload_items(json.load(f))
+
+    logger.info(f"eCatalog stub server listening on {server.url} ({len(server.state.items)} items preloaded)")
+    logger.info(f"Behavior: {behavior.model_dump()}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Stopping stub server")
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""Tests for AsyncECatalogAPIClient against the in-repo stub server"""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from ecatalog_async_client import AsyncECatalogAPIClient
+from ecatalog_client import ItemDivisions, ItemNew, TransportConfig
+from stub_server import start_stub_server
+
+
+def _item(sku):
+    return ItemNew(
+        Sku=sku, Site="RTG", Category="Adult : Livingroom : Sofas", Collection="Test", PDMDescription=f"ITEM {sku}",
+        Title=f"Item {sku}", AdvertisingCopy="", Image="", Dimensions="", GenericName="Sofa",
+        DeliveryType="Standard", Divisions=ItemDivisions(),
+    )
+
+
+def test_create_items_keeps_results_when_one_request_fails():
+    with start_stub_server() as server:
+        # Built outside any event loop, as a script would
+        client = AsyncECatalogAPIClient(server.url, transport=TransportConfig(max_retries=0), max_concurrency=2)
+        create_item = client.create_item
+
+        async def flaky_create_item(item):
+            if item.Sku == "BAD":
+                raise ConnectionError("connection reset")
+            return await create_item(item)
+
+        client.create_item = flaky_create_item
+
+        async def run():
+            async with client:
+                return await client.create_items([_item("A"), _item("BAD"), _item("B")])
+
+        results = asyncio.run(run())
+
+    assert [item.Sku for item, _, _ in results] == ["A", "BAD", "B"]
+    (_, created_a, error_a), (_, created_bad, error_bad), (_, created_b, error_b) = results
+    assert error_a is None and created_a["workrequest_id"]
+    assert created_bad is None and isinstance(error_bad, ConnectionError)
+    assert error_b is None and created_b["workrequest_id"]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the attribute vocabulary (workflows/attribute_vocabulary.py)"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic_sheets import dropship_sheet, write_sheet
+from ecatalog_client import ECatalogAPIClient
+from stub_server import start_stub_server
+from workflows.attribute_vocabulary import VOCABULARY_PATH_ENV, AttributeVocabulary, load_attribute_vocabulary
+from workflows.import_dropship_items import DropshipItemImporter
+
+
+@pytest.fixture
+def import_dirs(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATEGORY_INDEX_FILE", str(tmp_path / "no-category-index.json"))
+    monkeypatch.setenv("IMPORT_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    monkeypatch.setenv("PAYLOAD_STORE_DIR", str(tmp_path / "store"))
+    monkeypatch.setenv(VOCABULARY_PATH_ENV, str(tmp_path / "attribute_vocabulary.json"))
+    return tmp_path
+
+
+@pytest.mark.parametrize("dry_run", [True, False])
+def test_unknown_values_are_not_submitted(import_dirs, dry_run):
+    df = dropship_sheet(6, seed=1)
+    df["Color"] = ["Blue"] * 5 + ["Plaid"]
+    sheet = write_sheet(df, import_dirs / "vendor.csv")
+    sites = {site.upper() for site in df["site"]}
+    AttributeVocabulary({site: {"Color": ["Blue"]} for site in sites}).save(import_dirs / "attribute_vocabulary.json")
+
+    with start_stub_server() as server:
+        importer = DropshipItemImporter(ECatalogAPIClient(server.url))
+        stats = importer.import_from_spreadsheet(sheet, dry_run=dry_run)
+        created = set(server.state.items)
+
+    assert stats["failed"] == 1
+    assert stats["created"] == 5
+    # The live run leaves the rejected row out instead of creating a work request that fails
+    assert created == (set() if dry_run else set(df["Sku"][:5]))
+
+
+@pytest.fixture
+def vocabulary():
+    return AttributeVocabulary({
+        "rtg": {"Size": ["King", "Queen"], "Piece Count": ["2 Piece"]},
+        "KTG": {"Size": ["Twin"]},
+    })
+
+
+def test_membership_per_site(vocabulary):
+    assert vocabulary.unknown_values("RTG", "Size", ["king", "Twin"]) == ["Twin"]
+    assert vocabulary.unknown_values("ktg", "Size", ["Twin"]) == []
+    # Attribute names are matched however the sheet spells them
+    assert vocabulary.unknown_values("RTG", "PieceCount", ["3 Piece"]) == ["3 Piece"]
+    assert len(vocabulary) == 4
+
+
+def test_uncovered_site_or_attribute_is_not_checked(vocabulary):
+    assert vocabulary.allowed("OTG", "Size") is None
+    assert vocabulary.unknown_values("OTG", "Size", ["Anything"]) == []
+    assert vocabulary.unknown_values("RTG", "Decor", ["Anything"]) == []
+
+
+def test_invalid_values_by_row(vocabulary):
+    sites = pd.Series(["RTG", "KTG", "OTG", None])
+    sizes = pd.Series([["King"], ["King"], ["King"], ["King"]])
+
+    assert vocabulary.invalid_values(sites, {"Size": sizes}) == {1: {"Size": ["King"]}}
+
+
+def test_refresh_round_trip(tmp_path, monkeypatch):
+    export = tmp_path / "attribute_values.csv"
+    pd.DataFrame({
+        "site": ["RTG", "rtg", "KTG", "RTG"],
+        "attribute": ["Size", "Size", "Size", "Decor"],
+        "value": ["King", "Queen", "Twin", " "],
+    }).to_csv(export, index=False)
+
+    path = AttributeVocabulary.from_export(export).save(tmp_path / "attribute_vocabulary.json")
+    monkeypatch.setenv(VOCABULARY_PATH_ENV, str(path))
+    loaded = load_attribute_vocabulary()
+
+    assert loaded.values == {"KTG": {"Size": ["Twin"]}, "RTG": {"Size": ["King", "Queen"]}}
+    assert loaded.unknown_values("RTG", "Size", ["QUEEN"]) == []
+
+    # A refresh is picked up without restarting
+    AttributeVocabulary({"RTG": {"Size": ["King"]}}).save(path)
+    os.utime(path, (1, 1))
+    assert load_attribute_vocabulary().unknown_values("RTG", "Size", ["Queen"]) == ["Queen"]
+
+
+def test_export_needs_all_columns(tmp_path):
+    export = tmp_path / "attribute_values.csv"
+    pd.DataFrame({"site": ["RTG"], "value": ["King"]}).to_csv(export, index=False)
+
+    with pytest.raises(ValueError):
+        AttributeVocabulary.from_export(export)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Tests for the category index (workflows/category_index.py)"""
+
+import os
+
+import pandas as pd
+import pytest
+
+from workflows.category_index import (
+    FUZZY_MIN_SCORE, INDEX_PATH_ENV, CategoryIndex, category_key, load_category_index,
+)
+
+CATEGORIES = {
+    "RTG": [
+        "Adult : Living Room : Cocktail Table",
+        "Adult : Living Room : Sofas",
+        "Adult : Bedroom : Nightstands",
+        "Adult : Bedroom : Dressers",
+        "Adult : Bedroom : Chest",
+        "Adult : Bedroom : Chests",
+    ],
+    "KTG": ["Kids : Bedroom : Bunk Beds"],
+}
+
+
+@pytest.fixture
+def index():
+    return CategoryIndex(CATEGORIES)
+
+
+def test_exact_lookup_ignores_case_and_spacing(index):
+    assert category_key(" Adult:living  room : SOFAS ") == "adult:living room:sofas"
+    assert index.lookup("adult:living room:sofas", "rtg") == "Adult : Living Room : Sofas"
+    assert index.lookup("Adult : Living Room : Sofas", "KTG") is None
+    assert len(index) == 7
+
+
+def test_near_miss_is_corrected(index):
+    assert index.resolve("Adult : Living Room : Cocktail Tabels", "RTG")[0] == "Adult : Living Room : Cocktail Table"
+    assert index.check("Adult : Bedroom : Nightstand", "RTG") == ("Adult : Bedroom : Nightstands", None)
+
+
+def test_ranking(index):
+    suggestions = index.suggest("Adult : Bedroom : Dresser", "RTG")
+
+    assert suggestions[0][0] == "Adult : Bedroom : Dressers"
+    scores = [score for _, score in suggestions]
+    assert scores == sorted(scores, reverse=True)
+    assert scores[0] >= FUZZY_MIN_SCORE
+
+
+def test_ambiguous_match_is_not_corrected(index):
+    # "Chest" and "Chests" score too close to pick one
+    path, suggestions = index.resolve("Adult : Bedroom : Chestt", "RTG")
+
+    assert path is None
+    assert {suggestion for suggestion, _ in suggestions[:2]} == {"Adult : Bedroom : Chest", "Adult : Bedroom : Chests"}
+
+
+def test_unknown_category_gets_suggestions(index):
+    category, message = index.check("Adult : Bedroom : Dresers And Mirrors", "RTG")
+
+    assert category is None
+    assert "{sku}" in message and "did you mean 'Adult : Bedroom : Dressers'" in message
+
+    category, message = index.check("Outdoor : Grills", "RTG")
+    assert category is None and "did you mean" not in message
+
+
+def test_unknown_site_is_not_checked(index):
+    assert index.check("Anything : At All", "OTG") == ("Anything : At All", None)
+    assert index.suggest("Adult : Living Room : Sofas", "OTG") == []
+
+
+def test_refresh_round_trip(tmp_path, monkeypatch):
+    export = tmp_path / "categories.csv"
+    pd.DataFrame({
+        "cat_belongsToSite": ["rtg", "RTG", "KTG", None],
+        "cat_long_title": ["Adult : Living Room : Sofas", "adult : living room : sofas", "Kids : Bedroom : Bunk Beds", "Orphan"],
+    }).to_csv(export, index=False)
+
+    path = CategoryIndex.from_export(export).save(tmp_path / "category_index.json")
+    monkeypatch.setenv(INDEX_PATH_ENV, str(path))
+    loaded = load_category_index()
+
+    assert len(loaded) == 2
+    assert loaded.lookup("ADULT : LIVING ROOM : SOFAS", "RTG") == "Adult : Living Room : Sofas"
+    assert loaded.has_site("KTG") and not loaded.has_site("OTG")
+
+    # A refresh is picked up without restarting
+    CategoryIndex({"OTG": ["Outdoor : Seating"]}).save(path)
+    os.utime(path, (1, 1))
+    assert load_category_index().has_site("OTG")
+
+
+def test_export_needs_both_columns(tmp_path):
+    export = tmp_path / "categories.csv"
+    pd.DataFrame({"site": ["RTG"]}).to_csv(export, index=False)
+
+    with pytest.raises(ValueError):
+        CategoryIndex.from_export(export)
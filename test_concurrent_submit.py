@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""Tests for order-preserving concurrent submission (workflows/concurrent_submit.py)"""
+
+import random
+import threading
+import time
+
+import pytest
+
+from workflows.concurrent_submit import WINDOW_PER_WORKER, submit_ordered
+
+
+def _slow_double(n):
+    # Later items often finish first
+    time.sleep(random.random() / 200)
+    if n == 5:
+        raise ValueError("bad row")
+    return n * 2
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_results_in_input_order(concurrency):
+    results = list(submit_ordered(_slow_double, range(20), concurrency=concurrency))
+
+    assert [item for item, _, _ in results] == list(range(20))
+    assert [result for item, result, _ in results if item != 5] == [n * 2 for n in range(20) if n != 5]
+    _, result, error = results[5]
+    assert result is None and isinstance(error, ValueError)
+
+
+def test_items_consumed_lazily():
+    consumed = []
+
+    def items():
+        for n in range(100):
+            consumed.append(n)
+            yield n
+
+    results = submit_ordered(lambda n: n, items(), concurrency=2)
+    next(results)
+    # Only the window is read ahead of the consumer
+    assert len(consumed) <= 2 * WINDOW_PER_WORKER + 1
+    results.close()
+
+
+def test_stopping_early_cancels_queued_calls():
+    started = set()
+    release = threading.Event()
+
+    def blocked(n):
+        started.add(n)
+        if n:
+            release.wait(5)
+        return n
+
+    # Items 0-3 are submitted before the first result is yielded; 1 and 2 hold both workers
+    results = submit_ordered(blocked, range(50), concurrency=2)
+    assert next(results) == (0, 0, None)
+    threading.Timer(0.1, release.set).start()
+    results.close()
+
+    # The running calls finish; the queued one never starts
+    assert started <= {0, 1, 2}
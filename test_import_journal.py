@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests for the checkpoint journal of live imports (workflows/import_journal.py)"""
+
+import pytest
+
+from workflows.import_journal import CHECKPOINT_DIR_ENV, ImportJournal
+
+
+@pytest.fixture
+def sheet(tmp_path, monkeypatch):
+    monkeypatch.setenv(CHECKPOINT_DIR_ENV, str(tmp_path / "checkpoints"))
+    path = tmp_path / "vendor.csv"
+    path.write_text("SKU\nA\nB\nC\n")
+    return path
+
+
+def test_resume_skips_recorded_rows(sheet):
+    journal = ImportJournal.open("dropship", sheet)
+    journal.record(0, "A", 101)
+    journal.record(1, "B", None)
+    journal.close()
+
+    resumed = ImportJournal.open("dropship", sheet, resume=True)
+    assert resumed.path.parent.name == "dropship"
+    assert resumed.is_done(0, "A") and resumed.is_done(1, "B")
+    assert not resumed.is_done(2, "C")
+    # Rows whose create failed to return an ID are still done, but have no work request
+    assert resumed.workrequest_ids() == [101]
+
+    resumed.record(2, "C", 103)
+    resumed.close()
+    assert ImportJournal.open("dropship", sheet, resume=True).workrequest_ids() == [101, 103]
+
+
+def test_fresh_run_replaces_old_journal(sheet):
+    journal = ImportJournal.open("dropship", sheet)
+    journal.record(0, "A", 101)
+    journal.close()
+
+    fresh = ImportJournal.open("dropship", sheet)
+    assert len(fresh) == 0
+    fresh.record(1, "B", 102)
+    fresh.close()
+
+    assert ImportJournal.open("dropship", sheet, resume=True).skus() == ["B"]
+
+
+def test_edited_sheet_gets_new_journal(sheet):
+    journal = ImportJournal.open("dropship", sheet, sheet_name="Items")
+    journal.record(0, "A", 101)
+    journal.close()
+
+    sheet.write_text("SKU\nA\nB\nC\nD\n")
+    edited = ImportJournal.open("dropship", sheet, sheet_name="Items", resume=True)
+    assert edited.path != journal.path
+    assert len(edited) == 0
+
+
+def test_partial_last_line_is_ignored(sheet):
+    journal = ImportJournal.open("dropship", sheet)
+    journal.record(0, "A", 101)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"row": 1, "sku": "B", "workre')
+
+    resumed = ImportJournal.open("dropship", sheet, resume=True)
+    assert resumed.skus() == ["A"]
+
+
+def test_discard_deletes_journal(sheet):
+    journal = ImportJournal.open("dropship", sheet)
+    journal.record(0, "A", 101)
+    assert journal.exists()
+
+    journal.discard()
+    assert not journal.exists()
+    assert len(ImportJournal.open("dropship", sheet, resume=True)) == 0
+
+
+def test_resumed_run_after_partial_line_keeps_its_rows(sheet):
+    journal = ImportJournal.open("dropship", sheet)
+    journal.record(0, "A", 101)
+    journal.close()
+    with open(journal.path, "a", encoding="utf-8") as f:
+        f.write('{"row": 1, "sku": "B", "workre')
+
+    resumed = ImportJournal.open("dropship", sheet, resume=True)
+    resumed.record(1, "B", 102)
+    resumed.record(2, "C", 103)
+    resumed.close()
+
+    # The rows after the fragment are still done on the next resume
+    again = ImportJournal.open("dropship", sheet, resume=True)
+    assert again.skus() == ["A", "B", "C"]
+    assert again.workrequest_ids() == [101, 102, 103]
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests for diffing live items against sheet rows (workflows/item_sync.py)"""
+
+import pytest
+
+from benchmarks.synthetic_sheets import rtg_delivered_sheet, write_sheet
+from ecatalog_client import ECatalogAPIClient, Item, ItemAttributes, ItemDivisions, ItemNew
+from stub_server import start_stub_server
+from workflows import item_sync
+from workflows.import_rtg_delivered_items import RtgDeliveredItemImporter
+from workflows.item_sync import ItemDiff, ItemSync
+
+COMMON = dict(
+    Sku="DS1", Site="RTG", Category="Adult : Livingroom : Sofas", Collection="Test", Title="Sofa",
+    AdvertisingCopy="Soft", Image="", Dimensions="84 x 38 x 36", GenericName="Sofa",
+    DeliveryType="Standard", Divisions=ItemDivisions(),
+)
+
+
+def _live(**fields):
+    return Item(**{**COMMON, "RTGAlias": "SOFA DS1", **fields})
+
+
+def _row(**fields):
+    return ItemNew(**{**COMMON, "PDMDescription": "SOFA DS1", **fields})
+
+
+def test_in_sync():
+    diff = ItemDiff.compare(_live(), _row())
+
+    assert not diff
+    assert diff.update() is None
+    assert diff.rows() == []
+
+
+def test_patch_and_report_only_fields():
+    diff = ItemDiff.compare(_live(), _row(Title="Sleeper Sofa", PDMDescription="SLEEPER DS1", Category="Adult : Bedroom : Beds"))
+
+    assert diff.update().model_dump(exclude_none=True) == {"RTGAlias": "SLEEPER DS1", "Title": "Sleeper Sofa"}
+    assert diff.report_only == {"Category": ("Adult : Livingroom : Sofas", "Adult : Bedroom : Beds")}
+    assert {(row["field"], row["action"]) for row in diff.rows()} == {
+        ("RTGAlias", "patch"), ("Title", "patch"), ("Category", "manual"),
+    }
+
+
+def test_blank_cells_do_not_clear():
+    diff = ItemDiff.compare(_live(AdditionalNotes="Assembly required"), _row(AdvertisingCopy="", AdditionalNotes=None))
+
+    assert not diff
+
+
+def test_attribute_order_is_ignored():
+    live = _live(Attributes=ItemAttributes(Color=["Gray", "Blue"], Material=[]))
+    assert not ItemDiff.compare(live, _row(Attributes=ItemAttributes(Color=["Blue", "Gray"])))
+
+    diff = ItemDiff.compare(live, _row(Attributes=ItemAttributes(Color=["Blue"])))
+    assert list(diff.report_only) == ["Attributes"]
+    assert diff.rows()[0]["current"] == "Color: Blue, Gray"
+
+
+@pytest.fixture
+def rtg_sheet(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATEGORY_INDEX_FILE", str(tmp_path / "no-category-index.json"))
+    monkeypatch.setenv("ATTRIBUTE_VOCABULARY_FILE", str(tmp_path / "no-attribute-vocabulary.json"))
+    df = rtg_delivered_sheet(40, seed=3)
+    return write_sheet(df, tmp_path / "delivered.csv"), df
+
+
+def _sync(path, **kwargs):
+    with start_stub_server() as server:
+        client = ECatalogAPIClient(server.url)
+        return ItemSync(client, RtgDeliveredItemImporter(client), concurrency=4).run(path, **kwargs)
+
+
+def test_rows_without_build_in_status_are_not_synced(rtg_sheet):
+    path, df = rtg_sheet
+    build_in = RtgDeliveredItemImporter(None).build_in_mask(df)
+    assert 0 < build_in.sum() < len(df)
+
+    stats = _sync(path)
+
+    assert stats["skipped"] == len(df) - build_in.sum()
+    assert stats["processed"] == build_in.sum()
+    # The stub has none of the SKUs: only the filtered rows were looked up
+    assert stats["missing"] == build_in.sum() - stats["failed"]
+
+
+def test_limit_without_row_estimate(rtg_sheet, monkeypatch):
+    # .xls files and xlsx files without a dimension record can't be estimated
+    monkeypatch.setattr(item_sync, "estimate_rows", lambda *args: None)
+    path, df = rtg_sheet
+
+    stats = _sync(path, limit=10)
+
+    assert stats["processed"] + stats["skipped"] == 10
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Tests for row conversion on a process pool (workflows/parallel_convert.py)"""
+
+import io
+
+import pytest
+
+from benchmarks.synthetic_sheets import dropship_sheet, write_sheet
+from ecatalog_client import ECatalogAPIClient
+from workflows import import_dropship_items, import_engine
+from workflows.import_dropship_items import DropshipItemImporter
+
+
+@pytest.fixture
+def sheet(tmp_path, monkeypatch):
+    # Workers inherit the environment: no local category index or vocabulary for anyone
+    monkeypatch.setenv("CATEGORY_INDEX_FILE", str(tmp_path / "no-category-index.json"))
+    monkeypatch.setenv("ATTRIBUTE_VOCABULARY_FILE", str(tmp_path / "no-attribute-vocabulary.json"))
+    df = dropship_sheet(2500, seed=7)
+    # Rows that fail to convert, in more than one shard
+    df.loc[[10, 1500, 2499], "Category"] = ""
+    return write_sheet(df, tmp_path / "vendor.csv")
+
+
+def _dry_run(sheet, workers, monkeypatch):
+    output = io.StringIO()
+    for module in (import_engine, import_dropship_items):
+        monkeypatch.setattr(module.console, "file", output)
+    importer = DropshipItemImporter(ECatalogAPIClient("http://127.0.0.1:9"))
+    stats = importer.import_from_spreadsheet(sheet, dry_run=True, workers=workers)
+    # The progress bar and load time differ from run to run
+    lines = [line for line in output.getvalue().splitlines() if not line.startswith("Read ") and "━" not in line]
+    return stats, lines
+
+
+def test_workers_match_single_process(sheet, monkeypatch):
+    single_stats, single_lines = _dry_run(sheet, 1, monkeypatch)
+    pooled_stats, pooled_lines = _dry_run(sheet, 2, monkeypatch)
+
+    assert single_stats["failed"] >= 3
+    assert pooled_stats == single_stats
+    assert pooled_lines == single_lines
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Tests for batched payload exports (workflows/payload_export.py)"""
+
+import gzip
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from workflows import payload_export
+from workflows.payload_export import (
+    EXPORT_DIR_ENV, PayloadExport, PayloadExportReader, export_dir, find_exports, index_path,
+)
+
+
+@pytest.fixture
+def small_batches(monkeypatch):
+    # Several gzip members from a handful of payloads
+    monkeypatch.setattr(payload_export, "BATCH_LINES", 3)
+
+
+def _write(directory, name, keys):
+    with PayloadExport.create(directory, name) as export:
+        for number, key in enumerate(keys):
+            export.write(key, {"Sku": key, "Number": number})
+    return export.path
+
+
+def test_round_trip_and_lookup(tmp_path, small_batches):
+    keys = [f"DS{number}" for number in range(10)]
+    path = _write(tmp_path, "vendor", keys)
+
+    reader = PayloadExportReader(path)
+    assert len(reader) == 10
+    assert reader.keys() == keys
+    assert len(reader.index["members"]) == 4
+    assert [payload["Sku"] for payload in reader] == keys
+    assert "DS7" in reader and "DS10" not in reader
+    assert reader.get("DS7") == [{"Sku": "DS7", "Number": 7}]
+    assert reader.get("DS10") == []
+    # The index opens the same export
+    assert PayloadExportReader(index_path(path)).get("DS0") == [{"Sku": "DS0", "Number": 0}]
+
+
+def test_duplicate_keys_are_all_kept(tmp_path, small_batches):
+    path = _write(tmp_path, "rooms", ["ROOM1", "ROOM2", "ROOM1", "ROOM3", "ROOM1"])
+
+    assert [payload["Number"] for payload in PayloadExportReader(path).get("ROOM1")] == [0, 2, 4]
+
+
+def test_is_one_gzip_stream(tmp_path, small_batches):
+    path = _write(tmp_path, "vendor", [f"DS{number}" for number in range(7)])
+
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        lines = [json.loads(line) for line in f]
+    assert [payload["Number"] for payload in lines] == list(range(7))
+
+    if shutil.which("zcat"):
+        output = subprocess.run(["zcat", str(path)], check=True, capture_output=True).stdout
+        assert len(output.splitlines()) == 7
+
+
+def test_same_second_runs_get_separate_files(tmp_path):
+    first = _write(tmp_path, "vendor", ["DS1"])
+    second = _write(tmp_path, "vendor", ["DS2"])
+
+    assert first != second
+    assert set(find_exports(tmp_path)) == {first, second}
+    assert find_exports(tmp_path / "missing") == []
+
+
+def test_export_dir(tmp_path, monkeypatch):
+    monkeypatch.delenv(EXPORT_DIR_ENV, raising=False)
+    assert export_dir("dropship").parts[-3:] == ("data", "dropship", "json")
+
+    monkeypatch.setenv(EXPORT_DIR_ENV, str(tmp_path))
+    assert export_dir("dropship") == tmp_path / "dropship"
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Tests for the incremental import payload store (workflows/payload_store.py)"""
+
+import pytest
+
+from ecatalog_client import ItemDivisions, ItemNew
+from workflows.payload_store import (
+    CHANGED, NEW, NOT_UPDATABLE, STORE_DIR_ENV, UNCHANGED, PayloadStore, store_path,
+)
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv(STORE_DIR_ENV, str(tmp_path))
+    return tmp_path
+
+
+def _item(sku="DS1", **fields):
+    values = dict(
+        Sku=sku, Site="RTG", Category="Adult : Livingroom : Sofas", Collection="Test", PDMDescription=f"ITEM {sku}",
+        Title=f"Item {sku}", AdvertisingCopy="", Image="", Dimensions="", GenericName="Sofa",
+        DeliveryType="Standard", Divisions=ItemDivisions(),
+    )
+    values.update(fields)
+    return ItemNew(**values)
+
+
+def test_compare():
+    store = PayloadStore.open("dropship")
+    assert store.compare(_item()) == (NEW, [])
+
+    store.record(_item())
+    assert store.compare(_item()) == (UNCHANGED, [])
+    assert store.compare(_item(Title="Sofa", Category="Adult : Bedroom : Beds")) == (CHANGED, ["Category", "Title"])
+    # A field left out of the payload is a change too
+    assert store.compare(_item(Brand="Rooms To Go"))[1] == ["Brand"]
+
+
+def test_check_splits_updatable_fields():
+    store = PayloadStore.open("dropship")
+    store.record(_item())
+
+    state, update, message = store.check(_item(Title="Sofa", Category="Adult : Bedroom : Beds"))
+    assert state == CHANGED
+    assert update.model_dump(exclude_none=True) == {"Title": "Sofa"}
+    assert "Category" in message
+
+    state, update, _ = store.check(_item(Category="Adult : Bedroom : Beds"))
+    assert (state, update) == (NOT_UPDATABLE, None)
+
+
+def test_partial_record_keeps_unsent_changes():
+    store = PayloadStore.open("dropship")
+    store.record(_item())
+
+    changed = _item(Title="Sofa", Category="Adult : Bedroom : Beds")
+    store.record(changed, fields=["Title"])
+    # The Category change was not sent, so it is still reported
+    assert store.compare(changed) == (CHANGED, ["Category"])
+
+    store.record(changed)
+    assert store.compare(changed) == (UNCHANGED, [])
+
+
+def test_reopen_and_compact():
+    store = PayloadStore.open("dropship")
+    for title in ("One", "Two", "Three"):
+        store.record(_item(Title=title))
+    store.record(_item("DS2"))
+    store.close()
+
+    path = store_path("dropship")
+    assert len(path.read_text().splitlines()) == 4
+
+    reopened = PayloadStore.open("dropship")
+    assert len(reopened) == 2
+    assert reopened.compare(_item(Title="Three")) == (UNCHANGED, [])
+
+    reopened.compact()
+    assert len(path.read_text().splitlines()) == 2
+    assert PayloadStore.open("dropship").compare(_item(Title="Three")) == (UNCHANGED, [])
+
+
+def test_append_after_partial_line():
+    store = PayloadStore.open("dropship")
+    store.record(_item())
+    store.close()
+    path = store_path("dropship")
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"fields": {"Ca')
+
+    store = PayloadStore.open("dropship")
+    store.record(_item(Title="Sofa"))
+    store.record(_item("DS2"))
+    store.close()
+
+    reopened = PayloadStore.open("dropship")
+    assert reopened.compare(_item(Title="Sofa")) == (UNCHANGED, [])
+    assert reopened.compare(_item("DS2")) == (UNCHANGED, [])
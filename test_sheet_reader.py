@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Tests for streaming spreadsheet reads (workflows/sheet_reader.py)"""
+
+import pandas as pd
+import pytest
+
+from workflows.sheet_reader import SheetReader
+
+
+def _sheet():
+    return pd.DataFrame({
+        "SKU": [f"{n:07d}" for n in range(25)],
+        "Title": [f"Item {n}" for n in range(25)],
+        "Price": [n * 1.5 for n in range(25)],
+        "Unused": ["x"] * 25,
+    })
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    path = tmp_path / "vendor.csv"
+    _sheet().to_csv(path, index=False)
+    return path
+
+
+@pytest.fixture
+def xlsx_file(tmp_path):
+    pytest.importorskip("openpyxl")
+    path = tmp_path / "vendor.xlsx"
+    sheet = _sheet()
+    with pd.ExcelWriter(path, engine="openpyxl") as writer:
+        sheet.to_excel(writer, index=False)
+        # A formatted but empty row at the end isn't data
+        writer.sheets["Sheet1"].cell(row=len(sheet) + 3, column=1).number_format = "0.00"
+    return path
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+def test_csv_batches(csv_file, prefetch):
+    reader = SheetReader(csv_file, columns=["SKU", "Title", "Missing"], text_columns=["SKU"],
+                         batch_rows=10, prefetch=prefetch)
+    batches = list(reader)
+
+    assert [len(batch) for batch in batches] == [10, 10, 5]
+    df = pd.concat(batches)
+    assert list(df.columns) == ["SKU", "Title"]
+    # Read as text, leading zeros kept
+    assert df["SKU"].iloc[3] == "0000003"
+    assert list(df.index) == list(range(25))
+    assert reader.rows == 25
+    assert "25 rows" in reader.summary() and "2 of 4 columns" in reader.summary()
+
+
+def test_limit(csv_file):
+    reader = SheetReader(csv_file, batch_rows=10, limit=12, prefetch=0)
+
+    assert [len(batch) for batch in reader] == [10, 2]
+    assert reader.rows == 12
+
+
+def test_xlsx_matches_read_excel(xlsx_file):
+    reader = SheetReader(xlsx_file, columns=["SKU", "Title", "Price"], text_columns=["SKU"],
+                         batch_rows=10, engine="openpyxl")
+    df = pd.concat(list(reader))
+
+    expected = pd.read_excel(xlsx_file, usecols=["SKU", "Title", "Price"], dtype={"SKU": str})
+    pd.testing.assert_frame_equal(df, expected, check_dtype=False)
+    assert reader.rows == 25
+
+
+def test_unsupported_format(tmp_path):
+    with pytest.raises(ValueError):
+        SheetReader(tmp_path / "vendor.ods")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""Tests for the SKU pre-check (workflows/sku_precheck.py)"""
+
+from ecatalog_client import ECatalogAPIClient, SkuLookupResponse
+from stub_server import start_stub_server
+from workflows.sku_precheck import CREATE, EXISTS, SITE_CONFLICT, SkuPrecheck
+
+
+def _lookup(sku, site="RTG", exists=True):
+    return SkuLookupResponse(
+        sku=sku, site=site if exists else "", type="Item" if exists else "Missing", divisions={}, exists=exists
+    )
+
+
+class FakeClient:
+    """Answers lookup_skus from a fixed table of (result, error) per SKU"""
+
+    def __init__(self, answers):
+        self.answers = answers
+
+    def lookup_skus(self, skus, concurrency=8):
+        for sku in dict.fromkeys(skus):
+            result, error = self.answers[sku]
+            yield sku, result, error
+
+
+def test_exists_false_is_created():
+    """The API answers 200 with exists: false for SKUs it doesn't have"""
+    precheck = SkuPrecheck.run(FakeClient({"NEW1": (_lookup("NEW1", exists=False), None)}), ["NEW1"])
+
+    assert precheck.classify("NEW1", "RTG") == CREATE
+    assert precheck.classify("NEW1", "OTG") == CREATE
+    assert precheck.check("NEW1", "RTG") == (CREATE, None)
+    assert precheck.existing("NEW1") is None
+    assert precheck.missing == {"NEW1"}
+    assert not precheck.found
+
+
+def test_buckets():
+    client = FakeClient({
+        "OLD": (_lookup("OLD", site="RTG"), None),
+        "OTHER": (_lookup("OTHER", site="KTG"), None),
+        "GONE": (None, None),
+        "FAILED": (None, RuntimeError("timeout")),
+    })
+    precheck = SkuPrecheck.run(client, ["OLD", "OTHER", "GONE", "FAILED", "OLD"])
+
+    assert len(precheck) == 4
+    assert precheck.classify("OLD", "rtg") == EXISTS
+    assert precheck.classify(" OLD ", None) == EXISTS
+    assert precheck.classify("OTHER", "RTG") == SITE_CONFLICT
+    assert precheck.classify("GONE", "RTG") == CREATE
+    # A failed lookup is submitted anyway; the server decides
+    assert precheck.classify("FAILED", "RTG") == CREATE
+    assert precheck.errors == {"FAILED": "timeout"}
+    assert precheck.check("OTHER", "RTG")[1] is not None
+
+
+def test_against_stub_server():
+    with start_stub_server() as server:
+        server.state.preload_items([
+            {"Sku": "HAVE-RTG", "Site": "RTG", "Divisions": {}},
+            {"Sku": "HAVE-KTG", "Site": "KTG", "Divisions": {}},
+        ])
+        client = ECatalogAPIClient(server.url)
+        precheck = SkuPrecheck.run(client, ["HAVE-RTG", "HAVE-KTG", "NEW-1", "NEW-2"], concurrency=4)
+
+    assert precheck.classify("HAVE-RTG", "RTG") == EXISTS
+    assert precheck.classify("HAVE-KTG", "RTG") == SITE_CONFLICT
+    assert precheck.classify("NEW-1", "RTG") == CREATE
+    assert precheck.classify("NEW-2", "KTG") == CREATE
+    assert not precheck.errors
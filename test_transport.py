@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Tests for the client's retry policy (TransportConfig and ECatalogAPIClient._make_request)"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+import requests
+
+import ecatalog_client
+from ecatalog_client import ECatalogAPIClient, TransportConfig
+from stub_server import StubBehavior, start_stub_server
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Delays the client would have slept, without sleeping"""
+    delays = []
+    monkeypatch.setattr(ecatalog_client.time, "sleep", delays.append)
+    return delays
+
+
+def _response(status, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response.headers.update(headers or {})
+    response._content = b"{}"
+    response._content_consumed = True
+    return response
+
+
+class FakeSession:
+    """Answers requests from a queue of responses or exceptions"""
+
+    def __init__(self, outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.headers = {}
+
+    def request(self, method, url, **kwargs):
+        self.calls.append(method)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _client(outcomes, **transport):
+    client = ECatalogAPIClient("http://stub", transport=TransportConfig(**transport))
+    client.session = FakeSession(outcomes)
+    return client
+
+
+def test_retry_after_seconds_and_date():
+    transport = TransportConfig(backoff_max=30)
+    assert transport.backoff_delay(0, "7") == 7
+    # Capped like any other delay
+    assert transport.backoff_delay(0, "120") == 30
+
+    retry_at = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=10), usegmt=True)
+    assert 8 <= transport.backoff_delay(0, retry_at) <= 10
+
+    # Unparseable, or ignored by configuration: back to jittered backoff
+    assert transport.backoff_delay(0, "soon") <= transport.backoff_factor
+    assert TransportConfig(respect_retry_after=False).backoff_delay(0, "7") <= 0.5
+
+
+def test_backoff_is_jittered_and_capped():
+    transport = TransportConfig(backoff_factor=1, backoff_max=5)
+    delays = [transport.backoff_delay(attempt) for attempt in range(6) for _ in range(50)]
+
+    assert all(0 <= delay <= 5 for delay in delays)
+    assert all(delay <= 2 for delay in delays[50:100])
+    # Full jitter: not every client sleeps the same
+    assert len(set(delays[250:])) > 1
+
+
+def test_status_policy():
+    transport = TransportConfig()
+    assert transport.should_retry_status("GET", 503)
+    assert transport.should_retry_status("POST", 429)
+    assert not transport.should_retry_status("POST", 503)
+    assert not transport.should_retry_status("GET", 404)
+
+
+def test_get_retried_until_success(sleeps):
+    client = _client([_response(503), _response(502), _response(200)], max_retries=3)
+
+    assert client._make_request("GET", "/item/X").status_code == 200
+    assert client.session.calls == ["GET"] * 3
+    assert len(sleeps) == 2
+
+
+def test_post_retried_only_on_429_and_connect_timeout(sleeps):
+    client = _client(
+        [_response(429, {"Retry-After": "2"}), requests.exceptions.ConnectTimeout("down"), _response(200)]
+    )
+    assert client._make_request("POST", "/item").status_code == 200
+    assert sleeps[0] == 2
+
+    # The server may have acted on these: no second attempt
+    client = _client([_response(503)])
+    assert client._make_request("POST", "/item").status_code == 503
+    client = _client([requests.exceptions.ReadTimeout("slow")])
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client._make_request("POST", "/item")
+    assert client.session.calls == ["POST"]
+
+
+def test_max_retries_cutoff(sleeps):
+    client = _client([requests.exceptions.ConnectionError("reset")] * 3, max_retries=2)
+    with pytest.raises(requests.exceptions.ConnectionError):
+        client._make_request("GET", "/item/X")
+    assert len(client.session.calls) == 3
+
+    # Disabled: the first answer is final
+    client = _client([_response(503)], max_retries=0)
+    assert client._make_request("GET", "/item/X").status_code == 503
+    assert len(sleeps) == 2
+
+
+def test_stub_server_429_honours_retry_after(sleeps):
+    behavior = StubBehavior(error_rate=1.0, error_status=429)
+    with start_stub_server(behavior) as server:
+        client = ECatalogAPIClient(server.url, transport=TransportConfig(max_retries=2))
+        with pytest.raises(requests.exceptions.HTTPError) as error:
+            client.get_workrequest(1)
+        requests_seen = sum(server.state.request_counts.values())
+
+    assert error.value.response.status_code == 429
+    assert requests_seen == 3
+    # The stub sends Retry-After: 1
+    assert sleeps == [1, 1]
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Tests for the append-only workflow log (workflows/workflow_logger.py)"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+import pandas as pd
+
+from workflows.workflow_logger import LOG_COLUMNS, WorkflowLogger
+
+WRITERS = 4
+ROWS_PER_WRITER = 50
+
+
+def _log_rows(logs_dir, writer):
+    logger = WorkflowLogger("dropship", logs_dir)
+    for n in range(ROWS_PER_WRITER):
+        # Rows well past a pipe buffer, so an unlocked write could interleave
+        logger.log_submission(f"vendor-{writer}.xlsx", [f"W{writer}-{n}"] * 2000, [n], notes="x" * 20000)
+
+
+def test_concurrent_appends_stay_whole(tmp_path):
+    with ProcessPoolExecutor(max_workers=WRITERS, mp_context=get_context("spawn")) as pool:
+        list(pool.map(_log_rows, [tmp_path] * WRITERS, range(WRITERS)))
+
+    entries = WorkflowLogger("dropship", tmp_path).read_entries()
+
+    assert len(entries) == WRITERS * ROWS_PER_WRITER
+    for writer in range(WRITERS):
+        # Each writer's rows are all there, in the order it wrote them
+        ids = [entry["Work Request IDs"] for entry in entries if entry["Source File"] == f"vendor-{writer}.xlsx"]
+        assert ids == [str(n) for n in range(ROWS_PER_WRITER)]
+
+
+def test_torn_line_is_skipped(tmp_path):
+    logger = WorkflowLogger("dropship", tmp_path)
+    logger.log_import("a.xlsx", ["A"], [1])
+    with open(logger._get_store_path(), "a", encoding="utf-8") as f:
+        f.write('{"Action": "Imp')
+    logger.log_import("b.xlsx", ["B"], [2])
+
+    assert [entry["Source File"] for entry in logger.read_entries()] == ["a.xlsx"]
+
+
+def test_export_excel(tmp_path):
+    logger = WorkflowLogger("dropship", tmp_path)
+    assert logger.export_excel() is None
+
+    logger.log_import("a.xlsx", ["A", "B"], [1, 2])
+    logger.log_processing("a.xlsx", ["A", "B"], [1, 2], status="Failed", notes="timeout")
+    path = logger.export_excel()
+
+    df = pd.read_excel(path)
+    assert list(df.columns) == LOG_COLUMNS
+    assert df["Action"].tolist() == ["Import", "Process"]
+    assert df["SKU Count"].tolist() == [2, 2]
+    # The workbook is swapped in whole; no temp file is left behind
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_summary_falls_back_to_workbook(tmp_path):
+    # A day logged before the append-only store only has its workbook
+    logger = WorkflowLogger("dropship", tmp_path)
+    pd.DataFrame([{"Action": "Import", "Source File": "old.xlsx", "SKU Count": 3}], columns=LOG_COLUMNS).to_excel(
+        logger._get_log_file_path("2024-01-02"), index=False
+    )
+
+    summary = logger.get_log_summary("2024-01-02")
+    assert summary["Source File"].tolist() == ["old.xlsx"]
+    assert logger.get_log_summary("2024-01-03") is None
+
+    # Today's entries come from the store
+    logger.log_import("new.xlsx", ["A"], [1])
+    assert logger.get_log_summary()["Source File"].tolist() == ["new.xlsx"]
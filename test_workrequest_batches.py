@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""Tests for chunked work request processing (workflows/workrequest_batches.py)"""
+
+import requests
+from click.testing import CliRunner
+
+import cli
+from ecatalog_client import TransportConfig
+from stub_server import start_stub_server
+from workflows.workrequest_batches import process_in_chunks
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} Error", response=response)
+
+
+class FakeClient:
+    """process_workrequests fails with the queued errors; a failure can still process the IDs"""
+
+    def __init__(self, ids, failures):
+        self.transport = TransportConfig(backoff_factor=0)
+        self.status = {wr_id: "PENDING" for wr_id in ids}
+        # [(error, whether the server processed the IDs anyway)]
+        self.failures = list(failures)
+        self.sent = []
+
+    def process_workrequests(self, workrequest_ids):
+        self.sent.append(list(workrequest_ids))
+        if any(self.status[wr_id] != "PENDING" for wr_id in workrequest_ids):
+            raise _http_error(400)
+        error, processed = self.failures.pop(0) if self.failures else (None, True)
+        if processed:
+            for wr_id in workrequest_ids:
+                self.status[wr_id] = "RUNNING"
+        if error:
+            raise error
+        return {"processed": len(workrequest_ids)}
+
+    def get_workrequest(self, workrequest_id):
+        return {"id": workrequest_id, "status": self.status[workrequest_id]}
+
+    def list_workrequests(self, status=None, route_name=None):
+        return [self.get_workrequest(wr_id) for wr_id, s in self.status.items() if s == status]
+
+
+def test_read_timeout_after_processing_is_not_resent():
+    client = FakeClient([1, 2, 3], [(requests.exceptions.ReadTimeout("slow"), True)])
+    summary = process_in_chunks(client, [1, 2, 3], chunk_size=3)
+
+    assert client.sent == [[1, 2, 3]]
+    assert summary["accepted"] == [1, 2, 3]
+    assert summary["failed"] == []
+
+
+def test_read_timeout_before_processing_resends_pending():
+    client = FakeClient([1, 2], [(requests.exceptions.ReadTimeout("slow"), False)])
+    summary = process_in_chunks(client, [1, 2], chunk_size=2)
+
+    assert client.sent == [[1, 2], [1, 2]]
+    assert summary["accepted"] == [1, 2]
+
+
+def test_connect_timeout_and_429_are_resent():
+    client = FakeClient([1], [(requests.exceptions.ConnectTimeout("down"), False), (_http_error(429), False)])
+    summary = process_in_chunks(client, [1], chunk_size=1)
+
+    assert len(client.sent) == 3
+    assert summary["accepted"] == [1]
+
+
+def test_server_errors_are_not_resent():
+    client = FakeClient([1, 2, 3, 4], [(_http_error(500), False)])
+    summary = process_in_chunks(client, [1, 2, 3, 4], chunk_size=2, parallelism=1)
+
+    assert client.sent == [[1, 2], [3, 4]]
+    assert summary["failed"] == [1, 2]
+    assert summary["accepted"] == [3, 4]
+    assert summary["failed_chunks"] == 1
+
+
+def test_cli_process_sends_chunks():
+    with start_stub_server() as server:
+        ids = [server.state.add_workrequest("create_item", {})["id"] for _ in range(5)]
+        result = CliRunner().invoke(
+            cli.main,
+            ["--api-url", server.url, "--no-auth", "workrequest", "process", *map(str, ids), "--chunk-size", "2"],
+        )
+        requests_sent = server.state.request_counts["process_workrequests"]
+
+    assert result.exit_code == 0, result.output
+    assert requests_sent == 3
+    assert "5 accepted" in result.output
+    assert "Result type" not in result.output
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Tests for work request status fetching and watching (workflows/workrequest_status.py)"""
+
+import time
+
+import pytest
+
+from ecatalog_client import ECatalogAPIClient
+from stub_server import StubBehavior, start_stub_server
+from workflows import workrequest_status
+from workflows.workrequest_status import (
+    WorkRequestWatcher, count_statuses, fetch_workrequests, summarize_workrequest_status,
+)
+
+
+def _add(server, count, dispatch=False):
+    ids = []
+    for _ in range(count):
+        wr = server.state.add_workrequest("create_item", {})
+        if dispatch:
+            server.state.dispatch(wr)
+        ids.append(wr["id"])
+    return ids
+
+
+def test_small_sets_are_fetched_by_id():
+    with start_stub_server() as server:
+        ids = _add(server, 5)
+        states = fetch_workrequests(ECatalogAPIClient(server.url), ids, list_threshold=10)
+        counts = dict(server.state.request_counts)
+
+    assert list(states) == ids
+    assert all(wr["status"] == "PENDING" for wr in states.values())
+    assert counts.get("get_workrequest_by_id") == 5
+    assert "list_workrequests" not in counts
+
+
+def test_large_sets_are_listed_by_status():
+    with start_stub_server(StubBehavior(run_seconds=60)) as server:
+        pending = _add(server, 4)
+        running = _add(server, 3, dispatch=True)
+        # An ID the listing can't have falls back to a GET, which 404s
+        states = fetch_workrequests(ECatalogAPIClient(server.url), pending + running + [999], list_threshold=5)
+        counts = dict(server.state.request_counts)
+
+    assert counts["list_workrequests"] == 4
+    assert counts["get_workrequest_by_id"] == 1
+    assert states[999] is None
+    assert count_statuses(states) == {"PENDING": 5, "RUNNING": 3, "COMPLETED": 0, "FAILED": 0}
+
+
+def test_summary_with_failures():
+    with start_stub_server(StubBehavior(run_seconds=0, failure_rate=0.5, seed=1)) as server:
+        ids = _add(server, 20, dispatch=True)
+        counts = summarize_workrequest_status(ECatalogAPIClient(server.url), ids)
+
+    assert counts["COMPLETED"] + counts["FAILED"] == 20
+    assert counts["FAILED"] > 0 and counts["PENDING"] == counts["RUNNING"] == 0
+
+
+class ScriptedClient:
+    """Work requests that finish on the poll given for each (None = never)"""
+
+    def __init__(self, finish_on_poll):
+        self.finish_on_poll = finish_on_poll
+        self.polls = 0
+        self.fetched = []
+
+    def get_workrequest(self, wr_id):
+        self.fetched.append(wr_id)
+        done = self.finish_on_poll[wr_id] is not None and self.polls >= self.finish_on_poll[wr_id]
+        return {"id": wr_id, "status": "COMPLETED" if done else "RUNNING"}
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(workrequest_status.time, "sleep", delays.append)
+    return delays
+
+
+def _watch(client, **kwargs):
+    watcher = WorkRequestWatcher(client, list(client.finish_on_poll), list_threshold=None,
+                                 min_interval=1, max_interval=4, backoff=2)
+
+    def count_poll(watcher, finished):
+        client.polls += 1
+
+    return watcher, watcher.watch(on_poll=count_poll, **kwargs)
+
+
+def test_watch_backs_off_and_resets(sleeps):
+    # Polls 0-3 find nothing new, poll 4 finishes one, poll 6 the other
+    client = ScriptedClient({1: 4, 2: 6})
+    _, counts = _watch(client)
+
+    assert counts["COMPLETED"] == 2
+    assert sleeps == [2, 4, 4, 4, 1, 2]
+    # Finished work requests aren't fetched again
+    assert client.fetched.count(1) == 5 and client.fetched.count(2) == 7
+
+
+def test_watch_timeout(monkeypatch):
+    clock = [0.0]
+    delays = []
+
+    def sleep(seconds):
+        delays.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(workrequest_status.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(workrequest_status.time, "sleep", sleep)
+
+    watcher, counts = _watch(ScriptedClient({1: None}), timeout=5)
+
+    assert counts["RUNNING"] == 1
+    assert watcher.open_ids == [1]
+    # The last sleep is cut short at the deadline
+    assert delays == [2, 3]
+
+
+def test_eta_from_throughput():
+    client = ScriptedClient({wr_id: 1 if wr_id <= 3 else None for wr_id in range(1, 11)})
+    watcher = WorkRequestWatcher(client, list(client.finish_on_poll), list_threshold=None)
+    assert watcher.eta_seconds() is None
+
+    watcher.poll()
+    client.polls = 1
+    watcher.started_at = time.monotonic() - 60
+    watcher.poll()
+
+    # Three finished in the last minute, seven to go
+    assert watcher.throughput() == pytest.approx(3, rel=0.01)
+    assert watcher.eta_seconds() == pytest.approx(140, rel=0.01)
@@ -0,0 +1,165 @@
+"""
+Attribute vocabulary: the allowed attribute values per site
+
+The server only accepts attribute values (Size, Decor, ...) that exist for the item's
+site, and rejects the rest asynchronously - the work request FAILS with "Missing
+attribute values". The vocabulary is a local copy of those values, exported from the
+AttributeValues tables (see sql/EXPORT - Attribute values per site.sql) and cached
+as JSON (``cli.py attributes refresh``), so imports can flag unknown values for a
+whole sheet with set lookups; those rows are reported and never submitted.
+
+Values are compared case-insensitively, as the database does. Attributes or sites
+the vocabulary has no values for are not checked.
+"""
+
+import json
+import os
+import re
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+import pandas as pd
+
+DEFAULT_VOCABULARY_PATH = Path(__file__).parent.parent / "data" / "attributes" / "attribute_vocabulary.json"
+
+# Environment variable pointing at an alternative vocabulary file
+VOCABULARY_PATH_ENV = "ATTRIBUTE_VOCABULARY_FILE"
+
+# Column names accepted in an export, checked in order
+SITE_COLUMNS = ("site", "attributevaluesite_site", "attributevalue_site", "Site")
+ATTRIBUTE_COLUMNS = ("attribute", "attributedefinition_name", "Attribute")
+VALUE_COLUMNS = ("value", "attributevalue_value", "Value")
+
+_NON_ALPHANUMERIC = re.compile(r"[^0-9a-z]")
+
+
+def attribute_key(name: str) -> str:
+    """Attribute name as matched: "Piece Count", "PieceCount" and "piece_count" are the same"""
+    return _NON_ALPHANUMERIC.sub("", str(name).lower())
+
+
+def _first_column(df: pd.DataFrame, candidates: Tuple[str, ...]) -> Optional[str]:
+    return next((column for column in candidates if column in df.columns), None)
+
+
+class AttributeVocabulary:
+    """Allowed values per site and attribute"""
+
+    def __init__(self, values: Dict[str, Dict[str, Iterable[str]]], generated: Optional[str] = None):
+        self.generated = generated
+        self.values: Dict[str, Dict[str, List[str]]] = {}
+        self._allowed: Dict[Tuple[str, str], FrozenSet[str]] = {}
+        for site, attributes in values.items():
+            site = site.upper()
+            for attribute, attribute_values in attributes.items():
+                attribute_values = sorted({str(v) for v in attribute_values})
+                self.values.setdefault(site, {})[attribute] = attribute_values
+                self._allowed[(site, attribute_key(attribute))] = frozenset(
+                    v.casefold() for v in attribute_values
+                )
+
+    def __len__(self) -> int:
+        return sum(len(allowed) for allowed in self._allowed.values())
+
+    def allowed(self, site: str, attribute: str) -> Optional[FrozenSet[str]]:
+        """Casefolded allowed values, or None if this site/attribute isn't covered"""
+        return self._allowed.get((str(site).upper(), attribute_key(attribute)))
+
+    def unknown_values(self, site: str, attribute: str, values: Iterable[str]) -> List[str]:
+        """The values not allowed for this site and attribute"""
+        allowed = self.allowed(site, attribute)
+        if allowed is None:
+            return []
+        return [value for value in values if value.casefold() not in allowed]
+
+    def invalid_values(
+        self, sites: pd.Series, attribute_columns: Dict[str, pd.Series]
+    ) -> Dict[int, Dict[str, List[str]]]:
+        """
+        Check whole attribute columns against the vocabulary
+
+        Args:
+            sites: Site per row
+            attribute_columns: API attribute name -> column of value lists (or None)
+
+        Returns:
+            {row position: {attribute: [unknown values]}} for rows with unknown values
+        """
+        problems: Dict[int, Dict[str, List[str]]] = {}
+        site_values = [str(site).upper() if site is not None else "" for site in sites.tolist()]
+
+        for attribute, column in attribute_columns.items():
+            # Sheets repeat the same few values; check each (site, cell) once
+            checked: Dict[Tuple[str, Tuple[str, ...]], List[str]] = {}
+            for position, (site, values) in enumerate(zip(site_values, column.tolist())):
+                if not values:
+                    continue
+                key = (site, tuple(values))
+                if key not in checked:
+                    checked[key] = self.unknown_values(site, attribute, values)
+                if checked[key]:
+                    problems.setdefault(position, {})[attribute] = checked[key]
+        return problems
+
+    @classmethod
+    def from_export(cls, path: Union[str, Path], sheet_name: Optional[str] = None) -> "AttributeVocabulary":
+        """Build the vocabulary from a CSV/Excel export with site, attribute and value columns"""
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            df = pd.read_csv(path, dtype=str)
+        else:
+            df = pd.read_excel(path, sheet_name=sheet_name or 0, dtype=str)
+
+        site_column = _first_column(df, SITE_COLUMNS)
+        attribute_column = _first_column(df, ATTRIBUTE_COLUMNS)
+        value_column = _first_column(df, VALUE_COLUMNS)
+        if not site_column or not attribute_column or not value_column:
+            raise ValueError(
+                f"{path.name} needs site ({', '.join(SITE_COLUMNS)}), attribute "
+                f"({', '.join(ATTRIBUTE_COLUMNS)}) and value ({', '.join(VALUE_COLUMNS)}) columns"
+            )
+
+        values: Dict[str, Dict[str, List[str]]] = {}
+        for site, attribute, value in zip(df[site_column], df[attribute_column], df[value_column]):
+            if pd.isna(site) or pd.isna(attribute) or pd.isna(value) or not str(value).strip():
+                continue
+            site_values = values.setdefault(str(site).strip().upper(), {})
+            site_values.setdefault(str(attribute).strip(), []).append(str(value).strip())
+        return cls(values, generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    def save(self, path: Union[str, Path] = DEFAULT_VOCABULARY_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"generated": self.generated, "values": self.values}
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False, sort_keys=True)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_VOCABULARY_PATH) -> "AttributeVocabulary":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("values", {}), generated=data.get("generated"))
+
+
+def vocabulary_path() -> Path:
+    """The vocabulary file importers use: $ATTRIBUTE_VOCABULARY_FILE, else data/attributes/attribute_vocabulary.json"""
+    return Path(os.getenv(VOCABULARY_PATH_ENV) or DEFAULT_VOCABULARY_PATH)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: str, mtime: float) -> AttributeVocabulary:
+    return AttributeVocabulary.load(path)
+
+
+def load_attribute_vocabulary(path: Optional[Union[str, Path]] = None) -> Optional[AttributeVocabulary]:
+    """The cached attribute vocabulary, or None if it hasn't been built yet"""
+    path = Path(path) if path else vocabulary_path()
+    if not path.exists():
+        return None
+    # Keyed on mtime so a refresh is picked up without restarting
+    return _load_cached(str(path), path.stat().st_mtime)
@@ -0,0 +1,217 @@
+"""
+Category index: the valid eCatalog category paths per site
+
+A category the server doesn't know only shows up once its work request has FAILED.
+The index holds every selectable category per site (exported from the category
+table, see sql/EXPORT - Selectable categories per site.sql) so importers can check
+categories before anything is sent:
+
+- exact lookup on a normalized key (case and spacing around ':' ignored), which also
+  fixes the spelling to the one the catalog uses
+- near-misses ("Cocktail Tabels", "Nightstand") matched on character trigrams and
+  corrected when one category clearly scores best
+- anything else rejected, with the closest categories as suggestions
+
+The export is turned into a JSON cache once (``cli.py categories refresh``); importers
+load that cache and skip the check when there is none.
+"""
+
+import json
+import os
+import re
+from collections import Counter
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent / "data" / "categories" / "category_index.json"
+
+# Environment variable pointing at an alternative index file
+INDEX_PATH_ENV = "CATEGORY_INDEX_FILE"
+
+# Column names accepted in an export, checked in order
+SITE_COLUMNS = ("site", "cat_belongsToSite", "Site")
+CATEGORY_COLUMNS = ("category", "cat_long_title", "Category")
+
+# Lowest trigram similarity (0-1) accepted as a correction
+FUZZY_MIN_SCORE = 0.8
+
+# Best match must beat the runner-up by this much, otherwise it's ambiguous
+FUZZY_MARGIN = 0.05
+
+# Categories scoring lower aren't offered as suggestions
+SUGGEST_MIN_SCORE = 0.5
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def category_key(category: str) -> str:
+    """Lookup key: lowercase, single spaces, no spaces around ':'"""
+    parts = (_WHITESPACE.sub(" ", part).strip() for part in str(category).lower().split(":"))
+    return ":".join(part for part in parts if part)
+
+
+def _trigrams(key: str) -> Set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _SiteIndex:
+    """Categories of one site: key -> path, plus a trigram -> keys index for fuzzy matching"""
+
+    def __init__(self, categories: Iterable[str]):
+        self.paths: Dict[str, str] = {}
+        for category in categories:
+            self.paths.setdefault(category_key(category), category)
+
+        self.grams: Dict[str, Set[str]] = {key: _trigrams(key) for key in self.paths}
+        self.postings: Dict[str, List[str]] = {}
+        for key, grams in self.grams.items():
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(key)
+
+    def similar(self, key: str, limit: int) -> List[Tuple[str, float]]:
+        """Closest categories by Dice similarity of trigram sets, best first"""
+        grams = _trigrams(key)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.postings.get(gram, ()))
+        scored = [
+            (candidate, 2.0 * count / (len(grams) + len(self.grams[candidate])))
+            for candidate, count in shared.items()
+        ]
+        scored.sort(key=lambda entry: (-entry[1], entry[0]))
+        return [(self.paths[candidate], score) for candidate, score in scored[:limit]]
+
+
+class CategoryIndex:
+    """Valid category paths per site"""
+
+    def __init__(self, categories: Dict[str, Iterable[str]], generated: Optional[str] = None):
+        self.generated = generated
+        self.sites = {site.upper(): _SiteIndex(paths) for site, paths in categories.items()}
+
+    def __len__(self) -> int:
+        return sum(len(site.paths) for site in self.sites.values())
+
+    def has_site(self, site: str) -> bool:
+        return str(site).upper() in self.sites
+
+    def lookup(self, category: str, site: str) -> Optional[str]:
+        """Exact match (ignoring case and spacing), in the catalog's spelling"""
+        site_index = self.sites.get(str(site).upper())
+        return site_index.paths.get(category_key(category)) if site_index else None
+
+    def suggest(self, category: str, site: str, limit: int = 3) -> List[Tuple[str, float]]:
+        """Closest categories for a site as (path, score) pairs, best first"""
+        site_index = self.sites.get(str(site).upper())
+        return site_index.similar(category_key(category), limit) if site_index else []
+
+    def resolve(self, category: str, site: str) -> Tuple[Optional[str], List[Tuple[str, float]]]:
+        """
+        Find the catalog category for a (normalized) spreadsheet category
+
+        Returns:
+            (path, []) for an exact or clear fuzzy match, otherwise (None, suggestions)
+        """
+        exact = self.lookup(category, site)
+        if exact:
+            return exact, []
+
+        suggestions = self.suggest(category, site)
+        if suggestions and suggestions[0][1] >= FUZZY_MIN_SCORE:
+            runner_up = suggestions[1][1] if len(suggestions) > 1 else 0.0
+            if suggestions[0][1] - runner_up >= FUZZY_MARGIN:
+                return suggestions[0][0], suggestions
+        return None, suggestions
+
+    def check(self, category: str, site: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Validate a normalized category the way importers report category problems
+
+        Returns:
+            (category, None) when it is valid or was corrected, or (None, message) where
+            message is console markup containing a ``{sku}`` placeholder. Sites the
+            index has no categories for are passed through unchecked.
+        """
+        if not self.has_site(site):
+            return category, None
+
+        path, suggestions = self.resolve(category, site)
+        if path:
+            return path, None
+
+        hint = ""
+        close = [path for path, score in suggestions if score >= SUGGEST_MIN_SCORE]
+        if close:
+            hint = " - did you mean " + " / ".join(f"'{path}'" for path in close) + "?"
+        return None, (
+            f"[red]Unknown {str(site).upper()} category for SKU {{sku}}: '{category}'{hint}[/red]"
+        )
+
+    @classmethod
+    def from_export(cls, path: Union[str, Path], sheet_name: Optional[str] = None) -> "CategoryIndex":
+        """Build the index from a CSV/Excel export with site and category columns"""
+        path = Path(path)
+        if path.suffix.lower() == ".csv":
+            df = pd.read_csv(path, dtype=str)
+        else:
+            df = pd.read_excel(path, sheet_name=sheet_name or 0, dtype=str)
+
+        site_column = next((c for c in SITE_COLUMNS if c in df.columns), None)
+        category_column = next((c for c in CATEGORY_COLUMNS if c in df.columns), None)
+        if not site_column or not category_column:
+            raise ValueError(
+                f"{path.name} needs a site column ({', '.join(SITE_COLUMNS)}) "
+                f"and a category column ({', '.join(CATEGORY_COLUMNS)})"
+            )
+
+        categories: Dict[str, List[str]] = {}
+        for site, category in zip(df[site_column], df[category_column]):
+            if pd.isna(site) or pd.isna(category) or not str(category).strip():
+                continue
+            categories.setdefault(str(site).strip().upper(), []).append(str(category).strip())
+        return cls(categories, generated=datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+    def save(self, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "generated": self.generated,
+            "categories": {
+                site: sorted(site_index.paths.values()) for site, site_index in sorted(self.sites.items())
+            },
+        }
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path] = DEFAULT_INDEX_PATH) -> "CategoryIndex":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(data.get("categories", {}), generated=data.get("generated"))
+
+
+def index_path() -> Path:
+    """The index file importers use: $CATEGORY_INDEX_FILE, else data/categories/category_index.json"""
+    return Path(os.getenv(INDEX_PATH_ENV) or DEFAULT_INDEX_PATH)
+
+
+@lru_cache(maxsize=None)
+def _load_cached(path: str, mtime: float) -> CategoryIndex:
+    return CategoryIndex.load(path)
+
+
+def load_category_index(path: Optional[Union[str, Path]] = None) -> Optional[CategoryIndex]:
+    """The cached category index, or None if it hasn't been built yet"""
+    path = Path(path) if path else index_path()
+    if not path.exists():
+        return None
+    # Keyed on mtime so a refresh is picked up without restarting
+    return _load_cached(str(path), path.stat().st_mtime)
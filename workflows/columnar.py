@@ -0,0 +1,96 @@
+"""
+Column-at-a-time helpers for spreadsheet importers
+
+Importers used to walk ``df.iterrows()`` and clean every cell through ``pd.notna`` /
+``str().strip()`` / title-casing on a fresh ``pd.Series``. These helpers do the same
+cleaning once per column, and run expensive per-value functions (title casing,
+category normalization, attribute corrections) once per *distinct* value, so vendor
+sheets with tens of thousands of rows but a few hundred collections convert quickly.
+
+All helpers return object Series aligned with the input frame, holding Python values
+with ``None`` for missing cells, ready to be zipped into ItemNew keyword arguments.
+"""
+
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+
+def _empty(df: pd.DataFrame) -> pd.Series:
+    return pd.Series([None] * len(df), index=df.index, dtype=object)
+
+
+def _nulls_to_none(series: pd.Series) -> pd.Series:
+    series = series.astype(object)
+    return series.where(series.notna(), None)
+
+
+def raw_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """Column values as Python objects, None where the cell is empty or the column is absent"""
+    if column not in df.columns:
+        return _empty(df)
+    return _nulls_to_none(df[column])
+
+
+def coalesce_raw(df: pd.DataFrame, columns: Iterable[str]) -> pd.Series:
+    """First non-empty cell across candidate columns, checked left to right per row"""
+    result = _empty(df)
+    for column in columns:
+        if column in df.columns:
+            result = result.where(result.notna(), df[column].astype(object))
+    return _nulls_to_none(result)
+
+
+def clean_text(series: pd.Series, blank_as_none: bool = True) -> pd.Series:
+    """str(value).strip() for every non-empty cell; blank strings become None unless told otherwise"""
+    result = _nulls_to_none(series)
+    mask = result.notna()
+    if mask.any():
+        stripped = result[mask].map(str).str.strip()
+        if blank_as_none:
+            stripped = stripped.where(stripped != "", None)
+        result[mask] = stripped.astype(object)
+    return _nulls_to_none(result)
+
+
+def text_column(df: pd.DataFrame, column: str, blank_as_none: bool = True) -> pd.Series:
+    """Stripped text of a single column (see clean_text)"""
+    return clean_text(raw_column(df, column), blank_as_none)
+
+
+def bool_column(df: pd.DataFrame, column: str, default: Any = False) -> pd.Series:
+    """bool(value) for non-empty cells, default elsewhere"""
+    raw = raw_column(df, column)
+    return raw.map(lambda v: default if v is None else bool(v)).astype(object)
+
+
+def map_unique(series: pd.Series, fn: Callable[[Any], Any]) -> pd.Series:
+    """Apply fn once per distinct non-empty value and broadcast the results back"""
+    values = _nulls_to_none(series).tolist()
+    lookup = {}
+    results = []
+    for value in values:
+        if value is None:
+            results.append(None)
+            continue
+        if value not in lookup:
+            lookup[value] = fn(value)
+        results.append(lookup[value])
+    return pd.Series(results, index=series.index, dtype=object)
+
+
+def split_values(text: str, correct: Optional[Callable[[str], str]] = None) -> Optional[List[str]]:
+    """Split a comma-separated cell into trimmed, non-empty (optionally corrected) values"""
+    values = []
+    for part in text.split(","):
+        part = part.strip()
+        if part:
+            values.append(correct(part) if correct else part)
+    return values or None
+
+
+def iter_records(columns: Dict[str, pd.Series]) -> Iterator[Dict[str, Any]]:
+    """Yield one dict per row from aligned columns, leaving out None values"""
+    names = list(columns)
+    for values in zip(*(columns[name].tolist() for name in names)):
+        yield {name: value for name, value in zip(names, values) if value is not None}
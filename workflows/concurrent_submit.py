@@ -0,0 +1,65 @@
+"""
+Bounded, order-preserving concurrent submission
+
+Importers convert spreadsheet rows on the main thread and hand the resulting payloads
+to submit_ordered(), which runs the API call on a small thread pool. Results come back
+in input order so console output, stats and collected work request IDs are identical
+to a sequential run - only faster.
+"""
+
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Futures allowed to queue up behind the running workers, per worker
+WINDOW_PER_WORKER = 2
+
+
+def _resolve(item: T, future: Future) -> Tuple[T, Any, Optional[Exception]]:
+    try:
+        return item, future.result(), None
+    except Exception as e:
+        return item, None, e
+
+
+def submit_ordered(
+    fn: Callable[[T], Any], items: Iterable[T], concurrency: int = 1
+) -> Iterator[Tuple[T, Any, Optional[Exception]]]:
+    """
+    Call fn(item) for every item with up to `concurrency` calls in flight
+
+    Args:
+        fn: Function to call for each item (e.g. client.create_item)
+        items: Items to submit; consumed lazily on the calling thread
+        concurrency: Number of worker threads (1 = run inline, no threads)
+
+    Yields:
+        (item, result, error) tuples in input order; error is the exception raised
+        by fn, in which case result is None
+    """
+    if concurrency <= 1:
+        for item in items:
+            try:
+                yield item, fn(item), None
+            except Exception as e:
+                yield item, None, e
+        return
+
+    window = deque()
+    executor = ThreadPoolExecutor(max_workers=concurrency)
+    try:
+        for item in items:
+            window.append((item, executor.submit(fn, item)))
+            # Keep memory bounded on large sheets: drain the oldest result once the window is full
+            if len(window) >= concurrency * WINDOW_PER_WORKER:
+                yield _resolve(*window.popleft())
+
+        while window:
+            yield _resolve(*window.popleft())
+    finally:
+        # Consumer stopped early (error / Ctrl-C): don't start anything still queued
+        for _, future in window:
+            future.cancel()
+        executor.shutdown(wait=True)
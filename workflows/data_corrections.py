@@ -0,0 +1,142 @@
+"""
+Data corrections for spreadsheet values
+
+Vendor sheets carry the same typos and non-standard spellings over and over
+("Livingroom", "Mid Century", '24"-36" Medium'). The rules that fix them are a data
+table - workflows/data_corrections.json, or the file named by DATA_CORRECTIONS_FILE -
+with one rule set per importer and, per field type:
+
+    "replace": substrings replaced wherever they appear
+    "exact":   whole values replaced after the substring rules have run
+
+Each field's substring rules are compiled into one alternation regex (longest pattern
+first) and applied in a single pass. Every match is replaced once; the replacement
+text has already been run through the rules listed after it, so rules build on each
+other the way a chain of str.replace calls did ("Livingroom : Cocktail Tables" ->
+"Living Room : Cocktail Table"). Results are memoized per value.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from workflows.columnar import split_values
+
+DEFAULT_RULES_PATH = Path(__file__).parent / "data_corrections.json"
+
+# Environment variable pointing at an alternative rules file
+RULES_PATH_ENV = "DATA_CORRECTIONS_FILE"
+
+# Distinct values remembered per field type
+CACHE_SIZE = 65536
+
+
+def _apply_in_order(text: str, rules: List[Tuple[str, str]]) -> str:
+    for old, new in rules:
+        text = text.replace(old, new)
+    return text
+
+
+class FieldCorrections:
+    """Compiled corrections for one field type"""
+
+    def __init__(self, replace: Optional[Dict[str, str]] = None, exact: Optional[Dict[str, str]] = None):
+        rules = [(old, new) for old, new in (replace or {}).items() if old]
+        self.exact = dict(exact or {})
+
+        # Replacement text per pattern, after the rules that follow it
+        self.replace: Dict[str, str] = {
+            old: _apply_in_order(new, rules[i + 1:]) for i, (old, new) in enumerate(rules)
+        }
+        # A rule's output can complete a later pattern ("Accessoreis : Pillows/Throws" is
+        # "Accessories : Pillows/Throws" once fixed), so that misspelling is a pattern too
+        for i, (old, new) in enumerate(rules):
+            for later_old, _ in rules[i + 1:]:
+                if new in later_old:
+                    variant = later_old.replace(new, old)
+                    self.replace.setdefault(variant, _apply_in_order(variant, rules))
+
+        self._pattern = None
+        if self.replace:
+            # Longest first, so "Livingroom : Cocktail Tables" wins over "Livingroom"
+            alternatives = sorted(self.replace, key=len, reverse=True)
+            self._pattern = re.compile("|".join(re.escape(old) for old in alternatives))
+
+        self.correct = lru_cache(maxsize=CACHE_SIZE)(self._correct)
+
+    def _substitute(self, match: "re.Match") -> str:
+        return self.replace[match.group(0)]
+
+    def _correct(self, text: str) -> str:
+        if self._pattern is not None:
+            text = self._pattern.sub(self._substitute, text)
+        return self.exact.get(text, text)
+
+
+class DataCorrections:
+    """A rule set: field type -> FieldCorrections"""
+
+    def __init__(self, rules: Dict[str, Dict[str, Dict[str, str]]]):
+        self.fields = {
+            field_type: FieldCorrections(spec.get("replace"), spec.get("exact"))
+            for field_type, spec in rules.items()
+        }
+
+    def correct(self, text: Any, field_type: Optional[str] = None) -> Any:
+        """
+        Correct common data errors in one value
+
+        Args:
+            text: Input text to correct
+            field_type: Type of field ('category', 'decor', etc.) for specific corrections
+
+        Returns:
+            Corrected text; empty or non-string input is returned unchanged
+        """
+        if not text or not isinstance(text, str):
+            return text
+        field = self.fields.get(field_type)
+        return field.correct(text) if field else text
+
+    def correct_values(self, text: str, field_type: Optional[str] = None) -> Optional[List[str]]:
+        """Correct a comma-separated cell as a whole, then split it and correct each value"""
+        field = self.fields.get(field_type)
+        if not field:
+            return split_values(text)
+        return split_values(field.correct(text), field.correct)
+
+
+def load_rules(path: Optional[Union[str, Path]] = None) -> Dict[str, Dict]:
+    """
+    Read correction rule sets from a JSON file
+
+    Args:
+        path: Rules file; defaults to $DATA_CORRECTIONS_FILE, then the bundled table
+
+    Returns:
+        {rule set name: {field type: {"replace": {...}, "exact": {...}}}}
+    """
+    path = Path(path or os.getenv(RULES_PATH_ENV) or DEFAULT_RULES_PATH)
+    with open(path, "r", encoding="utf-8") as f:
+        rules = json.load(f)
+
+    for name, fields in rules.items():
+        for field_type, spec in fields.items():
+            unknown = set(spec) - {"replace", "exact"}
+            if unknown:
+                raise ValueError(
+                    f"{path}: unknown keys {sorted(unknown)} in rule set '{name}', field '{field_type}'"
+                )
+    return rules
+
+
+@lru_cache(maxsize=None)
+def corrections_for(rule_set: str) -> DataCorrections:
+    """Compiled corrections for one importer's rule set (loaded once per process)"""
+    rules = load_rules()
+    if rule_set not in rules:
+        raise ValueError(f"No data correction rule set named '{rule_set}'")
+    return DataCorrections(rules[rule_set])
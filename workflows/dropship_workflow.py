@@ -20,14 +20,18 @@ from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress
 from rich.prompt import Confirm
 from rich.panel import Panel
 from dotenv import load_dotenv
 
 from ecatalog_client import ECatalogAPIClient, OAuthConfig
 from .import_dropship_items import DropshipItemImporter
+from .import_journal import ImportJournal
+from .payload_export import EXPORT_FORMATS, EXPORT_NDJSON
+from .sku_precheck import SkuPrecheck
 from .workflow_logger import WorkflowLogger
+from .workrequest_status import summarize_workrequest_status
+from .workrequest_batches import DEFAULT_CHUNK_SIZE, process_in_chunks
 
 console = Console()
 
@@ -38,9 +42,26 @@ load_dotenv()
 class DropshipWorkflow:
     """Complete end-to-end dropship processing workflow"""
 
-    def __init__(self, api_client: ECatalogAPIClient):
+    def __init__(self, api_client: ECatalogAPIClient, concurrency: int = 1,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, workers: int = 1, quiet: bool = False,
+                 report_file: Optional[Path] = None, export_format: str = EXPORT_NDJSON):
         self.client = api_client
         self.console = console
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        # Processes converting rows during the dry-run validation
+        self.workers = workers
+        # Summary-only dry-run validation, with the per-row results in a report file
+        self.quiet = quiet
+        self.report_file = report_file
+        # How the dry run exports payloads: one NDJSON file per run, or a file per item
+        self.export_format = export_format
+        # Work request ID -> SKU, so each submitted chunk can be logged with its SKUs
+        self.workrequest_skus: Dict[int, str] = {}
+        # Checkpoint journal of the live import, kept until its work requests are processed
+        self.journal: Optional[ImportJournal] = None
+        # SKU lookups from the dry run, reused by the live import (--skip-existing)
+        self.precheck: Optional[SkuPrecheck] = None
         self.importer = DropshipItemImporter(api_client)
 
         # Initialize workflow logger
@@ -48,15 +69,24 @@ class DropshipWorkflow:
         logs_dir = project_root / "data" / "dropship" / "logs"
         self.logger = WorkflowLogger("dropship", logs_dir)
 
-    def run_end_to_end_workflow(self, file_path: Path, sheet_name: Optional[str] = None) -> bool:
-        """Run the complete dropship workflow"""
+    def run_end_to_end_workflow(self, file_path: Path, sheet_name: Optional[str] = None,
+                                resume: bool = False, skip_existing: bool = False,
+                                incremental: bool = False) -> bool:
+        """Run the complete dropship workflow
+
+        With resume, the live import skips rows an interrupted earlier run of the
+        same file already created, and their work requests are processed with the rest.
+        With skip_existing, SKUs eCatalog already has are looked up first and left out.
+        With incremental, rows unchanged since their last import are skipped and
+        changed ones are sent as partial updates.
+        """
         try:
             console.print(Panel.fit("[bold blue]🚀 Dropship End-to-End Workflow[/bold blue]"))
             console.print(f"Processing file: [cyan]{file_path.name}[/cyan]\n")
 
             # Step 1: Dry run with validation
             console.print("[bold]Step 1: Dry Run Validation & JSON Export[/bold]")
-            validation_results = self._run_dry_run_validation(file_path, sheet_name)
+            validation_results = self._run_dry_run_validation(file_path, sheet_name, skip_existing, incremental)
 
             if not validation_results:
                 console.print("[red]❌ Dry run validation failed[/red]")
@@ -72,7 +102,7 @@ class DropshipWorkflow:
 
             # Step 4: Live import with work request collection
             console.print("\n[bold]Step 4: Live Import & Work Request Collection[/bold]")
-            work_request_ids, skus_created = self._run_live_import(file_path, sheet_name)
+            work_request_ids, skus_created = self._run_live_import(file_path, sheet_name, resume, incremental)
 
             if not work_request_ids:
                 console.print("[red]❌ Live import failed - no work requests created[/red]")
@@ -86,6 +116,10 @@ class DropshipWorkflow:
                 console.print("[red]❌ Work request processing failed[/red]")
                 return False
 
+            # Nothing left to resume once the work requests are in
+            if self.journal is not None:
+                self.journal.discard()
+
             # Step 6: Completion message (status checking disabled)
             console.print("\n[bold]Step 6: Work Request Submission Complete[/bold]")
             console.print(f"[blue]✅ {len(work_request_ids)} work requests submitted for processing[/blue]")
@@ -107,10 +141,18 @@ class DropshipWorkflow:
         except Exception as e:
             console.print(f"[red]Workflow error: {e}[/red]")
             return False
+        finally:
+            # Refresh the Excel log once per run from the append-only log
+            self.logger.export_excel()
 
-    def _run_dry_run_validation(self, file_path: Path, sheet_name: Optional[str]) -> Optional[Dict]:
+    def _run_dry_run_validation(self, file_path: Path, sheet_name: Optional[str],
+                                skip_existing: bool = False, incremental: bool = False) -> Optional[Dict]:
         """Run dry-run import with JSON export and collect validation results"""
         try:
+            if skip_existing:
+                console.print("[blue]Looking up the sheet's SKUs in eCatalog...[/blue]")
+                self.precheck = self.importer.precheck_skus(file_path, sheet_name)
+
             console.print("[blue]Running dry-run validation and exporting JSON payloads...[/blue]")
 
             # Capture validation errors
@@ -130,7 +172,9 @@ class DropshipWorkflow:
             try:
                 # Run dry-run with JSON export
                 stats = self.importer.import_from_spreadsheet(
-                    file_path, sheet_name, dry_run=True, export_json=True
+                    file_path, sheet_name, dry_run=True, export_json=True, precheck=self.precheck,
+                    incremental=incremental, workers=self.workers, quiet=self.quiet,
+                    report_file=self.report_file, export_format=self.export_format
                 )
             finally:
                 # Restore original console.print
@@ -140,7 +184,8 @@ class DropshipWorkflow:
                 'stats': stats,
                 'file_path': file_path,
                 'sheet_name': sheet_name,
-                'validation_errors': validation_errors
+                'validation_errors': validation_errors,
+                'incremental': incremental
             }
 
         except Exception as e:
@@ -159,6 +204,15 @@ class DropshipWorkflow:
         table.add_row("Total Records", str(stats['processed']), "✅ Processed")
         table.add_row("Valid Records", str(stats['created']), "✅ Ready for Import")
         table.add_row("Failed Records", str(stats['failed']), "❌ Validation Failed" if stats['failed'] > 0 else "✅ All Valid")
+        if self.precheck is not None:
+            table.add_row("Already in eCatalog", str(stats['exists']), "⏭️  Skipped")
+            table.add_row("Exists on Another Site", str(stats['site_conflicts']),
+                          "❌ Site Conflict" if stats['site_conflicts'] > 0 else "✅ None")
+        if results.get('incremental'):
+            table.add_row("Changed Records", str(stats['updated']), "✅ Ready for Update")
+            table.add_row("Unchanged Records", str(stats['unchanged']), "⏭️  Skipped")
+            table.add_row("Needs Manual Edit", str(stats['not_updatable']),
+                          "⚠️  Not Updatable" if stats['not_updatable'] > 0 else "✅ None")
 
         console.print(table)
 
@@ -186,28 +240,45 @@ class DropshipWorkflow:
         if stats['failed'] > 0:
             console.print(f"\n[yellow]⚠️  Warning: {stats['failed']} records will be skipped due to validation errors[/yellow]")
 
-        if stats['created'] == 0:
+        if stats['created'] + stats.get('updated', 0) == 0:
             console.print("[red]No valid records to import[/red]")
             return False
 
-        console.print(f"\n[bold green]Ready to import {stats['created']} valid records[/bold green]")
+        console.print(f"\n[bold green]Ready to import {stats['created'] + stats.get('updated', 0)} valid records[/bold green]")
         return Confirm.ask("Proceed with live import?", default=False)
 
-    def _run_live_import(self, file_path: Path, sheet_name: Optional[str]) -> Tuple[List[int], List[str]]:
+    def _run_live_import(self, file_path: Path, sheet_name: Optional[str], resume: bool = False,
+                         incremental: bool = False) -> Tuple[List[int], List[str]]:
         """Run live import and collect work request IDs"""
         work_request_ids = []
         skus_processed = []
 
         try:
             # Custom import method that captures work request IDs and SKUs
-            stats = self._import_with_workrequest_collection(file_path, sheet_name, work_request_ids, skus_processed)
+            stats = self._import_with_workrequest_collection(
+                file_path, sheet_name, work_request_ids, skus_processed, resume, incremental
+            )
 
             console.print(f"[green]✅ Import completed: {stats['created']} items created[/green]")
+            if stats.get("updated"):
+                console.print(f"[green]✅ {stats['updated']} changed items updated[/green]")
+            if stats.get("unchanged"):
+                console.print(f"[blue]⏭️  {stats['unchanged']} items unchanged since the last import[/blue]")
+            if stats.get("resumed"):
+                console.print(f"[blue]⏭️  {stats['resumed']} items were created by the earlier run[/blue]")
+            if stats.get("exists") or stats.get("site_conflicts"):
+                console.print(
+                    f"[blue]⏭️  {stats['exists'] + stats['site_conflicts']} items already in eCatalog were not created[/blue]"
+                )
             console.print(f"[blue]📋 Collected {len(work_request_ids)} work request IDs[/blue]")
 
             # Log the import operation
             status = "Success" if stats['failed'] == 0 else "Partial"
             notes = f"Created: {stats['created']}, Failed: {stats['failed']}" if stats['failed'] > 0 else ""
+            if stats.get("resumed"):
+                notes = ", ".join(filter(None, [notes, f"Resumed: {stats['resumed']} rows from checkpoint"]))
+            if stats.get("updated"):
+                notes = ", ".join(filter(None, [notes, f"Updated: {stats['updated']}"]))
             self.logger.log_import(
                 source_file=file_path.name,
                 skus=skus_processed,
@@ -231,110 +302,87 @@ class DropshipWorkflow:
             return [], []
 
     def _import_with_workrequest_collection(self, file_path: Path, sheet_name: Optional[str],
-                                          work_request_ids: List[int], skus_processed: List[str]) -> Dict[str, int]:
+                                          work_request_ids: List[int], skus_processed: List[str],
+                                          resume: bool = False, incremental: bool = False) -> Dict[str, int]:
         """Import items and collect work request IDs"""
         # Use a custom version that captures work request IDs
-        return self._enhanced_import_from_spreadsheet(file_path, sheet_name, work_request_ids, skus_processed)
+        return self._enhanced_import_from_spreadsheet(file_path, sheet_name, work_request_ids, skus_processed,
+                                                      resume, incremental)
 
     def _enhanced_import_from_spreadsheet(self, file_path: Path, sheet_name: Optional[str],
-                                        work_request_ids: List[int], skus_processed: List[str]) -> Dict[str, int]:
-        """Enhanced import that captures work request IDs from API responses"""
-        import pandas as pd
-        from rich.progress import Progress
+                                        work_request_ids: List[int], skus_processed: List[str],
+                                        resume: bool = False, incremental: bool = False) -> Dict[str, int]:
+        """Live import through the importer, collecting SKUs and work request IDs
+
+        The importer journals every created row to self.journal, which stays on disk
+        until the work requests have been processed; with resume, rows it already has
+        are skipped and their SKUs and work request IDs collected as well. Submitted
+        payloads go to the payload store; with incremental, rows matching it are
+        skipped and changed rows are updated rather than created.
+        """
+        if not self.importer.check_source(file_path):
+            return self.importer.new_stats()
+
+        console.print(f"[bold]Processing {file_path.name} for live import...[/bold]")
+        self.journal = self.importer.open_journal(file_path, sheet_name, resume)
+        try:
+            stats = self.importer.import_from_spreadsheet(
+                file_path, sheet_name, dry_run=False, concurrency=self.concurrency,
+                precheck=self.precheck, incremental=incremental, journal=self.journal,
+            )
+        finally:
+            self.journal.close()
 
-        if not file_path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
+        # Every row created by this run or an interrupted earlier one
+        for (_, sku), workrequest_id in self.journal.entries.items():
+            skus_processed.append(sku)
+            if workrequest_id:
+                work_request_ids.append(workrequest_id)
+                self.workrequest_skus[workrequest_id] = sku
+        return stats
 
-        try:
-            # Read the spreadsheet
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                if sheet_name is None:
-                    sheet_name = 0
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
+    def _process_work_requests(self, source_file: str, skus: List[str], work_request_ids: List[int]) -> bool:
+        """Process work requests in chunks, logging each chunk's submission"""
+        def log_chunk(number: int, chunk: List[int], error: Optional[str], attempts: int) -> None:
+            chunk_skus = [self.workrequest_skus[wr_id] for wr_id in chunk if wr_id in self.workrequest_skus]
+            if error:
+                console.print(f"[red]❌ Chunk {number}/{total_chunks} ({len(chunk)} work requests) failed: {error}[/red]")
             else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return {"processed": 0, "created": 0, "failed": 0}
-
-            console.print(f"[bold]Processing {len(df)} records for live import...[/bold]")
-            stats = {"processed": 0, "created": 0, "failed": 0}
-
-            with Progress() as progress:
-                task = progress.add_task("Creating items...", total=len(df))
-
-                for index, row in df.iterrows():
-                    stats["processed"] += 1
-
-                    # Convert row to ItemNew object
-                    item = self.importer.row_to_item(row)
-                    if not item:
-                        stats["failed"] += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    # Actually create the item and capture work request ID
-                    try:
-                        result = self.client.create_item(item)
-                        if result:
-                            # Capture SKU
-                            skus_processed.append(item.Sku)
-                            # Extract work request ID
-                            workrequest_id = result.get("workrequest_id")
-                            if workrequest_id:
-                                work_request_ids.append(workrequest_id)
-                                console.print(f"[green]✅ {item.Sku}[/green] [dim]→ Work Request: {workrequest_id}[/dim]")
-                            else:
-                                console.print(f"[green]✅ {item.Sku}[/green] [yellow]→ No work request ID returned[/yellow]")
-                            stats["created"] += 1
-                        else:
-                            console.print(f"[red]❌ Failed to create: {item.Sku}[/red]")
-                            stats["failed"] += 1
-                    except Exception as e:
-                        console.print(f"[red]❌ Error creating {item.Sku}: {e}[/red]")
-                        stats["failed"] += 1
-
-                    progress.update(task, advance=1)
-
-            return stats
+                console.print(f"[green]✅ Chunk {number}/{total_chunks} ({len(chunk)} work requests) submitted[/green]")
 
-        except Exception as e:
-            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
+            self.logger.log_submission(
+                source_file=source_file,
+                skus=chunk_skus,
+                workrequest_ids=chunk,
+                status="Failed" if error else "Success",
+                notes=error or f"Chunk {number}/{total_chunks} submitted for batch processing (attempt {attempts})"
+            )
 
-    def _process_work_requests(self, source_file: str, skus: List[str], work_request_ids: List[int]) -> bool:
-        """Process work requests in batch"""
         try:
-            console.print(f"[blue]Submitting {len(work_request_ids)} work requests for processing...[/blue]")
+            total_chunks = -(-len(work_request_ids) // self.chunk_size)
+            console.print(
+                f"[blue]Submitting {len(work_request_ids)} work requests for processing "
+                f"in {total_chunks} chunk(s)...[/blue]"
+            )
 
-            # Use the client's process_workrequests method
-            result = self.client.process_workrequests(work_request_ids)
+            result = process_in_chunks(self.client, work_request_ids, chunk_size=self.chunk_size, on_chunk=log_chunk)
 
-            if result:
+            if not result["failed"]:
                 console.print("[green]✅ Work requests submitted for processing[/green]")
+                return True
 
-                # Log the submission
-                self.logger.log_submission(
-                    source_file=source_file,
-                    skus=skus,
-                    workrequest_ids=work_request_ids,
-                    status="Success",
-                    notes="Work requests submitted for batch processing"
+            console.print(
+                f"[red]❌ {len(result['failed'])} of {len(work_request_ids)} work requests "
+                f"could not be submitted ({result['failed_chunks']} chunk(s))[/red]"
+            )
+            if len(result["failed"]) <= 50:
+                console.print(
+                    "[dim]Retry them with: uv run python cli.py workrequest process "
+                    f"{' '.join(map(str, result['failed']))}[/dim]"
                 )
-                return True
             else:
-                console.print("[red]❌ Failed to submit work requests for processing[/red]")
-
-                # Log the failure
-                self.logger.log_submission(
-                    source_file=source_file,
-                    skus=skus,
-                    workrequest_ids=work_request_ids,
-                    status="Failed",
-                    notes="Failed to submit work requests"
-                )
-                return False
+                console.print("[dim]The failed work request IDs are in the workflow log[/dim]")
+            return False
 
         except Exception as e:
             console.print(f"[red]Work request processing error: {e}[/red]")
@@ -372,23 +420,7 @@ class DropshipWorkflow:
 
     def _check_all_work_request_status(self, work_request_ids: List[int]) -> Dict[str, int]:
         """Check status of all work requests"""
-        status_counts = {"PENDING": 0, "RUNNING": 0, "COMPLETED": 0, "FAILED": 0}
-
-        for wr_id in work_request_ids:
-            try:
-                wr_details = self.client.get_workrequest(wr_id)
-                if wr_details and 'status' in wr_details:
-                    status = wr_details['status'].upper()
-                    if status in status_counts:
-                        status_counts[status] += 1
-                    else:
-                        status_counts["PENDING"] += 1
-                else:
-                    status_counts["PENDING"] += 1
-            except Exception:
-                status_counts["PENDING"] += 1
-
-        return status_counts
+        return summarize_workrequest_status(self.client, work_request_ids)
 
     def _display_final_summary_simple(self, work_request_count: int) -> None:
         """Display simple final workflow summary without status checking"""
@@ -400,6 +432,7 @@ class DropshipWorkflow:
         console.print("\n[blue]💡 Next Steps:[/blue]")
         console.print("• Use [bold]uv run python cli.py workrequest list[/bold] to see all work requests")
         console.print("• Use [bold]uv run python cli.py workrequest get <ID>[/bold] to check specific work request status")
+        console.print("• Use [bold]uv run python cli.py workrequest watch <ID>...[/bold] to wait until work requests finish")
         console.print("• Work requests may take time to complete - check back later if still pending")
 
     def _display_final_summary(self, final_status: Dict[str, int]) -> None:
@@ -423,6 +456,7 @@ class DropshipWorkflow:
         console.print("\n[blue]💡 Next Steps:[/blue]")
         console.print("• Use [bold]uv run python cli.py workrequest list[/bold] to see all work requests")
         console.print("• Use [bold]uv run python cli.py workrequest get <ID>[/bold] to check specific work request status")
+        console.print("• Use [bold]uv run python cli.py workrequest watch <ID>...[/bold] to wait until work requests finish")
         console.print("• Work requests may take time to complete - check back later if still pending")
 
     def _handle_file_archiving(self, file_path: Path) -> bool:
@@ -464,7 +498,25 @@ class DropshipWorkflow:
 @click.option('--api-url', default='http://127.0.0.1:8000', help='eCatalog API base URL')
 @click.option('--sheet-name', help='Excel sheet name (if applicable)')
 @click.option('--no-auth', is_flag=True, help='Skip OAuth authentication (for testing)')
-def main(file_path: Optional[Path], api_url: str, sheet_name: Optional[str], no_auth: bool):
+@click.option('--concurrency', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Number of items to create in parallel')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=DEFAULT_CHUNK_SIZE, show_default=True,
+              help='Work requests per processing request')
+@click.option('--resume', is_flag=True, help='Skip rows an interrupted earlier run of this file already created')
+@click.option('--skip-existing', is_flag=True, help="Look up every SKU first and only create the ones eCatalog doesn't have")
+@click.option('--incremental', is_flag=True,
+              help='Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them')
+@click.option('--workers', type=click.IntRange(min=1), default=1, show_default=True,
+              help='Processes converting and validating rows in the dry run')
+@click.option('--quiet', is_flag=True,
+              help='Print a summary of the dry run instead of every row, and write the per-row results to a report file')
+@click.option('--report', 'report_file', type=click.Path(dir_okay=False, path_type=Path),
+              help='Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)')
+@click.option('--export-format', type=click.Choice(EXPORT_FORMATS), default=EXPORT_NDJSON, show_default=True,
+              help='How the dry run exports payloads: one compressed NDJSON file per run, or a JSON file per item')
+def main(file_path: Optional[Path], api_url: str, sheet_name: Optional[str], no_auth: bool, concurrency: int,
+         chunk_size: int, resume: bool, skip_existing: bool, incremental: bool, workers: int,
+         quiet: bool, report_file: Optional[Path], export_format: str):
     """Run complete end-to-end dropship workflow"""
 
     # Handle default directory and file selection
@@ -553,8 +605,11 @@ def main(file_path: Optional[Path], api_url: str, sheet_name: Optional[str], no_
         return
 
     # Run the complete workflow
-    workflow = DropshipWorkflow(client)
-    success = workflow.run_end_to_end_workflow(file_path, sheet_name)
+    workflow = DropshipWorkflow(client, concurrency=concurrency, chunk_size=chunk_size, workers=workers,
+                                quiet=quiet or report_file is not None, report_file=report_file,
+                                export_format=export_format)
+    success = workflow.run_end_to_end_workflow(file_path, sheet_name, resume=resume, skip_existing=skip_existing,
+                                               incremental=incremental)
 
     if success:
         console.print("\n[bold green]🎉 Workflow completed successfully![/bold green]")
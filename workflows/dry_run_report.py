@@ -0,0 +1,129 @@
+"""
+Dry-run report: what a dry run found, without a console line per row
+
+A verbose dry run prints three or four lines per row, and on a large sheet rendering
+them takes far longer than converting the rows. A quiet dry run (``--quiet``) prints
+only a summary; the per-row results are counted here instead - items by site,
+category and divisions, failures by reason, notes such as rows the precheck leaves
+out or changes an update can't carry - along with the category corrections made
+and the first few rows of each kind. The report is written as JSON once the run
+is done.
+"""
+
+import json
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from rich.console import Console
+from rich.table import Table
+from rich.text import Text
+
+from ecatalog_client import ItemNew
+
+DEFAULT_REPORT_ROOT = Path(__file__).parent.parent / "data"
+
+# Rows kept per kind (items to create, items to update, each failure reason, ...)
+DEFAULT_SAMPLE_ROWS = 20
+
+# Entries shown per breakdown in the console summary; the report has them all
+SUMMARY_TOP = 10
+
+
+def report_path(workflow: str, file_path: Path) -> Path:
+    """data/<workflow>/reports/<sheet>-dry-run.json"""
+    return DEFAULT_REPORT_ROOT / workflow / "reports" / f"{file_path.stem}-dry-run.json"
+
+
+def _plain(message: str) -> str:
+    """A console message without its markup"""
+    return Text.from_markup(message).plain
+
+
+class DryRunReport:
+    """Counts and sample rows of a quiet dry run"""
+
+    def __init__(self, file_path: Path, sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        self.file_path = file_path
+        self.sample_rows = sample_rows
+        self.by_site: Counter = Counter()
+        self.by_category: Counter = Counter()
+        self.by_division: Counter = Counter()
+        self.failures: Counter = Counter()
+        # exists, site_conflicts, not_updatable, changed - per-row notes by kind
+        self.notes: Counter = Counter()
+        self.corrections: List[Dict[str, str]] = []
+        # kind -> first rows of that kind
+        self.samples: Dict[str, List[Dict[str, Any]]] = {}
+
+    def _sample(self, kind: str, row: Dict[str, Any]) -> None:
+        rows = self.samples.setdefault(kind, [])
+        if len(rows) < self.sample_rows:
+            rows.append(row)
+
+    def add_item(self, item: ItemNew, divisions: str, update_fields: Optional[List[str]] = None) -> None:
+        """An item the run would create, or update with update_fields"""
+        self.by_site[item.Site] += 1
+        self.by_category[item.Category] += 1
+        self.by_division[divisions] += 1
+        row = {"sku": item.Sku, "title": item.Title, "site": item.Site, "category": item.Category}
+        if update_fields is None:
+            self._sample("create", {**row, "divisions": divisions})
+        else:
+            self._sample("update", {**row, "fields": update_fields})
+
+    def add_failure(self, sku: Any, reason: str, message: str) -> None:
+        """A row that didn't convert; message is the console message it would have printed"""
+        self.failures[reason] += 1
+        self._sample(f"failed: {reason}", {"sku": sku, "message": _plain(message)})
+
+    def add_note(self, kind: str, sku: str, message: str) -> None:
+        """A message about a valid row: why it's left out, or what its update can't carry"""
+        self.notes[kind] += 1
+        self._sample(kind, {"sku": sku, "message": _plain(message)})
+
+    def add_correction(self, category: str, site: str, resolved: str) -> None:
+        self.corrections.append({"category": category, "site": site, "corrected": resolved})
+
+    def to_dict(self, stats: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "file": str(self.file_path),
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "stats": {key: value for key, value in stats.items() if key != "workrequest_ids"},
+            "by_site": dict(self.by_site.most_common()),
+            "by_category": dict(self.by_category.most_common()),
+            "by_division": dict(self.by_division.most_common()),
+            "failures": dict(self.failures.most_common()),
+            "notes": dict(self.notes.most_common()),
+            "category_corrections": self.corrections,
+            "samples": self.samples,
+        }
+
+    def write(self, path: Path, stats: Dict[str, Any]) -> Path:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(stats), f, indent=2, ensure_ascii=False, default=str)
+        return path
+
+    def print_summary(self, console: Console) -> None:
+        """Breakdowns of the report, largest first"""
+        for title, counts in (
+            ("Items by site", self.by_site),
+            ("Items by category", self.by_category),
+            ("Items by divisions", self.by_division),
+            ("Failures by reason", self.failures),
+        ):
+            if not counts:
+                continue
+            table = Table(title=title)
+            table.add_column("Value", style="cyan")
+            table.add_column("Rows", justify="right")
+            for value, count in counts.most_common(SUMMARY_TOP):
+                table.add_row(str(value), f"{count:,}")
+            if len(counts) > SUMMARY_TOP:
+                table.add_row(f"[dim]... {len(counts) - SUMMARY_TOP} more[/dim]", "")
+            console.print(table)
+
+        if self.corrections:
+            console.print(f"[yellow]{len(self.corrections)} categories corrected (listed in the report)[/yellow]")
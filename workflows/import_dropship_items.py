@@ -6,24 +6,21 @@ import os
 import shutil
 import subprocess
 from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 from rich.prompt import Confirm
 from pathlib import Path
 import sys
-import json
-import re
-from typing import Dict, List, Optional
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 from ecatalog_client import (
     ECatalogAPIClient,
-    ItemNew,
     ItemDivisions,
     ItemDivision,
-    ItemAttributes,
     OAuthConfig,
 )
+from workflows.data_corrections import corrections_for
+from workflows.import_engine import SITE_BRANDS, SpreadsheetImporter
+from workflows.payload_export import EXPORT_FORMATS, EXPORT_NDJSON
 
 console = Console()
 
@@ -57,6 +54,8 @@ def correct_common_data_errors(text: str, field_type: str = None) -> str:
     """
     Correct common data errors found in spreadsheets
 
+    The rules are the "dropship" rule set in workflows/data_corrections.json.
+
     Args:
         text: Input text to correct
         field_type: Type of field ('category', 'decor', etc.) for specific corrections
@@ -64,240 +63,84 @@ def correct_common_data_errors(text: str, field_type: str = None) -> str:
     Returns:
         Corrected text
     """
-    if not text or not isinstance(text, str):
-        return text
-
-    corrected = text
-
-    # Category-specific corrections
-    if field_type == "category":
-        # Fix "Livingroom" -> "Living Room"
-        corrected = corrected.replace("Livingroom", "Living Room")
-        corrected = corrected.replace("Accessoreis", "Accessories")
-        corrected = corrected.replace("Décor", "Decor")
-        corrected = corrected.replace("Wall Dcor", "Wall Decor")
-        corrected = corrected.replace(
-            "Livingroom : Cocktail Tables", "Living Room : Cocktail Tables"
-        )
-        corrected = corrected.replace(
-            "Kids : Accessories : Pillows/throws", "Kids : Accessories: Pillows/throws"
-        )
-        corrected = corrected.replace(
-            "Accessories : Pillows/Throws", "Accessories: Pillows/throws"
-        )
-        corrected = corrected.replace("Cocktail Tables", "Cocktail Table")
-
-    # Decor attribute corrections
-    elif field_type == "decor":
-        # Fix "Mid Century Modern" -> "Mid-Century Modern"
-        corrected = corrected.replace("Mid Century Modern", "Mid-Century Modern")
-
-        # Fix "Mid Century" (standalone) -> "Mid-Century Modern"
-        if corrected == "Mid Century" or corrected == "MID CENTURY":
-            corrected = "Mid-Century Modern"
-
-    elif field_type == "size":
-        corrected = corrected.replace('48" + Extra Large', '48"+ Extra Large')
-        corrected = corrected.replace("48' + Extra Large", '48"+ Extra Large')
-
-        corrected = corrected.replace('36"-48" Large', '36" - 48" Large')
-        corrected = corrected.replace('24"-36" Medium', '24" - 36" Medium')
-        corrected = corrected.replace('24"-36" Medium', '24" - 36" Medium')
-        corrected = corrected.replace("24' - 36\" Medium", '24" - 36" Medium')
-        corrected = corrected.replace('>24" Small', 'Under 24" Small')
-        corrected = corrected.replace('<24" Small', 'Under 24" Small')
-
-        if corrected == "Extra Large":
-            corrected = '48" + Extra Large'
-        if corrected == "Large":
-            corrected = '36" - 48" Large'
-        if corrected == "Medium":
-            corrected = '24" - 36" Medium'
-        if corrected == "Small":
-            corrected = 'Under 24" Small'
-
-        # --categories that do not end in "s"
-        # select * from category where cat_title not like '%s' and cat_isselectable = 1
-
-        # ending in "Posturepedic"
-        # ending in "Bedding"
-        # ending in "Only"
-        # ending in "Foundation"
-
-        # Chest/Hutch
-        # Wall Decor
-        # Seating
-        # Storage
-        # Fuel
-        # Accent Furniture
-        # Home Entertainment
-        # Racing Collection
-
-    # Add more corrections here as needed
-    # corrected = corrected.replace("OtherWrongTerm", "CorrectTerm")
-
-    return corrected
-
-
-def smart_title_case(text: str) -> str:
-    """
-    Apply title case with special handling for roman numerals and acronyms
-
-    Args:
-        text: Input text to convert
-
-    Returns:
-        Text with proper title casing
-    """
-    if not text or not isinstance(text, str):
-        return text
-
-    # Roman numerals (common ones used in furniture/collections)
-    roman_numerals = {
-        "I",
-        "II",
-        "III",
-        "IV",
-        "V",
-        "VI",
-        "VII",
-        "VIII",
-        "IX",
-        "X",
-        "XI",
-        "XII",
-        "XIII",
-        "XIV",
-        "XV",
-        "XVI",
-        "XVII",
-        "XVIII",
-        "XIX",
-        "XX",
+    return corrections_for("dropship").correct(text, field_type)
+
+
+class DropshipItemImporter(SpreadsheetImporter):
+    """Importer for dropship vendor spreadsheets"""
+
+    # Direct mapping from dropship spreadsheet to API attributes
+    ATTRIBUTE_MAPPING = {
+        "Color": "Color",
+        "Decor": "Decor",
+        "Finish": "Finish",
+        "Features": "Features",
+        "Material": "Material",
+        "Movement": "Movement",
+        "PieceCount": "PieceCount",
+        "Shape": "Shape",  # Not in sample but keeping for completeness
+        "Size": "Size",
+        "Style": "Style",
+        "Theme": "Theme",  # Not in sample but keeping for completeness
+        "Team": "team",  # Dropship specific - lowercase
     }
 
-    # Sports and other acronyms that should stay uppercase
-    acronyms = {
-        "NFL",
-        "MLB",
-        "NBA",
-        "NHL",
-        "NCAA",
-        "MLS",
-        "UFC",
-        "WWE",
-        "ESPN",
-        "USA",
-        "US",
-        "UK",
-        "EU",
-        "LED",
-        "USB",
-        "WIFI",
-        "GPS",
-        "DVD",
-        "CD",
-        "TV",
-        "HD",
-        "LCD",
-        "OLED",
-        "AC",
-        "DC",
-        "AM",
-        "PM",
-        "CEO",
-        "CFO",
-        "DIY",
-        "FAQ",
-        "PDF",
-        "HTML",
-        "CSS",
-        "JS",
-        "API",
-        "URL",
-        "SEO",
-        "RTG",
-        "OTG",
-        "KTG",  # Site codes
+    # Field mapping from dropship spreadsheet columns to API fields
+    FIELD_MAPPING = {
+        "Sku": "Sku",
+        "Site": "site",
+        "Collection": "Collection",
+        "Category": "Category",
+        "PDMDescription": "VendorDescription",
+        "Title": "Name",
+        "AdvertisingCopy": "Advertising Copy",
+        "Image": "Image",
+        "AdditionalNotes": "Notes",
+        "Dimensions": "Dimensions",
+        "GenericName": "GenericName",
+        "DeliveryType": "DeliveryType",
+        "ShippingCode": "ShippingCode",
+        "Brand": "Brand",
+        "DeliverySubType": "Vendor Delivery Code",
     }
 
-    # Words that should be lowercase (articles, prepositions, conjunctions)
-    lowercase_words = {
-        "a",
-        "an",
-        "and",
-        "as",
-        "at",
-        "but",
-        "by",
-        "for",
-        "if",
-        "in",
-        "nor",
-        "of",
-        "on",
-        "or",
-        "so",
-        "the",
-        "to",
-        "up",
-        "yet",
-        "with",
-        "from",
-    }
-
-    # Split text into words, preserving spaces and punctuation
-    words = re.findall(r"\S+|\s+", text.strip())
-
-    result = []
-    for i, word in enumerate(words):
-        if word.isspace():
-            result.append(word)
-            continue
-
-        # Clean word for checking (remove punctuation for comparison)
-        clean_word = re.sub(r"[^\w]", "", word).upper()
-
-        # First word is always capitalized
-        if i == 0 or (
-            i > 0 and words[i - 1].isspace() and any(c in words[i - 1] for c in ".!?")
-        ):
-            if clean_word in roman_numerals:
-                # Replace the roman numeral part with correct case
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word in acronyms:
-                # Replace the acronym part with uppercase
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            else:
-                result.append(word.capitalize())
-        else:
-            # Check for special cases
-            if clean_word in roman_numerals:
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word in acronyms:
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word.lower() in lowercase_words:
-                result.append(word.lower())
-            else:
-                result.append(word.capitalize())
-
-    return "".join(result)
-
-
-class DropshipItemImporter:
-    def __init__(self, api_client: ECatalogAPIClient):
-        self.client = api_client
-        self.console = console
-
-    def parse_divisions_from_regionlist(self, region_list: str) -> ItemDivisions:
+    CRITICAL_FIELDS = [
+        "Sku",
+        "Site",
+        "Collection",
+        "PDMDescription",
+        "Title",
+        "GenericName",
+        "DeliveryType",
+    ]
+
+    BLANK_TEXT_FIELDS = ("DeliverySubType",)
+    TITLE_CASE_FIELDS = ("Collection",)
+    BOOLEAN_FIELDS = {"SingleItemRoom": "Single Item Room"}
+    HOUSE_BRANDS = SITE_BRANDS
+    CORRECTIONS = "dropship"
+    RESOLVE_CATEGORIES = True
+    DIVISION_COLUMN = "RegionList"
+
+    # Read with pandas' type inference; every other column is read as text
+    TYPED_COLUMNS = ("Single Item Room",)
+
+    # Directory under data/ for this importer's checkpoints and payload hashes
+    WORKFLOW = "dropship"
+
+    PREVIEW_MAPPINGS = [
+        ("Sku", "Sku"),
+        ("Site", "site"),
+        ("Category", "Category"),
+        ("Title", "Name"),
+        ("RegionList/Divisions", "RegionList"),
+        ("GenericName", "GenericName"),
+        ("DeliveryType", "DeliveryType"),
+        ("Brand", "Brand"),
+        ("Vendor", "Vendor"),
+    ]
+
+    def parse_divisions(self, region_list: str) -> ItemDivisions:
         """Parse division data from RegionList field (comma-separated)"""
         # Start with all divisions as None (null)
         divisions = {"FL": None, "SE": None, "TX": None}
@@ -307,478 +150,68 @@ class DropshipItemImporter:
             # Parse comma-separated regions - set specified divisions to Active=False
             regions = [r.strip() for r in region_str.split(",") if r.strip()]
             for region in regions:
-                if region == "FL":
-                    divisions["FL"] = ItemDivision(Active=False)
-                elif region == "SE":
-                    divisions["SE"] = ItemDivision(Active=False)
-                elif region == "TX":
-                    divisions["TX"] = ItemDivision(Active=False)
+                if region in divisions:
+                    divisions[region] = ItemDivision(Active=False)
 
         return ItemDivisions(**divisions)
 
-    def parse_attributes_from_row(self, row: pd.Series) -> Optional[ItemAttributes]:
-        """Parse item attributes from spreadsheet columns"""
-        attributes = {}
-
-        # Direct mapping from dropship spreadsheet to API attributes
-        attribute_mapping = {
-            "Color": "Color",
-            "Decor": "Decor",
-            "Finish": "Finish",
-            "Features": "Features",
-            "Material": "Material",
-            "Movement": "Movement",
-            "PieceCount": "PieceCount",
-            "Shape": "Shape",  # Not in sample but keeping for completeness
-            "Size": "Size",
-            "Style": "Style",
-            "Theme": "Theme",  # Not in sample but keeping for completeness
-            "Team": "team",  # Dropship specific - lowercase
-        }
-
-        for api_field, spreadsheet_col in attribute_mapping.items():
-            if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                value = str(row[spreadsheet_col]).strip()
-                if value:
-                    # Apply common data corrections for specific attributes
-                    if api_field == "Decor":
-                        value = correct_common_data_errors(value, "decor")
-                    elif api_field == "Size":
-                        value = correct_common_data_errors(value, "size")
-
-                    # Handle comma-separated values
-                    corrected_values = []
-                    for v in value.split(","):
-                        v_clean = v.strip()
-                        if v_clean:
-                            # Apply corrections to each value in comma-separated list
-                            if api_field == "Decor":
-                                v_clean = correct_common_data_errors(v_clean, "decor")
-                            elif api_field == "Size":
-                                v_clean = correct_common_data_errors(v_clean, "size")
-                            corrected_values.append(v_clean)
-
-                    if corrected_values:
-                        attributes[api_field] = corrected_values
-
-        return ItemAttributes(**attributes) if attributes else None
-
-    def row_to_item(self, row: pd.Series) -> Optional[ItemNew]:
-        """Convert a spreadsheet row to an ItemNew object"""
-        try:
-            # Field mapping from dropship spreadsheet columns to API fields
-            field_mapping = {
-                "Sku": "Sku",
-                "Site": "site",
-                "Collection": "Collection",
-                "Category": "Category",
-                "PDMDescription": "VendorDescription",
-                "Title": "Name",
-                "AdvertisingCopy": "Advertising Copy",
-                "Image": "Image",
-                "AdditionalNotes": "Notes",
-                "Dimensions": "Dimensions",
-                "GenericName": "GenericName",
-                "DeliveryType": "DeliveryType",
-                "ShippingCode": "ShippingCode",
-            }
-
-            # Optional fields with defaults
-            optional_mapping = {
-                "Brand": ("Brand", ""),
-            }
-
-            # Extract required fields
-            item_data = {}
-            missing_fields = []
-
-            for api_field, spreadsheet_col in field_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        # Apply smart title case to Collection field
-                        if api_field == "Collection":
-                            value = smart_title_case(value)
-                        item_data[api_field] = value
-                    else:
-                        missing_fields.append(f"{api_field} ({spreadsheet_col})")
-                else:
-                    missing_fields.append(f"{api_field} ({spreadsheet_col})")
-
-            # Handle optional fields with defaults
-            for api_field, (spreadsheet_col, default_value) in optional_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        # Apply smart title case to Collection field
-                        if api_field == "Collection":
-                            value = smart_title_case(value)
-                        item_data[api_field] = value
-                    else:
-                        item_data[api_field] = default_value
-                else:
-                    item_data[api_field] = default_value
-
-            # Special handling for Brand field based on Site
-            if not item_data.get("Brand") or item_data["Brand"] == "":
-                site = item_data.get("Site", "").upper()
-                if site in ("RTG", "KTG"):
-                    item_data["Brand"] = "Rooms To Go"
-                elif site == "OTG":
-                    item_data["Brand"] = "Rooms To Go Outdoor"
-
-            # Special handling for Category field - expand to full 3-part format if needed
-            if "Category" in item_data and item_data["Category"]:
-                category = item_data["Category"]
-
-                # Apply common data corrections to category
-                category = correct_common_data_errors(category, "category")
-
-                # Normalize for lookup: lowercase, remove spaces around colons
-                normalized_category = (
-                    category.lower()
-                    .replace(" : ", ":")
-                    .replace(": ", ":")
-                    .replace(" :", ":")
-                )
+    def normalize_category(self, category: str, site: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Expand a spreadsheet category to the API's full 3-part format
 
-                # Check if this is a special-case category (3-part with site prefix already)
-                if normalized_category in SPECIAL_CASE_CATEGORIES:
-                    # Use the exact required format from our special cases registry
-                    item_data["Category"] = SPECIAL_CASE_CATEGORIES[normalized_category]
-                # Check if this is a 2-part special case that needs site prefix added
-                elif normalized_category in SPECIAL_CASE_CATEGORIES_NO_PREFIX:
-                    # Determine site prefix
-                    site = item_data.get("Site", "").upper()
-                    catalog_prefix = ""
-                    if site == "RTG":
-                        catalog_prefix = "adult"
-                    elif site == "KTG":
-                        catalog_prefix = "kids"
-                    elif site == "OTG":
-                        catalog_prefix = "outdoor"
-
-                    # Build the normalized 3-part category key
-                    if catalog_prefix:
-                        normalized_with_prefix = (
-                            f"{catalog_prefix}:{normalized_category}"
-                        )
-                        # Check if the prefixed version exists in our special cases
-                        if normalized_with_prefix in SPECIAL_CASE_CATEGORIES:
-                            item_data["Category"] = SPECIAL_CASE_CATEGORIES[
-                                normalized_with_prefix
-                            ]
-                        else:
-                            console.print(
-                                f"[yellow]Warning: Special case '{normalized_category}' needs prefix but '{normalized_with_prefix}' not found in registry for SKU {row.get('Sku', 'Unknown')}[/yellow]"
-                            )
-                            return None
-                    else:
-                        console.print(
-                            f"[red]Cannot determine site prefix for special case category '{category}' for SKU {row.get('Sku', 'Unknown')}[/red]"
-                        )
-                        return None
-                else:
-                    # Standard category processing
-                    # Split on ":" delimiter (without spaces) and trim whitespace from each part
-                    parts = [part.strip() for part in category.split(":")]
+        Returns:
+            (category, None) on success, or (None, message) where message is console
+            markup containing a ``{sku}`` placeholder
+        """
+        # Apply common data corrections to category
+        category = correct_common_data_errors(category, "category")
 
-                    # Filter out empty parts
-                    parts = [part for part in parts if part]
+        # Normalize for lookup: lowercase, remove spaces around colons
+        normalized_category = (
+            category.lower().replace(" : ", ":").replace(": ", ":").replace(" :", ":")
+        )
 
-                    # Category must have at least 2 parts (category : subcategory)
-                    if len(parts) < 2:
-                        console.print(
-                            f"[red]Invalid category format for SKU {row.get('Sku', 'Unknown')}: '{category}' - must have at least 'Category : Subcategory' format[/red]"
-                        )
-                        return None
-
-                    # If category has exactly 2 parts, add catalog prefix based on site
-                    if len(parts) == 2:
-                        site = item_data.get("Site", "").upper()
-                        catalog_prefix = ""
-                        if site == "RTG":
-                            catalog_prefix = "Adult"
-                        elif site == "KTG":
-                            catalog_prefix = "Kids"
-                        elif site == "OTG":
-                            catalog_prefix = "Outdoor"
-
-                        if catalog_prefix:
-                            parts.insert(0, catalog_prefix)
-
-                    # Join parts with " : " (with spaces)
-                    item_data["Category"] = " : ".join(parts)
-
-            # Check for critical missing fields - Collection is required
-            critical_fields = [
-                "Sku",
-                "Site",
-                "Collection",
-                "PDMDescription",
-                "Title",
-                "GenericName",
-                "DeliveryType",
-            ]
-            critical_missing = [
-                field
-                for field in critical_fields
-                if field not in item_data or not item_data[field]
-            ]
-
-            if critical_missing:
-                console.print(
-                    f"[red]Missing critical fields for SKU {row.get('New SKU', 'Unknown')}: {critical_missing}[/red]"
-                )
-                console.print(
-                    f"[dim]Available columns: {', '.join(row.index.tolist())}[/dim]"
+        # Check if this is a special-case category (3-part with site prefix already)
+        if normalized_category in SPECIAL_CASE_CATEGORIES:
+            # Use the exact required format from our special cases registry
+            return SPECIAL_CASE_CATEGORIES[normalized_category], None
+
+        # Check if this is a 2-part special case that needs site prefix added
+        if normalized_category in SPECIAL_CASE_CATEGORIES_NO_PREFIX:
+            catalog_prefix = {"RTG": "adult", "KTG": "kids", "OTG": "outdoor"}.get(site, "")
+            if not catalog_prefix:
+                return None, (
+                    f"[red]Cannot determine site prefix for special case category '{category}' for SKU {{sku}}[/red]"
                 )
-                return None
-
-            # Category should be present in dropship files
 
-            # Handle optional boolean field - default to False if blank
-            if "Single Item Room" in row.index and pd.notna(row["Single Item Room"]):
-                item_data["SingleItemRoom"] = bool(row["Single Item Room"])
-            else:
-                item_data["SingleItemRoom"] = False
-
-            # Handle Vendor Delivery Code -> DeliverySubType
-            if "Vendor Delivery Code" in row.index and pd.notna(
-                row["Vendor Delivery Code"]
-            ):
-                item_data["DeliverySubType"] = str(row["Vendor Delivery Code"]).strip()
-
-            # Parse divisions from RegionList field
-            region_list = row.get("RegionList", "")
-            item_data["Divisions"] = self.parse_divisions_from_regionlist(region_list)
-
-            # Parse attributes
-            attributes = self.parse_attributes_from_row(row)
-            if attributes:
-                item_data["Attributes"] = attributes
-
-            return ItemNew(**item_data)
-
-        except Exception as e:
-            console.print(
-                f"[red]Error creating item from row {row.get('New SKU', 'Unknown')}: {e}[/red]"
+            # Build the normalized 3-part category key
+            normalized_with_prefix = f"{catalog_prefix}:{normalized_category}"
+            # Check if the prefixed version exists in our special cases
+            if normalized_with_prefix in SPECIAL_CASE_CATEGORIES:
+                return SPECIAL_CASE_CATEGORIES[normalized_with_prefix], None
+            return None, (
+                f"[yellow]Warning: Special case '{normalized_category}' needs prefix but '{normalized_with_prefix}' not found in registry for SKU {{sku}}[/yellow]"
             )
-            return None
-
-    def preview_data_mapping(
-        self, file_path: Path, sheet_name: Optional[str] = None
-    ) -> None:
-        """Preview how the spreadsheet data will be mapped"""
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                # Default to first sheet if no sheet name provided
-                if sheet_name is None:
-                    sheet_name = 0  # Read first sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return
-
-            console.print(f"[bold]Data Mapping Preview[/bold]")
-            console.print(f"Total rows: {len(df)}")
-
-            # Show first few rows mapping
-            for i in range(min(3, len(df))):
-                row = df.iloc[i]
-                console.print(
-                    f"\n[cyan]Row {i + 1} - SKU: {row.get('Sku', 'N/A')}[/cyan]"
-                )
 
-                table = Table()
-                table.add_column("API Field", style="yellow")
-                table.add_column("Spreadsheet Column", style="cyan")
-                table.add_column("Value", style="white")
-
-                # Show key mappings for dropship format
-                key_mappings = [
-                    ("Sku", "Sku"),
-                    ("Site", "site"),
-                    ("Category", "Category"),
-                    ("Title", "Name"),
-                    ("RegionList/Divisions", "RegionList"),
-                    ("GenericName", "GenericName"),
-                    ("DeliveryType", "DeliveryType"),
-                    ("Brand", "Brand"),
-                    ("Vendor", "Vendor"),
-                ]
-
-                for api_field, spreadsheet_col in key_mappings:
-                    value = row.get(spreadsheet_col, "N/A")
-                    if pd.notna(value):
-                        value = (
-                            str(value)[:50] + "..."
-                            if len(str(value)) > 50
-                            else str(value)
-                        )
-                    else:
-                        value = "N/A"
-                    table.add_row(api_field, spreadsheet_col, value)
-
-                console.print(table)
-
-        except Exception as e:
-            console.print(f"[red]Error previewing data: {e}[/red]")
-
-    def import_from_spreadsheet(
-        self,
-        file_path: Path,
-        sheet_name: Optional[str] = None,
-        dry_run: bool = True,
-        limit: Optional[int] = None,
-        export_json: bool = False,
-    ) -> Dict[str, any]:
-        """Import items from the dropship spreadsheet"""
-
-        if not file_path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0, "workrequest_ids": []}
+        # Standard category processing
+        # Split on ":" delimiter (without spaces), trim whitespace and drop empty parts
+        parts = [part.strip() for part in category.split(":")]
+        parts = [part for part in parts if part]
 
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                # Default to first sheet if no sheet name provided
-                if sheet_name is None:
-                    sheet_name = 0  # Read first sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return {
-                    "processed": 0,
-                    "created": 0,
-                    "failed": 0,
-                    "workrequest_ids": [],
-                }
-
-            # Apply limit if specified
-            if limit and limit > 0:
-                df = df.head(limit)
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name} (limited to first {limit})[/bold]"
-                )
-            else:
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name}[/bold]"
-                )
+        # Category must have at least 2 parts (category : subcategory)
+        if len(parts) < 2:
+            return None, (
+                f"[red]Invalid category format for SKU {{sku}}: '{category}' - must have at least 'Category : Subcategory' format[/red]"
+            )
 
-            stats = {"processed": 0, "created": 0, "failed": 0, "workrequest_ids": []}
+        # If category has exactly 2 parts, add catalog prefix based on site
+        if len(parts) == 2:
+            catalog_prefix = {"RTG": "Adult", "KTG": "Kids", "OTG": "Outdoor"}.get(site, "")
+            if catalog_prefix:
+                parts.insert(0, catalog_prefix)
 
-            # Create JSON output directory if needed
-            json_output_dir = None
-            if export_json:
-                json_output_dir = Path(
-                    "/Users/maust/Documents/CURSOR/prboardcli/data/dropship/json"
-                )
-                json_output_dir.mkdir(parents=True, exist_ok=True)
-                console.print(
-                    f"[blue]JSON payloads will be exported to: {json_output_dir}[/blue]"
-                )
-
-            if dry_run:
-                console.print(
-                    "[yellow]DRY RUN MODE - No items will be created[/yellow]"
-                )
-
-            with Progress() as progress:
-                task = progress.add_task("Processing items...", total=len(df))
-
-                for index, row in df.iterrows():
-                    stats["processed"] += 1
-
-                    # Convert row to ItemNew object
-                    item = self.row_to_item(row)
-                    if not item:
-                        stats["failed"] += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    # Export JSON payload if requested
-                    if export_json and json_output_dir:
-                        try:
-                            # Create JSON payload using same method as API call
-                            item_payload = item.model_dump(
-                                by_alias=True, exclude_none=True
-                            )
-                            json_filename = f"{item.Sku}.json"
-                            json_filepath = json_output_dir / json_filename
-
-                            with open(json_filepath, "w") as f:
-                                json.dump(item_payload, f, indent=2)
-
-                            console.print(f"[dim]Exported JSON: {json_filename}[/dim]")
-                        except Exception as e:
-                            console.print(
-                                f"[yellow]Warning: Failed to export JSON for {item.Sku}: {e}[/yellow]"
-                            )
-
-                    if dry_run:
-                        console.print(
-                            f"[cyan]Would create item:[/cyan] {item.Sku} - {item.Title}"
-                        )
-                        console.print(f"  Site: {item.Site}, Category: {item.Category}")
-                        # Show division status: None=null, False=inactive, True=active
-                        fl_status = (
-                            "null"
-                            if item.Divisions.FL is None
-                            else f"Active={item.Divisions.FL.Active}"
-                        )
-                        se_status = (
-                            "null"
-                            if item.Divisions.SE is None
-                            else f"Active={item.Divisions.SE.Active}"
-                        )
-                        tx_status = (
-                            "null"
-                            if item.Divisions.TX is None
-                            else f"Active={item.Divisions.TX.Active}"
-                        )
-                        console.print(
-                            f"  Divisions: FL={fl_status}, SE={se_status}, TX={tx_status}"
-                        )
-                        stats["created"] += 1
-                    else:
-                        # Actually create the item
-                        try:
-                            result = self.client.create_item(item)
-                            if result:
-                                # Extract work request ID if available
-                                workrequest_id = result.get("workrequest_id")
-                                if workrequest_id:
-                                    stats["workrequest_ids"].append(workrequest_id)
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title} [dim](Work Request: {workrequest_id})[/dim]"
-                                    )
-                                else:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title}"
-                                    )
-                                stats["created"] += 1
-                            else:
-                                console.print(
-                                    f"[red]Failed to create item:[/red] {item.Sku}"
-                                )
-                                stats["failed"] += 1
-                        except Exception as e:
-                            console.print(
-                                f"[red]Error creating item {item.Sku}: {e}[/red]"
-                            )
-                            stats["failed"] += 1
-
-                    progress.update(task, advance=1)
-
-            return stats
-
-        except Exception as e:
-            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0, "workrequest_ids": []}
+        # Join parts with " : " (with spaces)
+        return " : ".join(parts), None
 
 
 def handle_file_archiving(file_path: Path) -> bool:
@@ -842,6 +275,49 @@ def handle_file_archiving(file_path: Path) -> bool:
     is_flag=True,
     help="Export JSON payloads to /data/dropship/json/ directory",
 )
+@click.option(
+    "--export-format",
+    type=click.Choice(EXPORT_FORMATS),
+    default=EXPORT_NDJSON,
+    show_default=True,
+    help="With --export-json: one compressed NDJSON file per run, indexed by SKU, or a JSON file per item",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
 def main(
     file_path: Optional[Path],
     api_url: str,
@@ -851,6 +327,14 @@ def main(
     execute: bool,
     no_auth: bool,
     export_json: bool,
+    export_format: str,
+    concurrency: int,
+    resume: bool,
+    skip_existing: bool,
+    incremental: bool,
+    workers: int,
+    quiet: bool,
+    report_file: Optional[Path],
 ):
     """Import items from dropship spreadsheet to eCatalog API"""
 
@@ -961,9 +445,22 @@ def main(
         console.print(f"[red]API connection test failed: {e}[/red]")
         sys.exit(1)
 
+    precheck = importer.precheck_skus(file_path, sheet_name) if skip_existing else None
+
     # Import items
     stats = importer.import_from_spreadsheet(
-        file_path, sheet_name, dry_run, export_json=export_json
+        file_path,
+        sheet_name,
+        dry_run,
+        export_json=export_json,
+        export_format=export_format,
+        concurrency=concurrency,
+        resume=resume,
+        precheck=precheck,
+        incremental=incremental,
+        workers=workers,
+        quiet=quiet or report_file is not None,
+        report_file=report_file,
     )
 
     # Display results
@@ -971,12 +468,23 @@ def main(
     console.print(f"Processed: {stats['processed']}")
     console.print(f"{'Would create' if dry_run else 'Created'}: {stats['created']}")
     console.print(f"Failed: {stats['failed']}")
-
-    if dry_run and stats["created"] > 0:
+    if stats.get("resumed"):
+        console.print(f"Already created (resumed): {stats['resumed']}")
+    if precheck is not None:
+        console.print(f"Already in eCatalog: {stats['exists']}")
+        console.print(f"Exists on another site: {stats['site_conflicts']}")
+    if incremental:
+        console.print(f"{'Would update' if dry_run else 'Updated'}: {stats['updated']}")
+        console.print(f"Unchanged since last import: {stats['unchanged']}")
+        console.print(f"Changes that need a manual edit: {stats['not_updatable']}")
+
+    if dry_run and stats["created"] + stats.get("updated", 0) > 0:
         console.print(
-            f"\n[yellow]Run with --execute to actually create {stats['created']} items[/yellow]"
+            f"\n[yellow]Run with --execute to actually create {stats['created']} items"
+            + (f" and update {stats['updated']}" if stats.get("updated") else "")
+            + "[/yellow]"
         )
-    elif not dry_run and stats["created"] > 0:
+    elif not dry_run and stats["created"] + stats.get("updated", 0) > 0:
         # Get work request IDs that were created
         workrequest_ids = stats.get("workrequest_ids", [])
 
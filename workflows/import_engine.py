@@ -0,0 +1,823 @@
+"""
+Declarative spreadsheet import engine
+
+The dropship, RTG delivered, resku and generic item importers each carried a copy of
+the same machinery - streaming the sheet, mapping columns, attribute and division
+parsing, the precheck, the checkpoint journal, the payload store, JSON export and
+the concurrent create loop - with small differences in between. SpreadsheetImporter
+implements all of it once. An importer is a subclass that declares its layout:
+
+- FIELD_MAPPING / ATTRIBUTE_MAPPING: API field -> spreadsheet column, or a tuple of
+  candidate columns where the first non-empty cell of a row wins
+- CRITICAL_FIELDS: rows missing any of these are rejected
+- FALLBACK_COLUMNS, FIELD_DEFAULTS, BLANK_TEXT_FIELDS, TITLE_CASE_FIELDS,
+  BOOLEAN_FIELDS, HOUSE_BRANDS: per-field cleaning
+- CORRECTIONS: the data_corrections rule set for categories and attribute values
+- RESOLVE_CATEGORIES + normalize_category(): category expansion and index checks
+- DIVISION_COLUMN + parse_divisions(), or divisions() for other division layouts
+- FILTER_COLUMNS + row_filter(): for sheets where only some rows are imported
+
+The spec is compiled once per importer (candidate tuples, the columns to load);
+conversion then runs a column at a time per batch (see workflows/columnar.py).
+"""
+
+import json
+import warnings
+from collections import deque
+from itertools import repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+
+import pandas as pd
+from rich.console import Console
+from rich.progress import Progress
+from rich.table import Table
+
+from ecatalog_client import ECatalogAPIClient, ItemAttributes, ItemDivisions, ItemNew
+from workflows.attribute_vocabulary import load_attribute_vocabulary
+from workflows.category_index import category_key, load_category_index
+from workflows.columnar import (
+    bool_column,
+    clean_text,
+    coalesce_raw,
+    iter_records,
+    map_unique,
+    raw_column,
+    split_values,
+    text_column,
+)
+from workflows.concurrent_submit import submit_ordered
+from workflows.data_corrections import corrections_for
+from workflows.dry_run_report import DryRunReport, report_path
+from workflows.import_journal import ImportJournal
+from workflows.parallel_convert import PRINT, convert_in_processes
+from workflows.payload_export import EXPORT_FILES, EXPORT_NDJSON, PayloadExport, export_dir
+from workflows.payload_store import NOT_UPDATABLE, UNCHANGED, PayloadStore
+from workflows.sheet_reader import SUPPORTED_SUFFIXES, SheetReader, estimate_rows
+from workflows.sku_precheck import DEFAULT_LOOKUP_CONCURRENCY, SkuPrecheck
+from workflows.title_case import title_case_series
+
+console = Console()
+
+# A spreadsheet column, or candidate columns checked left to right
+Columns = Union[str, Tuple[str, ...]]
+
+# Default Brand per site when the spreadsheet leaves it blank
+SITE_BRANDS = {
+    "RTG": "Rooms To Go",
+    "KTG": "Rooms To Go",
+    "OTG": "Rooms To Go Outdoor",
+}
+
+# Attribute fields with their own correction rules
+ATTRIBUTE_FIELD_TYPES = {"Decor": "decor", "Size": "size"}
+
+# Progress bar redraws per second in quiet dry runs (Rich's default is 10)
+QUIET_REFRESH_PER_SECOND = 2
+
+
+def _candidates(columns: Columns) -> Tuple[str, ...]:
+    return (columns,) if isinstance(columns, str) else tuple(columns)
+
+
+def _text(df: pd.DataFrame, candidates: Tuple[str, ...], blank_as_none: bool = True) -> pd.Series:
+    """Stripped text of the first non-empty candidate column"""
+    if len(candidates) == 1:
+        return text_column(df, candidates[0], blank_as_none)
+    return clean_text(coalesce_raw(df, candidates), blank_as_none)
+
+
+def _division_status(divisions: ItemDivisions) -> str:
+    """FL=null, SE=Active=False, ... - None=null, False=inactive, True=active"""
+    return ", ".join(
+        f"{name}={'null' if division is None else f'Active={division.Active}'}"
+        for name, division in (("FL", divisions.FL), ("SE", divisions.SE), ("TX", divisions.TX))
+    )
+
+
+class SpreadsheetImporter:
+    """Import items from a spreadsheet whose layout the subclass declares"""
+
+    # API field -> spreadsheet column(s)
+    FIELD_MAPPING: Dict[str, Columns] = {}
+    ATTRIBUTE_MAPPING: Dict[str, Columns] = {}
+
+    CRITICAL_FIELDS: List[str] = []
+
+    # Columns tried in turn while a field is still empty
+    FALLBACK_COLUMNS: Dict[str, Tuple[str, ...]] = {}
+
+    # Values for fields still empty after the fallbacks
+    FIELD_DEFAULTS: Dict[str, Any] = {}
+
+    # Fields where a blank cell is sent as "" rather than left out
+    BLANK_TEXT_FIELDS: Tuple[str, ...] = ()
+
+    # Fields run through smart_title_case
+    TITLE_CASE_FIELDS: Tuple[str, ...] = ()
+
+    # Boolean API field -> column(s), and the value for blank cells
+    BOOLEAN_FIELDS: Dict[str, Columns] = {}
+    BOOLEAN_DEFAULT: Optional[bool] = False
+
+    # Brand for rows without one, by site (None: leave Brand as mapped)
+    HOUSE_BRANDS: Optional[Dict[str, str]] = None
+
+    # Rule set in workflows/data_corrections.json (None: attribute values are only split)
+    CORRECTIONS: Optional[str] = None
+
+    # Expand categories with normalize_category and check them against the category index
+    RESOLVE_CATEGORIES = False
+
+    # Column parse_divisions reads
+    DIVISION_COLUMN: Optional[str] = None
+
+    # Columns row_filter reads, and what the rows it keeps are called in messages
+    FILTER_COLUMNS: Tuple[str, ...] = ()
+    FILTER_LABEL = ""
+
+    # Other spreadsheet columns a hook reads
+    EXTRA_COLUMNS: Tuple[str, ...] = ()
+
+    # Read with pandas' type inference; every other column is read as text
+    TYPED_COLUMNS: Tuple[str, ...] = ()
+
+    # Directory under data/ for this importer's checkpoints, payload hashes and JSON exports
+    WORKFLOW = ""
+
+    # preview_data_mapping: heading, and (label, column) rows (None: the key fields' first columns)
+    PREVIEW_TITLE = "Data Mapping Preview"
+    PREVIEW_MAPPINGS: Optional[List[Tuple[str, str]]] = None
+
+    def __init__(self, api_client: ECatalogAPIClient):
+        self.client = api_client
+        self.console = console
+        # Valid categories per site; None until `cli.py categories refresh` has been run
+        self.category_index = load_category_index() if self.RESOLVE_CATEGORIES else None
+        # Corrections already reported, so each is printed once per import rather than per batch
+        self._reported_corrections: Set[Tuple[str, str]] = set()
+        # Allowed attribute values per site, checked by dry runs; None until `cli.py attributes refresh`
+        self.attribute_vocabulary = load_attribute_vocabulary()
+        # Collects per-row results instead of printing them during a quiet dry run
+        self.report: Optional[DryRunReport] = None
+
+        # The spec, compiled once: candidate tuples and the columns to load
+        self._fields = {field: _candidates(columns) for field, columns in self.FIELD_MAPPING.items()}
+        self._attributes = {field: _candidates(columns) for field, columns in self.ATTRIBUTE_MAPPING.items()}
+        self._booleans = {field: _candidates(columns) for field, columns in self.BOOLEAN_FIELDS.items()}
+        self._columns = list(
+            dict.fromkeys(
+                [
+                    *(column for candidates in self._fields.values() for column in candidates),
+                    *(column for fallbacks in self.FALLBACK_COLUMNS.values() for column in fallbacks),
+                    *(column for candidates in self._attributes.values() for column in candidates),
+                    *(column for candidates in self._booleans.values() for column in candidates),
+                    *([self.DIVISION_COLUMN] if self.DIVISION_COLUMN else []),
+                    *self.FILTER_COLUMNS,
+                    *self.EXTRA_COLUMNS,
+                ]
+            )
+        )
+
+    # --- Hooks -------------------------------------------------------------
+
+    def normalize_category(self, category: str, site: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Bring a spreadsheet category into the API's format (RESOLVE_CATEGORIES importers)
+
+        Returns:
+            (category, None) on success, or (None, message) where message is console
+            markup containing a ``{sku}`` placeholder
+        """
+        return category, None
+
+    def parse_attribute_value(self, api_field: str, value: str) -> Optional[List[str]]:
+        """Clean one attribute cell into its list of (corrected) values"""
+        if self.CORRECTIONS is None:
+            return split_values(value)
+        # Corrected as a whole, then per comma-separated value
+        return corrections_for(self.CORRECTIONS).correct_values(value, ATTRIBUTE_FIELD_TYPES.get(api_field))
+
+    def parse_divisions(self, value: Any) -> ItemDivisions:
+        """Divisions for one DIVISION_COLUMN cell"""
+        return ItemDivisions()
+
+    def divisions(self, df: pd.DataFrame) -> pd.Series:
+        """ItemDivisions per row (None where the row has none)"""
+        if not self.DIVISION_COLUMN:
+            return pd.Series([None] * len(df), index=df.index, dtype=object)
+        return map_unique(raw_column(df, self.DIVISION_COLUMN), self.parse_divisions)
+
+    def row_filter(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Boolean mask of the rows to import, or None to import every row"""
+        return None
+
+    # --- Reading -----------------------------------------------------------
+
+    def resolve_category(self, category: str, site: str) -> Tuple[Optional[str], Optional[str]]:
+        """normalize_category, then checked against the category index when there is one"""
+        category, error = self.normalize_category(category, site)
+        if error or self.category_index is None:
+            return category, error
+
+        resolved, error = self.category_index.check(category, site)
+        if resolved and category_key(resolved) != category_key(category):
+            self.report_correction(category, site, resolved)
+        return resolved, error
+
+    def report_correction(self, category: str, site: str, resolved: str) -> None:
+        """Report a category correction the first time this import makes it"""
+        if (category, site) in self._reported_corrections:
+            return
+        self._reported_corrections.add((category, site))
+        if self.report is not None:
+            self.report.add_correction(category, site, resolved)
+        else:
+            console.print(f"[yellow]Category '{category}' corrected to '{resolved}' ({site})[/yellow]")
+
+    def report_failure(self, sku: Any, reason: str, *messages: str) -> None:
+        """Report why a row was rejected: print the messages, or count the reason in a quiet run"""
+        if self.report is not None:
+            self.report.add_failure(sku, reason, messages[0])
+            return
+        for message in messages:
+            console.print(message)
+
+    def _note(self, kind: str, sku: str, message: str) -> None:
+        """Print a message about a valid row, or add it to the report of a quiet run"""
+        if self.report is not None:
+            self.report.add_note(kind, sku, message)
+        else:
+            console.print(message)
+
+    def source_columns(self) -> List[str]:
+        """Every spreadsheet column the importer reads"""
+        return list(self._columns)
+
+    def open_sheet(
+        self, file_path: Path, sheet_name: Optional[str] = None, limit: Optional[int] = None
+    ) -> SheetReader:
+        """Stream the sheet in batches, loading only the columns this importer reads"""
+        columns = self.source_columns()
+        return SheetReader(
+            file_path,
+            sheet_name,
+            columns=columns,
+            text_columns=[column for column in columns if column not in self.TYPED_COLUMNS],
+            limit=limit,
+        )
+
+    def filter_batches(
+        self, batches: Iterable[pd.DataFrame], on_skipped: Optional[Callable[[int], None]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Apply row_filter to a stream of batches, reporting how many rows each one drops"""
+        for batch in batches:
+            mask = self.row_filter(batch)
+            if mask is None:
+                yield batch
+                continue
+            if on_skipped:
+                on_skipped(len(batch) - int(mask.sum()))
+            yield batch[mask]
+
+    def sheet_skus(
+        self, file_path: Path, sheet_name: Optional[str] = None, limit: Optional[int] = None
+    ) -> List[str]:
+        """SKUs of the rows to import, read without the other columns"""
+        sku_columns = self._fields["Sku"]
+        columns = list(dict.fromkeys([*sku_columns, *self.FILTER_COLUMNS]))
+        reader = SheetReader(file_path, sheet_name, columns=columns, text_columns=columns, limit=limit)
+        return [
+            sku
+            for batch in self.filter_batches(reader)
+            for sku in _text(batch, sku_columns).dropna().tolist()
+        ]
+
+    def precheck_skus(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None,
+        limit: Optional[int] = None,
+        concurrency: int = DEFAULT_LOOKUP_CONCURRENCY,
+    ) -> SkuPrecheck:
+        """Look up every SKU of the sheet so that only new ones are created"""
+        skus = self.sheet_skus(file_path, sheet_name, limit)
+        with Progress() as progress:
+            task = progress.add_task("Checking SKUs...", total=len(set(skus)))
+            precheck = SkuPrecheck.run(
+                self.client, skus, concurrency, on_result=lambda _: progress.update(task, advance=1)
+            )
+        console.print(f"[blue]{precheck.summary()}[/blue]")
+        return precheck
+
+    def open_journal(
+        self, file_path: Path, sheet_name: Optional[str] = None, resume: bool = False
+    ) -> ImportJournal:
+        """The checkpoint journal for a live import of this sheet"""
+        journal = ImportJournal.open(self.WORKFLOW, file_path, sheet_name, resume=resume)
+        if resume:
+            if len(journal):
+                console.print(
+                    f"[blue]Resuming: {len(journal)} rows were submitted by an earlier run and will be skipped[/blue]"
+                )
+            else:
+                console.print("[dim]No checkpoint found for this file - importing every row[/dim]")
+        elif journal.exists():
+            console.print(
+                "[yellow]An earlier import of this file did not finish; its rows will be submitted again "
+                "(use --resume to skip them)[/yellow]"
+            )
+        return journal
+
+    # --- Conversion --------------------------------------------------------
+
+    def attribute_columns(self, df: pd.DataFrame) -> Dict[str, pd.Series]:
+        """API attribute name -> column of value lists (None for empty cells)"""
+        return {
+            api_field: map_unique(
+                _text(df, candidates),
+                lambda value, api_field=api_field: self.parse_attribute_value(api_field, value),
+            )
+            for api_field, candidates in self._attributes.items()
+            if any(column in df.columns for column in candidates)
+        }
+
+    def invalid_attribute_values(self, df: pd.DataFrame) -> Dict[int, Dict[str, List[str]]]:
+        """Attribute values the site's vocabulary doesn't have, per row position (empty without a vocabulary)"""
+        if self.attribute_vocabulary is None:
+            return {}
+        sites = _text(df, self._fields["Site"])
+        return self.attribute_vocabulary.invalid_values(sites, self.attribute_columns(df))
+
+    def items_from_batches(
+        self, batches: Iterable[pd.DataFrame], check_attributes: bool = False, workers: int = 1
+    ) -> Iterator[Tuple[Optional[ItemNew], Optional[Dict[str, List[str]]]]]:
+        """
+        items_from_frame over a stream of sheet batches
+
+        Yields (item, unknown attribute values) per row, in order; the second entry is
+        only filled in with check_attributes and a vocabulary. With workers > 1 the rows
+        are converted on that many processes (workflows/parallel_convert.py) and what
+        they would have printed is printed here, in row order.
+        """
+        if workers > 1:
+            for item, invalid, events in convert_in_processes(self, batches, check_attributes, workers):
+                for kind, args, kwargs in events:
+                    if kind == PRINT:
+                        console.print(*args, **kwargs)
+                    else:
+                        getattr(self, kind)(*args)
+                yield item, invalid
+            return
+
+        for batch in batches:
+            invalid_attributes = self.invalid_attribute_values(batch) if check_attributes else {}
+            for position, item in enumerate(self.items_from_frame(batch)):
+                yield item, invalid_attributes.get(position)
+
+    def items_from_frame(self, df: pd.DataFrame) -> Iterator[Optional[ItemNew]]:
+        """
+        Convert a whole sheet to ItemNew objects, column by column
+
+        Yields one entry per row, in order - None for rows that fail validation
+        (the reason is printed, as row_to_item always did).
+        """
+        columns = {
+            field: _text(df, candidates, blank_as_none=field not in self.BLANK_TEXT_FIELDS)
+            for field, candidates in self._fields.items()
+        }
+        for field, fallbacks in self.FALLBACK_COLUMNS.items():
+            for column in fallbacks:
+                columns[field] = columns[field].where(columns[field].notna(), text_column(df, column))
+        for field in self.TITLE_CASE_FIELDS:
+            columns[field] = title_case_series(columns[field])
+        for field, default in self.FIELD_DEFAULTS.items():
+            columns[field] = columns[field].where(columns[field].notna(), default)
+
+        site_upper = map_unique(columns["Site"], str.upper)
+
+        # Brand defaults to blank, then to the house brand for the site
+        if self.HOUSE_BRANDS is not None:
+            house_brand = site_upper.map(self.HOUSE_BRANDS).astype(object)
+            brand = columns["Brand"]
+            columns["Brand"] = brand.where(brand.notna(), house_brand.where(house_brand.notna(), ""))
+
+        # Category expansion depends on (category, site) - resolve each distinct pair once
+        category_results = repeat(None)
+        if self.RESOLVE_CATEGORIES:
+            category = columns.pop("Category")
+            category_keys = pd.Series(
+                list(zip(category.tolist(), site_upper.fillna("").tolist())),
+                index=df.index,
+                dtype=object,
+            ).where(category.notna(), None)
+            category_results = map_unique(category_keys, lambda key: self.resolve_category(*key)).tolist()
+
+        for field, candidates in self._booleans.items():
+            column = next((c for c in candidates if c in df.columns), candidates[0])
+            columns[field] = bool_column(df, column, default=self.BOOLEAN_DEFAULT)
+
+        columns["Divisions"] = self.divisions(df)
+        empty_divisions = ItemDivisions()
+
+        attribute_columns = self.attribute_columns(df)
+        attributes = iter_records(attribute_columns) if attribute_columns else None
+        available_columns = ", ".join(str(c) for c in df.columns)
+
+        for item_data, category_result in zip(iter_records(columns), category_results):
+            row_attributes = next(attributes) if attributes else {}
+            sku = item_data.get("Sku", "Unknown")
+
+            critical_missing = [field for field in self.CRITICAL_FIELDS if not item_data.get(field)]
+            if critical_missing:
+                self.report_failure(
+                    sku,
+                    "Missing critical fields",
+                    f"[red]Missing critical fields for SKU {sku}: {critical_missing}[/red]",
+                    f"[dim]Available columns: {available_columns}[/dim]",
+                )
+                yield None
+                continue
+
+            if self.RESOLVE_CATEGORIES:
+                if category_result is None:
+                    self.report_failure(sku, "Missing category", f"[red]Missing Category for SKU {sku}[/red]")
+                    yield None
+                    continue
+                category, error = category_result
+                if error:
+                    self.report_failure(sku, "Invalid category", error.replace("{sku}", str(sku)))
+                    yield None
+                    continue
+                item_data["Category"] = category
+
+            item_data.setdefault("Divisions", empty_divisions)
+            if row_attributes:
+                item_data["Attributes"] = ItemAttributes(**row_attributes)
+
+            try:
+                yield ItemNew(**item_data)
+            except Exception as e:
+                self.report_failure(sku, "Validation error", f"[red]Error creating item from row {sku}: {e}[/red]")
+                yield None
+
+    def row_to_item(self, row: pd.Series) -> Optional[ItemNew]:
+        """Convert a single spreadsheet row to an ItemNew object
+
+        Deprecated: this runs the whole columnar conversion on a one-row frame, which
+        costs milliseconds per row. Convert a frame of rows with items_from_frame instead.
+        """
+        warnings.warn(
+            "row_to_item is deprecated and slow; convert whole frames with items_from_frame",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        return next(self.items_from_frame(row.to_frame().T))
+
+    def preview_data_mapping(self, file_path: Path, sheet_name: Optional[str] = None) -> None:
+        """Preview how the spreadsheet data will be mapped"""
+        key_mappings = self.PREVIEW_MAPPINGS or [
+            (field, self._fields[field][0])
+            for field in ("Sku", "Site", "Category", "Title", "GenericName", "DeliveryType")
+            if field in self._fields
+        ]
+        sku_column = self._fields["Sku"][0]
+        try:
+            if file_path.suffix.lower() in [".xlsx", ".xls"]:
+                # Default to first sheet if no sheet name provided
+                df = pd.read_excel(file_path, sheet_name=0 if sheet_name is None else sheet_name)
+            elif file_path.suffix.lower() == ".csv":
+                df = pd.read_csv(file_path)
+            else:
+                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
+                return
+
+            console.print(f"[bold]{self.PREVIEW_TITLE}[/bold]")
+            console.print(f"Total rows: {len(df)}")
+
+            # Show first few rows mapping
+            for i in range(min(3, len(df))):
+                row = df.iloc[i]
+                console.print(f"\n[cyan]Row {i + 1} - SKU: {row.get(sku_column, 'N/A')}[/cyan]")
+
+                table = Table()
+                table.add_column("API Field", style="yellow")
+                table.add_column("Spreadsheet Column", style="cyan")
+                table.add_column("Value", style="white")
+
+                for api_field, spreadsheet_col in key_mappings:
+                    value = row.get(spreadsheet_col, "N/A")
+                    if pd.notna(value):
+                        value = str(value)[:50] + "..." if len(str(value)) > 50 else str(value)
+                    else:
+                        value = "N/A"
+                    table.add_row(api_field, spreadsheet_col, value)
+
+                console.print(table)
+
+        except Exception as e:
+            console.print(f"[red]Error previewing data: {e}[/red]")
+
+    # --- Import ------------------------------------------------------------
+
+    @staticmethod
+    def new_stats() -> Dict[str, Any]:
+        """Counters import_from_spreadsheet returns"""
+        return {
+            "processed": 0,
+            "created": 0,
+            "failed": 0,
+            "skipped": 0,
+            "resumed": 0,
+            "exists": 0,
+            "site_conflicts": 0,
+            "updated": 0,
+            "unchanged": 0,
+            "not_updatable": 0,
+            "workrequest_ids": [],
+        }
+
+    def check_source(self, file_path: Path) -> bool:
+        """Whether file_path is a sheet that can be read; the reason is printed when not"""
+        if not file_path.exists():
+            console.print(f"[red]File not found: {file_path}[/red]")
+            return False
+        if file_path.suffix.lower() not in SUPPORTED_SUFFIXES:
+            console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
+            return False
+        return True
+
+    def import_from_spreadsheet(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None,
+        dry_run: bool = True,
+        limit: Optional[int] = None,
+        export_json: bool = False,
+        concurrency: int = 1,
+        resume: bool = False,
+        precheck: Optional[SkuPrecheck] = None,
+        incremental: bool = False,
+        journal: Optional[ImportJournal] = None,
+        workers: int = 1,
+        quiet: bool = False,
+        report_file: Optional[Path] = None,
+        export_format: str = EXPORT_NDJSON,
+    ) -> Dict[str, Any]:
+        """Import items from the spreadsheet
+
+        Rows are read in batches on a background thread and converted on this one;
+        with concurrency > 1, create_item calls run on a pool of that many threads.
+        With workers > 1, rows are converted and validated on that many processes
+        instead. Results, and console output, stay in spreadsheet order.
+
+        Live runs journal every submitted row (see workflows/import_journal.py);
+        with resume, rows an interrupted earlier run already submitted are skipped
+        and its work request IDs are returned along with the new ones. A caller that
+        needs the journal afterwards passes its own (open_journal), which is then
+        neither discarded nor closed here.
+
+        A precheck (precheck_skus) leaves out rows whose SKU eCatalog already has,
+        counting them as "exists" or "site_conflicts". Rows row_filter drops count
+        as "skipped".
+
+        Live runs also record each submitted payload (workflows/payload_store.py).
+        With incremental, rows identical to their last submission are skipped
+        ("unchanged") and changed ones are sent as partial updates ("updated").
+
+        Quiet dry runs print a summary instead of a few lines per row; the per-row
+        results go into a DryRunReport written to report_file (by default
+        data/<WORKFLOW>/reports/<sheet>-dry-run.json). Live runs ignore quiet.
+
+        With export_json, each valid item's create payload is written to
+        export_dir(WORKFLOW) (data/<WORKFLOW>/json unless $PAYLOAD_EXPORT_DIR is
+        set): by default as one <sheet>_<timestamp>.ndjson.gz per run, indexed by
+        SKU (workflows/payload_export.py), or with export_format="files" as a
+        <SKU>.json per item.
+        """
+        stats = self.new_stats()
+        if not self.check_source(file_path):
+            return stats
+
+        own_journal = journal is None
+        store = None
+        export = None
+        quiet = quiet and dry_run
+        if quiet:
+            self.report = DryRunReport(file_path)
+
+        try:
+            reader = self.open_sheet(file_path, sheet_name, limit=limit)
+            total_rows = estimate_rows(file_path, sheet_name)
+            if limit and limit > 0:
+                total_rows = min(total_rows, limit) if total_rows is not None else limit
+                console.print(f"[bold]Reading {file_path.name} (limited to first {limit} rows)[/bold]")
+            else:
+                console.print(f"[bold]Reading {file_path.name}[/bold]")
+
+            json_output_dir = None
+            if export_json:
+                json_output_dir = export_dir(self.WORKFLOW)
+                if export_format == EXPORT_FILES:
+                    json_output_dir.mkdir(parents=True, exist_ok=True)
+                    console.print(f"[blue]JSON payloads will be exported to: {json_output_dir}[/blue]")
+                else:
+                    export = PayloadExport.create(json_output_dir, file_path.stem)
+                    json_output_dir = None
+                    console.print(f"[blue]JSON payloads will be exported to: {export.path}[/blue]")
+
+            if dry_run:
+                console.print(
+                    "[yellow]DRY RUN MODE - No items will be created[/yellow]"
+                    + (" [dim](quiet: summary only)[/dim]" if quiet else "")
+                )
+            else:
+                if own_journal:
+                    journal = self.open_journal(file_path, sheet_name, resume)
+                stats["workrequest_ids"].extend(journal.workrequest_ids())
+            # Live runs record what they submit; incremental runs compare against it
+            if incremental or not dry_run:
+                store = PayloadStore.open(self.WORKFLOW)
+            # Journal row of each item in flight - submit_ordered returns them in this order
+            submitted_rows = deque()
+            submit_errors = 0
+            # SKU -> update, for changed rows of an incremental run
+            updates = {}
+
+            # Without a line per row, redrawing the bar is most of the console work
+            with Progress(refresh_per_second=QUIET_REFRESH_PER_SECOND if quiet else 10) as progress:
+                task = progress.add_task("Processing items...", total=total_rows)
+
+                def skipped(count: int) -> None:
+                    stats["skipped"] += count
+                    progress.update(task, advance=count)
+
+                def valid_items():
+                    """Convert rows on this thread, yielding only the rows that map cleanly"""
+                    # Rows with attribute values the server would reject are never submitted:
+                    # their work requests would only fail later. The check is a set lookup per value
+                    items = self.items_from_batches(
+                        self.filter_batches(reader, skipped), check_attributes=True, workers=workers
+                    )
+                    for row, (item, invalid) in enumerate(items):
+                        stats["processed"] += 1
+
+                        if item and invalid:
+                            self.report_failure(
+                                item.Sku,
+                                "Invalid attribute values",
+                                f"[red]Invalid attribute values for SKU {item.Sku}: {invalid}[/red]",
+                            )
+                            item = None
+
+                        if not item:
+                            stats["failed"] += 1
+                            progress.update(task, advance=1)
+                            continue
+
+                        if journal is not None and journal.is_done(row, item.Sku):
+                            stats["resumed"] += 1
+                            progress.update(task, advance=1)
+                            continue
+
+                        # Incremental runs skip unchanged rows and update changed ones
+                        if incremental:
+                            state, update, message = store.check(item)
+                            if message:
+                                self._note(state, item.Sku, message)
+                            if state in (UNCHANGED, NOT_UPDATABLE):
+                                stats[state] += 1
+                                progress.update(task, advance=1)
+                                continue
+                            if update is not None:
+                                updates[item.Sku] = update
+
+                        # Rows whose SKU eCatalog already has are reported, not created
+                        if precheck is not None and item.Sku not in updates:
+                            bucket, message = precheck.check(item.Sku, item.Site)
+                            if message:
+                                self._note(bucket, item.Sku, message)
+                                stats[bucket] += 1
+                                progress.update(task, advance=1)
+                                continue
+
+                        if journal is not None:
+                            submitted_rows.append(row)
+
+                        if export is not None:
+                            export.write(item.Sku, item.model_dump(by_alias=True, exclude_none=True))
+                        elif json_output_dir:
+                            self._export_json(item, json_output_dir, quiet)
+
+                        yield item
+
+                if dry_run:
+                    for item in valid_items():
+                        update = updates.pop(item.Sku, None)
+                        if quiet:
+                            self.report.add_item(
+                                item,
+                                _division_status(item.Divisions),
+                                sorted(update.model_fields_set) if update is not None else None,
+                            )
+                            stats["updated" if update is not None else "created"] += 1
+                        elif update is not None:
+                            console.print(
+                                f"[cyan]Would update item:[/cyan] {item.Sku} - "
+                                f"{', '.join(sorted(update.model_fields_set))}"
+                            )
+                            stats["updated"] += 1
+                        else:
+                            console.print(f"[cyan]Would create item:[/cyan] {item.Sku} - {item.Title}")
+                            console.print(f"  Site: {item.Site}, Category: {item.Category}")
+                            console.print(f"  Divisions: {_division_status(item.Divisions)}")
+                            stats["created"] += 1
+                        progress.update(task, advance=1)
+                else:
+                    def submit(item: ItemNew):
+                        update = updates.get(item.Sku)
+                        if update is not None:
+                            return self.client.update_item(item.Sku, update)
+                        return self.client.create_item(item)
+
+                    # Results arrive in spreadsheet order
+                    for item, result, error in submit_ordered(submit, valid_items(), concurrency):
+                        row = submitted_rows.popleft()
+                        update = updates.pop(item.Sku, None)
+                        action = "Updated" if update is not None else "Created"
+                        if error:
+                            console.print(
+                                f"[red]Error {'updating' if update is not None else 'creating'} item {item.Sku}: {error}[/red]"
+                            )
+                            stats["failed"] += 1
+                            submit_errors += 1
+                        elif result:
+                            workrequest_id = result.get("workrequest_id")
+                            journal.record(row, item.Sku, workrequest_id)
+                            store.record(item, sorted(update.model_fields_set) if update is not None else None)
+                            if workrequest_id:
+                                stats["workrequest_ids"].append(workrequest_id)
+                                console.print(
+                                    f"[green]{action} item:[/green] {item.Sku} - {item.Title} [dim](Work Request: {workrequest_id})[/dim]"
+                                )
+                            else:
+                                console.print(f"[green]{action} item:[/green] {item.Sku} - {item.Title}")
+                            stats["updated" if update is not None else "created"] += 1
+                        else:
+                            console.print(
+                                f"[red]Failed to {'update' if update is not None else 'create'} item:[/red] {item.Sku}"
+                            )
+                            stats["failed"] += 1
+                            submit_errors += 1
+
+                        progress.update(task, advance=1)
+
+                # The row count was an estimate until the sheet had been read
+                progress.update(task, total=stats["processed"] + stats["skipped"])
+
+            console.print(f"[dim]{reader.summary()}[/dim]")
+            if export is not None:
+                export.close()
+                console.print(f"[blue]Exported {export.count} payloads to {export.path}[/blue]")
+            if journal is not None:
+                if submit_errors:
+                    console.print(
+                        f"[yellow]{submit_errors} items were not created - rerun with --resume to retry only those rows[/yellow]"
+                    )
+                elif own_journal:
+                    journal.discard()
+            if self.FILTER_LABEL:
+                console.print(
+                    f"[blue]Filtered: {stats['processed']} rows with {self.FILTER_LABEL}, {stats['skipped']} rows skipped[/blue]"
+                )
+                if stats["processed"] == 0:
+                    console.print(f"[yellow]No rows found with {self.FILTER_LABEL} to import[/yellow]")
+            if quiet:
+                self.report.print_summary(console)
+                path = self.report.write(report_file or report_path(self.WORKFLOW, file_path), stats)
+                console.print(f"[blue]Dry-run report written to {path}[/blue]")
+            return stats
+
+        except Exception as e:
+            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
+            return stats
+
+        finally:
+            self.report = None
+            if export is not None:
+                export.close()
+            if own_journal and journal is not None:
+                journal.close()
+            if store is not None:
+                store.close()
+
+    def _export_json(self, item: ItemNew, json_output_dir: Path, quiet: bool = False) -> None:
+        """Write the item's create payload to <SKU>.json"""
+        try:
+            json_filename = f"{item.Sku}.json"
+            with open(json_output_dir / json_filename, "w") as f:
+                json.dump(item.model_dump(by_alias=True, exclude_none=True), f, indent=2)
+            if not quiet:
+                console.print(f"[dim]Exported JSON: {json_filename}[/dim]")
+        except Exception as e:
+            console.print(f"[yellow]Warning: Failed to export JSON for {item.Sku}: {e}[/yellow]")
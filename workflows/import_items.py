@@ -4,21 +4,18 @@ import pandas as pd
 import click
 import os
 from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 from pathlib import Path
 import sys
-from typing import Dict, List, Optional
+from typing import Optional
 from dotenv import load_dotenv
 
 from ecatalog_client import (
     ECatalogAPIClient,
-    ItemNew,
     ItemDivisions,
     ItemDivision,
-    ItemAttributes,
     OAuthConfig,
 )
+from workflows.import_engine import SITE_BRANDS, SpreadsheetImporter
 
 console = Console()
 
@@ -26,12 +23,81 @@ console = Console()
 load_dotenv()
 
 
-class ReskuItemImporter:
-    def __init__(self, api_client: ECatalogAPIClient):
-        self.client = api_client
-        self.console = console
-
-    def parse_divisions_from_region(self, region: str) -> ItemDivisions:
+class ReskuItemImporter(SpreadsheetImporter):
+    """Importer for resku spreadsheets"""
+
+    # Direct mapping from spreadsheet to API attributes
+    ATTRIBUTE_MAPPING = {
+        "Color": "Color",
+        "Decor": "Décor",  # Note the accent
+        "Finish": "Finish",
+        "Features": "Features",
+        "Material": "Material",
+        "Movement": "Movement",
+        "PieceCount": "Piece Count",
+        "Shape": "Shape",
+        "Size": "Size",
+        "Style": "Style",
+        "Theme": "Theme",
+    }
+
+    # Field mapping from spreadsheet columns to API fields
+    FIELD_MAPPING = {
+        "Sku": "New SKU",
+        "Site": "Site",
+        "Collection": "Collection",
+        "Category": "Ecat Category",
+        "PDMDescription": "Description",
+        "Title": "Title",
+        "AdvertisingCopy": "Advertising Copy",
+        "Image": "Ecat Image Name",
+        "AdditionalNotes": "Additional Notes",
+        "Dimensions": "Out Of Box Dim",
+        "GenericName": "Generic Name",
+        "DeliveryType": "Delivery Type",
+        "ShippingCode": "Shipping Code",
+        "Brand": "Specialty Brand",
+        "DeliverySubType": "Vendor Delivery Code",
+    }
+
+    CRITICAL_FIELDS = [
+        "Sku",
+        "Site",
+        "Collection",
+        "PDMDescription",
+        "Title",
+        "GenericName",
+        "DeliveryType",
+    ]
+
+    # Use Category or Top Category when Ecat Category is blank
+    FALLBACK_COLUMNS = {"Category": ("Category", "Top Category")}
+
+    # Optional fields with defaults
+    FIELD_DEFAULTS = {"Dimensions": "", "Category": "Uncategorized"}
+
+    BLANK_TEXT_FIELDS = ("DeliverySubType",)
+    BOOLEAN_FIELDS = {"SingleItemRoom": "Single Item Room"}
+    HOUSE_BRANDS = SITE_BRANDS
+    DIVISION_COLUMN = "Region"
+
+    # Read with pandas' type inference; every other column is read as text
+    TYPED_COLUMNS = ("Single Item Room",)
+
+    # Directory under data/ for this importer's checkpoints and payload hashes
+    WORKFLOW = "resku"
+
+    PREVIEW_MAPPINGS = [
+        ("Sku", "New SKU"),
+        ("Site", "Site"),
+        ("Category", "Ecat Category"),
+        ("Title", "Title"),
+        ("Region/Divisions", "Region"),
+        ("GenericName", "Generic Name"),
+        ("DeliveryType", "Delivery Type"),
+    ]
+
+    def parse_divisions(self, region: str) -> ItemDivisions:
         """Parse division data from Region field"""
         # Start with all divisions as None (null)
         divisions = {"FL": None, "SE": None, "TX": None}
@@ -55,333 +121,6 @@ class ReskuItemImporter:
 
         return ItemDivisions(**divisions)
 
-    def parse_attributes_from_row(self, row: pd.Series) -> Optional[ItemAttributes]:
-        """Parse item attributes from spreadsheet columns"""
-        attributes = {}
-
-        # Direct mapping from spreadsheet to API attributes
-        attribute_mapping = {
-            "Color": "Color",
-            "Decor": "Décor",  # Note the accent
-            "Finish": "Finish",
-            "Features": "Features",
-            "Material": "Material",
-            "Movement": "Movement",
-            "PieceCount": "Piece Count",
-            "Shape": "Shape",
-            "Size": "Size",
-            "Style": "Style",
-            "Theme": "Theme",
-        }
-
-        for api_field, spreadsheet_col in attribute_mapping.items():
-            if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                value = str(row[spreadsheet_col]).strip()
-                if value:
-                    # Handle comma-separated values
-                    attributes[api_field] = [
-                        v.strip() for v in value.split(",") if v.strip()
-                    ]
-
-        return ItemAttributes(**attributes) if attributes else None
-
-    def row_to_item(self, row: pd.Series) -> Optional[ItemNew]:
-        """Convert a spreadsheet row to an ItemNew object"""
-        try:
-            # Field mapping from spreadsheet columns to API fields
-            field_mapping = {
-                "Sku": "New SKU",
-                "Site": "Site",
-                "Collection": "Collection",
-                "Category": "Ecat Category",
-                "PDMDescription": "Description",
-                "Title": "Title",
-                "AdvertisingCopy": "Advertising Copy",
-                "Image": "Ecat Image Name",
-                "AdditionalNotes": "Additional Notes",
-                "Dimensions": "Out Of Box Dim",
-                "GenericName": "Generic Name",
-                "DeliveryType": "Delivery Type",
-                "ShippingCode": "Shipping Code",
-            }
-
-            # Optional fields with defaults
-            optional_mapping = {
-                "Brand": ("Specialty Brand", ""),
-                "Dimensions": ("Out Of Box Dim", ""),
-            }
-
-            # Extract required fields
-            item_data = {}
-            missing_fields = []
-
-            for api_field, spreadsheet_col in field_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        item_data[api_field] = value
-                    else:
-                        missing_fields.append(f"{api_field} ({spreadsheet_col})")
-                else:
-                    missing_fields.append(f"{api_field} ({spreadsheet_col})")
-
-            # Handle optional fields with defaults
-            for api_field, (spreadsheet_col, default_value) in optional_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        item_data[api_field] = value
-                    else:
-                        item_data[api_field] = default_value
-                else:
-                    item_data[api_field] = default_value
-
-            # Special handling for Brand field based on Site
-            if not item_data.get("Brand") or item_data["Brand"] == "":
-                site = item_data.get("Site", "").upper()
-                if site in ("RTG", "KTG"):
-                    item_data["Brand"] = "Rooms To Go"
-                elif site == "OTG":
-                    item_data["Brand"] = "Rooms To Go Outdoor"
-
-            # Check for critical missing fields - Collection is required
-            critical_fields = [
-                "Sku",
-                "Site",
-                "Collection",
-                "PDMDescription",
-                "Title",
-                "GenericName",
-                "DeliveryType",
-            ]
-            critical_missing = [
-                field
-                for field in critical_fields
-                if field not in item_data or not item_data[field]
-            ]
-
-            if critical_missing:
-                console.print(
-                    f"[red]Missing critical fields for SKU {row.get('New SKU', 'Unknown')}: {critical_missing}[/red]"
-                )
-                console.print(f"[dim]Available columns: {', '.join(row.index.tolist())}[/dim]")
-                return None
-
-            # Use Category or Ecat Category for Category field
-            if "Category" not in item_data:
-                for cat_col in ["Ecat Category", "Category", "Top Category"]:
-                    if cat_col in row.index and pd.notna(row[cat_col]):
-                        value = str(row[cat_col]).strip()
-                        if value:
-                            item_data["Category"] = value
-                            break
-                else:
-                    item_data["Category"] = "Uncategorized"
-
-            # Handle optional boolean field - default to False if blank
-            if "Single Item Room" in row.index and pd.notna(row["Single Item Room"]):
-                item_data["SingleItemRoom"] = bool(row["Single Item Room"])
-            else:
-                item_data["SingleItemRoom"] = False
-
-            # Handle Vendor Delivery Code -> DeliverySubType
-            if "Vendor Delivery Code" in row.index and pd.notna(
-                row["Vendor Delivery Code"]
-            ):
-                item_data["DeliverySubType"] = str(row["Vendor Delivery Code"]).strip()
-
-            # Parse divisions from Region field
-            region = row.get("Region", "")
-            item_data["Divisions"] = self.parse_divisions_from_region(region)
-
-            # Parse attributes
-            attributes = self.parse_attributes_from_row(row)
-            if attributes:
-                item_data["Attributes"] = attributes
-
-            return ItemNew(**item_data)
-
-        except Exception as e:
-            console.print(
-                f"[red]Error creating item from row {row.get('New SKU', 'Unknown')}: {e}[/red]"
-            )
-            return None
-
-    def preview_data_mapping(
-        self, file_path: Path, sheet_name: Optional[str] = None
-    ) -> None:
-        """Preview how the spreadsheet data will be mapped"""
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                # Default to first sheet if no sheet name provided
-                if sheet_name is None:
-                    sheet_name = 0  # Read first sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return
-
-            console.print(f"[bold]Data Mapping Preview[/bold]")
-            console.print(f"Total rows: {len(df)}")
-
-            # Show first few rows mapping
-            for i in range(min(3, len(df))):
-                row = df.iloc[i]
-                console.print(
-                    f"\n[cyan]Row {i + 1} - SKU: {row.get('New SKU', 'N/A')}[/cyan]"
-                )
-
-                table = Table()
-                table.add_column("API Field", style="yellow")
-                table.add_column("Spreadsheet Column", style="cyan")
-                table.add_column("Value", style="white")
-
-                # Show key mappings
-                key_mappings = [
-                    ("Sku", "New SKU"),
-                    ("Site", "Site"),
-                    ("Category", "Ecat Category"),
-                    ("Title", "Title"),
-                    ("Region/Divisions", "Region"),
-                    ("GenericName", "Generic Name"),
-                    ("DeliveryType", "Delivery Type"),
-                ]
-
-                for api_field, spreadsheet_col in key_mappings:
-                    value = row.get(spreadsheet_col, "N/A")
-                    if pd.notna(value):
-                        value = (
-                            str(value)[:50] + "..."
-                            if len(str(value)) > 50
-                            else str(value)
-                        )
-                    else:
-                        value = "N/A"
-                    table.add_row(api_field, spreadsheet_col, value)
-
-                console.print(table)
-
-        except Exception as e:
-            console.print(f"[red]Error previewing data: {e}[/red]")
-
-    def import_from_spreadsheet(
-        self,
-        file_path: Path,
-        sheet_name: Optional[str] = None,
-        dry_run: bool = True,
-        limit: Optional[int] = None,
-    ) -> Dict[str, int]:
-        """Import items from the resku spreadsheet"""
-
-        if not file_path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
-
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                # Default to first sheet if no sheet name provided
-                if sheet_name is None:
-                    sheet_name = 0  # Read first sheet
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return {"processed": 0, "created": 0, "failed": 0}
-
-            # Apply limit if specified
-            if limit and limit > 0:
-                df = df.head(limit)
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name} (limited to first {limit})[/bold]"
-                )
-            else:
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name}[/bold]"
-                )
-
-            stats = {"processed": 0, "created": 0, "failed": 0}
-
-            if dry_run:
-                console.print(
-                    "[yellow]DRY RUN MODE - No items will be created[/yellow]"
-                )
-
-            with Progress() as progress:
-                task = progress.add_task("Processing items...", total=len(df))
-
-                for index, row in df.iterrows():
-                    stats["processed"] += 1
-
-                    # Convert row to ItemNew object
-                    item = self.row_to_item(row)
-                    if not item:
-                        stats["failed"] += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    if dry_run:
-                        console.print(
-                            f"[cyan]Would create item:[/cyan] {item.Sku} - {item.Title}"
-                        )
-                        console.print(f"  Site: {item.Site}, Category: {item.Category}")
-                        # Show division status: None=null, False=inactive, True=active
-                        fl_status = (
-                            "null"
-                            if item.Divisions.FL is None
-                            else f"Active={item.Divisions.FL.Active}"
-                        )
-                        se_status = (
-                            "null"
-                            if item.Divisions.SE is None
-                            else f"Active={item.Divisions.SE.Active}"
-                        )
-                        tx_status = (
-                            "null"
-                            if item.Divisions.TX is None
-                            else f"Active={item.Divisions.TX.Active}"
-                        )
-                        console.print(
-                            f"  Divisions: FL={fl_status}, SE={se_status}, TX={tx_status}"
-                        )
-                        stats["created"] += 1
-                    else:
-                        # Actually create the item
-                        try:
-                            result = self.client.create_item(item)
-                            if result:
-                                # Extract work request ID if available
-                                workrequest_id = result.get("workrequest_id")
-                                if workrequest_id:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title} [dim](Work Request: {workrequest_id})[/dim]"
-                                    )
-                                else:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title}"
-                                    )
-                                stats["created"] += 1
-                            else:
-                                console.print(
-                                    f"[red]Failed to create item:[/red] {item.Sku}"
-                                )
-                                stats["failed"] += 1
-                        except Exception as e:
-                            console.print(
-                                f"[red]Error creating item {item.Sku}: {e}[/red]"
-                            )
-                            stats["failed"] += 1
-
-                    progress.update(task, advance=1)
-
-            return stats
-
-        except Exception as e:
-            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
-
 
 @click.command()
 @click.argument("file_path", type=click.Path(exists=True, path_type=Path))
@@ -402,6 +141,42 @@ class ReskuItemImporter:
     "--execute", is_flag=True, help="Actually create items (overrides dry-run)"
 )
 @click.option("--no-auth", is_flag=True, help="Skip OAuth authentication (for testing)")
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
 def main(
     file_path: Path,
     api_url: str,
@@ -410,6 +185,13 @@ def main(
     dry_run: bool,
     execute: bool,
     no_auth: bool,
+    concurrency: int,
+    resume: bool,
+    skip_existing: bool,
+    incremental: bool,
+    workers: int,
+    quiet: bool,
+    report_file: Optional[Path],
 ):
     """Import items from resku spreadsheet to eCatalog API"""
 
@@ -468,18 +250,35 @@ def main(
         console.print(f"[red]API connection test failed: {e}[/red]")
         sys.exit(1)
 
+    precheck = importer.precheck_skus(file_path, sheet_name) if skip_existing else None
+
     # Import items
-    stats = importer.import_from_spreadsheet(file_path, sheet_name, dry_run)
+    stats = importer.import_from_spreadsheet(
+        file_path, sheet_name, dry_run, concurrency=concurrency, resume=resume,
+        precheck=precheck, incremental=incremental, workers=workers,
+        quiet=quiet or report_file is not None, report_file=report_file,
+    )
 
     # Display results
     console.print(f"\n[bold]Import Results:[/bold]")
     console.print(f"Processed: {stats['processed']}")
     console.print(f"{'Would create' if dry_run else 'Created'}: {stats['created']}")
     console.print(f"Failed: {stats['failed']}")
-
-    if dry_run and stats["created"] > 0:
+    if stats.get("resumed"):
+        console.print(f"Already created (resumed): {stats['resumed']}")
+    if precheck is not None:
+        console.print(f"Already in eCatalog: {stats['exists']}")
+        console.print(f"Exists on another site: {stats['site_conflicts']}")
+    if incremental:
+        console.print(f"{'Would update' if dry_run else 'Updated'}: {stats['updated']}")
+        console.print(f"Unchanged since last import: {stats['unchanged']}")
+        console.print(f"Changes that need a manual edit: {stats['not_updatable']}")
+
+    if dry_run and stats["created"] + stats.get("updated", 0) > 0:
         console.print(
-            f"\n[yellow]Run with --execute to actually create {stats['created']} items[/yellow]"
+            f"\n[yellow]Run with --execute to actually create {stats['created']} items"
+            + (f" and update {stats['updated']}" if stats.get("updated") else "")
+            + "[/yellow]"
         )
 
 
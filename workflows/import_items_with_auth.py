@@ -3,266 +3,137 @@
 import pandas as pd
 import click
 from rich.console import Console
-from rich.progress import Progress, TaskID
 from pathlib import Path
 import sys
-from typing import Dict, List, Optional
+from typing import Optional
 
 from ecatalog_client import (
     ECatalogAPIClient,
-    ItemNew,
     ItemDivisions,
     ItemDivision,
-    ItemAttributes,
     OAuthConfig,
 )
+from workflows.columnar import bool_column, map_unique
+from workflows.import_engine import SpreadsheetImporter
 
 console = Console()
 
 
-class ItemImporter:
-    def __init__(self, api_client: ECatalogAPIClient):
-        self.client = api_client
-        self.console = console
-
-    def parse_divisions(self, row: pd.Series) -> ItemDivisions:
-        """Parse division data from spreadsheet columns"""
-        divisions = {}
-
-        for division in ["FL", "SE", "TX"]:
-            # Look for columns like 'FL_Active', 'SE_Active', 'TX_Active' or just 'FL', 'SE', 'TX'
+class ItemImporter(SpreadsheetImporter):
+    """Importer for generic item spreadsheets, where column names vary in spelling"""
+
+    # Map common attribute columns
+    ATTRIBUTE_MAPPING = {
+        "Color": ("Color", "Colors", "color"),
+        "Decor": ("Decor", "decor"),
+        "Finish": ("Finish", "finish"),
+        "Features": ("Features", "features"),
+        "Material": ("Material", "material"),
+        "Movement": ("Movement", "movement"),
+        "PieceCount": ("PieceCount", "Piece_Count", "piece_count"),
+        "Shape": ("Shape", "shape"),
+        "Size": ("Size", "size"),
+        "Style": ("Style", "style"),
+        "Theme": ("Theme", "theme"),
+        "Team": ("Team", "team"),
+    }
+
+    # Required fields mapping
+    REQUIRED_MAPPING = {
+        "Sku": ("New SKU", "New Sku"),
+        "Site": ("Site", "site"),
+        "Category": ("Ecat Category",),
+        "Collection": ("Collection", "collection"),
+        "PDMDescription": ("Description", "PDMDescription", "pdm_description"),
+        "Title": ("Title", "title", "Item_Title"),
+        "AdvertisingCopy": (
+            "Advertising_Copy",
+            "AdvertisingCopy",
+            "advertising_copy",
+        ),
+        "Dimensions": ("Out Of Box Dim",),
+        "Image": ("Ecat Image Name", "Image", "image", "Image_Name"),
+        "GenericName": (
+            "Generic Name",
+            "Generic_Name",
+            "GenericName",
+            "generic_name",
+        ),
+        "DeliveryType": (
+            "Delivery Type",
+            "Delivery_Type",
+            "DeliveryType",
+            "delivery_type",
+        ),
+    }
+
+    # Optional fields - sent as "" when blank
+    OPTIONAL_MAPPING = {
+        "Brand": ("Brand", "brand"),
+        "AdditionalNotes": (
+            "Additional_Notes",
+            "AdditionalNotes",
+            "additional_notes",
+            "Notes",
+        ),
+        "DeliverySubType": (
+            "Delivery_Sub_Type",
+            "DeliverySubType",
+            "delivery_sub_type",
+        ),
+        "ShippingCode": ("Shipping_Code", "ShippingCode", "shipping_code"),
+        "GroupKey": ("Group_Key", "GroupKey", "group_key"),
+        "GroupKeyModifier": (
+            "Group_Key_Modifier",
+            "GroupKeyModifier",
+            "group_key_modifier",
+        ),
+    }
+
+    FIELD_MAPPING = {**REQUIRED_MAPPING, **OPTIONAL_MAPPING}
+    CRITICAL_FIELDS = list(REQUIRED_MAPPING)
+    BLANK_TEXT_FIELDS = tuple(OPTIONAL_MAPPING)
+
+    # Boolean fields - only set if explicitly provided
+    BOOLEAN_FIELDS = {"SingleItemRoom": ("Single_Item_Room", "SingleItemRoom")}
+    BOOLEAN_DEFAULT = None
+
+    DIVISIONS = ("FL", "SE", "TX")
+
+    # Division flags: 'FL_Active', 'SE_Active', 'TX_Active' or just 'FL', 'SE', 'TX'
+    EXTRA_COLUMNS = (
+        *(f"{division}_Active" for division in DIVISIONS),
+        *DIVISIONS,
+    )
+
+    # Booleans keep pandas' type inference; every other column is read as text
+    TYPED_COLUMNS = (*EXTRA_COLUMNS, *BOOLEAN_FIELDS["SingleItemRoom"])
+
+    # Directory under data/ for this importer's checkpoints and payload hashes
+    WORKFLOW = "items"
+
+    def divisions(self, df: pd.DataFrame) -> pd.Series:
+        """Parse division data from spreadsheet columns, one ItemDivisions per row"""
+        flags = {}
+        for division in self.DIVISIONS:
+            # Default to False if not specified - requires explicit activation
             active_col = f"{division}_Active"
-            if active_col in row.index:
-                active = bool(row[active_col]) if pd.notna(row[active_col]) else False
-            elif division in row.index:
-                active = bool(row[division]) if pd.notna(row[division]) else False
-            else:
-                # Default to False if not specified - requires explicit activation
-                active = False
-
-            divisions[division] = ItemDivision(Active=active)
-
-        return ItemDivisions(**divisions)
-
-    def parse_attributes(self, row: pd.Series) -> Optional[ItemAttributes]:
-        """Parse item attributes from spreadsheet columns"""
-        attributes = {}
-
-        # Map common attribute columns
-        attribute_mapping = {
-            "Color": ["Color", "Colors", "color"],
-            "Decor": ["Decor", "decor"],
-            "Finish": ["Finish", "finish"],
-            "Features": ["Features", "features"],
-            "Material": ["Material", "material"],
-            "Movement": ["Movement", "movement"],
-            "PieceCount": ["PieceCount", "Piece_Count", "piece_count"],
-            "Shape": ["Shape", "shape"],
-            "Size": ["Size", "size"],
-            "Style": ["Style", "style"],
-            "Theme": ["Theme", "theme"],
-            "Team": ["Team", "team"],
-        }
-
-        for attr_name, possible_columns in attribute_mapping.items():
-            for col in possible_columns:
-                if col in row.index and pd.notna(row[col]):
-                    # Handle comma-separated values
-                    value = str(row[col]).strip()
-                    if value:
-                        attributes[attr_name] = [
-                            v.strip() for v in value.split(",") if v.strip()
-                        ]
-                    break
-
-        return ItemAttributes(**attributes) if attributes else None
-
-    def row_to_item(self, row: pd.Series) -> Optional[ItemNew]:
-        """Convert a spreadsheet row to an ItemNew object"""
-        try:
-            # Required fields mapping
-            required_mapping = {
-                "Sku": ["New SKU", "New Sku"],
-                "Site": ["Site", "site"],
-                "Category": ["Ecat Category"],
-                "Collection": ["Collection", "collection"],
-                "PDMDescription": ["Description", "PDMDescription", "pdm_description"],
-                "Title": ["Title", "title", "Item_Title"],
-                "AdvertisingCopy": [
-                    "Advertising_Copy",
-                    "AdvertisingCopy",
-                    "advertising_copy",
-                ],
-                "Dimensions": ["Out Of Box Dim"],
-                "Image": ["Ecat Image Name", "Image", "image", "Image_Name"],
-                "GenericName": [
-                    "Generic Name",
-                    "Generic_Name",
-                    "GenericName",
-                    "generic_name",
-                ],
-                "DeliveryType": [
-                    "Delivery Type",
-                    "Delivery_Type",
-                    "DeliveryType",
-                    "delivery_type",
-                ],
-            }
-
-            # Extract required fields
-            item_data = {}
-            missing_fields = []
-
-            for field, possible_columns in required_mapping.items():
-                value = None
-                for col in possible_columns:
-                    if col in row.index and pd.notna(row[col]):
-                        value = str(row[col]).strip()
-                        break
-
-                if value:
-                    item_data[field] = value
-                else:
-                    missing_fields.append(field)
-
-            if missing_fields:
-                console.print(
-                    f"[red]Missing required fields for row: {missing_fields}[/red]"
-                )
-                return None
-
-            # Optional fields
-            optional_mapping = {
-                "Brand": ["Brand", "brand"],
-                "AdditionalNotes": [
-                    "Additional_Notes",
-                    "AdditionalNotes",
-                    "additional_notes",
-                    "Notes",
-                ],
-                "DeliverySubType": [
-                    "Delivery_Sub_Type",
-                    "DeliverySubType",
-                    "delivery_sub_type",
-                ],
-                "ShippingCode": ["Shipping_Code", "ShippingCode", "shipping_code"],
-                "GroupKey": ["Group_Key", "GroupKey", "group_key"],
-                "GroupKeyModifier": [
-                    "Group_Key_Modifier",
-                    "GroupKeyModifier",
-                    "group_key_modifier",
-                ],
-            }
-
-            for field, possible_columns in optional_mapping.items():
-                for col in possible_columns:
-                    if col in row.index and pd.notna(row[col]):
-                        item_data[field] = str(row[col]).strip()
-                        break
-
-            # Boolean fields - only set if explicitly provided
-            if "Single_Item_Room" in row.index or "SingleItemRoom" in row.index:
-                single_room_col = (
-                    "Single_Item_Room"
-                    if "Single_Item_Room" in row.index
-                    else "SingleItemRoom"
-                )
-                if pd.notna(row[single_room_col]):
-                    item_data["SingleItemRoom"] = bool(row[single_room_col])
-
-            # Parse divisions and attributes
-            item_data["Divisions"] = self.parse_divisions(row)
-            attributes = self.parse_attributes(row)
-            if attributes:
-                item_data["Attributes"] = attributes
-
-            return ItemNew(**item_data)
-
-        except Exception as e:
-            console.print(f"[red]Error creating item from row: {e}[/red]")
-            return None
-
-    def import_from_spreadsheet(
-        self, file_path: Path, sheet_name: Optional[str] = None, dry_run: bool = True
-    ) -> Dict[str, int]:
-        """Import items from a spreadsheet file"""
-
-        if not file_path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
-
-        try:
-            # Read the spreadsheet
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return {"processed": 0, "created": 0, "failed": 0}
-
-            console.print(f"Loaded {len(df)} rows from {file_path}")
-            console.print(f"Columns: {', '.join(df.columns.tolist())}")
-
-            stats = {"processed": 0, "created": 0, "failed": 0}
-
-            if dry_run:
-                console.print(
-                    "[yellow]DRY RUN MODE - No items will be created[/yellow]"
-                )
-
-            with Progress() as progress:
-                task = progress.add_task("Processing items...", total=len(df))
-
-                for index, row in df.iterrows():
-                    stats["processed"] += 1
-
-                    # Convert row to ItemNew object
-                    item = self.row_to_item(row)
-                    if not item:
-                        stats["failed"] += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    if dry_run:
-                        console.print(
-                            f"[cyan]Would create item:[/cyan] {item.Sku} - {item.Title}"
-                        )
-                        stats["created"] += 1
-                    else:
-                        # Actually create the item
-                        try:
-                            result = self.client.create_item(item)
-                            if result:
-                                # Extract work request ID if available
-                                workrequest_id = result.get("workrequest_id")
-                                if workrequest_id:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title} [dim](Work Request: {workrequest_id})[/dim]"
-                                    )
-                                else:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title}"
-                                    )
-                                stats["created"] += 1
-                            else:
-                                console.print(
-                                    f"[red]Failed to create item:[/red] {item.Sku}"
-                                )
-                                stats["failed"] += 1
-                        except Exception as e:
-                            console.print(
-                                f"[red]Error creating item {item.Sku}: {e}[/red]"
-                            )
-                            stats["failed"] += 1
-
-                    progress.update(task, advance=1)
-
-            return stats
+            flags[division] = bool_column(
+                df, active_col if active_col in df.columns else division, default=False
+            )
 
-        except Exception as e:
-            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
+        keys = pd.Series(
+            list(zip(*(flags[division] for division in self.DIVISIONS))), index=df.index, dtype=object
+        )
+        return map_unique(
+            keys,
+            lambda key: ItemDivisions(
+                **{
+                    division: ItemDivision(Active=active)
+                    for division, active in zip(self.DIVISIONS, key)
+                }
+            ),
+        )
 
 
 @click.command()
@@ -0,0 +1,174 @@
+"""
+Checkpoint journal for live imports
+
+A live import that dies part way (network drop, expired token, Ctrl-C) used to start
+over from the first row on the next run, creating the same items and work requests
+again. The journal records every row a run has submitted - row position, SKU and the
+returned work request ID - as one JSON line, flushed as it is written, so a rerun with
+``--resume`` skips those rows and only submits the rest.
+
+Journals live in data/<workflow>/checkpoints/ (or $IMPORT_CHECKPOINT_DIR/<workflow>/)
+and are keyed by the SHA-256 of the spreadsheet and the sheet name: an edited file
+gets a new journal, so rows are never skipped against a different version of the
+sheet. A journal is deleted once its import has finished.
+"""
+
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+DEFAULT_CHECKPOINT_ROOT = Path(__file__).parent.parent / "data"
+
+# Environment variable pointing at an alternative checkpoint directory
+CHECKPOINT_DIR_ENV = "IMPORT_CHECKPOINT_DIR"
+
+_UNSAFE_CHARACTERS = re.compile(r"[^0-9A-Za-z._-]+")
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def open_for_append(path: Path):
+    """
+    Open a JSON-lines file for appending
+
+    A run killed mid-write leaves a partial last line. Readers skip it, but the next
+    entry appended would be glued onto it and skipped too, so the fragment is cut off
+    first.
+    """
+    if path.exists():
+        with open(path, "rb+") as f:
+            end = f.seek(0, os.SEEK_END)
+            keep = end
+            # Back up to just after the last newline
+            while keep > 0:
+                start = max(keep - (1 << 16), 0)
+                f.seek(start)
+                newline = f.read(keep - start).rfind(b"\n")
+                if newline >= 0:
+                    keep = start + newline + 1
+                    break
+                keep = start
+            if keep < end:
+                f.truncate(keep)
+    return open(path, "a", encoding="utf-8")
+
+
+def checkpoint_dir(workflow: str) -> Path:
+    """Where a workflow's journals go: $IMPORT_CHECKPOINT_DIR/<workflow>, else data/<workflow>/checkpoints"""
+    override = os.getenv(CHECKPOINT_DIR_ENV)
+    if override:
+        return Path(override) / workflow
+    return DEFAULT_CHECKPOINT_ROOT / workflow / "checkpoints"
+
+
+class ImportJournal:
+    """Rows of one spreadsheet that a live import has already submitted"""
+
+    def __init__(self, path: Path, source: str, sha256: str, sheet_name: Optional[str] = None):
+        self.path = Path(path)
+        self.source = source
+        self.sha256 = sha256
+        self.sheet_name = sheet_name
+        # (row position, SKU) -> work request ID, in submission order
+        self.entries: Dict[Tuple[int, str], Optional[int]] = {}
+        self._file = None
+
+    @classmethod
+    def open(
+        cls, workflow: str, file_path: Path, sheet_name: Optional[str] = None, resume: bool = False
+    ) -> "ImportJournal":
+        """
+        The journal for a spreadsheet
+
+        Args:
+            workflow: Workflow name, e.g. 'dropship' (selects the checkpoint directory)
+            file_path: Spreadsheet being imported
+            sheet_name: Sheet being imported, if any
+            resume: Load the rows recorded by an earlier run; otherwise the journal
+                starts empty and replaces any earlier one on the first record()
+        """
+        file_path = Path(file_path)
+        sha256 = file_sha256(file_path)
+        name = file_path.stem
+        if sheet_name:
+            name += f"-{sheet_name}"
+        name = _UNSAFE_CHARACTERS.sub("_", name)
+        journal = cls(
+            checkpoint_dir(workflow) / f"{name}-{sha256[:16]}.jsonl", file_path.name, sha256, sheet_name
+        )
+        if resume:
+            journal._load()
+        return journal
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write leaves a partial last line
+                    continue
+                if "sha256" in entry and entry["sha256"] != self.sha256:
+                    return
+                if "row" in entry:
+                    self.entries[(entry["row"], entry["sku"])] = entry.get("workrequest_id")
+
+    def is_done(self, row: int, sku: str) -> bool:
+        return (row, sku) in self.entries
+
+    def record(self, row: int, sku: str, workrequest_id: Optional[int]) -> None:
+        """Journal a submitted row; written through before returning"""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Appending continues a resumed journal; a fresh run replaces the old one
+            self._file = open_for_append(self.path) if self.entries else open(self.path, "w", encoding="utf-8")
+            if not self.entries:
+                self._write({
+                    "source": self.source,
+                    "sha256": self.sha256,
+                    "sheet": self.sheet_name,
+                    "started": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                })
+        self.entries[(row, sku)] = workrequest_id
+        self._write({"row": row, "sku": sku, "workrequest_id": workrequest_id})
+
+    def _write(self, entry: Dict) -> None:
+        self._file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._file.flush()
+
+    def skus(self) -> List[str]:
+        return [sku for _, sku in self.entries]
+
+    def workrequest_ids(self) -> List[int]:
+        """Work request IDs of the journaled rows, in submission order"""
+        return [wr_id for wr_id in self.entries.values() if wr_id]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self) -> None:
+        """Close and delete the journal (the import it covers is done)"""
+        self.close()
+        self.entries.clear()
+        if self.path.exists():
+            self.path.unlink()
@@ -14,10 +14,11 @@ The workflow:
 1. Parses the spreadsheet
 2. Groups swaps by room and division
 3. Validates the data
-4. Exports each swap to its own JSON file for traceability
+4. Exports the swaps for traceability (one NDJSON file per run indexed by room SKU,
+   or a JSON file per swap)
 5. Executes each swap individually via API (one work request per room)
 
-Note: Each room swap is isolated and gets its own JSON file and work request
+Note: Each room swap is isolated and gets its own work request
 for better traceability and failure isolation.
 """
 
@@ -42,6 +43,7 @@ from ecatalog_client import (
     RoomItem,
     OAuthConfig,
 )
+from workflows.payload_export import EXPORT_FILES, EXPORT_NDJSON, PayloadExport, export_dir
 
 console = Console()
 
@@ -228,13 +230,24 @@ class RoomItemSwapImporter:
 
         return list(swaps.values())
 
-    def export_to_json(self, swaps: List[Dict], output_dir: Path) -> List[Path]:
+    def export_to_json(self, swaps: List[Dict], output_dir: Path, export_format: str = EXPORT_NDJSON) -> List[Path]:
         """
-        Export swap operations to individual JSON files for traceability
+        Export swap operations for traceability
+
+        By default all swaps go into one compressed NDJSON file indexed by room SKU
+        (see workflows/payload_export.py); with export_format="files" each swap gets
+        its own JSON file.
 
         Returns:
             List of paths to the exported JSON files
         """
+        if export_format != EXPORT_FILES:
+            with PayloadExport.create(output_dir, "room_item_swap") as export:
+                for swap in swaps:
+                    export.write(swap['room_sku'], swap)
+            console.print(f"[green]Exported {export.count} swap operations to: {export.path}[/green]")
+            return [export.path]
+
         output_dir.mkdir(parents=True, exist_ok=True)
 
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
@@ -256,7 +269,8 @@ class RoomItemSwapImporter:
         self,
         file_path: Path,
         sheet_name: Optional[str] = None,
-        dry_run: bool = True
+        dry_run: bool = True,
+        export_format: str = EXPORT_NDJSON
     ) -> Dict:
         """
         Import room item swaps from spreadsheet
@@ -265,6 +279,7 @@ class RoomItemSwapImporter:
             file_path: Path to spreadsheet file
             sheet_name: Excel sheet name (if applicable)
             dry_run: If True, don't actually execute swaps
+            export_format: "ndjson" (one file per run) or "files" (one file per swap)
 
         Returns:
             Dict with statistics
@@ -280,9 +295,9 @@ class RoomItemSwapImporter:
         # Process spreadsheet
         swaps = self.process_spreadsheet(file_path, sheet_name)
 
-        # Export to JSON - each swap gets its own file for traceability
-        json_dir = file_path.parent / 'json'
-        json_files = self.export_to_json(swaps, json_dir)
+        # Export to JSON for traceability
+        json_dir = export_dir('room_item_swap')
+        json_files = self.export_to_json(swaps, json_dir, export_format)
 
         # Validate all swaps
         console.print("\n[bold]Validating swap operations...[/bold]")
@@ -13,25 +13,23 @@ import pandas as pd
 import click
 import os
 import shutil
-import re
 from rich.console import Console
-from rich.progress import Progress
-from rich.table import Table
 from rich.prompt import Confirm
 from pathlib import Path
 import sys
-import json
-from typing import Dict, Optional
+from typing import Optional, Tuple
 from dotenv import load_dotenv
 
 from ecatalog_client import (
     ECatalogAPIClient,
-    ItemNew,
     ItemDivisions,
     ItemDivision,
-    ItemAttributes,
     OAuthConfig,
 )
+from workflows.columnar import map_unique, text_column
+from workflows.data_corrections import corrections_for
+from workflows.import_engine import SITE_BRANDS, SpreadsheetImporter
+from workflows.payload_export import EXPORT_FORMATS, EXPORT_NDJSON
 
 console = Console()
 
@@ -43,6 +41,8 @@ def correct_common_data_errors(text: str, field_type: str = None) -> str:
     """
     Correct common data errors found in spreadsheets
 
+    The rules are the "rtg_delivered" rule set in workflows/data_corrections.json.
+
     Args:
         text: Input text to correct
         field_type: Type of field ('category', 'decor', etc.) for specific corrections
@@ -50,680 +50,161 @@ def correct_common_data_errors(text: str, field_type: str = None) -> str:
     Returns:
         Corrected text
     """
-    if not text or not isinstance(text, str):
-        return text
-
-    corrected = text
-
-    # Category-specific corrections
-    if field_type == "category":
-        # Fix "Livingroom" -> "Living Room"
-        corrected = corrected.replace("Livingroom", "Living Room")
-        corrected = corrected.replace("Accessoreis", "Accessories")
-        corrected = corrected.replace("Décor", "Decor")
-        corrected = corrected.replace("Wall Dcor", "Wall Decor")
-        corrected = corrected.replace(
-            "Livingroom : Cocktail Tables", "Living Room : Cocktail Tables"
-        )
-        corrected = corrected.replace("Cocktail Tables", "Cocktail Table")
-
-    # Decor attribute corrections
-    elif field_type == "decor":
-        # Fix "Mid Century Modern" -> "Mid-Century Modern"
-        corrected = corrected.replace("Mid Century Modern", "Mid-Century Modern")
-
-        # Fix "Mid Century" (standalone) -> "Mid-Century Modern"
-        if corrected == "Mid Century" or corrected == "MID CENTURY":
-            corrected = "Mid-Century Modern"
-
-    elif field_type == "size":
-        corrected = corrected.replace('48"+ Extra Large', '48" + Extra Large')
-        corrected = corrected.replace("48' + Extra Large", '48" + Extra Large')
-        corrected = corrected.replace('36"-48" Large', '36" - 48" Large')
-
-        corrected = corrected.replace('24"-36" Medium', '24" - 36" Medium')
-        corrected = corrected.replace("24' - 36\" Medium", '24" - 36" Medium')
-
-        if corrected == "Extra Large":
-            corrected = '48" + Extra Large'
-        if corrected == "Large":
-            corrected = '36" - 48" Large'
-        if corrected == "Medium":
-            corrected = '24" - 36" Medium'
-        if corrected == "Small":
-            corrected = 'Under 24" Small'
-
-    # Add more corrections here as needed
-    # corrected = corrected.replace("OtherWrongTerm", "CorrectTerm")
-
-    return corrected
-
-
-def smart_title_case(text: str) -> str:
-    """
-    Apply title case with special handling for roman numerals and acronyms
+    return corrections_for("rtg_delivered").correct(text, field_type)
 
-    Args:
-        text: Input text to convert
 
-    Returns:
-        Text with proper title casing
-    """
-    if not text or not isinstance(text, str):
-        return text
-
-    # Roman numerals (common ones used in furniture/collections)
-    roman_numerals = {
-        "I",
-        "II",
-        "III",
-        "IV",
-        "V",
-        "VI",
-        "VII",
-        "VIII",
-        "IX",
-        "X",
-        "XI",
-        "XII",
-        "XIII",
-        "XIV",
-        "XV",
-        "XVI",
-        "XVII",
-        "XVIII",
-        "XIX",
-        "XX",
-    }
+class RtgDeliveredItemImporter(SpreadsheetImporter):
+    """Importer for RTG delivered product spreadsheets"""
 
-    # Sports and other acronyms that should stay uppercase
-    acronyms = {
-        "NFL",
-        "MLB",
-        "NBA",
-        "NHL",
-        "NCAA",
-        "MLS",
-        "UFC",
-        "WWE",
-        "ESPN",
-        "USA",
-        "US",
-        "UK",
-        "EU",
-        "LED",
-        "USB",
-        "WIFI",
-        "GPS",
-        "DVD",
-        "CD",
-        "TV",
-        "HD",
-        "LCD",
-        "OLED",
-        "AC",
-        "DC",
-        "AM",
-        "PM",
-        "CEO",
-        "CFO",
-        "DIY",
-        "FAQ",
-        "PDF",
-        "HTML",
-        "CSS",
-        "JS",
-        "API",
-        "URL",
-        "SEO",
-        "RTG",
-        "OTG",
-        "KTG",  # Site codes
+    DIVISIONS = ("FL", "SE", "TX")
+
+    # Direct mapping from spreadsheet to API attributes
+    ATTRIBUTE_MAPPING = {
+        "Color": "Color",
+        "Decor": "Décor",  # Note the accent
+        "Finish": "Finish",
+        "Features": "Features",
+        "Material": "Material",
+        "Movement": "Movement",
+        "PieceCount": "Piece Count",
+        "Shape": "Shape",
+        "Size": "Size",
+        "Style": "Style",
+        "Theme": "Theme",
     }
 
-    # Words that should be lowercase (articles, prepositions, conjunctions)
-    lowercase_words = {
-        "a",
-        "an",
-        "and",
-        "as",
-        "at",
-        "but",
-        "by",
-        "for",
-        "if",
-        "in",
-        "nor",
-        "of",
-        "on",
-        "or",
-        "so",
-        "the",
-        "to",
-        "up",
-        "yet",
-        "with",
-        "from",
+    # Field mapping from spreadsheet columns to API fields
+    FIELD_MAPPING = {
+        "Sku": "New SKU",
+        "Site": "Site",
+        "Collection": "Collection",
+        "Category": "Ecat Category",
+        "PDMDescription": "Description",
+        "Title": "Title",
+        "AdvertisingCopy": "Advertising Copy",
+        "Image": "Ecat Image Name",
+        "AdditionalNotes": "Additional Notes",
+        "Dimensions": "Out Of Box Dim",
+        "GenericName": "Generic Name",
+        "DeliveryType": "Delivery Type",
+        "ShippingCode": "Shipping Code",
+        "Brand": "Specialty Brand",
+        "DeliverySubType": "Vendor Delivery Code",
     }
 
-    # Split text into words, preserving spaces and punctuation
-    words = re.findall(r"\S+|\s+", text.strip())
-
-    result = []
-    for i, word in enumerate(words):
-        if word.isspace():
-            result.append(word)
-            continue
-
-        # Clean word for checking (remove punctuation for comparison)
-        clean_word = re.sub(r"[^\w]", "", word).upper()
-
-        # First word is always capitalized
-        if i == 0 or (
-            i > 0 and words[i - 1].isspace() and any(c in words[i - 1] for c in ".!?")
-        ):
-            if clean_word in roman_numerals:
-                # Replace the roman numeral part with correct case
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word in acronyms:
-                # Replace the acronym part with uppercase
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            else:
-                result.append(word.capitalize())
-        else:
-            # Check for special cases
-            if clean_word in roman_numerals:
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word in acronyms:
-                result.append(
-                    re.sub(r"[a-zA-Z]+", clean_word, word, flags=re.IGNORECASE)
-                )
-            elif clean_word.lower() in lowercase_words:
-                result.append(word.lower())
-            else:
-                result.append(word.capitalize())
-
-    return "".join(result)
-
-
-class RtgDeliveredItemImporter:
-    """Importer for RTG delivered product spreadsheets"""
+    CRITICAL_FIELDS = [
+        "Sku",
+        "Site",
+        "Collection",
+        "PDMDescription",
+        "Title",
+        "GenericName",
+        "DeliveryType",
+    ]
+
+    # Use Category or Top Category when Ecat Category is blank
+    FALLBACK_COLUMNS = {"Category": ("Category", "Top Category")}
+
+    BLANK_TEXT_FIELDS = ("DeliverySubType",)
+    TITLE_CASE_FIELDS = ("Collection",)
+    BOOLEAN_FIELDS = {"SingleItemRoom": "Single Item Room"}
+    HOUSE_BRANDS = SITE_BRANDS
+    CORRECTIONS = "rtg_delivered"
+    RESOLVE_CATEGORIES = True
+
+    # Only rows some division is to be built in are imported
+    FILTER_COLUMNS = tuple(f"{division} Ecat Status" for division in DIVISIONS)
+    FILTER_LABEL = "'Build in' status"
+
+    # Read with pandas' type inference; every other column is read as text
+    TYPED_COLUMNS = ("Single Item Room",)
+
+    # Directory under data/ for this importer's checkpoints and payload hashes
+    WORKFLOW = "rtg_delivered"
+
+    PREVIEW_TITLE = "Data Mapping Preview - RTG Delivered Items"
+    PREVIEW_MAPPINGS = [
+        ("Sku", "New SKU"),
+        ("Site", "Site"),
+        ("Category", "Ecat Category"),
+        ("Title", "Title"),
+        ("Region/Divisions", "Region"),
+        ("GenericName", "Generic Name"),
+        ("DeliveryType", "Delivery Type"),
+    ]
+
+    def build_in_flags(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Per-division flags for rows whose Ecat Status says "Build in <division>"
 
-    def __init__(self, api_client: ECatalogAPIClient):
-        self.client = api_client
-        self.console = console
+        Returns a boolean frame with one column per division (FL, SE, TX).
+        """
+        return pd.DataFrame(
+            {
+                division: text_column(df, f"{division} Ecat Status")
+                .fillna("")
+                .str.contains(f"Build in {division}", regex=False)
+                .astype(bool)
+                for division in self.DIVISIONS
+            },
+            index=df.index,
+        )
 
-    def should_import_row(self, row: pd.Series) -> bool:
+    def build_in_mask(self, df: pd.DataFrame) -> pd.Series:
         """
-        Check if row should be imported based on Ecat Status fields.
+        Rows that should be imported based on Ecat Status fields.
         Only import rows where at least one division has "Build in" status.
         """
-        fl_status = str(row.get("FL Ecat Status", "")).strip() if pd.notna(row.get("FL Ecat Status")) else ""
-        se_status = str(row.get("SE Ecat Status", "")).strip() if pd.notna(row.get("SE Ecat Status")) else ""
-        tx_status = str(row.get("TX Ecat Status", "")).strip() if pd.notna(row.get("TX Ecat Status")) else ""
-
-        # Check if any division has "Build in" status
-        has_build_in = (
-            "Build in FL" in fl_status or
-            "Build in SE" in se_status or
-            "Build in TX" in tx_status
-        )
+        return self.build_in_flags(df).any(axis=1)
 
-        return has_build_in
+    row_filter = build_in_mask
 
-    def parse_divisions_from_ecat_status(self, row: pd.Series) -> ItemDivisions:
+    def divisions_for_flags(self, flags: Tuple[bool, bool, bool]) -> ItemDivisions:
         """
-        Parse division data from Ecat Status columns.
+        Build divisions from (FL, SE, TX) "Build in" flags.
         Only set division to Active=False if that division has "Build in" status.
         """
-        divisions = {"FL": None, "SE": None, "TX": None}
-
-        # Check FL Ecat Status
-        fl_status = str(row.get("FL Ecat Status", "")).strip() if pd.notna(row.get("FL Ecat Status")) else ""
-        if "Build in FL" in fl_status:
-            divisions["FL"] = ItemDivision(Active=False)
-
-        # Check SE Ecat Status
-        se_status = str(row.get("SE Ecat Status", "")).strip() if pd.notna(row.get("SE Ecat Status")) else ""
-        if "Build in SE" in se_status:
-            divisions["SE"] = ItemDivision(Active=False)
-
-        # Check TX Ecat Status
-        tx_status = str(row.get("TX Ecat Status", "")).strip() if pd.notna(row.get("TX Ecat Status")) else ""
-        if "Build in TX" in tx_status:
-            divisions["TX"] = ItemDivision(Active=False)
-
-        return ItemDivisions(**divisions)
-
-    def parse_attributes_from_row(self, row: pd.Series) -> Optional[ItemAttributes]:
-        """Parse item attributes from spreadsheet columns"""
-        attributes = {}
-
-        # Direct mapping from spreadsheet to API attributes
-        attribute_mapping = {
-            "Color": "Color",
-            "Decor": "Décor",  # Note the accent
-            "Finish": "Finish",
-            "Features": "Features",
-            "Material": "Material",
-            "Movement": "Movement",
-            "PieceCount": "Piece Count",
-            "Shape": "Shape",
-            "Size": "Size",
-            "Style": "Style",
-            "Theme": "Theme",
-        }
-
-        for api_field, spreadsheet_col in attribute_mapping.items():
-            if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                value = str(row[spreadsheet_col]).strip()
-                if value:
-                    # Apply common data corrections for specific attributes
-                    if api_field == "Decor":
-                        value = correct_common_data_errors(value, "decor")
-                    elif api_field == "Size":
-                        value = correct_common_data_errors(value, "size")
-
-                    # Handle comma-separated values
-                    corrected_values = []
-                    for v in value.split(","):
-                        v_clean = v.strip()
-                        if v_clean:
-                            # Apply corrections to each value in comma-separated list
-                            if api_field == "Decor":
-                                v_clean = correct_common_data_errors(v_clean, "decor")
-                            elif api_field == "Size":
-                                v_clean = correct_common_data_errors(v_clean, "size")
-                            corrected_values.append(v_clean)
-
-                    if corrected_values:
-                        attributes[api_field] = corrected_values
-
-        return ItemAttributes(**attributes) if attributes else None
-
-    def row_to_item(self, row: pd.Series) -> Optional[ItemNew]:
-        """Convert a spreadsheet row to an ItemNew object"""
-        try:
-            # Field mapping from spreadsheet columns to API fields
-            field_mapping = {
-                "Sku": "New SKU",
-                "Site": "Site",
-                "Collection": "Collection",
-                "Category": "Ecat Category",
-                "PDMDescription": "Description",
-                "Title": "Title",
-                "AdvertisingCopy": "Advertising Copy",
-                "Image": "Ecat Image Name",
-                "AdditionalNotes": "Additional Notes",
-                "Dimensions": "Out Of Box Dim",
-                "GenericName": "Generic Name",
-                "DeliveryType": "Delivery Type",
-                "ShippingCode": "Shipping Code",
+        return ItemDivisions(
+            **{
+                division: ItemDivision(Active=False) if build_in else None
+                for division, build_in in zip(self.DIVISIONS, flags)
             }
+        )
 
-            # Optional fields with defaults
-            optional_mapping = {
-                "Brand": ("Specialty Brand", ""),
-            }
-
-            # Extract required fields
-            item_data = {}
-            missing_fields = []
-
-            for api_field, spreadsheet_col in field_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        # Apply smart title case to Collection field
-                        if api_field == "Collection":
-                            value = smart_title_case(value)
-                        item_data[api_field] = value
-                    else:
-                        # Allow empty Dimensions - it's optional
-                        if api_field not in ["Dimensions", "AdditionalNotes", "Image"]:
-                            missing_fields.append(f"{api_field} ({spreadsheet_col})")
-                else:
-                    # Allow empty Dimensions - it's optional
-                    if api_field not in ["Dimensions", "AdditionalNotes", "Image"]:
-                        missing_fields.append(f"{api_field} ({spreadsheet_col})")
-
-            # Handle optional fields with defaults
-            for api_field, (spreadsheet_col, default_value) in optional_mapping.items():
-                if spreadsheet_col in row.index and pd.notna(row[spreadsheet_col]):
-                    value = str(row[spreadsheet_col]).strip()
-                    if value:
-                        # Apply smart title case to Collection field
-                        if api_field == "Collection":
-                            value = smart_title_case(value)
-                        item_data[api_field] = value
-                    else:
-                        item_data[api_field] = default_value
-                else:
-                    item_data[api_field] = default_value
-
-            # Special handling for Brand field based on Site
-            if not item_data.get("Brand") or item_data["Brand"] == "":
-                site = item_data.get("Site", "").upper()
-                if site in ("RTG", "KTG"):
-                    item_data["Brand"] = "Rooms To Go"
-                elif site == "OTG":
-                    item_data["Brand"] = "Rooms To Go Outdoor"
-
-            # Check for critical missing fields
-            critical_fields = [
-                "Sku",
-                "Site",
-                "Collection",
-                "PDMDescription",
-                "Title",
-                "GenericName",
-                "DeliveryType",
-            ]
-            critical_missing = [
-                field
-                for field in critical_fields
-                if field not in item_data or not item_data[field]
-            ]
-
-            if critical_missing:
-                console.print(
-                    f"[red]Missing critical fields for SKU {row.get('New SKU', 'Unknown')}: {critical_missing}[/red]"
-                )
-                console.print(f"[dim]Available columns: {', '.join(row.index.tolist())}[/dim]")
-                return None
-
-            # Use Category or Ecat Category for Category field
-            if "Category" not in item_data or not item_data["Category"]:
-                for cat_col in ["Ecat Category", "Category", "Top Category"]:
-                    if cat_col in row.index and pd.notna(row[cat_col]):
-                        value = str(row[cat_col]).strip()
-                        if value:
-                            item_data["Category"] = value
-                            break
-                else:
-                    console.print(
-                        f"[red]Missing Category for SKU {row.get('New SKU', 'Unknown')}[/red]"
-                    )
-                    return None
-
-            # Apply common data corrections to category
-            if "Category" in item_data and item_data["Category"]:
-                category = item_data["Category"]
-                category = correct_common_data_errors(category, "category")
-                item_data["Category"] = category
-
-                # Category must have at least 2 parts (category : subcategory)
-                if " : " not in category:
-                    console.print(
-                        f"[red]Invalid category format for SKU {row.get('New SKU', 'Unknown')}: '{category}' - must have at least 'Category : Subcategory' format[/red]"
-                    )
-                    return None
-
-                # If category has exactly 2 parts, add catalog prefix based on site
-                if category.count(" : ") == 1:
-                    site = item_data.get("Site", "").upper()
-                    catalog_prefix = ""
-                    if site == "RTG":
-                        catalog_prefix = "Adult"
-                    elif site == "KTG":
-                        catalog_prefix = "Kids"
-                    elif site == "OTG":
-                        catalog_prefix = "Outdoor"
-
-                    if catalog_prefix:
-                        item_data["Category"] = f"{catalog_prefix} : {category}"
-                # If already has 2+ colons (3+ parts), leave as is
-
-            # Handle optional boolean field - default to False if blank
-            if "Single Item Room" in row.index and pd.notna(row["Single Item Room"]):
-                item_data["SingleItemRoom"] = bool(row["Single Item Room"])
-            else:
-                item_data["SingleItemRoom"] = False
-
-            # Handle Vendor Delivery Code -> DeliverySubType
-            if "Vendor Delivery Code" in row.index and pd.notna(
-                row["Vendor Delivery Code"]
-            ):
-                item_data["DeliverySubType"] = str(row["Vendor Delivery Code"]).strip()
-
-            # Parse divisions from Ecat Status columns
-            item_data["Divisions"] = self.parse_divisions_from_ecat_status(row)
-
-            # Parse attributes
-            attributes = self.parse_attributes_from_row(row)
-            if attributes:
-                item_data["Attributes"] = attributes
-
-            return ItemNew(**item_data)
-
-        except Exception as e:
-            console.print(
-                f"[red]Error creating item from row {row.get('New SKU', 'Unknown')}: {e}[/red]"
-            )
-            return None
-
-    def preview_data_mapping(
-        self, file_path: Path, sheet_name: Optional[str] = None
-    ) -> None:
-        """Preview how the spreadsheet data will be mapped"""
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                if sheet_name is None:
-                    sheet_name = 0
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return
-
-            console.print(f"[bold]Data Mapping Preview - RTG Delivered Items[/bold]")
-            console.print(f"Total rows: {len(df)}")
-
-            # Show first few rows mapping
-            for i in range(min(3, len(df))):
-                row = df.iloc[i]
-                console.print(
-                    f"\n[cyan]Row {i + 1} - SKU: {row.get('New SKU', 'N/A')}[/cyan]"
-                )
-
-                table = Table()
-                table.add_column("API Field", style="yellow")
-                table.add_column("Spreadsheet Column", style="cyan")
-                table.add_column("Value", style="white")
-
-                # Show key mappings
-                key_mappings = [
-                    ("Sku", "New SKU"),
-                    ("Site", "Site"),
-                    ("Category", "Ecat Category"),
-                    ("Title", "Title"),
-                    ("Region/Divisions", "Region"),
-                    ("GenericName", "Generic Name"),
-                    ("DeliveryType", "Delivery Type"),
-                ]
-
-                for api_field, spreadsheet_col in key_mappings:
-                    value = row.get(spreadsheet_col, "N/A")
-                    if pd.notna(value):
-                        value = (
-                            str(value)[:50] + "..."
-                            if len(str(value)) > 50
-                            else str(value)
-                        )
-                    else:
-                        value = "N/A"
-                    table.add_row(api_field, spreadsheet_col, value)
+    def divisions(self, df: pd.DataFrame) -> pd.Series:
+        """Divisions from the Ecat Status columns (at most 8 distinct combinations)"""
+        flags = pd.Series(
+            list(self.build_in_flags(df).itertuples(index=False, name=None)),
+            index=df.index,
+            dtype=object,
+        )
+        return map_unique(flags, self.divisions_for_flags)
 
-                console.print(table)
+    def normalize_category(self, category: str, site: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Correct a spreadsheet category and add the catalog prefix for 2-part categories
 
-        except Exception as e:
-            console.print(f"[red]Error previewing data: {e}[/red]")
-
-    def import_from_spreadsheet(
-        self,
-        file_path: Path,
-        sheet_name: Optional[str] = None,
-        dry_run: bool = True,
-        limit: Optional[int] = None,
-        export_json: bool = False,
-    ) -> Dict[str, int]:
-        """Import items from the RTG delivered spreadsheet"""
-
-        if not file_path.exists():
-            console.print(f"[red]File not found: {file_path}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
+        Returns:
+            (category, None) on success, or (None, message) where message is console
+            markup containing a ``{sku}`` placeholder
+        """
+        # Apply common data corrections to category
+        category = correct_common_data_errors(category, "category")
 
-        try:
-            if file_path.suffix.lower() in [".xlsx", ".xls"]:
-                if sheet_name is None:
-                    sheet_name = 0
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-            elif file_path.suffix.lower() == ".csv":
-                df = pd.read_csv(file_path)
-            else:
-                console.print(f"[red]Unsupported file format: {file_path.suffix}[/red]")
-                return {"processed": 0, "created": 0, "failed": 0}
-
-            # Apply limit if specified
-            if limit and limit > 0:
-                df = df.head(limit)
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name} (limited to first {limit})[/bold]"
-                )
-            else:
-                console.print(
-                    f"[bold]Loaded {len(df)} rows from {file_path.name}[/bold]"
-                )
-
-            # Filter rows based on "Build in" status
-            total_rows = len(df)
-            filtered_df = df[df.apply(self.should_import_row, axis=1)]
-            filtered_count = len(filtered_df)
-            skipped_count = total_rows - filtered_count
-
-            console.print(
-                f"[blue]Filtered: {filtered_count} rows with 'Build in' status, {skipped_count} rows skipped[/blue]"
+        # Category must have at least 2 parts (category : subcategory)
+        if " : " not in category:
+            return None, (
+                f"[red]Invalid category format for SKU {{sku}}: '{category}' - must have at least 'Category : Subcategory' format[/red]"
             )
 
-            if filtered_count == 0:
-                console.print("[yellow]No rows found with 'Build in' status to import[/yellow]")
-                return {"processed": 0, "created": 0, "failed": 0}
-
-            df = filtered_df
-            stats = {"processed": 0, "created": 0, "failed": 0, "skipped": skipped_count}
-
-            # Create JSON output directory if needed
-            json_output_dir = None
-            if export_json:
-                json_output_dir = Path(
-                    "/Users/maust/Documents/CURSOR/prboardcli/data/rtg_delivered/json"
-                )
-                json_output_dir.mkdir(parents=True, exist_ok=True)
-                console.print(
-                    f"[blue]JSON payloads will be exported to: {json_output_dir}[/blue]"
-                )
-
-            if dry_run:
-                console.print(
-                    "[yellow]DRY RUN MODE - No items will be created[/yellow]"
-                )
-
-            with Progress() as progress:
-                task = progress.add_task("Processing items...", total=len(df))
-
-                for _, row in df.iterrows():
-                    stats["processed"] += 1
-
-                    # Convert row to ItemNew object
-                    item = self.row_to_item(row)
-                    if not item:
-                        stats["failed"] += 1
-                        progress.update(task, advance=1)
-                        continue
-
-                    # Export JSON payload if requested
-                    if export_json and json_output_dir:
-                        try:
-                            item_payload = item.model_dump(
-                                by_alias=True, exclude_none=True
-                            )
-                            json_filename = f"{item.Sku}.json"
-                            json_filepath = json_output_dir / json_filename
-
-                            with open(json_filepath, "w") as f:
-                                json.dump(item_payload, f, indent=2)
-
-                            console.print(f"[dim]Exported JSON: {json_filename}[/dim]")
-                        except Exception as e:
-                            console.print(
-                                f"[yellow]Warning: Failed to export JSON for {item.Sku}: {e}[/yellow]"
-                            )
-
-                    if dry_run:
-                        console.print(
-                            f"[cyan]Would create item:[/cyan] {item.Sku} - {item.Title}"
-                        )
-                        console.print(f"  Site: {item.Site}, Category: {item.Category}")
-                        # Show division status
-                        fl_status = (
-                            "null"
-                            if item.Divisions.FL is None
-                            else f"Active={item.Divisions.FL.Active}"
-                        )
-                        se_status = (
-                            "null"
-                            if item.Divisions.SE is None
-                            else f"Active={item.Divisions.SE.Active}"
-                        )
-                        tx_status = (
-                            "null"
-                            if item.Divisions.TX is None
-                            else f"Active={item.Divisions.TX.Active}"
-                        )
-                        console.print(
-                            f"  Divisions: FL={fl_status}, SE={se_status}, TX={tx_status}"
-                        )
-                        stats["created"] += 1
-                    else:
-                        # Actually create the item
-                        try:
-                            result = self.client.create_item(item)
-                            if result:
-                                workrequest_id = result.get("workrequest_id")
-                                if workrequest_id:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title} [dim](Work Request: {workrequest_id})[/dim]"
-                                    )
-                                else:
-                                    console.print(
-                                        f"[green]Created item:[/green] {item.Sku} - {item.Title}"
-                                    )
-                                stats["created"] += 1
-                            else:
-                                console.print(
-                                    f"[red]Failed to create item:[/red] {item.Sku}"
-                                )
-                                stats["failed"] += 1
-                        except Exception as e:
-                            console.print(
-                                f"[red]Error creating item {item.Sku}: {e}[/red]"
-                            )
-                            stats["failed"] += 1
-
-                    progress.update(task, advance=1)
-
-            return stats
+        # If category has exactly 2 parts, add catalog prefix based on site
+        if category.count(" : ") == 1:
+            catalog_prefix = {"RTG": "Adult", "KTG": "Kids", "OTG": "Outdoor"}.get(site, "")
+            if catalog_prefix:
+                return f"{catalog_prefix} : {category}", None
 
-        except Exception as e:
-            console.print(f"[red]Error reading spreadsheet: {e}[/red]")
-            return {"processed": 0, "created": 0, "failed": 0}
+        # If already has 2+ colons (3+ parts), leave as is
+        return category, None
 
 
 def handle_file_archiving(file_path: Path) -> bool:
@@ -783,6 +264,49 @@ def handle_file_archiving(file_path: Path) -> bool:
     is_flag=True,
     help="Export JSON payloads to /data/rtg_delivered/json/ directory",
 )
+@click.option(
+    "--export-format",
+    type=click.Choice(EXPORT_FORMATS),
+    default=EXPORT_NDJSON,
+    show_default=True,
+    help="With --export-json: one compressed NDJSON file per run, indexed by SKU, or a JSON file per item",
+)
+@click.option(
+    "--concurrency",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of items to create in parallel",
+)
+@click.option(
+    "--resume",
+    is_flag=True,
+    help="Skip rows an interrupted earlier run of this file already created",
+)
+@click.option(
+    "--skip-existing",
+    is_flag=True,
+    help="Look up every SKU first and only create the ones eCatalog doesn't have",
+)
+@click.option(
+    "--incremental",
+    is_flag=True,
+    help="Skip rows unchanged since they were last submitted; update changed rows instead of re-creating them",
+)
+@click.option(
+    "--workers",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Processes converting and validating rows (speeds up dry runs of large sheets)",
+)
+@click.option("--quiet", is_flag=True, help="Dry run: print a summary instead of every row, and write the per-row results to a report file")
+@click.option(
+    "--report",
+    "report_file",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Where the dry-run report goes (implies --quiet; default: data/<workflow>/reports/<sheet>-dry-run.json)",
+)
 def main(
     file_path: Optional[Path],
     api_url: str,
@@ -792,6 +316,14 @@ def main(
     execute: bool,
     no_auth: bool,
     export_json: bool,
+    export_format: str,
+    concurrency: int,
+    resume: bool,
+    skip_existing: bool,
+    incremental: bool,
+    workers: int,
+    quiet: bool,
+    report_file: Optional[Path],
 ):
     """Import RTG delivered items from spreadsheet to eCatalog API"""
 
@@ -890,9 +422,22 @@ def main(
         console.print(f"[red]API connection test failed: {e}[/red]")
         sys.exit(1)
 
+    precheck = importer.precheck_skus(file_path, sheet_name) if skip_existing else None
+
     # Import items
     stats = importer.import_from_spreadsheet(
-        file_path, sheet_name, dry_run, export_json=export_json
+        file_path,
+        sheet_name,
+        dry_run,
+        export_json=export_json,
+        export_format=export_format,
+        concurrency=concurrency,
+        resume=resume,
+        precheck=precheck,
+        incremental=incremental,
+        workers=workers,
+        quiet=quiet or report_file is not None,
+        report_file=report_file,
     )
 
     # Display results
@@ -900,12 +445,23 @@ def main(
     console.print(f"Processed: {stats['processed']}")
     console.print(f"{'Would create' if dry_run else 'Created'}: {stats['created']}")
     console.print(f"Failed: {stats['failed']}")
-
-    if dry_run and stats["created"] > 0:
+    if stats.get("resumed"):
+        console.print(f"Already created (resumed): {stats['resumed']}")
+    if precheck is not None:
+        console.print(f"Already in eCatalog: {stats['exists']}")
+        console.print(f"Exists on another site: {stats['site_conflicts']}")
+    if incremental:
+        console.print(f"{'Would update' if dry_run else 'Updated'}: {stats['updated']}")
+        console.print(f"Unchanged since last import: {stats['unchanged']}")
+        console.print(f"Changes that need a manual edit: {stats['not_updatable']}")
+
+    if dry_run and stats["created"] + stats.get("updated", 0) > 0:
         console.print(
-            f"\n[yellow]Run with --execute to actually create {stats['created']} items[/yellow]"
+            f"\n[yellow]Run with --execute to actually create {stats['created']} items"
+            + (f" and update {stats['updated']}" if stats.get("updated") else "")
+            + "[/yellow]"
         )
-    elif not dry_run and stats["created"] > 0:
+    elif not dry_run and stats["created"] + stats.get("updated", 0) > 0:
         archive_success = handle_file_archiving(file_path)
         if not archive_success:
             console.print("[yellow]⚠️ File archiving failed, but import completed successfully[/yellow]")
@@ -20,6 +20,7 @@ from rich.console import Console
 from rich.progress import Progress
 
 from ecatalog_client import ECatalogAPIClient, SkuSubstitutionRequest
+from workflows.payload_export import export_dir
 
 console = Console()
 
@@ -294,8 +295,7 @@ class SkuSubstitutionImporter:
     def _export_json(self, sub_request: SkuSubstitutionRequest, key: str, source_file: Path):
         """Export substitution request to JSON file"""
         try:
-            project_root = Path(__file__).parent.parent
-            json_dir = project_root / "data" / "sku_substitution" / "json"
+            json_dir = export_dir("sku_substitution")
             json_dir.mkdir(parents=True, exist_ok=True)
 
             # Use key as filename
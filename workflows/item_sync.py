@@ -0,0 +1,257 @@
+"""
+Sync: bring live items in line with a spreadsheet
+
+Copy and dimension corrections used to be made one SKU at a time with
+``cli.py item update``, or by re-creating the items. ItemSync reads a sheet through
+one of the importers (so the same column mapping and corrections apply), fetches
+the live item for every row with get_item, and compares the two field by field.
+Only the fields that differ are sent, as one PATCH /item/{sku} per changed item.
+
+Fetches and PATCHes run on thread pools (submit_ordered), chained so items are
+updated while later rows are still being fetched; results come back in sheet order.
+Differences in fields a PATCH can't carry (Category, Attributes, ...) are reported,
+not sent. Blank cells never clear a live value.
+"""
+
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import requests
+from rich.console import Console
+from rich.progress import Progress
+
+from ecatalog_client import ECatalogAPIClient, Item, ItemNew, ItemPartialUpdate
+from workflows.concurrent_submit import submit_ordered
+from workflows.sheet_reader import estimate_rows
+
+console = Console()
+
+# get_item calls in flight
+DEFAULT_FETCH_CONCURRENCY = 16
+
+# Item fields whose sheet value comes from a differently named ItemNew field
+SOURCE_FIELDS = {"RTGAlias": "PDMDescription"}
+
+# Fields a PATCH can change
+PATCH_FIELDS = tuple(ItemPartialUpdate.model_fields)
+
+# Fields compared but only reported - a PATCH can't carry them
+REPORT_ONLY_FIELDS = ("Site", "Category", "Collection", "Brand", "Attributes")
+
+REPORT_COLUMNS = ["sku", "field", "current", "sheet", "action"]
+
+
+def _comparable(value: Any) -> Any:
+    """A field value in a form that compares equal when the catalog would consider it equal"""
+    if value is None:
+        return ""
+    if hasattr(value, "model_dump"):
+        # Attribute lists are sets as far as the catalog is concerned
+        return {
+            key: sorted(values) if isinstance(values, list) else values
+            for key, values in value.model_dump(exclude_none=True).items()
+            if values
+        }
+    return value
+
+
+def _display(value: Any) -> str:
+    value = _comparable(value)
+    if isinstance(value, dict):
+        return "; ".join(f"{key}: {', '.join(values)}" for key, values in value.items())
+    return str(value)
+
+
+class ItemDiff:
+    """Field-level differences between a live item and its sheet row"""
+
+    def __init__(self, sku: str):
+        self.sku = sku
+        # field -> (current value, sheet value)
+        self.changes: Dict[str, Tuple[Any, Any]] = {}
+        self.report_only: Dict[str, Tuple[Any, Any]] = {}
+
+    @classmethod
+    def compare(cls, current: Item, new: ItemNew) -> "ItemDiff":
+        diff = cls(new.Sku)
+        for field in PATCH_FIELDS + REPORT_ONLY_FIELDS:
+            sheet_value = getattr(new, SOURCE_FIELDS.get(field, field))
+            # A blank cell means "not given", not "clear it"
+            if _comparable(sheet_value) in ("", {}):
+                continue
+            current_value = getattr(current, field)
+            if _comparable(current_value) != _comparable(sheet_value):
+                target = diff.changes if field in PATCH_FIELDS else diff.report_only
+                target[field] = (current_value, sheet_value)
+        return diff
+
+    def __bool__(self) -> bool:
+        return bool(self.changes or self.report_only)
+
+    def update(self) -> Optional[ItemPartialUpdate]:
+        """The PATCH body for the changed fields, None when there are none"""
+        if not self.changes:
+            return None
+        return ItemPartialUpdate(**{field: new for field, (_, new) in self.changes.items()})
+
+    def rows(self) -> List[Dict[str, str]]:
+        """Report rows, one per differing field"""
+        return [
+            {"sku": self.sku, "field": field, "current": _display(old), "sheet": _display(new), "action": action}
+            for fields, action in ((self.changes, "patch"), (self.report_only, "manual"))
+            for field, (old, new) in fields.items()
+        ]
+
+
+class ItemSync:
+    """Diff a spreadsheet against the live catalog and PATCH what differs"""
+
+    def __init__(self, client: ECatalogAPIClient, importer: Any, concurrency: int = DEFAULT_FETCH_CONCURRENCY):
+        """
+        Args:
+            client: API client
+            importer: Importer whose sheet layout the file uses (DropshipItemImporter,
+                RtgDeliveredItemImporter or ReskuItemImporter)
+            concurrency: get_item and update_item calls in flight, each
+        """
+        self.client = client
+        self.importer = importer
+        self.concurrency = concurrency
+
+    def fetch(self, item: ItemNew) -> Optional[Item]:
+        """The live item for a row, None if eCatalog doesn't have the SKU"""
+        try:
+            return self.client.get_item(item.Sku)
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    def run(
+        self,
+        file_path: Path,
+        sheet_name: Optional[str] = None,
+        dry_run: bool = True,
+        report_path: Optional[Path] = None,
+        limit: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Sync the items of a sheet
+
+        Args:
+            file_path: Spreadsheet in the importer's layout
+            sheet_name: Sheet to read, if any
+            dry_run: Only report the differences
+            report_path: Write every differing field to this CSV file
+            limit: Only the first N rows
+
+        Returns:
+            Stats: processed, skipped (rows the importer's row filter drops), failed
+            (rows that didn't convert), missing (not in eCatalog), errors (fetch
+            failures), in_sync, patched (or would be), manual (items whose only
+            differences can't be patched), patch_failed, and workrequest_ids
+        """
+        stats = {
+            "processed": 0,
+            "skipped": 0,
+            "failed": 0,
+            "missing": 0,
+            "errors": 0,
+            "in_sync": 0,
+            "patched": 0,
+            "manual": 0,
+            "patch_failed": 0,
+            "workrequest_ids": [],
+        }
+        report = open(report_path, "w", newline="", encoding="utf-8") if report_path else None
+        writer = csv.DictWriter(report, fieldnames=REPORT_COLUMNS) if report else None
+        if writer:
+            writer.writeheader()
+
+        try:
+            reader = self.importer.open_sheet(file_path, sheet_name, limit)
+            total_rows = estimate_rows(file_path, sheet_name)
+            if limit and limit > 0:
+                total_rows = min(total_rows, limit) if total_rows is not None else limit
+
+            with Progress() as progress:
+                task = progress.add_task("Comparing items...", total=total_rows)
+
+                def skipped(count: int) -> None:
+                    stats["skipped"] += count
+                    progress.update(task, advance=count)
+
+                def rows() -> Iterator[ItemNew]:
+                    # Rows the importer wouldn't import (e.g. no "Build in" status) aren't synced either
+                    for item, _ in self.importer.items_from_batches(self.importer.filter_batches(reader, skipped)):
+                        stats["processed"] += 1
+                        if not item:
+                            stats["failed"] += 1
+                            progress.update(task, advance=1)
+                            continue
+                        yield item
+
+                def diffs() -> Iterator[ItemDiff]:
+                    for item, current, error in submit_ordered(self.fetch, rows(), self.concurrency):
+                        if error:
+                            console.print(f"[red]Error fetching {item.Sku}: {error}[/red]")
+                            stats["errors"] += 1
+                        elif current is None:
+                            console.print(f"[dim]Not in eCatalog: {item.Sku}[/dim]")
+                            stats["missing"] += 1
+                        else:
+                            diff = ItemDiff.compare(current, item)
+                            if writer:
+                                writer.writerows(diff.rows())
+                            if not diff:
+                                stats["in_sync"] += 1
+                            else:
+                                self._print_diff(diff)
+                                if diff.changes:
+                                    # Progress advances once the PATCH is done (or skipped)
+                                    yield diff
+                                    continue
+                                stats["manual"] += 1
+                        progress.update(task, advance=1)
+
+                if dry_run:
+                    for _ in diffs():
+                        stats["patched"] += 1
+                        progress.update(task, advance=1)
+                else:
+                    def patch(diff: ItemDiff) -> Optional[Dict]:
+                        return self.client.update_item(diff.sku, diff.update())
+
+                    for diff, result, error in submit_ordered(patch, diffs(), self.concurrency):
+                        if error or not result:
+                            console.print(f"[red]Failed to update {diff.sku}: {error or 'empty response'}[/red]")
+                            stats["patch_failed"] += 1
+                        else:
+                            workrequest_id = result.get("workrequest_id")
+                            if workrequest_id:
+                                stats["workrequest_ids"].append(workrequest_id)
+                            console.print(
+                                f"[green]Updated {diff.sku}[/green]"
+                                + (f" [dim](Work Request: {workrequest_id})[/dim]" if workrequest_id else "")
+                            )
+                            stats["patched"] += 1
+                        progress.update(task, advance=1)
+
+                progress.update(task, total=stats["processed"] + stats["skipped"])
+
+            console.print(f"[dim]{reader.summary()}[/dim]")
+            return stats
+
+        finally:
+            if report:
+                report.close()
+
+    def _print_diff(self, diff: ItemDiff) -> None:
+        console.print(f"[bold]{diff.sku}[/bold]")
+        for field, (old, new) in diff.changes.items():
+            console.print(f"  [cyan]{field}[/cyan]: [red]{_display(old)}[/red] → [green]{_display(new)}[/green]")
+        for field, (old, new) in diff.report_only.items():
+            console.print(
+                f"  [yellow]{field}[/yellow]: {_display(old)} → {_display(new)} [dim](can't be patched - edit in eCatalog)[/dim]"
+            )
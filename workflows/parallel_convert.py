@@ -0,0 +1,134 @@
+"""
+Row conversion on a process pool
+
+Converting rows to items (column cleaning, corrections, category checks and ItemNew
+validation) is pure Python and runs on one core, which bounds how fast a big dry run
+can go. convert_in_processes() shards the sheet's batches into SHARD_ROWS-row frames
+and converts them on worker processes, each holding its own copy of the importer.
+
+Workers don't print. Everything the importer would have printed while converting a
+row is recorded and sent back with that row, and the results are returned in sheet
+order, so the caller can replay the output and get exactly what a single-process run
+prints, whichever worker finished first. Calls to the importer's report_* methods are
+sent back the same way and made by the caller's importer, so category corrections are
+still reported once per import rather than once per worker, and a quiet dry run's
+report gets every failure.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+from ecatalog_client import ItemNew
+
+# Rows per frame sent to a worker - small enough that a single 5,000-row batch still
+# spreads across the pool
+SHARD_ROWS = 1000
+
+# Shards allowed to queue up behind the running workers, per worker
+WINDOW_PER_WORKER = 2
+
+# Event kind of a console.print call; other events are calls to these importer methods
+PRINT = "print"
+REPLAYED_METHODS = ("report_correction", "report_failure")
+
+Event = Tuple[str, tuple, Dict[str, Any]]
+ConvertedRow = Tuple[Optional[ItemNew], Optional[Dict[str, List[str]]], List[Event]]
+
+
+class EventRecorder:
+    """Stands in for the import engine's console in a worker process"""
+
+    def __init__(self):
+        self.events: List[Event] = []
+
+    def print(self, *objects: Any, **kwargs: Any) -> None:
+        self.events.append((PRINT, objects, kwargs))
+
+    def method(self, name: str):
+        """A stand-in for the importer method `name` that records its calls"""
+        return lambda *args: self.events.append((name, args, {}))
+
+    def take(self) -> List[Event]:
+        """The events recorded since the last call"""
+        events, self.events = self.events, []
+        return events
+
+
+# Per-worker state, set up once by _init_worker
+_importer = None
+_recorder: Optional[EventRecorder] = None
+_check_attributes = False
+
+
+def _init_worker(importer_class: type, check_attributes: bool) -> None:
+    global _importer, _recorder, _check_attributes
+    from workflows import import_engine
+
+    _recorder = EventRecorder()
+    import_engine.console = _recorder
+    # Conversion never calls the API, so the worker's importer has no client
+    _importer = importer_class(None)
+    for name in REPLAYED_METHODS:
+        setattr(_importer, name, _recorder.method(name))
+    _check_attributes = check_attributes
+
+
+def _convert_shard(frame: pd.DataFrame) -> List[ConvertedRow]:
+    # Whatever was recorded before a row was yielded belongs to that row
+    return [
+        (item, invalid, _recorder.take())
+        for item, invalid in _importer.items_from_batches([frame], _check_attributes)
+    ]
+
+
+def _shards(batches: Iterable[pd.DataFrame], shard_rows: int) -> Iterator[pd.DataFrame]:
+    for batch in batches:
+        for start in range(0, len(batch), shard_rows):
+            yield batch.iloc[start:start + shard_rows]
+
+
+def convert_in_processes(
+    importer: Any,
+    batches: Iterable[pd.DataFrame],
+    check_attributes: bool = False,
+    workers: int = 2,
+    shard_rows: int = SHARD_ROWS,
+) -> Iterator[ConvertedRow]:
+    """
+    items_from_batches on a pool of worker processes
+
+    Args:
+        importer: The SpreadsheetImporter; each worker builds its own instance of its class
+        batches: Sheet batches, already filtered; consumed lazily on the calling thread
+        check_attributes: Check attribute values against the vocabulary
+        workers: Worker processes
+        shard_rows: Rows per frame sent to a worker
+
+    Yields:
+        (item, unknown attribute values, recorded events) per row, in sheet order
+    """
+    window = deque()
+    # spawn, as on macOS: the sheet reader's thread is running when the pool starts
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(type(importer), check_attributes),
+    )
+    try:
+        for shard in _shards(batches, shard_rows):
+            window.append(executor.submit(_convert_shard, shard))
+            if len(window) >= workers * WINDOW_PER_WORKER:
+                yield from window.popleft().result()
+
+        while window:
+            yield from window.popleft().result()
+    finally:
+        # Consumer stopped early (error / Ctrl-C): drop the shards not started yet
+        for future in window:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -0,0 +1,198 @@
+"""
+Batched payload export: one compressed NDJSON file per run
+
+With --export-json the importers used to write an indented <SKU>.json per item, and
+the room swap exporter a file per room - tens of thousands of small files on a big
+run, each a separate create, and as many unlinks for ``cli.py clean``.
+
+PayloadExport writes a run's payloads as JSON lines to a single
+<name>_<timestamp>.ndjson.gz instead. Lines are compressed in batches of BATCH_LINES,
+each batch a complete gzip member, so the file is still one ordinary gzip stream
+(``zcat``, ``gzip.open``) while a single payload can be read by decompressing only its
+batch. Where each one is goes in a small index next to it
+(<name>_<timestamp>.ndjson.idx, JSON): the byte offset of every batch, and
+key (SKU, room SKU) -> [batch number, line in batch].
+
+Per-file export (EXPORT_FILES) is still available for tools that expect one file per
+payload. Exports go to data/<workflow>/json under the project, or to
+$PAYLOAD_EXPORT_DIR/<workflow> when that is set; ``cli.py exports`` and ``clean`` look
+in the same place.
+"""
+
+import gzip
+import json
+import os
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+DEFAULT_EXPORT_ROOT = Path(__file__).parent.parent / "data"
+
+# Environment variable pointing at an alternative directory for exported payloads
+EXPORT_DIR_ENV = "PAYLOAD_EXPORT_DIR"
+
+# --export-format values
+EXPORT_NDJSON = "ndjson"
+EXPORT_FILES = "files"
+EXPORT_FORMATS = (EXPORT_NDJSON, EXPORT_FILES)
+
+EXPORT_SUFFIX = ".ndjson.gz"
+INDEX_SUFFIX = ".ndjson.idx"
+
+# Payloads per gzip member - what a lookup decompresses to read one payload
+BATCH_LINES = 500
+
+# Bytes read at a time while decompressing one member
+READ_CHUNK = 64 * 1024
+
+
+def export_dir(workflow: str) -> Path:
+    """$PAYLOAD_EXPORT_DIR/<workflow>, else data/<workflow>/json"""
+    override = os.getenv(EXPORT_DIR_ENV)
+    if override:
+        return Path(override) / workflow
+    return DEFAULT_EXPORT_ROOT / workflow / "json"
+
+
+def index_path(export_path: Path) -> Path:
+    """The index file of an export"""
+    return export_path.with_name(export_path.name[: -len(EXPORT_SUFFIX)] + INDEX_SUFFIX)
+
+
+class PayloadExport:
+    """Writes a run's payloads to one gzip-compressed NDJSON file with an index by key"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        # Byte offset of each gzip member
+        self.members: List[int] = []
+        # key -> [[member, line in member], ...]; a key can occur more than once
+        self.index: Dict[str, List[List[int]]] = {}
+        self._pending: List[bytes] = []
+        self._pending_keys: List[str] = []
+        self._file = open(path, "wb")
+
+    @classmethod
+    def create(cls, directory: Path, name: str) -> "PayloadExport":
+        """A new export in directory, named <name>_<timestamp>.ndjson.gz"""
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        path = directory / f"{stem}{EXPORT_SUFFIX}"
+        # Two runs in the same second (a dry run and the live run) don't overwrite each other
+        attempt = 1
+        while path.exists():
+            attempt += 1
+            path = directory / f"{stem}_{attempt}{EXPORT_SUFFIX}"
+        return cls(path)
+
+    def write(self, key: str, payload: Dict[str, Any]) -> None:
+        self._pending.append(json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8") + b"\n")
+        self._pending_keys.append(str(key))
+        self.count += 1
+        if len(self._pending) >= BATCH_LINES:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        member = len(self.members)
+        self.members.append(self._file.tell())
+        for line, key in enumerate(self._pending_keys):
+            self.index.setdefault(key, []).append([member, line])
+        # mtime=0: identical payloads compress to identical bytes
+        self._file.write(gzip.compress(b"".join(self._pending), mtime=0))
+        self._pending = []
+        self._pending_keys = []
+
+    def close(self) -> None:
+        """Write the last batch and the index"""
+        if self._file.closed:
+            return
+        self._flush()
+        self._file.close()
+        with open(index_path(self.path), "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "file": self.path.name,
+                    "created": datetime.now().isoformat(timespec="seconds"),
+                    "count": self.count,
+                    "members": self.members,
+                    "keys": self.index,
+                },
+                f,
+                ensure_ascii=False,
+            )
+
+    def __enter__(self) -> "PayloadExport":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class PayloadExportReader:
+    """Reads an export written by PayloadExport"""
+
+    def __init__(self, path: Path):
+        """
+        Args:
+            path: The .ndjson.gz file, or its .ndjson.idx index
+        """
+        path = Path(path)
+        if path.name.endswith(INDEX_SUFFIX):
+            path = path.with_name(path.name[: -len(INDEX_SUFFIX)] + EXPORT_SUFFIX)
+        self.path = path
+        self._index: Optional[Dict[str, Any]] = None
+
+    @property
+    def index(self) -> Dict[str, Any]:
+        if self._index is None:
+            with open(index_path(self.path), encoding="utf-8") as f:
+                self._index = json.load(f)
+        return self._index
+
+    def __len__(self) -> int:
+        return self.index["count"]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index["keys"]
+
+    def keys(self) -> List[str]:
+        return list(self.index["keys"])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Every payload, in the order written"""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                yield json.loads(line)
+
+    def _member_lines(self, offset: int) -> List[bytes]:
+        decompressor = zlib.decompressobj(wbits=31)
+        data = []
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            while not decompressor.eof:
+                chunk = f.read(READ_CHUNK)
+                if not chunk:
+                    break
+                data.append(decompressor.decompress(chunk))
+        return b"".join(data).splitlines()
+
+    def get(self, key: str) -> List[Dict[str, Any]]:
+        """The payloads exported under key, reading only the batches they are in"""
+        payloads = []
+        members: Dict[int, List[bytes]] = {}
+        for member, line in self.index["keys"].get(key, []):
+            if member not in members:
+                members[member] = self._member_lines(self.index["members"][member])
+            payloads.append(json.loads(members[member][line]))
+        return payloads
+
+
+def find_exports(directory: Path) -> List[Path]:
+    """The exports in directory, newest first"""
+    if not directory.exists():
+        return []
+    return sorted(directory.glob(f"*{EXPORT_SUFFIX}"), key=lambda path: path.stat().st_mtime, reverse=True)
@@ -0,0 +1,206 @@
+"""
+Payload store: what was last submitted for each SKU
+
+Vendors send revised versions of the same sheet several times a week, and a plain
+re-import submits every row again. The store keeps a hash of each field of the last
+ItemNew payload submitted per SKU, so an incremental run (``--incremental``) can
+tell rows apart:
+
+- new: never submitted - created as usual
+- unchanged: same payload as last time - skipped
+- changed: updated with an ItemPartialUpdate carrying only the changed fields
+
+ItemPartialUpdate only covers some fields (Title, Dimensions, ...). Changes to the
+others (Category, Attributes, Divisions, ...) are reported and left out, and their
+old hashes are kept so the change keeps being reported until it is made by hand.
+
+The store is an append-only NDJSON file per importer in data/<workflow>/ (or
+$PAYLOAD_STORE_DIR), one line per submission with the latest wins; it is compacted
+when it has grown to several times the number of SKUs.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from ecatalog_client import ItemNew, ItemPartialUpdate
+from workflows.import_journal import open_for_append
+
+DEFAULT_STORE_ROOT = Path(__file__).parent.parent / "data"
+
+# Environment variable pointing at an alternative directory for the store files
+STORE_DIR_ENV = "PAYLOAD_STORE_DIR"
+
+NEW = "new"
+UNCHANGED = "unchanged"
+CHANGED = "changed"
+# Changed, but only in fields an update can't carry
+NOT_UPDATABLE = "not_updatable"
+
+# ItemNew fields an ItemPartialUpdate can carry
+UPDATABLE_FIELDS = frozenset(ItemPartialUpdate.model_fields) & frozenset(ItemNew.model_fields)
+
+# Rewrite the file once it holds this many lines per SKU
+COMPACT_RATIO = 3
+
+
+def _digest(value) -> str:
+    return hashlib.sha256(
+        json.dumps(value, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    ).hexdigest()[:16]
+
+
+def store_path(workflow: str) -> Path:
+    """$PAYLOAD_STORE_DIR/<workflow>.ndjson, else data/<workflow>/payload_hashes.ndjson"""
+    override = os.getenv(STORE_DIR_ENV)
+    if override:
+        return Path(override) / f"{workflow}.ndjson"
+    return DEFAULT_STORE_ROOT / workflow / "payload_hashes.ndjson"
+
+
+class PayloadStore:
+    """Field hashes of the last payload submitted per SKU"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        # SKU -> (payload hash, {field: hash})
+        self.entries: Dict[str, Tuple[str, Dict[str, str]]] = {}
+        self._lines = 0
+        self._file = None
+
+    @classmethod
+    def open(cls, workflow: str) -> "PayloadStore":
+        store = cls(store_path(workflow))
+        store._load()
+        if store._lines > COMPACT_RATIO * max(len(store.entries), 1000):
+            store.compact()
+        return store
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # A run killed mid-write leaves a partial last line
+                    continue
+                self.entries[entry["sku"]] = (entry["hash"], entry["fields"])
+                self._lines += 1
+
+    @staticmethod
+    def payload(item: ItemNew) -> Dict:
+        """The payload create_item sends"""
+        return item.model_dump(by_alias=True, exclude_none=True)
+
+    def compare(self, item: ItemNew) -> Tuple[str, List[str]]:
+        """
+        How an item differs from what was last submitted for its SKU
+
+        Returns:
+            (NEW, []), (UNCHANGED, []) or (CHANGED, [changed fields])
+        """
+        entry = self.entries.get(item.Sku)
+        if entry is None:
+            return NEW, []
+        payload = self.payload(item)
+        # One hash settles the common case; fields are only compared when it differs
+        if _digest(payload) == entry[0]:
+            return UNCHANGED, []
+        old_fields = entry[1]
+        new_fields = {field: _digest(value) for field, value in payload.items()}
+        changed = sorted(
+            field for field in set(old_fields) | set(new_fields)
+            if old_fields.get(field) != new_fields.get(field)
+        )
+        return (CHANGED, changed) if changed else (UNCHANGED, [])
+
+    def partial_update(self, item: ItemNew, fields: List[str]) -> Tuple[Optional[ItemPartialUpdate], List[str]]:
+        """
+        The update for an item's changed fields
+
+        Returns:
+            (update, fields it can't carry); update is None when no changed field is updatable
+        """
+        values = {field: getattr(item, field) for field in fields if field in UPDATABLE_FIELDS}
+        # Cleared fields have no value to send (updates drop None)
+        values = {field: value for field, value in values.items() if value is not None}
+        skipped = [field for field in fields if field not in values]
+        return (ItemPartialUpdate(**values) if values else None), skipped
+
+    def check(self, item: ItemNew) -> Tuple[str, Optional[ItemPartialUpdate], Optional[str]]:
+        """
+        What an incremental import does with an item
+
+        Returns:
+            (state, update, message): state is NEW, UNCHANGED, CHANGED (send the
+            update) or NOT_UPDATABLE; message is console markup naming changed
+            fields the update leaves out, if any
+        """
+        state, changed = self.compare(item)
+        if state != CHANGED:
+            return state, None, None
+        update, skipped = self.partial_update(item, changed)
+        message = None
+        if skipped:
+            message = (
+                f"[yellow]{item.Sku}: {', '.join(skipped)} changed, which an import can't "
+                f"update - change it in eCatalog[/yellow]"
+            )
+        return (CHANGED if update is not None else NOT_UPDATABLE), update, message
+
+    def record(self, item: ItemNew, fields: Optional[List[str]] = None) -> None:
+        """
+        Remember a submitted item
+
+        Args:
+            item: The item as submitted
+            fields: Only these fields were sent (an update); the others keep their old hashes
+        """
+        payload = self.payload(item)
+        current = {field: _digest(value) for field, value in payload.items()}
+        entry = self.entries.get(item.Sku)
+        if fields is None or entry is None:
+            stored = current
+        else:
+            stored = dict(entry[1])
+            for field in fields:
+                if field in current:
+                    stored[field] = current[field]
+                else:
+                    stored.pop(field, None)
+        # The whole-payload hash only matches again once every field is up to date
+        payload_hash = _digest(payload) if stored == current else ""
+        self.entries[item.Sku] = (payload_hash, stored)
+        self._append({"sku": item.Sku, "hash": payload_hash, "fields": stored})
+
+    def _append(self, entry: Dict) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open_for_append(self.path)
+        self._file.write(json.dumps(entry, ensure_ascii=False, sort_keys=True) + "\n")
+        self._file.flush()
+        self._lines += 1
+
+    def compact(self) -> None:
+        """Rewrite the file with one line per SKU"""
+        self.close()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for sku, (payload_hash, fields) in self.entries.items():
+                f.write(json.dumps({"sku": sku, "hash": payload_hash, "fields": fields},
+                                   ensure_ascii=False, sort_keys=True) + "\n")
+        os.replace(tmp_path, self.path)
+        self._lines = len(self.entries)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
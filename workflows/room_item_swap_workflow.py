@@ -4,7 +4,7 @@
 End-to-End Room Item Swap Workflow
 
 This script provides a complete workflow for processing room item swap files:
-1. Dry-run import with JSON export and validation (each room swap gets its own JSON file)
+1. Dry-run import with JSON export and validation
 2. User confirmation for live import
 3. Live import with work request collection (one work request per room swap)
 4. Individual work request processing (for traceability and isolation)
@@ -35,6 +35,7 @@ from dotenv import load_dotenv
 
 from ecatalog_client import ECatalogAPIClient, OAuthConfig
 from workflows.import_room_item_swap import RoomItemSwapImporter
+from workflows.payload_export import EXPORT_NDJSON
 from workflows.workflow_logger import WorkflowLogger
 
 console = Console()
@@ -46,10 +47,12 @@ load_dotenv()
 class RoomItemSwapWorkflow:
     """Complete end-to-end room item swap processing workflow"""
 
-    def __init__(self, api_client: ECatalogAPIClient):
+    def __init__(self, api_client: ECatalogAPIClient, export_format: str = EXPORT_NDJSON):
         self.client = api_client
         self.console = console
         self.importer = RoomItemSwapImporter(api_client)
+        # How swaps are exported: one NDJSON file per run, or a file per swap
+        self.export_format = export_format
 
         # Initialize workflow logger
         project_root = Path(__file__).parent.parent
@@ -123,6 +126,9 @@ class RoomItemSwapWorkflow:
             console.print(f"[red]Traceback:[/red]")
             console.print(traceback.format_exc())
             return False
+        finally:
+            # Refresh the Excel log once per run from the append-only log
+            self.logger.export_excel()
 
     def _run_dry_run_validation(self, file_path: Path, sheet_name: Optional[str]) -> Optional[Dict]:
         """Run dry-run import with JSON export and collect validation results"""
@@ -131,7 +137,7 @@ class RoomItemSwapWorkflow:
 
             # Run dry-run with JSON export
             stats = self.importer.import_from_spreadsheet(
-                file_path, sheet_name, dry_run=True
+                file_path, sheet_name, dry_run=True, export_format=self.export_format
             )
 
             return {
@@ -188,7 +194,7 @@ class RoomItemSwapWorkflow:
 
         try:
             stats = self.importer.import_from_spreadsheet(
-                file_path, sheet_name, dry_run=False
+                file_path, sheet_name, dry_run=False, export_format=self.export_format
             )
 
             console.print(f"[green]✅ Import completed: {stats['created']} swaps executed[/green]")
@@ -0,0 +1,345 @@
+"""
+Streaming spreadsheet reader
+
+pd.read_excel / pd.read_csv load a whole sheet before the first row is converted, so
+memory grows with the file and nothing is submitted until parsing is done.
+SheetReader yields the sheet as DataFrames of `batch_rows` rows instead: CSV through
+pandas' chunked reader, Excel row by row. A background thread reads the next batch
+while the current one is converted and submitted.
+
+Vendor workbooks carry far more columns than an importer maps, so the reader can be
+limited to the columns it needs (``columns``) and read those as text
+(``text_columns``) - no type inference, and codes such as SKUs keep their leading
+zeros and don't turn into "123.0" in a column with blanks.
+
+Excel files are read with python-calamine when it is installed (``uv sync --extra
+fast-excel``), which is several times faster than openpyxl's read-only mode on large
+workbooks; set SPREADSHEET_ENGINE=openpyxl to force the pure-Python reader.
+
+Batches carry the sheet's row numbers as their index (0-based, header excluded) and
+parse cells the way pd.read_excel does: empty cells and the usual NA strings become
+NaN, whole-number floats become ints, and trailing blank rows are dropped. Types of
+the other columns are inferred per batch rather than for the whole sheet.
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Iterator, List, Optional, Union
+
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+try:
+    import python_calamine
+except ImportError:  # optional: uv sync --extra fast-excel
+    python_calamine = None
+
+SUPPORTED_SUFFIXES = (".csv", ".xlsx", ".xls")
+
+# Rows per DataFrame handed to the importer
+DEFAULT_BATCH_ROWS = 5000
+
+# Batches read ahead on the background thread
+DEFAULT_PREFETCH = 1
+
+# Environment variable choosing the Excel engine ("calamine" or "openpyxl")
+ENGINE_ENV = "SPREADSHEET_ENGINE"
+
+# Error values Excel readers return as strings; pd.read_excel reads them as NaN
+EXCEL_ERRORS = frozenset({"#N/A", "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#GETTING_DATA"})
+
+
+def excel_engine(engine: Optional[str] = None) -> str:
+    """The Excel engine to use: the one asked for, else $SPREADSHEET_ENGINE, else calamine if installed"""
+    engine = (engine or os.getenv(ENGINE_ENV) or "").lower()
+    if engine == "calamine" and python_calamine is None:
+        raise ValueError("The calamine engine requires python-calamine - install it with `uv sync --extra fast-excel`")
+    if engine and engine not in ("calamine", "openpyxl"):
+        raise ValueError(f"Unknown spreadsheet engine '{engine}' (use calamine or openpyxl)")
+    return engine or ("calamine" if python_calamine is not None else "openpyxl")
+
+
+def _convert_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str) and value in EXCEL_ERRORS:
+        return float("nan")
+    if isinstance(value, date) and not isinstance(value, datetime):
+        # calamine returns dates; openpyxl (and so pd.read_excel) datetimes
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _trimmed(row: Iterable[Any], keep: Optional[List[int]]) -> List[Any]:
+    if keep is not None:
+        row = list(row)
+        row = [row[i] if i < len(row) else None for i in keep]
+    cells = [_convert_cell(value) for value in row]
+    while cells and cells[-1] == "":
+        cells.pop()
+    return cells
+
+
+def _openpyxl_rows(file_path: Path, sheet_name: Union[str, int]) -> Iterator[Iterable[Any]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+    try:
+        sheet = workbook.worksheets[sheet_name] if isinstance(sheet_name, int) else workbook[sheet_name]
+        yield from sheet.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _calamine_rows(file_path: Path, sheet_name: Union[str, int]) -> Iterator[Iterable[Any]]:
+    workbook = python_calamine.load_workbook(str(file_path))
+    try:
+        if isinstance(sheet_name, int):
+            sheet = workbook.get_sheet_by_index(sheet_name)
+        else:
+            sheet = workbook.get_sheet_by_name(sheet_name)
+        yield from sheet.iter_rows()
+    finally:
+        if hasattr(workbook, "close"):
+            workbook.close()
+
+
+def _prefetched(batches: Iterator[pd.DataFrame], depth: int) -> Iterator[pd.DataFrame]:
+    """Run the reader on a background thread, up to `depth` batches ahead of the consumer"""
+    done = object()
+    ready: "queue.Queue" = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                ready.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for batch in batches:
+                if not put(batch):
+                    return
+            put(done)
+        except Exception as e:
+            put(e)
+
+    thread = threading.Thread(target=produce, name="sheet-reader", daemon=True)
+    thread.start()
+    try:
+        while True:
+            entry = ready.get()
+            if entry is done:
+                return
+            if isinstance(entry, Exception):
+                raise entry
+            yield entry
+    finally:
+        # Consumer stopped early (error / Ctrl-C): let the reader thread finish
+        stop.set()
+        thread.join()
+
+
+class SheetReader:
+    """
+    A CSV/Excel sheet as a stream of DataFrames
+
+    Iterate it once; afterwards ``rows`` and ``seconds`` (time spent reading and
+    parsing, which overlaps conversion when prefetching) describe the load.
+    """
+
+    def __init__(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: Optional[Union[str, int]] = None,
+        columns: Optional[Iterable[str]] = None,
+        text_columns: Optional[Iterable[str]] = None,
+        batch_rows: int = DEFAULT_BATCH_ROWS,
+        limit: Optional[int] = None,
+        prefetch: int = DEFAULT_PREFETCH,
+        engine: Optional[str] = None,
+    ):
+        """
+        Args:
+            file_path: .csv, .xlsx or .xls file
+            sheet_name: Excel sheet name or index (default: first sheet)
+            columns: Only read these columns (absent ones are ignored); default all
+            text_columns: Columns read as text instead of inferring their type
+            batch_rows: Rows per DataFrame
+            limit: Stop after this many rows
+            prefetch: Batches to read ahead on a background thread (0 = read inline)
+            engine: Excel engine, "calamine" or "openpyxl" (see excel_engine)
+        """
+        self.file_path = Path(file_path)
+        suffix = self.file_path.suffix.lower()
+        if suffix not in SUPPORTED_SUFFIXES:
+            raise ValueError(f"Unsupported file format: {self.file_path.suffix}")
+
+        self.sheet_name = 0 if sheet_name is None else sheet_name
+        self.columns = None if columns is None else set(columns)
+        self.text_columns = set(text_columns or ())
+        self.batch_rows = max(1, batch_rows)
+        self.limit = limit if limit and limit > 0 else None
+        self.prefetch = prefetch
+        if suffix == ".csv":
+            self.engine = "pandas"
+        elif suffix == ".xls" and python_calamine is None:
+            # xlrd has no row-by-row mode: the sheet is read whole, then split
+            self.engine = "xlrd"
+        else:
+            self.engine = excel_engine(engine)
+
+        self.sheet_columns: List[Any] = []
+        self.rows = 0
+        self.seconds = 0.0
+
+    def __iter__(self) -> Iterator[pd.DataFrame]:
+        batches = self._timed(self._limited(self._batches()))
+        if self.prefetch > 0:
+            batches = _prefetched(batches, self.prefetch)
+        return batches
+
+    def summary(self) -> str:
+        """One line describing the load, for the console"""
+        projected = ""
+        if self.columns is not None and self.sheet_columns:
+            used = sum(1 for column in self.sheet_columns if column in self.columns)
+            projected = f", {used} of {len(self.sheet_columns)} columns"
+        return (
+            f"Read {self.rows:,} rows from {self.file_path.name} in {self.seconds:.1f}s "
+            f"({self.engine}{projected})"
+        )
+
+    def _timed(self, batches: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        while True:
+            start = time.perf_counter()
+            batch = next(batches, None)
+            self.seconds += time.perf_counter() - start
+            if batch is None:
+                return
+            self.rows += len(batch)
+            yield batch
+
+    def _limited(self, batches: Iterator[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        if self.limit is None:
+            yield from batches
+            return
+        remaining = self.limit
+        for batch in batches:
+            if len(batch) >= remaining:
+                yield batch.iloc[:remaining]
+                return
+            remaining -= len(batch)
+            yield batch
+
+    def _batches(self) -> Iterator[pd.DataFrame]:
+        if self.engine == "pandas":
+            return self._csv_batches()
+        if self.engine == "xlrd":
+            return self._whole_sheet_batches()
+        rows = _calamine_rows if self.engine == "calamine" else _openpyxl_rows
+        return self._excel_batches(rows(self.file_path, self.sheet_name))
+
+    def _dtypes(self, names: Iterable[Any]) -> dict:
+        return {name: str for name in names if name in self.text_columns}
+
+    def _csv_batches(self) -> Iterator[pd.DataFrame]:
+        self.sheet_columns = list(pd.read_csv(self.file_path, nrows=0).columns)
+        wanted = self.columns
+        chunks = pd.read_csv(
+            self.file_path,
+            chunksize=self.batch_rows,
+            usecols=(lambda name: name in wanted) if wanted is not None else None,
+            dtype=self._dtypes(self.sheet_columns) or None,
+        )
+        yield from chunks
+
+    def _whole_sheet_batches(self) -> Iterator[pd.DataFrame]:
+        header = pd.read_excel(self.file_path, sheet_name=self.sheet_name, nrows=0)
+        self.sheet_columns = list(header.columns)
+        wanted = self.columns
+        df = pd.read_excel(
+            self.file_path,
+            sheet_name=self.sheet_name,
+            usecols=(lambda name: name in wanted) if wanted is not None else None,
+            dtype=self._dtypes(self.sheet_columns) or None,
+        )
+        for start in range(0, len(df), self.batch_rows):
+            yield df.iloc[start:start + self.batch_rows]
+
+    def _frame(self, header: List[Any], rows: List[List[Any]], start: int) -> pd.DataFrame:
+        width = max([len(header)] + [len(row) for row in rows])
+        padded = [row + [""] * (width - len(row)) for row in [header] + rows]
+        df = TextParser(padded, header=0, dtype=self._dtypes(header) or None).read()
+        df.index = pd.RangeIndex(start, start + len(df))
+        return df
+
+    def _excel_batches(self, rows: Iterator[Iterable[Any]]) -> Iterator[pd.DataFrame]:
+        first = next(rows, None)
+        if first is None:
+            return
+        self.sheet_columns = _trimmed(first, None)
+        keep = None
+        if self.columns is not None:
+            keep = [i for i, name in enumerate(self.sheet_columns) if name in self.columns]
+        header = _trimmed(first, keep)
+
+        batch: List[List[Any]] = []
+        blank_rows: List[List[Any]] = []
+        start = 0
+        for row in rows:
+            cells = _trimmed(row, keep)
+            if not cells:
+                # Blank rows only count if data follows them (trailing ones are formatting)
+                blank_rows.append(cells)
+                continue
+            batch.extend(blank_rows)
+            blank_rows = []
+            batch.append(cells)
+            if len(batch) >= self.batch_rows:
+                yield self._frame(header, batch, start)
+                start += len(batch)
+                batch = []
+        if batch:
+            yield self._frame(header, batch, start)
+
+
+def estimate_rows(file_path: Path, sheet_name: Optional[Union[str, int]] = None) -> Optional[int]:
+    """
+    Rough data row count for progress bars, without parsing the sheet
+
+    CSV counts lines (cells with line breaks make it an overestimate); XLSX uses the
+    sheet's recorded dimensions. None when it can't be told.
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+    try:
+        if suffix == ".csv":
+            lines = 0
+            with open(file_path, "rb") as f:
+                for block in iter(lambda: f.read(1 << 20), b""):
+                    lines += block.count(b"\n")
+            return max(lines - 1, 0)
+        if suffix == ".xlsx":
+            from openpyxl import load_workbook
+
+            workbook = load_workbook(file_path, read_only=True)
+            try:
+                index = 0 if sheet_name is None else sheet_name
+                sheet = workbook.worksheets[index] if isinstance(index, int) else workbook[index]
+                return sheet.max_row - 1 if sheet.max_row else None
+            finally:
+                workbook.close()
+    except Exception:
+        return None
+    return None
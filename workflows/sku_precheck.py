@@ -0,0 +1,114 @@
+"""
+SKU pre-check: which rows of a sheet actually need creating
+
+Importers used to call create_item for every row, including SKUs eCatalog already
+has - each of those becomes a work request that fails or overwrites data. The
+pre-check looks up every SKU of the sheet up front (concurrently, through the
+client's cached lookup_skus) and sorts rows into three buckets:
+
+- create: the SKU is not in eCatalog (the lookup answers exists: false, or 404 on
+  older servers), or its lookup failed - the server decides
+- exists: the SKU is already there, on the row's site
+- conflicting site: the SKU is already there, but on a different site
+
+Dry runs report the buckets; live runs only submit the create bucket.
+"""
+
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from ecatalog_client import ECatalogAPIClient, SkuLookupResponse
+
+# Lookups in flight while pre-checking a sheet
+DEFAULT_LOOKUP_CONCURRENCY = 16
+
+# Buckets; EXISTS and SITE_CONFLICT double as the importers' stats keys
+CREATE = "create"
+EXISTS = "exists"
+SITE_CONFLICT = "site_conflicts"
+
+
+class SkuPrecheck:
+    """Lookup results for the SKUs of one sheet"""
+
+    def __init__(self, found: Dict[str, SkuLookupResponse], missing: Iterable[str],
+                 errors: Dict[str, str]):
+        self.found = found
+        self.missing = set(missing)
+        # SKU -> error message for lookups that failed (treated as not found)
+        self.errors = errors
+
+    @classmethod
+    def run(
+        cls,
+        client: ECatalogAPIClient,
+        skus: Iterable[str],
+        concurrency: int = DEFAULT_LOOKUP_CONCURRENCY,
+        on_result: Optional[Callable[[str], None]] = None,
+    ) -> "SkuPrecheck":
+        """
+        Look up every distinct SKU
+
+        Args:
+            client: API client (lookups go through its SKU lookup cache)
+            skus: SKUs of the sheet, duplicates allowed
+            concurrency: Lookups in flight
+            on_result: Called with each SKU as its lookup finishes (progress display)
+        """
+        found: Dict[str, SkuLookupResponse] = {}
+        missing = []
+        errors: Dict[str, str] = {}
+        for sku, result, error in client.lookup_skus(skus, concurrency=concurrency):
+            if error is not None:
+                errors[sku] = str(error)
+            elif result is not None and result.exists:
+                found[sku] = result
+            else:
+                missing.append(sku)
+            if on_result:
+                on_result(sku)
+        return cls(found, missing, errors)
+
+    def __len__(self) -> int:
+        return len(self.found) + len(self.missing) + len(self.errors)
+
+    def existing(self, sku: str) -> Optional[SkuLookupResponse]:
+        """The lookup of a SKU eCatalog has, None if it doesn't have it"""
+        result = self.found.get(str(sku).strip())
+        return result if result is not None and result.exists else None
+
+    def classify(self, sku: str, site: Optional[str]) -> str:
+        """CREATE, EXISTS or SITE_CONFLICT for a row's SKU and site"""
+        existing = self.existing(sku)
+        if existing is None:
+            return CREATE
+        if site and existing.site and existing.site.upper() != str(site).upper():
+            return SITE_CONFLICT
+        return EXISTS
+
+    def check(self, sku: str, site: Optional[str]) -> Tuple[str, Optional[str]]:
+        """
+        Bucket of a row, as importers report it
+
+        Returns:
+            (bucket, message) where message is console markup for rows that are
+            skipped, None for rows to create
+        """
+        bucket = self.classify(sku, site)
+        if bucket == SITE_CONFLICT:
+            return bucket, (
+                f"[red]SKU {sku} already exists on site {self.existing(sku).site} "
+                f"(sheet says {site}) - not created[/red]"
+            )
+        if bucket == EXISTS:
+            return bucket, f"[dim]Already in eCatalog, skipped: {sku}[/dim]"
+        return bucket, None
+
+    def summary(self) -> str:
+        """One line for the console, counted per distinct SKU"""
+        text = (
+            f"Checked {len(self)} SKUs: {len(self.missing) + len(self.errors)} to create, "
+            f"{len(self.found)} already in eCatalog"
+        )
+        if self.errors:
+            text += f" ({len(self.errors)} lookups failed - those rows are submitted anyway)"
+        return text
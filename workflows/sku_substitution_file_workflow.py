@@ -37,6 +37,21 @@ console = Console()
 # Load environment variables
 load_dotenv()
 
+# Substitution logs carry one row per substitution instead of a SKU list
+SUBSTITUTION_LOG_COLUMNS = [
+    'Timestamp',
+    'Action',
+    'Source File',
+    'Division',
+    'Old SKUs',
+    'New SKUs',
+    'Package SKUs',
+    'Work Request IDs',
+    'Work Request Count',
+    'Status',
+    'Notes'
+]
+
 
 class SkuSubstitutionFileWorkflow:
     """Complete end-to-end SKU substitution file processing workflow"""
@@ -49,7 +64,7 @@ class SkuSubstitutionFileWorkflow:
         # Initialize workflow logger
         project_root = Path(__file__).parent.parent
         logs_dir = project_root / "data" / "sku_substitution" / "logs"
-        self.logger = WorkflowLogger("sku_substitution", logs_dir)
+        self.logger = WorkflowLogger("sku_substitution", logs_dir, columns=SUBSTITUTION_LOG_COLUMNS)
 
     def run_end_to_end_workflow(self, file_path: Path, sheet_name: Optional[str] = None) -> bool:
         """Run the complete SKU substitution workflow"""
@@ -113,6 +128,9 @@ class SkuSubstitutionFileWorkflow:
             import traceback
             console.print(traceback.format_exc())
             return False
+        finally:
+            # Refresh the Excel log once per run from the append-only log
+            self.logger.export_excel()
 
     def _run_dry_run_validation(self, file_path: Path, sheet_name: Optional[str]) -> Optional[Dict]:
         """Run dry-run validation with JSON export"""
@@ -276,43 +294,16 @@ class SkuSubstitutionFileWorkflow:
         Log SKU substitution operation with detailed substitution data.
         Creates a log entry with Division, Old SKU, New SKU, and Package SKUs columns.
         """
-        import pandas as pd
         from datetime import datetime
 
         try:
-            log_path = self.logger._get_log_file_path()
-
-            # Check if log file exists and load it
-            if log_path.exists():
-                try:
-                    df = pd.read_excel(log_path)
-                except Exception:
-                    df = pd.DataFrame()
-            else:
-                df = pd.DataFrame()
-
-            # Create new DataFrame with SKU substitution-specific columns if empty
-            if df.empty:
-                df = pd.DataFrame(columns=[
-                    'Timestamp',
-                    'Action',
-                    'Source File',
-                    'Division',
-                    'Old SKUs',
-                    'New SKUs',
-                    'Package SKUs',
-                    'Work Request IDs',
-                    'Work Request Count',
-                    'Status',
-                    'Notes'
-                ])
-
+            rows = []
             # Add a row for each substitution detail
             for i, detail in enumerate(substitution_details):
                 # Get the corresponding work request ID if available
                 wr_id = work_request_ids[i] if i < len(work_request_ids) else ""
 
-                new_row = {
+                rows.append({
                     'Timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                     'Action': action,
                     'Source File': source_file,
@@ -324,12 +315,9 @@ class SkuSubstitutionFileWorkflow:
                     'Work Request Count': 1 if wr_id else 0,
                     'Status': status,
                     'Notes': notes
-                }
-
-                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+                })
 
-            # Save to Excel
-            df.to_excel(log_path, index=False, engine='openpyxl')
+            self.logger.append_rows(rows)
 
             self.logger.logger.info(
                 f"Logged {action} operation: {len(substitution_details)} substitution(s), "
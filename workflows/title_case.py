@@ -0,0 +1,86 @@
+"""
+Title casing for collection names
+
+smart_title_case() used to live in both the dropship and RTG delivered importers and
+rebuilt its word sets and ran several regexes per word on every call. The word sets
+and patterns are built once here, results are cached per input string (collections
+repeat heavily across a sheet), and title_case_series() converts a whole column.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any
+
+import pandas as pd
+
+from workflows.columnar import map_unique
+
+# Roman numerals (common ones used in furniture/collections)
+ROMAN_NUMERALS = frozenset({
+    "I", "II", "III", "IV", "V", "VI", "VII", "VIII", "IX", "X",
+    "XI", "XII", "XIII", "XIV", "XV", "XVI", "XVII", "XVIII", "XIX", "XX",
+})
+
+# Sports and other acronyms that should stay uppercase
+ACRONYMS = frozenset({
+    "NFL", "MLB", "NBA", "NHL", "NCAA", "MLS", "UFC", "WWE", "ESPN",
+    "USA", "US", "UK", "EU",
+    "LED", "USB", "WIFI", "GPS", "DVD", "CD", "TV", "HD", "LCD", "OLED", "AC", "DC",
+    "AM", "PM", "CEO", "CFO", "DIY", "FAQ", "PDF", "HTML", "CSS", "JS", "API", "URL", "SEO",
+    "RTG", "OTG", "KTG",  # Site codes
+})
+
+# Words kept uppercase as-is
+UPPERCASE_WORDS = ROMAN_NUMERALS | ACRONYMS
+
+# Words that should be lowercase (articles, prepositions, conjunctions)
+LOWERCASE_WORDS = frozenset({
+    "a", "an", "and", "as", "at", "but", "by", "for", "if", "in", "nor", "of",
+    "on", "or", "so", "the", "to", "up", "yet", "with", "from",
+})
+
+# Distinct strings remembered by smart_title_case
+CACHE_SIZE = 65536
+
+_TOKEN_PATTERN = re.compile(r"\S+|\s+")
+_NON_WORD_PATTERN = re.compile(r"[^\w]")
+_LETTERS_PATTERN = re.compile(r"[a-zA-Z]+")
+
+
+def _title_case_word(word: str, first: bool) -> str:
+    # Compare without punctuation, so "(iii)" and "nfl," are still recognised
+    clean_word = _NON_WORD_PATTERN.sub("", word).upper()
+    if clean_word in UPPERCASE_WORDS:
+        return _LETTERS_PATTERN.sub(clean_word, word)
+    if not first and clean_word.lower() in LOWERCASE_WORDS:
+        return word.lower()
+    return word.capitalize()
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _title_case(text: str) -> str:
+    tokens = _TOKEN_PATTERN.findall(text.strip())
+    return "".join(
+        token if token.isspace() else _title_case_word(token, first=i == 0)
+        for i, token in enumerate(tokens)
+    )
+
+
+def smart_title_case(text: Any) -> Any:
+    """
+    Apply title case with special handling for roman numerals and acronyms
+
+    Args:
+        text: Input text to convert
+
+    Returns:
+        Text with proper title casing; empty or non-string input is returned unchanged
+    """
+    if not text or not isinstance(text, str):
+        return text
+    return _title_case(text)
+
+
+def title_case_series(series: pd.Series) -> pd.Series:
+    """smart_title_case for every non-empty cell of a column, once per distinct value"""
+    return map_unique(series, smart_title_case)
@@ -1,74 +1,133 @@
 """
 Workflow Logger for tracking batch operations and work requests.
 
-This module provides functionality to log workflow operations to Excel files,
-including timestamps, filenames, SKUs processed, and work request IDs.
+This module logs workflow operations - timestamps, filenames, SKUs processed and
+work request IDs - to an append-only NDJSON file per workflow per day. Each entry is
+a single locked append, so logging stays cheap on busy days and two workflows can
+log at the same time. The familiar Excel log is generated from that file on demand
+(export_excel), typically once at the end of a workflow run.
 """
 
+import json
+import os
 import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, Iterator, List, Optional
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows - appends are still single writes, just unlocked
+    fcntl = None
+
+
+# Columns of the Excel log / get_log_summary() frame
+LOG_COLUMNS = [
+    'Timestamp',
+    'Action',
+    'Source File',
+    'SKUs',
+    'SKU Count',
+    'Work Request IDs',
+    'Work Request Count',
+    'Status',
+    'Notes'
+]
+
+
+@contextmanager
+def _locked(fd: int, exclusive: bool) -> Iterator[None]:
+    """Hold an advisory lock on an open file descriptor"""
+    if fcntl is None:
+        yield
+        return
+    fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+    try:
+        yield
+    finally:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
 
 class WorkflowLogger:
     """Logger for workflow batch operations"""
 
-    def __init__(self, workflow_name: str, logs_dir: Path):
+    def __init__(self, workflow_name: str, logs_dir: Path, columns: Optional[List[str]] = None):
         """
         Initialize workflow logger.
 
         Args:
             workflow_name: Name of the workflow (e.g., 'dropship', 'rtg_delivered')
             logs_dir: Directory where log files should be stored
+            columns: Log columns, for workflows that log their own row layout
         """
         self.workflow_name = workflow_name
+        self.columns = columns or LOG_COLUMNS
         self.logs_dir = Path(logs_dir)
         self.logs_dir.mkdir(parents=True, exist_ok=True)
 
         # Set up Python logging
         self.logger = logging.getLogger(f"workflow_logger.{workflow_name}")
 
-    def _get_log_file_path(self) -> Path:
-        """Get the log file path for today's date"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        filename = f"{today}-{self.workflow_name}.xlsx"
+    def _get_log_file_path(self, date: Optional[str] = None) -> Path:
+        """Get the Excel log file path for a date (default: today)"""
+        date = date or datetime.now().strftime("%Y-%m-%d")
+        filename = f"{date}-{self.workflow_name}.xlsx"
         return self.logs_dir / filename
 
-    def _initialize_log_file(self, log_path: Path) -> pd.DataFrame:
+    def _get_store_path(self, date: Optional[str] = None) -> Path:
+        """Get the append-only NDJSON log path for a date (default: today)"""
+        return self._get_log_file_path(date).with_suffix(".ndjson")
+
+    def append_rows(self, rows: List[Dict]) -> None:
         """
-        Initialize or load existing log file.
+        Append log rows (dicts keyed by column name) to today's store.
 
-        Args:
-            log_path: Path to the log file
+        All rows go out in one write under an exclusive lock, so concurrent
+        workflows never interleave partial lines.
+        """
+        if not rows:
+            return
+        data = "".join(
+            json.dumps(row, ensure_ascii=False, default=str) + "\n" for row in rows
+        ).encode("utf-8")
+        fd = os.open(self._get_store_path(), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            with _locked(fd, exclusive=True):
+                while data:
+                    data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+
+    def read_entries(self, date: Optional[str] = None) -> List[Dict]:
+        """
+        Read the log rows for a date (default: today).
 
         Returns:
-            DataFrame with log data
-        """
-        if log_path.exists():
-            # Load existing log
-            try:
-                df = pd.read_excel(log_path)
-                self.logger.info(f"Loaded existing log file: {log_path}")
-                return df
-            except Exception as e:
-                self.logger.warning(f"Could not load existing log file: {e}. Creating new one.")
-
-        # Create new DataFrame with columns
-        df = pd.DataFrame(columns=[
-            'Timestamp',
-            'Action',
-            'Source File',
-            'SKUs',
-            'SKU Count',
-            'Work Request IDs',
-            'Work Request Count',
-            'Status',
-            'Notes'
-        ])
-        self.logger.info(f"Initialized new log file: {log_path}")
-        return df
+            List of row dicts in the order they were logged
+        """
+        store_path = self._get_store_path(date)
+        if not store_path.exists():
+            return []
+
+        entries = []
+        with open(store_path, "r", encoding="utf-8") as f:
+            with _locked(f.fileno(), exclusive=False):
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn line from a crashed writer shouldn't hide the rest of the day
+                        self.logger.warning(f"Skipping unreadable log line in {store_path}")
+        return entries
+
+    def _entries_to_frame(self, entries: List[Dict]) -> pd.DataFrame:
+        """Shape raw entries like the Excel log"""
+        return pd.DataFrame(entries, columns=self.columns)
 
     def log_batch_operation(
         self,
@@ -80,7 +139,7 @@ class WorkflowLogger:
         notes: str = ""
     ) -> None:
         """
-        Log a batch operation to the Excel file.
+        Log a batch operation to today's append-only log.
 
         Args:
             action: Description of the action (e.g., 'Import', 'Submit', 'Process')
@@ -91,27 +150,17 @@ class WorkflowLogger:
             notes: Additional notes or error messages
         """
         try:
-            log_path = self._get_log_file_path()
-            df = self._initialize_log_file(log_path)
-
-            # Prepare the new row
-            new_row = {
+            self.append_rows([{
                 'Timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
                 'Action': action,
                 'Source File': source_file,
-                'SKUs': ', '.join(skus) if skus else '',
+                'SKUs': ', '.join(map(str, skus)) if skus else '',
                 'SKU Count': len(skus) if skus else 0,
                 'Work Request IDs': ', '.join(map(str, workrequest_ids)) if workrequest_ids else '',
                 'Work Request Count': len(workrequest_ids) if workrequest_ids else 0,
                 'Status': status,
                 'Notes': notes
-            }
-
-            # Append the new row
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-            # Save to Excel
-            df.to_excel(log_path, index=False, engine='openpyxl')
+            }])
 
             self.logger.info(
                 f"Logged {action} operation: {len(skus) if skus else 0} SKUs, "
@@ -203,14 +252,45 @@ class WorkflowLogger:
             notes=notes
         )
 
-    def get_log_summary(self) -> Optional[pd.DataFrame]:
+    def export_excel(self, date: Optional[str] = None) -> Optional[Path]:
         """
-        Get a summary of today's log entries.
+        Write the Excel log for a date (default: today) from the append-only log.
+
+        Args:
+            date: Date in YYYY-MM-DD format
+
+        Returns:
+            Path of the written workbook, or None if nothing was logged that day
+        """
+        entries = self.read_entries(date)
+        if not entries:
+            return None
+
+        log_path = self._get_log_file_path(date)
+        try:
+            # Write to a temp file and swap it in so a reader never sees half a workbook
+            tmp_path = log_path.with_name(f".{log_path.name}.{os.getpid()}.tmp")
+            self._entries_to_frame(entries).to_excel(tmp_path, index=False, engine='openpyxl')
+            os.replace(tmp_path, log_path)
+            self.logger.info(f"Exported {len(entries)} log entries to {log_path}")
+            return log_path
+        except Exception as e:
+            self.logger.error(f"Failed to export Excel log: {e}")
+            return None
+
+    def get_log_summary(self, date: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Get a summary of a day's log entries (default: today).
 
         Returns:
             DataFrame with log summary or None if no log exists
         """
-        log_path = self._get_log_file_path()
+        entries = self.read_entries(date)
+        if entries:
+            return self._entries_to_frame(entries)
+
+        # Days logged before the append-only store only have the workbook
+        log_path = self._get_log_file_path(date)
         if not log_path.exists():
             return None
 
@@ -0,0 +1,138 @@
+"""
+Chunked work request submission
+
+POST /workrequests/process with every ID from a large run in one body can time out,
+and then nothing is known about which IDs the server took. process_in_chunks() sends
+the IDs in fixed-size chunks, a few at a time, and reports which IDs were accepted.
+
+Processing is not idempotent: a chunk is only sent again as is when the server can't
+have acted on it - the connection was never made, or it answered 429 (the transport's
+own policy for POST). When the outcome is unknown (read timeout, connection dropped
+mid-request), the chunk's work requests are fetched first, and only the ones still
+PENDING are sent again.
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import requests
+
+from ecatalog_client import ECatalogAPIClient
+from workflows.concurrent_submit import submit_ordered
+from workflows.workrequest_status import fetch_workrequests
+
+# Work request IDs per POST /workrequests/process
+DEFAULT_CHUNK_SIZE = 200
+
+# Chunks in flight at once - each one fans out to flows on the server
+DEFAULT_PARALLEL_CHUNKS = 2
+
+# Attempts per chunk, including the first
+DEFAULT_CHUNK_ATTEMPTS = 3
+
+# Statuses that mean the server refused the request without processing it
+RETRYABLE_STATUSES = (429,)
+
+
+def chunked(workrequest_ids: List[int], chunk_size: int) -> List[List[int]]:
+    """Split IDs into consecutive chunks of at most chunk_size"""
+    return [workrequest_ids[i:i + chunk_size] for i in range(0, len(workrequest_ids), chunk_size)]
+
+
+def _is_retryable(error: Exception) -> bool:
+    """The server can't have processed the chunk, so it can be sent again as is"""
+    if isinstance(error, requests.exceptions.HTTPError) and error.response is not None:
+        return error.response.status_code in RETRYABLE_STATUSES
+    return isinstance(error, requests.exceptions.ConnectTimeout)
+
+
+def _outcome_unknown(error: Exception) -> bool:
+    """The request may have reached the server: a read timeout or a dropped connection"""
+    return isinstance(error, (requests.exceptions.Timeout, requests.exceptions.ConnectionError))
+
+
+def _still_pending(client: ECatalogAPIClient, workrequest_ids: List[int]) -> Optional[List[int]]:
+    """The IDs still PENDING, or None if any of them couldn't be fetched"""
+    states = fetch_workrequests(client, workrequest_ids)
+    if any(wr is None for wr in states.values()):
+        return None
+    return [wr_id for wr_id, wr in states.items() if str(wr.get("status") or "").upper() == "PENDING"]
+
+
+def _submit_chunk(client: ECatalogAPIClient, chunk: List[int], max_attempts: int) -> Tuple[int, Optional[str]]:
+    """Send one chunk, resending only what the server can't have taken. Returns (attempts, error or None)"""
+    pending = list(chunk)
+    error = None
+    # An earlier attempt may have been processed even though it failed
+    uncertain = False
+    for attempt in range(max_attempts):
+        if attempt:
+            time.sleep(client.transport.backoff_delay(attempt - 1))
+            if uncertain:
+                pending = _still_pending(client, pending)
+                if pending is None:
+                    return attempt, f"{error} (processing state unknown - check with 'workrequest list')"
+                if not pending:
+                    return attempt, None
+
+        try:
+            client.process_workrequests(pending)
+            return attempt + 1, None
+        except Exception as e:
+            error = str(e)
+            if _outcome_unknown(e) and not _is_retryable(e):
+                uncertain = True
+            elif not _is_retryable(e) and not uncertain:
+                # The server rejected the chunk itself (e.g. an ID that isn't PENDING)
+                return attempt + 1, error
+            # After an uncertain attempt a rejection may just mean the first one went through:
+            # the next pass re-checks the IDs before deciding
+
+    if uncertain:
+        pending = _still_pending(client, pending)
+        if pending == []:
+            return max_attempts, None
+    return max_attempts, error
+
+
+def process_in_chunks(
+    client: ECatalogAPIClient,
+    workrequest_ids: List[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    parallelism: int = DEFAULT_PARALLEL_CHUNKS,
+    max_attempts: int = DEFAULT_CHUNK_ATTEMPTS,
+    on_chunk: Optional[Callable[[int, List[int], Optional[str], int], None]] = None,
+) -> Dict[str, Any]:
+    """
+    Submit work requests for processing in chunks
+
+    Args:
+        client: API client
+        workrequest_ids: Work request IDs to process
+        chunk_size: IDs per request
+        parallelism: Chunks submitted at once
+        max_attempts: Attempts per chunk before giving up on it
+        on_chunk: Called in chunk order with (chunk number, chunk IDs, error or None,
+            attempts), e.g. to log each chunk
+
+    Returns:
+        Dict with "accepted" and "failed" ID lists, "chunks" and "failed_chunks" counts
+    """
+    chunks = chunked(list(workrequest_ids), max(1, chunk_size))
+    summary = {"accepted": [], "failed": [], "chunks": len(chunks), "failed_chunks": 0}
+
+    def submit(chunk: List[int]) -> Tuple[int, Optional[str]]:
+        return _submit_chunk(client, chunk, max_attempts)
+
+    for number, (chunk, result, error) in enumerate(submit_ordered(submit, chunks, parallelism), 1):
+        attempts, chunk_error = result if not error else (0, str(error))
+        if chunk_error:
+            summary["failed"].extend(chunk)
+            summary["failed_chunks"] += 1
+        else:
+            summary["accepted"].extend(chunk)
+
+        if on_chunk:
+            on_chunk(number, chunk, chunk_error, attempts)
+
+    return summary
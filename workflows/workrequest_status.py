@@ -0,0 +1,214 @@
+"""
+Work request status aggregation
+
+Workflows end by counting how many of their work requests are PENDING / RUNNING /
+COMPLETED / FAILED. Fetching them one GET at a time takes minutes for a large import,
+so statuses are fetched on a small thread pool, and for large ID sets the server's
+per-status listing (GET /workrequests/?status=...) is used instead: four requests
+regardless of how many work requests the run created.
+
+WorkRequestWatcher builds on the same fetch to wait for a batch to finish.
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from ecatalog_client import ECatalogAPIClient
+from workflows.concurrent_submit import submit_ordered
+
+STATUSES = ("PENDING", "RUNNING", "COMPLETED", "FAILED")
+TERMINAL_STATUSES = ("COMPLETED", "FAILED")
+
+# Parallel GET /workrequests/{id} calls
+DEFAULT_CONCURRENCY = 8
+
+# From this many IDs on, list by status instead of fetching each work request
+LIST_THRESHOLD = 500
+
+
+def _list_by_status(client: ECatalogAPIClient, wanted: set) -> Dict[int, Dict]:
+    """Work requests in `wanted`, found through the per-status listing"""
+    found = {}
+    for _, results, error in submit_ordered(
+        lambda status: client.list_workrequests(status=status), STATUSES, len(STATUSES)
+    ):
+        if error or not results:
+            continue
+        for wr in results:
+            wr_id = wr.get('id')
+            if wr_id in wanted:
+                found[wr_id] = wr
+    return found
+
+
+def fetch_workrequests(
+    client: ECatalogAPIClient,
+    workrequest_ids: Iterable[int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    list_threshold: Optional[int] = LIST_THRESHOLD,
+) -> Dict[int, Optional[Dict]]:
+    """
+    Fetch the current state of many work requests
+
+    Args:
+        client: API client
+        workrequest_ids: Work request IDs to fetch
+        concurrency: Parallel per-ID requests
+        list_threshold: Use the per-status listing from this many IDs on (None = never)
+
+    Returns:
+        Work request dict per ID, in input order; None where it couldn't be fetched
+    """
+    ids = list(dict.fromkeys(workrequest_ids))
+    states: Dict[int, Optional[Dict]] = dict.fromkeys(ids)
+
+    if list_threshold is not None and len(ids) >= list_threshold:
+        states.update(_list_by_status(client, set(ids)))
+
+    # Anything the listing didn't cover (small runs, other statuses) is fetched by ID
+    missing: List[int] = [wr_id for wr_id, wr in states.items() if wr is None]
+    for wr_id, wr, error in submit_ordered(client.get_workrequest, missing, concurrency):
+        if not error and wr:
+            states[wr_id] = wr
+
+    return states
+
+
+def count_statuses(states: Dict[int, Optional[Dict]]) -> Dict[str, int]:
+    """Count work requests per status; unknown or unreadable ones count as PENDING"""
+    status_counts = {status: 0 for status in STATUSES}
+    for wr in states.values():
+        status = str(wr.get('status') or '').upper() if wr else ''
+        status_counts[status if status in status_counts else "PENDING"] += 1
+    return status_counts
+
+
+def summarize_workrequest_status(
+    client: ECatalogAPIClient,
+    workrequest_ids: Iterable[int],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    list_threshold: Optional[int] = LIST_THRESHOLD,
+) -> Dict[str, int]:
+    """{"PENDING", "RUNNING", "COMPLETED", "FAILED"} counts for a set of work requests"""
+    return count_statuses(fetch_workrequests(client, workrequest_ids, concurrency, list_threshold))
+
+
+def _status_of(wr: Optional[Dict]) -> str:
+    return str(wr.get('status') or '').upper() if wr else ''
+
+
+class WorkRequestWatcher:
+    """
+    Poll a batch of work requests until every one is COMPLETED or FAILED
+
+    Only still-open work requests are fetched on each poll. The poll interval starts
+    at min_interval, grows by `backoff` after every poll that finds nothing new and
+    drops back to min_interval as soon as something finishes.
+    """
+
+    def __init__(
+        self,
+        client: ECatalogAPIClient,
+        workrequest_ids: Iterable[int],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        list_threshold: Optional[int] = LIST_THRESHOLD,
+        min_interval: float = 2.0,
+        max_interval: float = 60.0,
+        backoff: float = 1.5,
+    ):
+        self.client = client
+        self.concurrency = concurrency
+        self.list_threshold = list_threshold
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+
+        self.states: Dict[int, Optional[Dict]] = dict.fromkeys(workrequest_ids)
+        self.started_at = time.monotonic()
+        self._done_at_start: Optional[int] = None
+
+    @property
+    def open_ids(self) -> List[int]:
+        """Work requests that haven't reached a terminal status yet"""
+        return [wr_id for wr_id, wr in self.states.items() if _status_of(wr) not in TERMINAL_STATUSES]
+
+    @property
+    def done_count(self) -> int:
+        return len(self.states) - len(self.open_ids)
+
+    def counts(self) -> Dict[str, int]:
+        return count_statuses(self.states)
+
+    def throughput(self) -> float:
+        """Work requests finished per minute since the first poll"""
+        elapsed = time.monotonic() - self.started_at
+        if not elapsed or self._done_at_start is None:
+            return 0.0
+        return (self.done_count - self._done_at_start) * 60.0 / elapsed
+
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds until every work request is finished, at the current throughput"""
+        rate = self.throughput()
+        if not rate:
+            return None
+        return len(self.open_ids) * 60.0 / rate
+
+    def poll(self) -> List[Dict]:
+        """
+        Fetch the open work requests once
+
+        Returns:
+            Work requests that reached COMPLETED or FAILED in this poll
+        """
+        open_ids = self.open_ids
+        fetched = fetch_workrequests(self.client, open_ids, self.concurrency, self.list_threshold)
+
+        finished = []
+        for wr_id, wr in fetched.items():
+            if wr is None:
+                # Keep the last known state if this fetch failed
+                continue
+            self.states[wr_id] = wr
+            if _status_of(wr) in TERMINAL_STATUSES:
+                finished.append(wr)
+
+        if self._done_at_start is None:
+            # Work finished before we started watching doesn't count towards throughput
+            self._done_at_start = self.done_count
+            self.started_at = time.monotonic()
+        return finished
+
+    def watch(
+        self,
+        timeout: Optional[float] = None,
+        on_poll: Optional[Callable[["WorkRequestWatcher", List[Dict]], None]] = None,
+    ) -> Dict[str, int]:
+        """
+        Poll until every work request is finished or `timeout` seconds have passed
+
+        Args:
+            timeout: Give up after this many seconds (None = wait indefinitely)
+            on_poll: Called after every poll with the watcher and the work requests
+                that finished in that poll, e.g. to report failures as they appear
+
+        Returns:
+            Final {"PENDING", "RUNNING", "COMPLETED", "FAILED"} counts
+        """
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        interval = self.min_interval
+
+        while True:
+            finished = self.poll()
+            if on_poll:
+                on_poll(self, finished)
+            if not self.open_ids:
+                break
+
+            now = time.monotonic()
+            if deadline is not None and now >= deadline:
+                break
+
+            interval = self.min_interval if finished else min(interval * self.backoff, self.max_interval)
+            time.sleep(interval if deadline is None else min(interval, deadline - now))
+
+        return self.counts()